@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: plan-year accumulator updates, AccumulatorSet vs. AccumulatorLedger.
+
+Applies a year of claims (deductible, then out-of-pocket) for families of
+four. The reference loop threads each claim through the member's immutable
+``AccumulatorSet`` (and only sees its own copy of the family limits); the
+ledger applies the whole claim stream in bulk with shared family limits.
+
+Usage:
+    python benchmarks/bench_accumulator_ledger.py
+    python benchmarks/bench_accumulator_ledger.py --members 100000 --claims-per-member 20
+"""
+
+import argparse
+import random
+import resource
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.benefits import AccumulatorLedger, create_medical_accumulators  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_sets(count: int) -> list:
+    """Build one medical accumulator set per member."""
+    return [
+        create_medical_accumulators(
+            member_id=f"MEM-{i:07d}",
+            plan_year=2024,
+            deductible_individual=Decimal("1500"),
+            deductible_family=Decimal("3000"),
+            oop_individual=Decimal("5000"),
+            oop_family=Decimal("10000"),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--claims-per-member", type=int, default=12)
+    parser.add_argument("--loop-max", type=int, default=50_000, help="claims in the model loop")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sets = make_sets(args.members)
+    family_ids = {acc_set.member_id: f"FAM-{i // 4}" for i, acc_set in enumerate(sets)}
+    member_ids = [
+        acc_set.member_id for acc_set in sets for _ in range(args.claims_per_member)
+    ]
+    rng.shuffle(member_ids)
+    amounts = [Decimal(rng.randrange(1_000, 80_000)) / 100 for _ in member_ids]
+    claims = len(member_ids)
+
+    print(f"{'engine':>8} {'claims':>10} {'time (s)':>9} {'claims/s':>12} {'peak MB':>8}")
+
+    by_member = {acc_set.member_id: acc_set for acc_set in sets}
+    loop_claims = min(claims, args.loop_max)
+    start = time.perf_counter()
+    for member_id, amount in zip(member_ids[:loop_claims], amounts[:loop_claims], strict=True):
+        acc_set, _ = by_member[member_id].apply_to_deductible(amount)
+        acc_set, _ = acc_set.apply_to_oop(amount)
+        by_member[member_id] = acc_set
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'models':>8} {loop_claims:>10,} {elapsed:>9.2f} "
+        f"{loop_claims / elapsed:>12,.0f} {peak_rss_mb():>8.1f}"
+    )
+
+    start = time.perf_counter()
+    ledger = AccumulatorLedger(sets, family_ids=family_ids)
+    load = time.perf_counter() - start
+    start = time.perf_counter()
+    ledger.apply_to_deductible(member_ids, amounts)
+    ledger.apply_to_oop(member_ids, amounts)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'ledger':>8} {claims:>10,} {elapsed:>9.2f} "
+        f"{claims / elapsed:>12,.0f} {peak_rss_mb():>8.1f}"
+    )
+
+    start = time.perf_counter()
+    snapshots = sum(1 for _ in ledger.snapshots())
+    print(f"load {load:.2f}s, {snapshots:,} snapshots {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dim_date generation, cold build versus cache hit.
+
+Builds the date dimension for spans of increasing length with the cache
+bypassed, then times a repeat call that is served from the LRU cache.
+
+Usage:
+    python benchmarks/bench_dim_date.py
+    python benchmarks/bench_dim_date.py --years 10 50 100 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.dimensional import clear_dim_date_cache, generate_dim_date  # noqa: E402
+
+
+def best_of(fn, repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--start-year", type=int, default=1950)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'years':>6} {'rows':>8} {'build (ms)':>11} {'cached (ms)':>12}")
+    for years in args.years:
+        start = f"{args.start_year}-01-01"
+        end = f"{args.start_year + years - 1}-12-31"
+
+        build = best_of(
+            lambda start=start, end=end: generate_dim_date(start, end, use_cache=False),
+            args.repeat,
+        )
+        clear_dim_date_cache()
+        rows = len(generate_dim_date(start, end))
+        cached = best_of(
+            lambda start=start, end=end: generate_dim_date(start, end), args.repeat
+        )
+        print(f"{years:>6} {rows:>8,} {build * 1000:>11.1f} {cached * 1000:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
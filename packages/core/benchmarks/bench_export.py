@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cohort export time and peak memory by format.
+
+Persists a cohort of synthetic patients, then exports it as JSON, CSV and
+Parquet. The peak-RSS watermark is reset before each export (Linux only),
+so the reported growth belongs to that export alone; with streaming export
+it should stay roughly flat as the cohort grows.
+
+Usage:
+    python benchmarks/bench_export.py
+    python benchmarks/bench_export.py --sizes 10000 100000 --compression zstd
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from bench_persist import make_patients  # noqa: E402
+
+from healthsim.db import DatabaseConnection  # noqa: E402
+from healthsim.state.auto_persist import AutoPersistService  # noqa: E402
+
+
+def _status_kb(field: str) -> int:
+    """Read a memory field (e.g. VmRSS, VmHWM) from /proc/self/status in kB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def reset_peak_rss() -> int:
+    """Reset the peak-RSS watermark (Linux) and return the current RSS in kB."""
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    return _status_kb("VmRSS")
+
+
+def time_export(service, cohort_id: str, format: str, compression, out_dir: str) -> tuple:
+    """Export once; return (seconds, peak RSS growth in MB, output bytes)."""
+    baseline_kb = reset_peak_rss()
+    start = time.perf_counter()
+    result = service.export_cohort(
+        cohort_id,
+        format=format,
+        output_path=str(Path(out_dir) / f"export-{format}"),
+        compression=compression if format != 'json' else None,
+    )
+    elapsed = time.perf_counter() - start
+    peak_mb = (_status_kb("VmHWM") - baseline_kb) / 1024
+    return elapsed, peak_mb, result.file_size_bytes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--compression", default=None, help="codec for csv/parquet (e.g. zstd)")
+    args = parser.parse_args()
+
+    print(f"{'entities':>10} {'format':>8} {'time (s)':>9} {'peak +MB':>9} {'size MB':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "bench.duckdb")
+            db = DatabaseConnection(Path(db_path))
+            service = AutoPersistService(connection=db.connect())
+            cohort_id = service.persist_entities_bulk(
+                entities=make_patients(size), entity_type='patient',
+            ).cohort_id
+
+            for format in ('json', 'csv', 'parquet'):
+                elapsed, peak_mb, file_size = time_export(
+                    service, cohort_id, format, args.compression, tmpdir,
+                )
+                print(
+                    f"{size:>10,} {format:>8} {elapsed:>9.2f} "
+                    f"{peak_mb:>9.1f} {file_size / 1e6:>9.1f}"
+                )
+            db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ProfileJourneyOrchestrator serial vs process-pool execution.
+
+Generates a cohort with the diabetic-first-year journey template, executes
+events through a simple handler, and reports speedup for each worker count.
+Parallel output is checked against the serial run.
+
+Usage:
+    python benchmarks/bench_orchestrator.py
+    python benchmarks/bench_orchestrator.py --count 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.generation.orchestrator import ProfileJourneyOrchestrator  # noqa: E402
+from healthsim.generation.profile_schema import ProfileSpecification  # noqa: E402
+
+PROFILE = {
+    "id": "bench-orchestrator",
+    "name": "Benchmark Orchestrator",
+    "generation": {"count": 1000},
+    "demographics": {
+        "age": {"type": "normal", "mean": 68, "std_dev": 10, "min": 40, "max": 95},
+        "gender": {"type": "categorical", "weights": {"M": 0.48, "F": 0.52}},
+    },
+    "clinical": {
+        "primary_condition": {"code": "E11", "prevalence": 1.0},
+        "comorbidities": [{"code": "I10", "prevalence": 0.7}],
+    },
+}
+
+
+def record_event(entity, event, context):
+    """Handler that echoes a few parameters (module-level so it pickles)."""
+    return {"entity_id": entity["entity_id"], "params": dict(context["event_parameters"])}
+
+
+def run(count: int, workers: int) -> tuple:
+    """Run the orchestrator once; return (seconds, result)."""
+    orchestrator = ProfileJourneyOrchestrator(seed=42)
+    for event_type in ("encounter", "lab_order", "lab_result", "prescription", "diagnosis"):
+        orchestrator.journey_engine.register_handler("patientsim", event_type, record_event)
+    start = time.perf_counter()
+    result = orchestrator.execute(
+        profile=ProfileSpecification.model_validate(PROFILE),
+        journey="diabetic-first-year",
+        count=count,
+        start_date=date(2025, 1, 1),
+        execute_events=True,
+        up_to_date=date(2025, 12, 31),
+        workers=workers,
+    )
+    return time.perf_counter() - start, result
+
+
+def timelines(result) -> list:
+    """Comparable view of the timelines (executed_at is wall-clock time)."""
+    return [
+        [(ev.timeline_event_id, ev.scheduled_date, ev.status, ev.result) for ev in e.timeline.events]
+        for e in result.entities
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>8} {'time (s)':>9} {'entities/s':>11} {'speedup':>8} {'identical':>10}")
+    baseline_time, baseline = run(args.count, 1)
+    expected = timelines(baseline)
+    for workers in args.workers:
+        if workers == 1:
+            elapsed, result = baseline_time, baseline
+        else:
+            elapsed, result = run(args.count, workers)
+        identical = timelines(result) == expected
+        print(
+            f"{workers:>8} {elapsed:>9.2f} {args.count / elapsed:>11,.0f} "
+            f"{baseline_time / elapsed:>7.2f}x {str(identical):>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-by-row vs. bulk entity persistence.
+
+Compares AutoPersistService.persist_entities (one INSERT per entity with an
+UPDATE fallback) against persist_entities_bulk (one INSERT ... ON CONFLICT
+DO UPDATE per batch) on a scratch database.
+
+Usage:
+    python benchmarks/bench_persist.py
+    python benchmarks/bench_persist.py --sizes 1000 10000 --loop-max 10000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.db import DatabaseConnection  # noqa: E402
+from healthsim.state.auto_persist import AutoPersistService  # noqa: E402
+
+
+def make_patients(count: int) -> list:
+    """Build flat patient dicts like the generators emit."""
+    return [
+        {
+            'patient_id': str(uuid4()),
+            'mrn': f'MRN{i:08d}',
+            'given_name': f'Patient{i}',
+            'family_name': 'Bench',
+            'birth_date': f'19{50 + i % 50:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}',
+            'gender': 'male' if i % 2 else 'female',
+            'city': 'Springfield',
+            'state': 'IL',
+        }
+        for i in range(count)
+    ]
+
+
+def time_persist(method_name: str, entities: list) -> tuple:
+    """Persist entities into a fresh database; return (seconds, inserted, updated)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = DatabaseConnection(Path(tmpdir) / "bench.duckdb")
+        service = AutoPersistService(connection=db.connect())
+        try:
+            start = time.perf_counter()
+            result = getattr(service, method_name)(entities=entities, entity_type='patient')
+            elapsed = time.perf_counter() - start
+        finally:
+            db.close()
+    return elapsed, result.rows_inserted, result.rows_updated
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--loop-max", type=int, default=100_000,
+        help="skip the row-by-row path above this size",
+    )
+    args = parser.parse_args()
+
+    print(f"{'entities':>10} {'loop (s)':>10} {'bulk (s)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        entities = make_patients(size)
+        bulk_s, inserted, updated = time_persist('persist_entities_bulk', entities)
+        assert (inserted, updated) == (size, 0)
+
+        if size <= args.loop_max:
+            loop_s, _, _ = time_persist('persist_entities', entities)
+            print(f"{size:>10,} {loop_s:>10.2f} {bulk_s:>10.2f} {loop_s / bulk_s:>7.1f}x")
+        else:
+            print(f"{size:>10,} {'-':>10} {bulk_s:>10.2f} {'-':>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
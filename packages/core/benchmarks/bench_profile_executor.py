@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ProfileExecutor throughput, scalar vs vectorized.
+
+Executes a Medicare diabetes profile (demographics, severity, comorbidity,
+conditional A1C lab, plan mix) in both modes and reports entities/second.
+Scalar mode is run at the smaller sizes only; it scales linearly.
+
+Usage:
+    python benchmarks/bench_profile_executor.py
+    python benchmarks/bench_profile_executor.py --sizes 10000 1000000 --scalar-max 10000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.generation.profile_executor import ProfileExecutor  # noqa: E402
+from healthsim.generation.profile_schema import ProfileSpecification  # noqa: E402
+
+PROFILE = {
+    "id": "bench-medicare-diabetes",
+    "name": "Benchmark Medicare Diabetes",
+    "generation": {"count": 1000, "seed": 42},
+    "demographics": {
+        "age": {"type": "normal", "mean": 72, "std_dev": 8, "min": 65, "max": 95},
+        "gender": {"type": "categorical", "weights": {"M": 0.48, "F": 0.52}},
+        "race": {"type": "categorical", "weights": {"white": 0.6, "black": 0.2, "asian": 0.1, "other": 0.1}},
+    },
+    "clinical": {
+        "primary_condition": {"code": "E11", "prevalence": 1.0},
+        "severity": {"type": "categorical", "weights": {"controlled": 0.6, "uncontrolled": 0.4}},
+        "comorbidities": [{"code": "I10", "prevalence": 0.7}, {"code": "E78", "prevalence": 0.6}],
+        "lab_values": {
+            "a1c": {
+                "type": "conditional",
+                "rules": [
+                    {"condition": "severity == 'controlled'",
+                     "distribution": {"type": "normal", "mean": 6.5, "std_dev": 0.3}},
+                    {"condition": "severity == 'uncontrolled'",
+                     "distribution": {"type": "normal", "mean": 8.5, "std_dev": 1.0}},
+                ],
+            },
+        },
+    },
+    "coverage": {"type": "Medicare", "plan_distribution": {"MA": 0.45, "FFS": 0.55}},
+}
+
+
+def time_execute(spec: ProfileSpecification, count: int, vectorized: bool) -> float:
+    """Execute once and return elapsed seconds."""
+    start = time.perf_counter()
+    ProfileExecutor(spec).execute(count_override=count, vectorized=vectorized)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--scalar-max", type=int, default=100_000,
+                        help="largest size to run in scalar mode")
+    args = parser.parse_args()
+
+    spec = ProfileSpecification.model_validate(PROFILE)
+
+    print(f"{'entities':>10} {'mode':>11} {'time (s)':>9} {'entities/s':>12}")
+    for size in args.sizes:
+        modes = [True] if size > args.scalar_max else [False, True]
+        for vectorized in modes:
+            elapsed = time_execute(spec, size, vectorized)
+            mode = "vectorized" if vectorized else "scalar"
+            print(f"{size:>10,} {mode:>11} {elapsed:>9.2f} {size / elapsed:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ benefits across medical, pharmacy, dental, and vision domains.
 Key Components:
     - Accumulators: Track deductibles, out-of-pocket maximums, and other
       benefit limits across plan years
+    - AccumulatorLedger: Array-backed balances for applying claim streams
+      for many members in bulk
     - Cost Sharing: Common copay, coinsurance, and deductible application logic
 
 Example:
@@ -38,11 +40,13 @@ from healthsim.benefits.accumulators import (
     create_medical_accumulators,
     create_pharmacy_accumulators,
 )
+from healthsim.benefits.ledger import AccumulatorLedger
 
 __all__ = [
     # Core model
     "Accumulator",
     "AccumulatorSet",
+    "AccumulatorLedger",
     # Enums
     "AccumulatorType",
     "AccumulatorLevel",
@@ -140,6 +140,18 @@ class BenefitType(str, Enum):
     COMBINED = "combined"
 
 
+# Network tiers that draw on in-network accumulators
+IN_NETWORK_TIERS = frozenset(
+    {
+        NetworkTier.IN_NETWORK,
+        NetworkTier.TIER_1,
+        NetworkTier.TIER_2,
+        NetworkTier.PREFERRED_PHARMACY,
+        NetworkTier.MAIL_ORDER,
+    }
+)
+
+
 class Accumulator(BaseModel):
     """Single benefit accumulator.
 
@@ -297,6 +309,11 @@ class AccumulatorSet(BaseModel):
         rx_oop: Pharmacy OOP max (if separate from medical)
         specialty_oop: Specialty drug OOP (if separate limit)
 
+    Individual limits are embedded in the family limit: an amount applies
+    to both accumulators and stops at whichever limit is reached first. A
+    set with a family accumulator but no individual one draws on the family
+    limit alone. ``AccumulatorLedger`` applies claim streams the same way.
+
     Example:
         >>> acc_set = create_medical_accumulators(
         ...     member_id="MEM-001",
@@ -350,13 +367,7 @@ class AccumulatorSet(BaseModel):
 
     def _is_in_network(self, network: NetworkTier) -> bool:
         """Check if network tier is considered in-network."""
-        return network in (
-            NetworkTier.IN_NETWORK,
-            NetworkTier.TIER_1,
-            NetworkTier.TIER_2,
-            NetworkTier.PREFERRED_PHARMACY,
-            NetworkTier.MAIL_ORDER,
-        )
+        return network in IN_NETWORK_TIERS
 
     def apply_to_deductible(
         self,
@@ -367,8 +378,8 @@ class AccumulatorSet(BaseModel):
         """Apply amount to deductible accumulators.
 
         Handles individual + family coordination:
-        - Amount applies to individual accumulator first
-        - Also applies to family accumulator (tracks aggregate)
+        - Amount applies to both individual and family accumulators
+        - It is capped by whichever has less remaining
         - Once family deductible is met, individual is considered met too
 
         Args:
@@ -379,43 +390,15 @@ class AccumulatorSet(BaseModel):
         Returns:
             Tuple of (new_accumulator_set, amount_actually_applied)
         """
-        updates: dict = {}
-        total_applied = Decimal("0")
-
         # Handle pharmacy-specific deductible
         if benefit_type == BenefitType.PHARMACY and self.rx_deductible:
             new_rx_ded, applied = self.rx_deductible.apply(amount)
-            updates["rx_deductible"] = new_rx_ded
-            return self.model_copy(update=updates), applied
+            return self.model_copy(update={"rx_deductible": new_rx_ded}), applied
 
         # Select appropriate accumulators based on network
         if self._is_in_network(network):
-            ind_acc = self.deductible_individual_in
-            fam_acc = self.deductible_family_in
-            ind_key = "deductible_individual_in"
-            fam_key = "deductible_family_in"
-        else:
-            ind_acc = self.deductible_individual_out
-            fam_acc = self.deductible_family_out
-            ind_key = "deductible_individual_out"
-            fam_key = "deductible_family_out"
-
-        # Check if family deductible is already met (waives individual)
-        if fam_acc and fam_acc.met:
-            return self, Decimal("0")
-
-        # Apply to individual
-        if ind_acc and not ind_acc.met:
-            new_ind, applied = ind_acc.apply(amount)
-            updates[ind_key] = new_ind
-            total_applied = applied
-
-        # Apply to family (same amount, tracks family aggregate)
-        if fam_acc and total_applied > 0:
-            new_fam, _ = fam_acc.apply(total_applied)
-            updates[fam_key] = new_fam
-
-        return self.model_copy(update=updates), total_applied
+            return self._apply_embedded("deductible_individual_in", "deductible_family_in", amount)
+        return self._apply_embedded("deductible_individual_out", "deductible_family_out", amount)
 
     def apply_to_oop(
         self,
@@ -437,43 +420,42 @@ class AccumulatorSet(BaseModel):
         Returns:
             Tuple of (new_accumulator_set, amount_actually_applied)
         """
-        updates: dict = {}
-        total_applied = Decimal("0")
-
         # Handle pharmacy-specific OOP
         if benefit_type == BenefitType.PHARMACY and self.rx_oop:
             new_rx_oop, applied = self.rx_oop.apply(amount)
-            updates["rx_oop"] = new_rx_oop
-            return self.model_copy(update=updates), applied
+            return self.model_copy(update={"rx_oop": new_rx_oop}), applied
 
         # Select appropriate accumulators based on network
         if self._is_in_network(network):
-            ind_acc = self.oop_individual_in
-            fam_acc = self.oop_family_in
-            ind_key = "oop_individual_in"
-            fam_key = "oop_family_in"
-        else:
-            ind_acc = self.oop_individual_out
-            fam_acc = self.oop_family_out
-            ind_key = "oop_individual_out"
-            fam_key = "oop_family_out"
+            return self._apply_embedded("oop_individual_in", "oop_family_in", amount)
+        return self._apply_embedded("oop_individual_out", "oop_family_out", amount)
 
-        # Check if family OOP is already met (plan pays 100%)
-        if fam_acc and fam_acc.met:
-            return self, Decimal("0")
+    def _apply_embedded(
+        self, ind_key: str, fam_key: str, amount: Decimal
+    ) -> tuple[AccumulatorSet, Decimal]:
+        """Apply amount to an individual accumulator embedded in a family one.
 
-        # Apply to individual
-        if ind_acc and not ind_acc.met:
-            new_ind, applied = ind_acc.apply(amount)
-            updates[ind_key] = new_ind
-            total_applied = applied
+        The amount is capped by whichever accumulator has less remaining;
+        with only one of the two present, that one alone caps it.
+        """
+        ind_acc = getattr(self, ind_key)
+        fam_acc = getattr(self, fam_key)
+        if ind_acc is None and fam_acc is None:
+            return self, Decimal("0")
 
-        # Apply to family
-        if fam_acc and total_applied > 0:
-            new_fam, _ = fam_acc.apply(total_applied)
-            updates[fam_key] = new_fam
+        applicable = amount
+        for acc in (ind_acc, fam_acc):
+            if acc is not None:
+                applicable = min(applicable, acc.remaining)
+        # A met family limit waives the individual one
+        if applicable <= 0:
+            return self, Decimal("0")
 
-        return self.model_copy(update=updates), total_applied
+        updates: dict = {}
+        for key, acc in ((ind_key, ind_acc), (fam_key, fam_acc)):
+            if acc is not None:
+                updates[key], _ = acc.apply(applicable)
+        return self.model_copy(update=updates), applicable
 
     def apply_to_specialty_oop(self, amount: Decimal) -> tuple[AccumulatorSet, Decimal]:
         """Apply amount to specialty drug OOP accumulator.
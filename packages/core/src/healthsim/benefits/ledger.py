@@ -0,0 +1,464 @@
+"""Array-backed accumulator ledger.
+
+``AccumulatorSet`` is immutable: every amount applied copies the set and the
+accumulators it touches, which adds up to millions of models over a plan
+year of claims. ``AccumulatorLedger`` holds the same balances for many
+members in integer cent arrays, updated in place, and applies whole claim
+streams at once. Snapshots convert balances back to ``AccumulatorSet``
+models on demand.
+
+Members of a family share family-level accumulators. Individual limits are
+embedded in the family limit: a claim draws on the member's individual
+accumulator and on the family accumulator, and stops at whichever is
+reached first. A member with a family accumulator but no individual one
+draws on the family limit alone (a non-embedded, aggregate limit).
+
+Example:
+    >>> from healthsim.benefits import AccumulatorLedger, create_medical_accumulators
+    >>> sets = [
+    ...     create_medical_accumulators(member_id, 2024, Decimal("500"), Decimal("1000"),
+    ...                                 Decimal("3000"), Decimal("6000"))
+    ...     for member_id in ("MEM-001", "MEM-002", "MEM-003")
+    ... ]
+    >>> ledger = AccumulatorLedger(sets, family_ids={m.member_id: "FAM-1" for m in sets})
+    >>> ledger.apply_to_deductible(["MEM-001", "MEM-002", "MEM-003"], [600, 400, 300])
+    array([500., 400., 100.])
+    >>> ledger.snapshot("MEM-003").deductible_family_in.met
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+
+from healthsim.benefits.accumulators import (
+    IN_NETWORK_TIERS,
+    AccumulatorSet,
+    BenefitType,
+    NetworkTier,
+)
+
+# AccumulatorSet fields held per member, in ledger column order
+INDIVIDUAL_FIELDS = (
+    "deductible_individual_in",
+    "deductible_individual_out",
+    "oop_individual_in",
+    "oop_individual_out",
+    "rx_deductible",
+    "rx_oop",
+    "specialty_oop",
+)
+
+# AccumulatorSet fields held per family, in ledger column order
+FAMILY_FIELDS = (
+    "deductible_family_in",
+    "deductible_family_out",
+    "oop_family_in",
+    "oop_family_out",
+)
+
+# Limit recorded for an accumulator the member's set does not have
+_ABSENT = -1
+
+# Room left under an absent limit, large enough never to cap a plan year
+_UNLIMITED = np.iinfo(np.int64).max // 4
+
+# Ledger columns per accumulator kind: (individual in, individual out, family in,
+# family out, carved-out pharmacy)
+_COLUMNS = {
+    "deductible": (0, 1, 0, 1, 4),
+    "oop": (2, 3, 2, 3, 5),
+}
+
+
+class AccumulatorLedger:
+    """Mutable benefit accumulator balances for many members.
+
+    Limits and applied amounts are stored in integer cents, indexed by
+    member (or family) and accumulator. The ``apply_to_*`` methods mirror
+    ``AccumulatorSet`` for whole claim streams: claims are applied in the
+    order given, each against the balance left by the claims before it.
+
+    Attributes:
+        plan_year: Benefit plan year of the loaded sets
+    """
+
+    def __init__(
+        self,
+        accumulator_sets: Iterable[AccumulatorSet],
+        family_ids: Mapping[str, str] | None = None,
+    ) -> None:
+        """Load balances from accumulator sets.
+
+        Family limits and amounts applied so far are taken from the first
+        member loaded for each family.
+
+        Args:
+            accumulator_sets: One set per member
+            family_ids: Family of each member_id; members without one form
+                a family of their own
+
+        Raises:
+            ValueError: If a member appears twice or the sets span plan years
+        """
+        self._sets = list(accumulator_sets)
+        family_ids = family_ids or {}
+        years = {acc_set.plan_year for acc_set in self._sets}
+        if len(years) > 1:
+            raise ValueError(f"accumulator sets must share a plan year, got {sorted(years)}")
+        self.plan_year = years.pop() if years else None
+
+        self._index: dict[str, int] = {}
+        family_index: dict[str, int] = {}
+        family_rows = []
+        family_sources: list[AccumulatorSet] = []
+        for row, acc_set in enumerate(self._sets):
+            if acc_set.member_id in self._index:
+                raise ValueError(f"duplicate member_id '{acc_set.member_id}'")
+            self._index[acc_set.member_id] = row
+            family_id = family_ids.get(acc_set.member_id, f"member:{acc_set.member_id}")
+            if family_id not in family_index:
+                family_index[family_id] = len(family_sources)
+                family_sources.append(acc_set)
+            family_rows.append(family_index[family_id])
+
+        self._family = np.array(family_rows, dtype=np.intp)
+        self._limits, self._applied = _load(self._sets, INDIVIDUAL_FIELDS)
+        self._family_limits, self._family_applied = _load(family_sources, FAMILY_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def __contains__(self, member_id: object) -> bool:
+        return member_id in self._index
+
+    def apply_to_deductible(
+        self,
+        member_ids: Sequence[str],
+        amounts: Sequence[Decimal | float] | np.ndarray,
+        network: NetworkTier | Sequence[NetworkTier] = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType | Sequence[BenefitType] = BenefitType.COMBINED,
+    ) -> np.ndarray:
+        """Apply claim amounts to deductible accumulators, in order.
+
+        Pharmacy claims draw on the member's carved-out Rx deductible when
+        they have one, like ``AccumulatorSet.apply_to_deductible``.
+
+        Args:
+            member_ids: Member of each claim
+            amounts: Amount of each claim, in dollars
+            network: Network tier of every claim, or of each claim
+            benefit_type: Benefit type of every claim, or of each claim
+
+        Returns:
+            Amount applied for each claim, in dollars
+        """
+        return self._apply("deductible", member_ids, amounts, network, benefit_type)
+
+    def apply_to_oop(
+        self,
+        member_ids: Sequence[str],
+        amounts: Sequence[Decimal | float] | np.ndarray,
+        network: NetworkTier | Sequence[NetworkTier] = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType | Sequence[BenefitType] = BenefitType.COMBINED,
+    ) -> np.ndarray:
+        """Apply claim amounts to out-of-pocket accumulators, in order.
+
+        Amounts applied to the deductible should be applied here as well,
+        since deductible counts toward the out-of-pocket maximum.
+
+        Args:
+            member_ids: Member of each claim
+            amounts: Amount of each claim, in dollars
+            network: Network tier of every claim, or of each claim
+            benefit_type: Benefit type of every claim, or of each claim
+
+        Returns:
+            Amount applied for each claim, in dollars
+        """
+        return self._apply("oop", member_ids, amounts, network, benefit_type)
+
+    def apply_to_specialty_oop(
+        self,
+        member_ids: Sequence[str],
+        amounts: Sequence[Decimal | float] | np.ndarray,
+    ) -> np.ndarray:
+        """Apply claim amounts to specialty drug OOP accumulators, in order.
+
+        Args:
+            member_ids: Member of each claim
+            amounts: Amount of each claim, in dollars
+
+        Returns:
+            Amount applied for each claim (zero for members without a
+            specialty limit), in dollars
+        """
+        rows = self._rows(member_ids)
+        cents = _to_cents(amounts, len(rows))
+        column = INDIVIDUAL_FIELDS.index("specialty_oop")
+        return self._draw_columns(rows, cents, column, None) / 100
+
+    def get_remaining(
+        self,
+        member_ids: Sequence[str],
+        accumulator: str = "deductible",
+        network: NetworkTier | Sequence[NetworkTier] = NetworkTier.IN_NETWORK,
+        benefit_type: BenefitType | Sequence[BenefitType] = BenefitType.COMBINED,
+    ) -> np.ndarray:
+        """Get the amount each member can still apply before a limit is met.
+
+        Args:
+            member_ids: Members to look up
+            accumulator: "deductible" or "oop"
+            network: Network tier, for every member or for each
+            benefit_type: Benefit type, for every member or for each
+
+        Returns:
+            Remaining amount per member (the lesser of individual and family
+            room), in dollars
+        """
+        rows = self._rows(member_ids)
+        remaining = np.zeros(len(rows), dtype=np.int64)
+        for selected, column, family_column in self._route(
+            accumulator, rows, network, benefit_type
+        ):
+            member_rows = rows[selected]
+            room = _room(self._limits[member_rows, column], self._applied[member_rows, column])
+            if family_column is not None:
+                family_rows = self._family[member_rows]
+                room = np.minimum(
+                    room,
+                    _room(
+                        self._family_limits[family_rows, family_column],
+                        self._family_applied[family_rows, family_column],
+                    ),
+                )
+            remaining[selected] = np.where(room == _UNLIMITED, 0, room)
+        return remaining / 100
+
+    def reset_for_new_year(self, new_plan_year: int | None = None) -> None:
+        """Reset every applied amount to zero for a new plan year.
+
+        Args:
+            new_plan_year: New plan year (defaults to current + 1)
+        """
+        if self.plan_year is not None:
+            self.plan_year = new_plan_year or (self.plan_year + 1)
+        self._applied[:] = 0
+        self._family_applied[:] = 0
+
+    def snapshot(self, member_id: str) -> AccumulatorSet:
+        """Export a member's current balances as an AccumulatorSet.
+
+        Args:
+            member_id: Member to export
+
+        Returns:
+            The member's AccumulatorSet with applied amounts from the ledger
+
+        Raises:
+            KeyError: If the member is not in the ledger
+        """
+        return self._snapshot(self._index[member_id])
+
+    def snapshots(self) -> Iterator[AccumulatorSet]:
+        """Export every member's balances, in load order."""
+        for row in range(len(self._sets)):
+            yield self._snapshot(row)
+
+    def _snapshot(self, row: int) -> AccumulatorSet:
+        """Build the AccumulatorSet for a ledger row."""
+        acc_set = self._sets[row]
+        family = self._family[row]
+        updates: dict = {"plan_year": self.plan_year}
+        for fields, applied in (
+            (INDIVIDUAL_FIELDS, self._applied[row]),
+            (FAMILY_FIELDS, self._family_applied[family]),
+        ):
+            for field_name, cents in zip(fields, applied.tolist(), strict=True):
+                accumulator = getattr(acc_set, field_name)
+                if accumulator is None:
+                    continue
+                amount = Decimal(cents).scaleb(-2)
+                if amount == accumulator.applied and self.plan_year == accumulator.plan_year:
+                    continue
+                updates[field_name] = accumulator.model_copy(
+                    update={
+                        "applied": amount,
+                        "plan_year": self.plan_year,
+                        "last_updated": date.today(),
+                    }
+                )
+        return acc_set.model_copy(update=updates)
+
+    def _apply(
+        self,
+        accumulator: str,
+        member_ids: Sequence[str],
+        amounts: Sequence[Decimal | float] | np.ndarray,
+        network: NetworkTier | Sequence[NetworkTier],
+        benefit_type: BenefitType | Sequence[BenefitType],
+    ) -> np.ndarray:
+        """Apply amounts to deductible or OOP accumulators."""
+        rows = self._rows(member_ids)
+        cents = _to_cents(amounts, len(rows))
+        applied = np.zeros(len(rows), dtype=np.int64)
+        for selected, column, family_column in self._route(
+            accumulator, rows, network, benefit_type
+        ):
+            applied[selected] = self._draw_columns(
+                rows[selected], cents[selected], column, family_column
+            )
+        return applied / 100
+
+    def _route(
+        self,
+        accumulator: str,
+        rows: np.ndarray,
+        network: NetworkTier | Sequence[NetworkTier],
+        benefit_type: BenefitType | Sequence[BenefitType],
+    ) -> Iterator[tuple[np.ndarray, int, int | None]]:
+        """Split claims by the accumulators they draw on.
+
+        Yields:
+            ``(claim mask, individual column, family column or None)``
+        """
+        if accumulator not in _COLUMNS:
+            raise ValueError(
+                f"accumulator must be one of {', '.join(_COLUMNS)}, got '{accumulator}'"
+            )
+        ind_in, ind_out, fam_in, fam_out, rx = _COLUMNS[accumulator]
+        in_network = _per_claim(network, len(rows), lambda tier: tier in IN_NETWORK_TIERS)
+        carved_out = _per_claim(
+            benefit_type, len(rows), lambda benefit: benefit == BenefitType.PHARMACY
+        ) & (self._limits[rows, rx] != _ABSENT)
+
+        yield carved_out, rx, None
+        yield ~carved_out & in_network, ind_in, fam_in
+        yield ~carved_out & ~in_network, ind_out, fam_out
+
+    def _draw_columns(
+        self,
+        rows: np.ndarray,
+        cents: np.ndarray,
+        column: int,
+        family_column: int | None,
+    ) -> np.ndarray:
+        """Draw claims against one individual and one family column, in place."""
+        if not len(rows):
+            return np.zeros(0, dtype=np.int64)
+
+        has_individual = self._limits[:, column] != _ABSENT
+        drawn = _draw(
+            rows, cents, _room(self._limits[:, column], self._applied[:, column])
+        )
+        if family_column is not None:
+            families = self._family[rows]
+            has_family = self._family_limits[families, family_column] != _ABSENT
+            if has_family.any():
+                family_room = _room(
+                    self._family_limits[:, family_column],
+                    self._family_applied[:, family_column],
+                )
+                # Individual draws are already capped, and any claim the family
+                # limit cuts short is the last with a non-zero draw, so capping
+                # the capped amounts again gives the embedded result
+                drawn[has_family] = _draw(families[has_family], drawn[has_family], family_room)
+                np.add.at(
+                    self._family_applied[:, family_column],
+                    families[has_family],
+                    drawn[has_family],
+                )
+            drawn[~has_individual[rows] & ~has_family] = 0
+        else:
+            drawn[~has_individual[rows]] = 0
+
+        np.add.at(self._applied[:, column], rows, np.where(has_individual[rows], drawn, 0))
+        return drawn
+
+    def _rows(self, member_ids: Sequence[str]) -> np.ndarray:
+        """Look up the ledger row of each member."""
+        try:
+            return np.fromiter(
+                (self._index[member_id] for member_id in member_ids),
+                dtype=np.intp,
+                count=len(member_ids),
+            )
+        except KeyError as e:
+            raise ValueError(f"member_id {e} is not in the ledger") from None
+
+
+def _load(
+    acc_sets: list[AccumulatorSet], fields: tuple[str, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read limits and applied amounts, in cents, for the given fields."""
+    limits = np.full((len(acc_sets), len(fields)), _ABSENT, dtype=np.int64)
+    applied = np.zeros((len(acc_sets), len(fields)), dtype=np.int64)
+    for row, acc_set in enumerate(acc_sets):
+        for column, field_name in enumerate(fields):
+            accumulator = getattr(acc_set, field_name)
+            if accumulator is not None:
+                limits[row, column] = _cents(accumulator.limit)
+                applied[row, column] = _cents(accumulator.applied)
+    return limits, applied
+
+
+def _cents(amount: Decimal) -> int:
+    """Convert a dollar amount to whole cents."""
+    return int((amount * 100).to_integral_value())
+
+
+def _to_cents(amounts: Sequence[Decimal | float] | np.ndarray, count: int) -> np.ndarray:
+    """Convert claim amounts in dollars to an array of cents."""
+    values = np.asarray(amounts, dtype=float)
+    if values.shape != (count,):
+        raise ValueError(f"amounts must have one value per member_id, got shape {values.shape}")
+    if (values < 0).any():
+        raise ValueError("amounts must be non-negative")
+    return np.rint(values * 100).astype(np.int64)
+
+
+def _per_claim(value, count: int, test) -> np.ndarray:
+    """Evaluate a test for a scalar or per-claim value as a boolean array."""
+    if isinstance(value, str):
+        return np.full(count, test(value))
+    return np.fromiter((test(item) for item in value), dtype=bool, count=count)
+
+
+def _room(limits: np.ndarray, applied: np.ndarray) -> np.ndarray:
+    """Room left under each limit, unlimited where there is no limit."""
+    return np.where(limits == _ABSENT, _UNLIMITED, np.maximum(limits - applied, 0))
+
+
+def _draw(keys: np.ndarray, amounts: np.ndarray, room: np.ndarray) -> np.ndarray:
+    """Cap amounts, in order, by the room left under each key's limit.
+
+    Args:
+        keys: Row of each amount in ``room``
+        amounts: Amounts to draw, in claim order
+        room: Room left per row
+
+    Returns:
+        Amount drawn for each claim
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_amounts = amounts[order]
+
+    starts = np.ones(len(sorted_keys), dtype=bool)
+    starts[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    total = np.cumsum(sorted_amounts)
+    before_group = (total - sorted_amounts)[starts]
+    running = total - before_group[np.cumsum(starts) - 1]
+
+    capped = np.minimum(running, room[sorted_keys])
+    drawn = np.diff(capped, prepend=0)
+    drawn[starts] = capped[starts]
+
+    result = np.empty_like(drawn)
+    result[order] = drawn
+    return result
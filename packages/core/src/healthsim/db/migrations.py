@@ -257,6 +257,18 @@ MIGRATIONS: List[Tuple[str, str, str]] = [
         DROP INDEX IF EXISTS idx_scenario_tags_scenario;
         DROP INDEX IF EXISTS idx_scenario_tags_tag;
     """),
+    
+    # Materialized per-cohort statistics for summary generation
+    ("1.8", "Add cohort_stats table for incremental cohort summaries", """
+        CREATE TABLE IF NOT EXISTS cohort_stats (
+            cohort_id       VARCHAR NOT NULL,
+            entity_type     VARCHAR NOT NULL,
+            entity_count    BIGINT NOT NULL DEFAULT 0,
+            statistics      JSON,
+            updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (cohort_id, entity_type)
+        );
+    """),
 ]
 
 
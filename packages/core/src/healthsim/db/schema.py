@@ -9,7 +9,7 @@ from typing import List
 import duckdb
 
 # Current schema version
-SCHEMA_VERSION = "1.7"
+SCHEMA_VERSION = "1.8"
 
 # Standard provenance columns included in all canonical tables
 PROVENANCE_COLUMNS = """
@@ -69,6 +69,17 @@ CREATE TABLE IF NOT EXISTS cohort_entities (
 );
 """
 
+COHORT_STATS_DDL = """
+CREATE TABLE IF NOT EXISTS cohort_stats (
+    cohort_id       VARCHAR NOT NULL,
+    entity_type     VARCHAR NOT NULL,  -- 'patients', 'claims', ... or '_cohort' marker
+    entity_count    BIGINT NOT NULL DEFAULT 0,
+    statistics      JSON,              -- Mergeable aggregates (ranges, sums, value counts)
+    updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (cohort_id, entity_type)
+);
+"""
+
 COHORT_TAGS_DDL = """
 CREATE TABLE IF NOT EXISTS cohort_tags (
     id              INTEGER PRIMARY KEY DEFAULT nextval('cohort_tags_seq'),
@@ -622,6 +633,7 @@ ALL_DDL = [
     COHORTS_DDL,
     COHORT_ENTITIES_DDL,
     COHORT_TAGS_DDL,
+    COHORT_STATS_DDL,
     
     # Profile management tables
     PROFILES_SEQ_DDL,
@@ -693,7 +705,7 @@ def get_canonical_tables() -> List[str]:
 
 def get_state_tables() -> List[str]:
     """Get list of state management table names."""
-    return ['cohorts', 'cohort_entities', 'cohort_tags']
+    return ['cohorts', 'cohort_entities', 'cohort_tags', 'cohort_stats']
 
 
 def get_system_tables() -> List[str]:
@@ -15,6 +15,11 @@ Components:
       US federal holidays for time-based analytics.
     - BaseDimensionalTransformer: Abstract base class for product-specific
       transformers (PatientSim, MemberSim, RxMemberSim).
+    - SQLDimensionalTransformer: Abstract base class for columnar
+      transformers that run as DuckDB SQL over the canonical tables.
+    - readmission_flags, length_of_stay, is_mortality: Utilization metrics
+      shared by encounter and inpatient claim facts, with SQL equivalents
+      (readmission_flags_sql, ...).
     - BaseDimensionalWriter: Abstract base class for target writers.
     - DuckDBDimensionalWriter: Write dimensional tables to DuckDB for
       fast local analytics.
@@ -46,8 +51,23 @@ For product-specific transformers, see:
 
 from __future__ import annotations
 
-from healthsim.dimensional.generators.dim_date import generate_dim_date
+from healthsim.dimensional.generators.dim_date import (
+    clear_dim_date_cache,
+    generate_dim_date,
+)
 from healthsim.dimensional.transformers.base import BaseDimensionalTransformer
+from healthsim.dimensional.transformers.sql import SQLDimensionalTransformer
+from healthsim.dimensional.transformers.utilization import (
+    MORTALITY_KEYWORDS,
+    READMISSION_WINDOWS,
+    is_mortality,
+    is_mortality_sql,
+    length_of_stay,
+    length_of_stay_days_sql,
+    length_of_stay_hours_sql,
+    readmission_flags,
+    readmission_flags_sql,
+)
 from healthsim.dimensional.writers.base import BaseDimensionalWriter
 from healthsim.dimensional.writers.duckdb_writer import DuckDBDimensionalWriter
 from healthsim.dimensional.writers.registry import WriterRegistry
@@ -55,8 +75,20 @@ from healthsim.dimensional.writers.registry import WriterRegistry
 __all__ = [
     # Generators
     "generate_dim_date",
+    "clear_dim_date_cache",
     # Transformers
     "BaseDimensionalTransformer",
+    "SQLDimensionalTransformer",
+    # Utilization metrics
+    "MORTALITY_KEYWORDS",
+    "READMISSION_WINDOWS",
+    "is_mortality",
+    "is_mortality_sql",
+    "length_of_stay",
+    "length_of_stay_days_sql",
+    "length_of_stay_hours_sql",
+    "readmission_flags",
+    "readmission_flags_sql",
     # Writers
     "BaseDimensionalWriter",
     "DuckDBDimensionalWriter",
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from .dim_date import generate_dim_date
+from .dim_date import clear_dim_date_cache, generate_dim_date
 
 __all__ = [
+    "clear_dim_date_cache",
     "generate_dim_date",
 ]
@@ -7,13 +7,42 @@ including comprehensive date attributes and US federal holiday flags.
 from __future__ import annotations
 
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
     pass
 
+# Number of distinct date ranges kept by the dim_date cache
+DIM_DATE_CACHE_SIZE = 32
+
+# English names, independent of the process locale
+_DAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    dtype=object,
+)
+_MONTH_NAMES = np.array(
+    [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ],
+    dtype=object,
+)
+_QUARTER_NAMES = np.array(["Q1", "Q2", "Q3", "Q4"], dtype=object)
+
 
 def _parse_date(d: str | date) -> date:
     """Parse a date string or return a date object."""
@@ -150,6 +179,7 @@ def _get_us_federal_holidays(year: int) -> dict[date, str]:
 def generate_dim_date(
     start_date: str | date = "2020-01-01",
     end_date: str | date = "2030-12-31",
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """Generate a date dimension table with US federal holidays.
 
@@ -157,11 +187,17 @@ def generate_dim_date(
     plus US federal holiday flags. This is suitable for use in star schema
     dimensional models.
 
+    Columns are computed with vectorized pandas/NumPy operations, and
+    results are kept in an LRU cache keyed on the date range; each call
+    returns its own copy, so repeated calls for the same range cost only a
+    DataFrame copy.
+
     Args:
         start_date: Start date (inclusive) as ISO string or date object.
             Defaults to '2020-01-01'.
         end_date: End date (inclusive) as ISO string or date object.
             Defaults to '2030-12-31'.
+        use_cache: Whether to serve/store the result in the LRU cache.
 
     Returns:
         DataFrame with one row per date and the following columns:
@@ -204,71 +240,87 @@ def generate_dim_date(
     if start > end:
         raise ValueError(f"start_date ({start}) must be <= end_date ({end})")
 
-    # Pre-compute all holidays for the date range
+    if not use_cache:
+        return _build_dim_date(start, end)
+    # Hand out a copy so callers can't mutate the cached frame
+    return _cached_dim_date(start, end).copy()
+
+
+@lru_cache(maxsize=DIM_DATE_CACHE_SIZE)
+def _cached_dim_date(start: date, end: date) -> pd.DataFrame:
+    """LRU-cached _build_dim_date, keyed on the (start, end) range."""
+    return _build_dim_date(start, end)
+
+
+def clear_dim_date_cache() -> None:
+    """Drop all cached date dimensions."""
+    _cached_dim_date.cache_clear()
+
+
+def _build_dim_date(start: date, end: date) -> pd.DataFrame:
+    """Build the date dimension with column-wise NumPy operations."""
+    index = pd.date_range(start, end, freq="D")
+    n = len(index)
+
+    year = index.year.to_numpy(dtype=np.int64)
+    month = index.month.to_numpy(dtype=np.int64)
+    day = index.day.to_numpy(dtype=np.int64)
+    weekday = index.dayofweek.to_numpy(dtype=np.int64)  # 0=Monday
+    quarter = (month - 1) // 3 + 1
+
+    # Year-month / year-quarter labels: format once per distinct period
+    month_code = (year - start.year) * 12 + (month - 1)
+    month_labels = np.array(
+        [f"{start.year + c // 12}-{c % 12 + 1:02d}" for c in range(month_code[-1] + 1)],
+        dtype=object,
+    )
+    quarter_code = (year - start.year) * 4 + (quarter - 1)
+    quarter_labels = np.array(
+        [f"{start.year + c // 4}-Q{c % 4 + 1}" for c in range(quarter_code[-1] + 1)],
+        dtype=object,
+    )
+
+    # Join holiday names from the precomputed per-year holiday map
     all_holidays: dict[date, str] = {}
-    for year in range(start.year, end.year + 1):
-        all_holidays.update(_get_us_federal_holidays(year))
-
-    # Generate date range
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current)
-        current += timedelta(days=1)
-
-    # Build data rows
-    rows = []
-    for d in dates:
-        # Get next month's first day for month_end calculation
-        if d.month == 12:
-            next_month_first = date(d.year + 1, 1, 1)
-        else:
-            next_month_first = date(d.year, d.month + 1, 1)
-
-        is_month_end = d == next_month_first - timedelta(days=1)
-
-        # Quarter calculations
-        quarter = (d.month - 1) // 3 + 1
-        quarter_start_month = (quarter - 1) * 3 + 1
-        quarter_end_month = quarter * 3
-
-        is_quarter_start = d.month == quarter_start_month and d.day == 1
-
-        if quarter_end_month == 12:
-            quarter_end_date = date(d.year, 12, 31)
-        else:
-            quarter_end_date = date(d.year, quarter_end_month + 1, 1) - timedelta(days=1)
-        is_quarter_end = d == quarter_end_date
-
-        # Holiday info
-        holiday_name = all_holidays.get(d)
-        is_holiday = holiday_name is not None
-
-        row = {
-            "date_key": int(d.strftime("%Y%m%d")),
-            "full_date": d,
-            "year": d.year,
+    for y in range(start.year, end.year + 1):
+        all_holidays.update(_get_us_federal_holidays(y))
+    holiday_name = np.full(n, None, dtype=object)
+    for holiday_date, name in all_holidays.items():
+        offset = (holiday_date - start).days
+        if 0 <= offset < n:
+            holiday_name[offset] = name
+    is_holiday = holiday_name != None  # noqa: E711 - elementwise comparison
+
+    is_month_start = day == 1
+    is_month_end = index.is_month_end
+    is_quarter_start = is_month_start & ((month - 1) % 3 == 0)
+
+    # String columns are passed as lists so pandas infers their dtype the
+    # same way it does for the row-wise construction
+    return pd.DataFrame(
+        {
+            "date_key": year * 10000 + month * 100 + day,
+            "full_date": index.date,
+            "year": year,
             "quarter": quarter,
-            "month": d.month,
-            "day": d.day,
-            "day_of_week": d.isoweekday(),  # 1=Monday, 7=Sunday (ISO)
-            "day_of_year": d.timetuple().tm_yday,
-            "week_of_year": d.isocalendar()[1],
-            "day_name": d.strftime("%A"),
-            "month_name": d.strftime("%B"),
-            "quarter_name": f"Q{quarter}",
-            "year_month": d.strftime("%Y-%m"),
-            "year_quarter": f"{d.year}-Q{quarter}",
-            "is_weekend": d.weekday() >= 5,
-            "is_month_start": d.day == 1,
-            "is_month_end": is_month_end,
+            "month": month,
+            "day": day,
+            "day_of_week": weekday + 1,  # 1=Monday, 7=Sunday (ISO)
+            "day_of_year": index.dayofyear.to_numpy(dtype=np.int64),
+            "week_of_year": index.isocalendar()["week"].to_numpy(dtype=np.int64),
+            "day_name": _DAY_NAMES[weekday].tolist(),
+            "month_name": _MONTH_NAMES[month - 1].tolist(),
+            "quarter_name": _QUARTER_NAMES[quarter - 1].tolist(),
+            "year_month": month_labels[month_code].tolist(),
+            "year_quarter": quarter_labels[quarter_code].tolist(),
+            "is_weekend": weekday >= 5,
+            "is_month_start": is_month_start,
+            "is_month_end": np.asarray(is_month_end),
             "is_quarter_start": is_quarter_start,
-            "is_quarter_end": is_quarter_end,
-            "is_year_start": d.month == 1 and d.day == 1,
-            "is_year_end": d.month == 12 and d.day == 31,
+            "is_quarter_end": np.asarray(index.is_quarter_end),
+            "is_year_start": is_month_start & (month == 1),
+            "is_year_end": (month == 12) & (day == 31),
             "is_us_federal_holiday": is_holiday,
-            "holiday_name": holiday_name,
+            "holiday_name": holiday_name.tolist(),
         }
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+    )
@@ -1,9 +1,32 @@
-"""Base transformer for dimensional model transformations."""
+"""Base transformers for dimensional model transformations."""
 
 from __future__ import annotations
 
 from .base import BaseDimensionalTransformer
+from .sql import SQLDimensionalTransformer
+from .utilization import (
+    MORTALITY_KEYWORDS,
+    READMISSION_WINDOWS,
+    is_mortality,
+    is_mortality_sql,
+    length_of_stay,
+    length_of_stay_days_sql,
+    length_of_stay_hours_sql,
+    readmission_flags,
+    readmission_flags_sql,
+)
 
 __all__ = [
     "BaseDimensionalTransformer",
+    "SQLDimensionalTransformer",
+    # Utilization metrics
+    "MORTALITY_KEYWORDS",
+    "READMISSION_WINDOWS",
+    "is_mortality",
+    "is_mortality_sql",
+    "length_of_stay",
+    "length_of_stay_days_sql",
+    "length_of_stay_hours_sql",
+    "readmission_flags",
+    "readmission_flags_sql",
 ]
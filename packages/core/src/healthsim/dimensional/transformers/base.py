@@ -38,8 +38,23 @@ class BaseDimensionalTransformer(ABC):
         ...             {'dim_patient': dim_patient},
         ...             {'fact_encounter': fact_encounters}
         ...         )
+
+    Class Attributes:
+        NATURAL_KEYS: Columns identifying a row across runs, per table.
+            Tables listed here can be loaded incrementally with
+            ``DuckDBDimensionalWriter.write_dimensional_model(if_exists='merge')``;
+            tables keyed only by positional surrogates are left out.
+        SURROGATE_KEYS: Positional surrogate key column of each lookup
+            dimension listed in NATURAL_KEYS. Merges keep the surrogate
+            already stored for a natural key and number new rows after it.
+        FOREIGN_KEYS: Per table, surrogate key column -> dimension it
+            references, so merged batches can be re-keyed to match.
     """
 
+    NATURAL_KEYS: dict[str, tuple[str, ...]] = {}
+    SURROGATE_KEYS: dict[str, str] = {}
+    FOREIGN_KEYS: dict[str, dict[str, str]] = {}
+
     @abstractmethod
     def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
         """Transform canonical entities to dimensional model.
@@ -0,0 +1,356 @@
+"""SQL-native base transformer for dimensional model transformations.
+
+Product transformers built on ``BaseDimensionalTransformer`` walk lists of
+canonical model objects and append one dict per row. This module provides the
+columnar alternative: the star schema is expressed as DuckDB SQL over the
+canonical tables (``patients``, ``encounters``, ``claims``, ...) and is
+returned as Arrow tables, pandas DataFrames, or materialized in place without
+ever creating a Python object per row.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from datetime import date, datetime
+from typing import Any
+
+import pandas as pd
+
+from healthsim.dimensional.writers.duckdb_writer import (
+    insert_new_rows_sql,
+    rekey_sql,
+    surrogate_key_map_sql,
+)
+
+from .base import BaseDimensionalTransformer
+
+# ICD-10-CM chapter categories by first character, as used by the
+# PatientSim and MemberSim diagnosis dimensions.
+ICD10_CATEGORIES = {
+    "A": "Infectious",
+    "B": "Infectious",
+    "C": "Neoplasm",
+    "D": "Neoplasm/Blood",
+    "E": "Endocrine/Metabolic",
+    "F": "Mental/Behavioral",
+    "G": "Nervous System",
+    "H": "Eye/Ear",
+    "I": "Circulatory",
+    "J": "Respiratory",
+    "K": "Digestive",
+    "L": "Skin",
+    "M": "Musculoskeletal",
+    "N": "Genitourinary",
+    "O": "Pregnancy",
+    "P": "Perinatal",
+    "Q": "Congenital",
+    "R": "Symptoms",
+    "S": "Injury",
+    "T": "Injury/Poisoning",
+    "V": "External Causes",
+    "W": "External Causes",
+    "X": "External Causes",
+    "Y": "External Causes",
+    "Z": "Health Status",
+}
+
+
+class SQLDimensionalTransformer(BaseDimensionalTransformer):
+    """Abstract base class for transformers that run as SQL in DuckDB.
+
+    Subclasses implement ``_build_queries()``, returning one SELECT statement
+    per dimension and fact table. Each statement reads its canonical tables
+    through ``source()``, which applies the optional cohort filter and exposes
+    the table's ``rowid`` as ``_row`` so "first seen" and input-order
+    semantics of the object transformers can be reproduced with
+    ``ORDER BY _row``.
+
+    The SQL fragment helpers (``date_key_sql``, ``age_sql``, ...) mirror the
+    static utility methods of ``BaseDimensionalTransformer`` so that both
+    transform paths derive identical values.
+
+    Example:
+        >>> transformer = PatientSQLDimensionalTransformer(conn, cohort_id="c-1")
+        >>> dimensions, facts = transformer.transform()          # pandas
+        >>> dimensions, facts = transformer.transform_arrow()    # pyarrow
+        >>> counts = transformer.materialize(schema="analytics")  # in DuckDB
+    """
+
+    def __init__(
+        self,
+        conn: Any = None,
+        cohort_id: str | None = None,
+        snapshot_date: date | None = None,
+    ) -> None:
+        """Initialize the transformer.
+
+        Args:
+            conn: DuckDB connection holding the canonical tables. Defaults to
+                ``healthsim.db.get_connection()``.
+            cohort_id: Restrict every source table to this cohort. Reads all
+                rows when None.
+            snapshot_date: Date for age calculations. Defaults to today.
+        """
+        if conn is None:
+            from healthsim.db import get_connection
+
+            conn = get_connection()
+
+        self.conn = conn
+        self.cohort_id = cohort_id
+        self.snapshot_date = snapshot_date or date.today()
+        self._tables: set[str] | None = None
+
+    @abstractmethod
+    def _build_queries(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Build the SELECT statement for every table that can be produced.
+
+        Returns:
+            Tuple of (dimension queries, fact queries), each mapping table
+            name to SQL. Tables whose canonical sources are missing or empty
+            should be left out.
+        """
+
+    def transform(self) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+        """Run the transformation and return pandas DataFrames.
+
+        Returns:
+            Tuple of (dimensions dict, facts dict) where each dict maps
+            table names to DataFrames.
+        """
+        dimension_sql, fact_sql = self._build_queries()
+        dimensions = {name: self.query(sql).df() for name, sql in dimension_sql.items()}
+        facts = {name: self.query(sql).df() for name, sql in fact_sql.items()}
+        return dimensions, facts
+
+    def transform_arrow(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run the transformation and return ``pyarrow.Table`` objects.
+
+        Requires pyarrow (``pip install healthsim-core[arrow]``).
+
+        Returns:
+            Tuple of (dimensions dict, facts dict) where each dict maps
+            table names to Arrow tables.
+        """
+        dimension_sql, fact_sql = self._build_queries()
+        dimensions = {name: self._fetch_arrow(sql) for name, sql in dimension_sql.items()}
+        facts = {name: self._fetch_arrow(sql) for name, sql in fact_sql.items()}
+        return dimensions, facts
+
+    def materialize(self, schema: str = "analytics", if_exists: str = "replace") -> dict[str, int]:
+        """Create the star schema as tables in the source database.
+
+        Data never leaves DuckDB.
+
+        Args:
+            schema: Target schema, created if missing.
+            if_exists: 'replace' to recreate existing tables, or 'merge' to
+                insert only rows whose ``NATURAL_KEYS`` are new. Tables
+                without natural keys are always replaced. Lookup dimensions
+                in ``SURROGATE_KEYS`` keep their stored keys, and columns
+                in ``FOREIGN_KEYS`` are re-keyed to match.
+
+        Returns:
+            Dict mapping each table written to its row count, or to the
+            rows inserted for merged tables.
+
+        Raises:
+            ValueError: If if_exists is not 'replace' or 'merge'.
+        """
+        if if_exists not in ("replace", "merge"):
+            raise ValueError(f"if_exists must be 'replace' or 'merge', got '{if_exists}'")
+
+        dimension_sql, fact_sql = self._build_queries()
+        self.conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        existing = {
+            row[0]
+            for row in self.conn.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_schema = ?",
+                [schema],
+            ).fetchall()
+        }
+
+        counts: dict[str, int] = {}
+        key_maps: dict[str, str] = {}
+        try:
+            for name, sql in {**dimension_sql, **fact_sql}.items():
+                keys = self.NATURAL_KEYS.get(name) if if_exists == "merge" else None
+                columns = {
+                    col: key_maps[dim]
+                    for col, dim in self.FOREIGN_KEYS.get(name, {}).items()
+                    if dim in key_maps
+                }
+                surrogate = self.SURROGATE_KEYS.get(name)
+                if keys and name in existing and surrogate:
+                    key_maps[name] = columns[surrogate] = f"_key_map_{name}"
+                    key_map_sql = surrogate_key_map_sql(
+                        f"{schema}.{name}", f"({sql})", surrogate, keys
+                    )
+                    self.query(f"CREATE OR REPLACE TEMP TABLE {key_maps[name]} AS {key_map_sql}")
+                if columns:
+                    sql = rekey_sql(f"({sql})", columns)
+
+                if keys and name in existing:
+                    merge = insert_new_rows_sql(f"{schema}.{name}", f"({sql})", keys)
+                    counts[name] = self.query(merge).fetchone()[0]
+                    continue
+                self.query(f"CREATE OR REPLACE TABLE {schema}.{name} AS {sql}")
+                counts[name] = self.conn.execute(
+                    f"SELECT COUNT(*) FROM {schema}.{name}"
+                ).fetchone()[0]
+        finally:
+            for key_map in key_maps.values():
+                self.conn.execute(f"DROP TABLE IF EXISTS {key_map}")
+        return counts
+
+    def watermark(self) -> datetime | None:
+        """Latest ``updated_at`` of the source cohort, or of all cohorts.
+
+        Pass this as the ``watermark`` of
+        ``DuckDBDimensionalWriter.write_dimensional_model`` so tables are
+        only reloaded after the cohort changes.
+        """
+        if not self.has_table("cohorts"):
+            return None
+        where = " WHERE id = $cohort_id" if self.cohort_id is not None else ""
+        return self.query(f"SELECT max(updated_at) FROM cohorts{where}").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # Source Access
+    # -------------------------------------------------------------------------
+
+    def has_table(self, table_name: str) -> bool:
+        """Check whether a canonical table exists in the current schema."""
+        if self._tables is None:
+            rows = self.conn.execute(
+                """
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = current_schema()
+                """
+            ).fetchall()
+            self._tables = {row[0] for row in rows}
+        return table_name in self._tables
+
+    def has_rows(self, table_name: str, where: str | None = None) -> bool:
+        """Check whether a canonical table exists and has rows in scope.
+
+        Args:
+            table_name: Canonical table name.
+            where: Optional SQL condition the rows must also satisfy.
+        """
+        if not self.has_table(table_name):
+            return False
+        condition = f" WHERE {where}" if where else ""
+        sql = f"SELECT 1 FROM {self.source(table_name)}{condition} LIMIT 1"
+        return self.query(sql).fetchone() is not None
+
+    def source(self, table_name: str) -> str:
+        """Return a subquery over a canonical table, filtered to the cohort.
+
+        The subquery adds ``_row`` (the table's rowid) for order-preserving
+        window functions and ordered aggregates.
+        """
+        where = " WHERE cohort_id = $cohort_id" if self.cohort_id is not None else ""
+        return f"(SELECT *, rowid AS _row FROM {table_name}{where})"
+
+    def query(self, sql: str) -> Any:
+        """Execute SQL on the source connection, binding the cohort filter."""
+        if "$cohort_id" in sql:
+            return self.conn.execute(sql, {"cohort_id": self.cohort_id})
+        return self.conn.execute(sql)
+
+    def _fetch_arrow(self, sql: str) -> Any:
+        """Fetch a query result as a ``pyarrow.Table``."""
+        result = self.query(sql)
+        # Newer DuckDB releases deprecate fetch_arrow_table() for to_arrow_table().
+        fetch = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+        return fetch()
+
+    # -------------------------------------------------------------------------
+    # SQL Fragment Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def literal_sql(value: Any) -> str:
+        """Render a Python value as a SQL literal.
+
+        Examples:
+            >>> SQLDimensionalTransformer.literal_sql("O'Neil")
+            "'O''Neil'"
+            >>> SQLDimensionalTransformer.literal_sql(date(2024, 1, 31))
+            "DATE '2024-01-31'"
+        """
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, date):
+            return f"DATE '{value.isoformat()}'"
+        return "'" + str(value).replace("'", "''") + "'"
+
+    @classmethod
+    def case_sql(cls, expr: str, mapping: dict[str, Any], default: Any = None) -> str:
+        """Render a dict lookup as a simple CASE expression.
+
+        Equivalent to ``mapping.get(value, default)``.
+        """
+        whens = " ".join(
+            f"WHEN {cls.literal_sql(key)} THEN {cls.literal_sql(value)}"
+            for key, value in mapping.items()
+        )
+        return f"CASE {expr} {whens} ELSE {cls.literal_sql(default)} END"
+
+    @staticmethod
+    def date_key_sql(expr: str) -> str:
+        """SQL equivalent of ``date_to_key``: a date or timestamp as YYYYMMDD."""
+        return f"(year({expr}) * 10000 + month({expr}) * 100 + day({expr}))"
+
+    @classmethod
+    def age_sql(cls, dob: str, as_of: date) -> str:
+        """SQL equivalent of ``calculate_age`` as of a fixed date."""
+        before_birthday = f"(month({dob}) * 100 + day({dob}) > {as_of.month * 100 + as_of.day})"
+        return (
+            f"CASE WHEN {dob} IS NOT NULL THEN "
+            f"greatest(0, {as_of.year} - year({dob}) - CAST({before_birthday} AS INTEGER)) END"
+        )
+
+    @staticmethod
+    def age_band_sql(age: str) -> str:
+        """SQL equivalent of ``age_band``."""
+        return (
+            f"CASE WHEN {age} IS NULL OR {age} < 0 THEN NULL "
+            f"WHEN {age} <= 17 THEN '0-17' "
+            f"WHEN {age} <= 34 THEN '18-34' "
+            f"WHEN {age} <= 49 THEN '35-49' "
+            f"WHEN {age} <= 64 THEN '50-64' "
+            f"ELSE '65+' END"
+        )
+
+    @staticmethod
+    def truthy_sql(expr: str) -> str:
+        """SQL test for a non-null, non-empty string (Python truthiness)."""
+        return f"({expr} IS NOT NULL AND {expr} <> '')"
+
+    @classmethod
+    def icd10_category_sql(cls, code: str) -> str:
+        """SQL ICD-10 category from the first character of a code."""
+        category = cls.case_sql(f"upper(left({code}, 1))", ICD10_CATEGORIES, "Other")
+        return f"CASE WHEN {cls.truthy_sql(code)} THEN {category} ELSE 'Unknown' END"
+
+    @classmethod
+    def procedure_code_system_sql(cls, code: str) -> str:
+        """SQL procedure code system inferred from code format.
+
+        CPT is 5 digits, HCPCS a letter and 4 digits, ICD-10-PCS 7
+        alphanumerics.
+        """
+        trimmed = f"trim({code})"
+        return (
+            f"CASE WHEN NOT {cls.truthy_sql(code)} THEN 'Unknown' "
+            f"WHEN regexp_full_match({trimmed}, '[0-9]{{5}}') THEN 'CPT' "
+            f"WHEN regexp_full_match({trimmed}, '[A-Za-z][0-9]{{4}}') THEN 'HCPCS' "
+            f"WHEN regexp_full_match({trimmed}, '[A-Za-z0-9]{{7}}') THEN 'ICD-10-PCS' "
+            f"ELSE 'Unknown' END"
+        )
@@ -0,0 +1,175 @@
+"""Utilization metrics shared by encounter and claim fact builders.
+
+Readmission flags, length of stay and mortality are derived the same way for
+PatientSim encounters and MemberSim inpatient claims. Each metric comes in a
+Python form for the object transformers and a SQL form for the
+``SQLDimensionalTransformer`` subclasses, and both forms agree row for row.
+
+A stay is a readmission within ``N`` days when an earlier admission of the
+same patient or member was discharged 0 to ``N`` calendar days before this
+admission. Rather than comparing every pair of stays, admissions and
+discharges are swept once in date order while tracking the latest discharge
+seen, which is O(n log n) per group instead of O(k^2).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Sequence
+from datetime import date, datetime
+
+# Discharge disposition substrings that indicate the patient died.
+MORTALITY_KEYWORDS = ("expired", "died", "death", "deceased", "morgue")
+
+# Default readmission windows in days.
+READMISSION_WINDOWS = (7, 30)
+
+Stay = tuple[Hashable, date | datetime, date | datetime | None]
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def readmission_flags(
+    stays: Iterable[Stay],
+    windows: Sequence[int] = READMISSION_WINDOWS,
+) -> list[tuple[bool, ...]]:
+    """Flag each stay that is a readmission within each window.
+
+    Stays are assumed to be discharged no earlier than they are admitted,
+    which the canonical models validate.
+
+    Args:
+        stays: ``(group_key, admitted, discharged)`` per stay, where
+            ``group_key`` identifies the patient or member and
+            ``discharged`` is None for stays still open.
+        windows: Readmission windows in days.
+
+    Returns:
+        One tuple of flags per stay, in input order, with one flag per
+        window.
+
+    Example:
+        >>> readmission_flags([
+        ...     ("MRN1", date(2024, 6, 1), date(2024, 6, 5)),
+        ...     ("MRN1", date(2024, 6, 20), None),
+        ... ])
+        [(False, False), (False, True)]
+    """
+    groups: dict[Hashable, list[tuple]] = {}
+    count = 0
+    for index, (group_key, admitted, discharged) in enumerate(stays):
+        events = groups.setdefault(group_key, [])
+        # Events sort by day, then by the admission time of their stay, with
+        # admissions ahead of discharges. A discharge therefore precedes an
+        # admission exactly when it is on an earlier day, or on the same day
+        # but belongs to a stay admitted strictly earlier.
+        events.append((_as_date(admitted), admitted, 0, index))
+        if discharged is not None:
+            events.append((_as_date(discharged), admitted, 1, -1))
+        count = index + 1
+
+    no_flags = (False,) * len(windows)
+    flags = [no_flags] * count
+    for events in groups.values():
+        events.sort()
+        last_discharge: date | None = None
+        for day, _, kind, index in events:
+            if kind:
+                last_discharge = day
+            elif last_discharge is not None:
+                gap = (day - last_discharge).days
+                flags[index] = tuple(gap <= window for window in windows)
+    return flags
+
+
+def length_of_stay(
+    admitted: date | datetime,
+    discharged: date | datetime | None,
+) -> tuple[float | None, int | None]:
+    """Length of stay as ``(hours, whole days)``, or ``(None, None)`` if open.
+
+    Example:
+        >>> length_of_stay(datetime(2024, 6, 1, 10), datetime(2024, 6, 4, 14))
+        (76.0, 3)
+    """
+    if not discharged:
+        return None, None
+    delta = discharged - admitted
+    return delta.total_seconds() / 3600, delta.days
+
+
+def is_mortality(discharge_disposition: str | None) -> bool:
+    """Check whether a discharge disposition indicates death."""
+    if not discharge_disposition:
+        return False
+    disposition = discharge_disposition.lower()
+    return any(keyword in disposition for keyword in MORTALITY_KEYWORDS)
+
+
+# -----------------------------------------------------------------------------
+# SQL Forms
+# -----------------------------------------------------------------------------
+
+
+def readmission_flags_sql(
+    stays: str,
+    windows: Sequence[int] = READMISSION_WINDOWS,
+) -> str:
+    """SQL equivalent of ``readmission_flags`` as a single window query.
+
+    Args:
+        stays: Query or table with columns ``stay_id``, ``group_key``,
+            ``admitted`` and ``discharged``.
+        windows: Readmission windows in days.
+
+    Returns:
+        A SELECT yielding ``stay_id`` and one ``is_readmission_{N}_day``
+        boolean per window for every stay.
+    """
+    flags = ",\n".join(
+        f"coalesce(date_diff('day', last_discharge, day) <= {window}, false) "
+        f"AS is_readmission_{window}_day"
+        for window in windows
+    )
+    return f"""
+        WITH stays AS ({stays}),
+        events AS (
+            SELECT stay_id, group_key, CAST(admitted AS DATE) AS day, admitted,
+                   0 AS kind, NULL::DATE AS discharge_day
+            FROM stays
+            UNION ALL
+            SELECT NULL, group_key, CAST(discharged AS DATE), admitted,
+                   1, CAST(discharged AS DATE)
+            FROM stays
+            WHERE discharged IS NOT NULL
+        ),
+        swept AS (
+            SELECT stay_id, day, kind,
+                   max(discharge_day) OVER (
+                       PARTITION BY group_key ORDER BY day, admitted, kind
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                   ) AS last_discharge
+            FROM events
+        )
+        SELECT stay_id,
+        {flags}
+        FROM swept
+        WHERE kind = 0
+    """
+
+
+def length_of_stay_hours_sql(admitted: str, discharged: str) -> str:
+    """SQL equivalent of the hours from ``length_of_stay``, NULL if open."""
+    return f"(date_diff('microsecond', {admitted}, {discharged}) / 3600e6)"
+
+
+def length_of_stay_days_sql(admitted: str, discharged: str) -> str:
+    """SQL equivalent of the whole days from ``length_of_stay``, NULL if open."""
+    return f"CAST(floor(date_diff('microsecond', {admitted}, {discharged}) / 86400e6) AS BIGINT)"
+
+
+def is_mortality_sql(discharge_disposition: str) -> str:
+    """SQL equivalent of ``is_mortality``."""
+    pattern = "|".join(MORTALITY_KEYWORDS)
+    return f"coalesce(regexp_matches(lower({discharge_disposition}), '{pattern}'), false)"
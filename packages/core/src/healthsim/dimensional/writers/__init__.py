@@ -9,6 +9,10 @@ Available Writers:
     - DatabricksDimensionalWriter: Write to Databricks Unity Catalog
       (requires databricks-sql-connector)
 
+Staging:
+    - LocalParquetStager, VolumeParquetStager: Parquet staging areas for
+      bulk loads (requires pyarrow)
+
 Usage:
     >>> from healthsim.dimensional.writers import WriterRegistry, DuckDBDimensionalWriter
     >>>
@@ -29,10 +33,18 @@ from __future__ import annotations
 from healthsim.dimensional.writers.base import BaseDimensionalWriter
 from healthsim.dimensional.writers.duckdb_writer import DuckDBDimensionalWriter
 from healthsim.dimensional.writers.registry import WriterRegistry
+from healthsim.dimensional.writers.staging import (
+    LocalParquetStager,
+    ParquetStager,
+    VolumeParquetStager,
+)
 
 __all__ = [
     "BaseDimensionalWriter",
     "DuckDBDimensionalWriter",
+    "LocalParquetStager",
+    "ParquetStager",
+    "VolumeParquetStager",
     "WriterRegistry",
 ]
 
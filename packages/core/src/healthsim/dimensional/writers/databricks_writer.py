@@ -8,11 +8,20 @@ Authentication via environment variables (recommended):
     DATABRICKS_TOKEN: Personal access token
 
 Or pass explicitly to constructor.
+
+Two load modes are supported. ``insert`` (the default) sends rows through
+batched ``INSERT`` statements, which needs nothing beyond the connector.
+``parquet`` stages each table as Parquet files (see
+``healthsim.dimensional.writers.staging``) and loads them with
+``CREATE TABLE ... AS SELECT`` or ``COPY INTO``, writing several tables at
+once; use it for multi-million-row fact tables.
 """
 
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
@@ -25,6 +34,11 @@ except ImportError:
     Connection = None
 
 from healthsim.dimensional.writers.base import BaseDimensionalWriter
+from healthsim.dimensional.writers.staging import (
+    LocalParquetStager,
+    ParquetStager,
+    VolumeParquetStager,
+)
 
 if TYPE_CHECKING:
     from healthsim.config.dimensional import TargetConfig
@@ -51,16 +65,27 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         >>> with DatabricksDimensionalWriter(catalog='healthsim', schema='gold') as writer:
         ...     writer.write_table('dim_date', dim_date_df)
         ...     stats = writer.get_table_stats()
+        >>>
+        >>> # Bulk load through Parquet staged in a Unity Catalog volume
+        >>> with DatabricksDimensionalWriter(
+        ...     load_mode='parquet', staging_path='/Volumes/healthsim/gold/staging'
+        ... ) as writer:
+        ...     writer.write_dimensional_model(dimensions, facts)
 
     Attributes:
         catalog: Unity Catalog name.
         schema: Schema within catalog.
         host: Databricks workspace URL.
         http_path: SQL Warehouse HTTP path.
+        load_mode: 'insert' or 'parquet'.
+        stager: Parquet staging area used by the 'parquet' load mode.
+        max_workers: Tables written concurrently by write_dimensional_model
+            in the 'parquet' load mode.
     """
 
     TARGET_NAME = "databricks"
     REQUIRED_PACKAGES = ["databricks.sql"]
+    LOAD_MODES = ("insert", "parquet")
 
     def __init__(
         self,
@@ -69,6 +94,11 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         host: str | None = None,
         http_path: str | None = None,
         access_token: str | None = None,
+        load_mode: str = "insert",
+        staging_path: str | None = None,
+        stager: ParquetStager | None = None,
+        max_workers: int = 4,
+        connection_factory: Callable[[], Any] | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize Databricks writer.
@@ -79,6 +109,15 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
             host: Databricks workspace URL (or DATABRICKS_HOST env var).
             http_path: SQL Warehouse HTTP path (or DATABRICKS_HTTP_PATH env var).
             access_token: Personal access token (or DATABRICKS_TOKEN env var).
+            load_mode: 'insert' for batched INSERTs, 'parquet' for staged
+                Parquet bulk loads.
+            staging_path: Staging directory for the 'parquet' load mode.
+                Paths under /Volumes/ are uploaded with PUT; other paths
+                are written directly and must be readable by the warehouse.
+            stager: Explicit Parquet stager, overriding staging_path.
+            max_workers: Tables written concurrently in the 'parquet' load mode.
+            connection_factory: Callable returning a new DB-API connection.
+                Defaults to ``databricks.sql.connect`` with the credentials above.
             **kwargs: Additional arguments (ignored, for compatibility).
 
         Raises:
@@ -93,6 +132,23 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         self.access_token = access_token or os.environ.get("DATABRICKS_TOKEN")
 
         self._validate_config()
+
+        if load_mode not in self.LOAD_MODES:
+            raise ValueError(f"load_mode must be one of {', '.join(self.LOAD_MODES)}")
+        # Stagers built from staging_path are closed along with the writer
+        self._owns_stager = stager is None
+        if load_mode == "parquet" and stager is None:
+            if not staging_path:
+                raise ValueError("load_mode='parquet' requires staging_path or stager")
+            if staging_path.startswith("/Volumes/"):
+                stager = VolumeParquetStager(staging_path)
+            else:
+                stager = LocalParquetStager(staging_path)
+
+        self.load_mode = load_mode
+        self.stager = stager
+        self.max_workers = max_workers
+        self._connection_factory = connection_factory
         self._conn: Connection | None = None
 
     def _validate_config(self) -> None:
@@ -134,18 +190,33 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
             host=settings.get("host"),
             http_path=settings.get("http_path"),
             access_token=settings.get("access_token"),
+            load_mode=settings.get("load_mode", "insert"),
+            staging_path=settings.get("staging_path"),
+            max_workers=settings.get("max_workers", 4),
         )
 
     def connect(self) -> None:
         """Establish connection to Databricks."""
         if self._conn is None:
-            self._conn = databricks_sql.connect(
-                server_hostname=self.host.replace("https://", ""),
-                http_path=self.http_path,
-                access_token=self.access_token,
-            )
+            self._conn = self._open_connection()
             self._ensure_schema()
 
+    def _open_connection(self) -> Connection:
+        """Open a new connection to the SQL Warehouse."""
+        if self._connection_factory is not None:
+            return self._connection_factory()
+
+        options: dict[str, Any] = {}
+        if self.stager is not None and self.stager.local_dir:
+            # PUT uploads are only allowed from explicitly permitted paths
+            options["staging_allowed_local_path"] = self.stager.local_dir
+        return databricks_sql.connect(
+            server_hostname=self.host.replace("https://", ""),
+            http_path=self.http_path,
+            access_token=self.access_token,
+            **options,
+        )
+
     def _ensure_schema(self) -> None:
         """Create schema if it doesn't exist."""
         with self._conn.cursor() as cursor:
@@ -154,10 +225,12 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
             cursor.execute(f"USE SCHEMA {self.schema}")
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection and any stager the writer created."""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+        if self._owns_stager and self.stager is not None:
+            self.stager.close()
 
     @property
     def connection(self) -> Connection:
@@ -189,38 +262,144 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         Raises:
             ValueError: If if_exists is not 'replace' or 'append'.
         """
-        full_name = f"{self.catalog}.{self.schema}.{table_name}"
-
         if df.empty:
             return self._create_empty_table(table_name, df)
 
         with self.connection.cursor() as cursor:
-            if if_exists == "replace":
-                columns_sql = self._column_definitions(df)
+            return self._write(cursor, table_name, df, if_exists)
+
+    def write_dimensional_model(
+        self,
+        dimensions: dict[str, pd.DataFrame],
+        facts: dict[str, pd.DataFrame],
+    ) -> dict[str, int]:
+        """Write complete dimensional model (dimensions and facts).
+
+        In the 'parquet' load mode up to ``max_workers`` tables are staged
+        and loaded at once, each over its own connection. All dimensions
+        are written before any fact.
+
+        Args:
+            dimensions: Dict of dimension_name -> DataFrame.
+            facts: Dict of fact_name -> DataFrame.
+
+        Returns:
+            Dict of table_name -> row_count.
+        """
+        if self.load_mode != "parquet" or self.max_workers <= 1:
+            return super().write_dimensional_model(dimensions, facts)
+
+        # Create the schema before workers write into it
+        self.connect()
+
+        results: dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for tables in (dimensions, facts):
+                futures = {
+                    name: pool.submit(self._write_on_new_connection, name, df)
+                    for name, df in tables.items()
+                }
+                for name, future in futures.items():
+                    results[name] = future.result()
+        return results
+
+    def _write_on_new_connection(self, table_name: str, df: pd.DataFrame) -> int:
+        """Replace one table over a dedicated connection (worker thread entry)."""
+        conn = self._open_connection()
+        try:
+            with conn.cursor() as cursor:
+                if df.empty:
+                    cursor.execute(self._create_table_sql(table_name, df))
+                    return 0
+                return self._write(cursor, table_name, df, "replace")
+        finally:
+            conn.close()
+
+    def _write(self, cursor: Any, table_name: str, df: pd.DataFrame, if_exists: str) -> int:
+        """Write a non-empty DataFrame using the configured load mode.
+
+        Args:
+            cursor: Database cursor.
+            table_name: Name of the table.
+            df: DataFrame to write.
+            if_exists: 'replace' to overwrite, 'append' to add rows.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: If if_exists is not 'replace' or 'append'.
+        """
+        if if_exists not in ("replace", "append"):
+            raise ValueError("if_exists must be 'replace' or 'append'")
+
+        full_name = f"{self.catalog}.{self.schema}.{table_name}"
+        exists = if_exists == "append" and self._table_exists(cursor, table_name)
+
+        if self.load_mode == "parquet":
+            self._load_parquet(cursor, table_name, df, if_exists, exists)
+        else:
+            if not exists:
                 cursor.execute(
-                    f"""
-                    CREATE OR REPLACE TABLE {full_name} (
-                        {columns_sql}
-                    ) USING DELTA
-                """
+                    self._create_table_sql(table_name, df, replace=if_exists == "replace")
                 )
-                self._insert_data(cursor, full_name, df)
-            elif if_exists == "append":
-                if not self.table_exists(table_name):
-                    columns_sql = self._column_definitions(df)
-                    cursor.execute(
-                        f"""
-                        CREATE TABLE {full_name} (
-                            {columns_sql}
-                        ) USING DELTA
-                    """
-                    )
-                self._insert_data(cursor, full_name, df)
-            else:
-                raise ValueError("if_exists must be 'replace' or 'append'")
+            self._insert_data(cursor, full_name, df)
 
         return len(df)
 
+    def _load_parquet(
+        self,
+        cursor: Any,
+        table_name: str,
+        df: pd.DataFrame,
+        if_exists: str,
+        exists: bool,
+    ) -> None:
+        """Stage ``df`` as Parquet and load it with CTAS or COPY INTO.
+
+        Args:
+            cursor: Database cursor.
+            table_name: Name of the table.
+            df: DataFrame to load.
+            if_exists: 'replace' to overwrite, 'append' to add rows.
+            exists: Whether the table already exists (append only).
+        """
+        full_name = f"{self.catalog}.{self.schema}.{table_name}"
+        location = self.stager.stage(cursor, table_name, df)
+        try:
+            if exists:
+                cursor.execute(
+                    f"COPY INTO {full_name} FROM '{location}' FILEFORMAT = PARQUET"
+                )
+            else:
+                create = "CREATE OR REPLACE TABLE" if if_exists == "replace" else "CREATE TABLE"
+                cursor.execute(
+                    f"{create} {full_name} USING DELTA "
+                    f"AS SELECT * FROM parquet.`{location}`"
+                )
+        finally:
+            self.stager.remove(cursor, location)
+
+    def _create_table_sql(self, table_name: str, df: pd.DataFrame, replace: bool = True) -> str:
+        """Build a CREATE TABLE statement from the DataFrame's schema.
+
+        Args:
+            table_name: Name of the table.
+            df: DataFrame with schema.
+            replace: Use CREATE OR REPLACE rather than CREATE.
+
+        Returns:
+            SQL statement.
+        """
+        full_name = f"{self.catalog}.{self.schema}.{table_name}"
+        create = "CREATE OR REPLACE TABLE" if replace else "CREATE TABLE"
+        columns_sql = self._column_definitions(df)
+        return f"""
+            {create} {full_name} (
+                {columns_sql}
+            ) USING DELTA
+        """
+
     def _column_definitions(self, df: pd.DataFrame) -> str:
         """Generate SQL column definitions from DataFrame.
 
@@ -268,7 +447,9 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         placeholders = ", ".join(["%s"] * len(df.columns))
         sql = f"INSERT INTO {full_name} ({columns}) VALUES ({placeholders})"
 
-        rows = [tuple(None if pd.isna(v) else v for v in row) for row in df.values]
+        rows = list(
+            df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        )
 
         for i in range(0, len(rows), batch_size):
             cursor.executemany(sql, rows[i : i + batch_size])
@@ -283,16 +464,8 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         Returns:
             0 (no rows written).
         """
-        full_name = f"{self.catalog}.{self.schema}.{table_name}"
-        columns_sql = self._column_definitions(df)
         with self.connection.cursor() as cursor:
-            cursor.execute(
-                f"""
-                CREATE OR REPLACE TABLE {full_name} (
-                    {columns_sql}
-                ) USING DELTA
-            """
-            )
+            cursor.execute(self._create_table_sql(table_name, df))
         return 0
 
     def get_table_list(self) -> list[str]:
@@ -358,18 +531,22 @@ class DatabricksDimensionalWriter(BaseDimensionalWriter):
         """
         try:
             with self.connection.cursor() as cursor:
-                cursor.execute(
-                    f"""
-                    SELECT 1 FROM {self.catalog}.information_schema.tables
-                    WHERE table_catalog = '{self.catalog}'
-                    AND table_schema = '{self.schema}'
-                    AND table_name = '{table_name}'
-                """
-                )
-                return cursor.fetchone() is not None
+                return self._table_exists(cursor, table_name)
         except Exception:
             return False
 
+    def _table_exists(self, cursor: Any, table_name: str) -> bool:
+        """Check if table exists using the given cursor."""
+        cursor.execute(
+            f"""
+            SELECT 1 FROM {self.catalog}.information_schema.tables
+            WHERE table_catalog = '{self.catalog}'
+            AND table_schema = '{self.schema}'
+            AND table_name = '{table_name}'
+        """
+        )
+        return cursor.fetchone() is not None
+
     @property
     def full_table_prefix(self) -> str:
         """Return catalog.schema prefix.
@@ -2,10 +2,18 @@
 
 Provides a writer class for persisting dimensional model tables to DuckDB,
 which is ideal for local analytics workloads and fast SQL queries.
+
+Besides replacing or appending whole tables, the writer can load
+incrementally: ``if_exists='merge'`` inserts only rows whose natural key is
+not yet present, and per-table watermarks record how far the source had
+progressed when each table was last loaded.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +25,84 @@ from healthsim.dimensional.writers.base import BaseDimensionalWriter
 if TYPE_CHECKING:
     from healthsim.config.dimensional import TargetConfig
 
+# Table within the writer's schema holding per-table load watermarks.
+WATERMARK_TABLE = "_watermarks"
+
+
+def insert_new_rows_sql(target: str, source: str, key_columns: Sequence[str]) -> str:
+    """Build an INSERT of the ``source`` rows whose key is absent from ``target``.
+
+    DuckDB plans the correlated ``NOT EXISTS`` as a hash anti-join, so only
+    the new rows are written. NULL key values match each other.
+
+    Args:
+        target: Fully qualified target table.
+        source: Table, view or parenthesized query with the target's columns.
+        key_columns: Natural key columns.
+
+    Returns:
+        SQL statement whose result is the number of rows inserted.
+    """
+    match = " AND ".join(f"t.{col} IS NOT DISTINCT FROM s.{col}" for col in key_columns)
+    return f"""
+        INSERT INTO {target} BY NAME
+        SELECT s.* FROM {source} s
+        WHERE NOT EXISTS (SELECT 1 FROM {target} t WHERE {match})
+    """
+
+
+def surrogate_key_map_sql(
+    target: str, source: str, surrogate_key: str, key_columns: Sequence[str]
+) -> str:
+    """Build a query mapping ``source`` surrogate keys onto those of ``target``.
+
+    Lookup dimensions number their rows by position within one batch, so the
+    same natural key can carry a different surrogate in every batch. Rows
+    already in ``target`` keep their stored surrogate; new rows are numbered
+    after the largest stored one. Negative keys (the Unknown members) are
+    left as they are.
+
+    Args:
+        target: Fully qualified dimension table already loaded.
+        source: Table, view or parenthesized query with the new batch.
+        surrogate_key: Surrogate key column of the dimension.
+        key_columns: Natural key columns of the dimension.
+
+    Returns:
+        SELECT statement with columns ``batch_key`` and ``stored_key``.
+    """
+    match = " AND ".join(f"t.{col} IS NOT DISTINCT FROM s.{col}" for col in key_columns)
+    kept = f"s.{surrogate_key} < 0 OR t.{surrogate_key} IS NOT NULL"
+    return f"""
+        SELECT s.{surrogate_key} AS batch_key,
+            CASE WHEN {kept} THEN coalesce(t.{surrogate_key}, s.{surrogate_key})
+            ELSE (SELECT greatest(coalesce(max({surrogate_key}), 0), 0) FROM {target})
+                + row_number() OVER (PARTITION BY {kept} ORDER BY s.{surrogate_key})
+            END AS stored_key
+        FROM {source} s LEFT JOIN {target} t ON {match}
+    """
+
+
+def rekey_sql(source: str, key_maps: dict[str, str]) -> str:
+    """Build a query over ``source`` with surrogate key columns translated.
+
+    Args:
+        source: Table, view or parenthesized query.
+        key_maps: Column name -> key map table built from
+            ``surrogate_key_map_sql()``. Values without a mapping are kept.
+
+    Returns:
+        SELECT statement with the same columns as ``source``.
+    """
+    replace = ", ".join(
+        f"coalesce(m{i}.stored_key, s.{col}) AS {col}" for i, col in enumerate(key_maps)
+    )
+    joins = "".join(
+        f" LEFT JOIN {key_map} m{i} ON m{i}.batch_key = s.{col}"
+        for i, (col, key_map) in enumerate(key_maps.items())
+    )
+    return f"SELECT s.* REPLACE ({replace}) FROM {source} s{joins}"
+
 
 class DuckDBDimensionalWriter(BaseDimensionalWriter):
     """Write dimensional model to DuckDB database.
@@ -42,6 +128,17 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
         ...     result = writer.query('SELECT COUNT(*) as cnt FROM analytics.dim_date')
         ...     print(result.iloc[0]['cnt'])
         366
+        >>>
+        >>> # Incremental refresh after new entities were added to a cohort
+        >>> transformer = PatientSQLDimensionalTransformer(conn, cohort_id='c-1')
+        >>> dimensions, facts = transformer.transform()
+        >>> writer.write_dimensional_model(
+        ...     dimensions,
+        ...     facts,
+        ...     if_exists='merge',
+        ...     key_columns=transformer.NATURAL_KEYS,
+        ...     watermark=transformer.watermark(),
+        ... )
 
     Attributes:
         db_path: Path to the database file or ':memory:'.
@@ -132,6 +229,7 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
         table_name: str,
         df: pd.DataFrame,
         if_exists: str = "replace",
+        key_columns: Sequence[str] | None = None,
     ) -> int:
         """Write a single DataFrame to a table.
 
@@ -144,18 +242,28 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
             if_exists: How to handle existing tables:
                 - 'replace': Drop and recreate the table (default)
                 - 'append': Add rows to existing table
+                - 'merge': Add only rows whose key_columns values are not
+                  already in the table
+            key_columns: Natural key columns, required for 'merge'.
 
         Returns:
-            Number of rows written.
+            Number of rows written. For 'merge' into an existing table, the
+            number of new rows inserted.
 
         Raises:
-            ValueError: If if_exists is not 'replace' or 'append'.
+            ValueError: If if_exists is not 'replace', 'append' or 'merge',
+                or 'merge' is requested without key_columns.
         """
-        if if_exists not in ("replace", "append"):
-            raise ValueError(f"if_exists must be 'replace' or 'append', got '{if_exists}'")
+        if if_exists not in ("replace", "append", "merge"):
+            raise ValueError(
+                f"if_exists must be 'replace', 'append' or 'merge', got '{if_exists}'"
+            )
+        if if_exists == "merge" and not key_columns:
+            raise ValueError("if_exists='merge' requires key_columns")
 
         conn = self._ensure_connection()
         full_table_name = f"{self.schema}.{table_name}"
+        exists = if_exists != "replace" and self.table_exists(table_name)
 
         if if_exists == "replace":
             conn.execute(f"DROP TABLE IF EXISTS {full_table_name}")
@@ -163,18 +271,164 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
         # Register the DataFrame temporarily
         conn.register("_temp_df", df)
 
-        if if_exists == "replace":
+        written = len(df)
+        if not exists:
             conn.execute(f"CREATE TABLE {full_table_name} AS SELECT * FROM _temp_df")
-        else:  # append
-            # Check if table exists
-            if self.table_exists(table_name):
-                conn.execute(f"INSERT INTO {full_table_name} SELECT * FROM _temp_df")
-            else:
-                conn.execute(f"CREATE TABLE {full_table_name} AS SELECT * FROM _temp_df")
+        elif if_exists == "append":
+            conn.execute(f"INSERT INTO {full_table_name} SELECT * FROM _temp_df")
+        else:  # merge
+            sql = insert_new_rows_sql(full_table_name, "_temp_df", key_columns)
+            written = conn.execute(sql).fetchone()[0]
 
         conn.unregister("_temp_df")
 
-        return len(df)
+        return written
+
+    def write_dimensional_model(
+        self,
+        dimensions: dict[str, pd.DataFrame],
+        facts: dict[str, pd.DataFrame],
+        if_exists: str = "replace",
+        key_columns: dict[str, Sequence[str]] | None = None,
+        watermark: datetime | None = None,
+        surrogate_keys: dict[str, str] | None = None,
+        foreign_keys: dict[str, dict[str, str]] | None = None,
+    ) -> dict[str, int]:
+        """Write complete dimensional model (dimensions and facts).
+
+        For incremental refreshes pass ``if_exists='merge'`` with the
+        transformer's ``NATURAL_KEYS``, ``SURROGATE_KEYS`` and
+        ``FOREIGN_KEYS``: tables with a natural key gain only their new
+        rows, while the rest are replaced. Lookup dimensions numbered by
+        position keep the surrogates already stored for their natural keys,
+        and the batch's key columns referencing them are translated to
+        match before any table is written.
+
+        Args:
+            dimensions: Dict of dimension_name -> DataFrame.
+            facts: Dict of fact_name -> DataFrame.
+            if_exists: 'replace', 'append' or 'merge', as for write_table().
+            key_columns: Natural key columns per table name.
+            watermark: High-water mark of the source, typically the cohort's
+                ``updated_at``. Tables already loaded at or beyond it are
+                skipped and report 0 rows; every table written records it.
+            surrogate_keys: Positional surrogate key column per dimension
+                whose natural key is listed in ``key_columns``.
+            foreign_keys: Per table, column -> dimension it references.
+
+        Returns:
+            Dict of table_name -> rows written.
+        """
+        key_columns = key_columns or {}
+        surrogate_keys = surrogate_keys or {}
+        foreign_keys = foreign_keys or {}
+        results: dict[str, int] = {}
+        key_maps: dict[str, str] = {}
+
+        try:
+            # Dimensions first (facts depend on them)
+            for name, df in chain(dimensions.items(), facts.items()):
+                if watermark is not None and self.table_exists(name):
+                    loaded = self.get_watermark(name)
+                    if loaded is not None and loaded >= watermark:
+                        results[name] = 0
+                        continue
+
+                keys = key_columns.get(name)
+                mode = "replace" if if_exists == "merge" and not keys else if_exists
+                if if_exists == "merge":
+                    df = self._rekey(name, df, keys, surrogate_keys, foreign_keys, key_maps)
+                results[name] = self.write_table(name, df, if_exists=mode, key_columns=keys)
+
+                if watermark is not None:
+                    self.set_watermark(name, watermark)
+        finally:
+            for key_map in key_maps.values():
+                self._ensure_connection().execute(f"DROP TABLE IF EXISTS {key_map}")
+
+        return results
+
+    def _rekey(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        keys: Sequence[str] | None,
+        surrogate_keys: dict[str, str],
+        foreign_keys: dict[str, dict[str, str]],
+        key_maps: dict[str, str],
+    ) -> pd.DataFrame:
+        """Translate positional surrogate keys in a batch to the stored ones.
+
+        Builds the key map of a surrogate-keyed dimension already loaded
+        (recorded in ``key_maps``) and rewrites the dimension's own key and
+        every column referencing a mapped dimension.
+        """
+        conn = self._ensure_connection()
+        surrogate = surrogate_keys.get(name)
+        columns = {
+            col: key_maps[dim]
+            for col, dim in foreign_keys.get(name, {}).items()
+            if dim in key_maps and col in df.columns
+        }
+        if not columns and not (surrogate and keys and self.table_exists(name)):
+            return df
+
+        conn.register("_temp_df", df)
+        try:
+            if surrogate and keys and self.table_exists(name):
+                key_maps[name] = f"_key_map_{name}"
+                target = f"{self.schema}.{name}"
+                conn.execute(
+                    f"CREATE OR REPLACE TEMP TABLE {key_maps[name]} AS "
+                    + surrogate_key_map_sql(target, "_temp_df", surrogate, keys)
+                )
+                columns[surrogate] = key_maps[name]
+            return conn.execute(rekey_sql("_temp_df", columns)).df()
+        finally:
+            conn.unregister("_temp_df")
+
+    def get_watermark(self, table_name: str) -> datetime | None:
+        """Get the source watermark recorded when a table was last loaded.
+
+        Args:
+            table_name: Name of the table.
+
+        Returns:
+            The watermark, or None if the table has none.
+        """
+        if not self.table_exists(WATERMARK_TABLE):
+            return None
+        conn = self._ensure_connection()
+        row = conn.execute(
+            f"SELECT watermark FROM {self.schema}.{WATERMARK_TABLE} WHERE table_name = ?",
+            [table_name],
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, table_name: str, watermark: datetime) -> None:
+        """Record the source watermark a table has been loaded up to.
+
+        Args:
+            table_name: Name of the table.
+            watermark: Source high-water mark, e.g. the cohort's updated_at.
+        """
+        conn = self._ensure_connection()
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.schema}.{WATERMARK_TABLE} (
+                table_name  VARCHAR PRIMARY KEY,
+                watermark   TIMESTAMP,
+                loaded_at   TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO {self.schema}.{WATERMARK_TABLE}
+            VALUES (?, ?, current_timestamp)
+            """,
+            [table_name, watermark],
+        )
 
     def get_table_list(self) -> list[str]:
         """Get list of tables in the schema.
@@ -188,7 +442,7 @@ class DuckDBDimensionalWriter(BaseDimensionalWriter):
             f"""
             SELECT table_name
             FROM information_schema.tables
-            WHERE table_schema = '{self.schema}'
+            WHERE table_schema = '{self.schema}' AND table_name <> '{WATERMARK_TABLE}'
             ORDER BY table_name
             """
         ).fetchall()
@@ -0,0 +1,214 @@
+"""Parquet staging areas for bulk-loading dimensional tables.
+
+Warehouse writers load large tables fastest from files: the DataFrame is
+written once as Parquet, and the warehouse reads it in parallel with
+``COPY INTO`` or ``CREATE TABLE ... AS SELECT``. A stager owns where those
+files live and how they get there.
+
+Stagers:
+    - LocalParquetStager: Write to a directory the warehouse can also read,
+      such as a FUSE-mounted Unity Catalog volume on a Databricks cluster,
+      or any local directory for testing.
+    - VolumeParquetStager: Upload to a Unity Catalog volume from anywhere
+      with the SQL connector's ``PUT`` command.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import shutil
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+# Rows per Parquet file; several files let the warehouse read in parallel.
+DEFAULT_ROWS_PER_FILE = 1_000_000
+
+
+class ParquetStager(ABC):
+    """Abstract base class for Parquet staging areas.
+
+    ``stage()`` writes a DataFrame as one or more Parquet files under a new
+    batch directory and returns that directory's path as the warehouse sees
+    it. ``remove()`` deletes a batch once it has been loaded.
+
+    Attributes:
+        rows_per_file: Maximum rows written to each Parquet file.
+    """
+
+    def __init__(self, rows_per_file: int = DEFAULT_ROWS_PER_FILE) -> None:
+        """Initialize the stager.
+
+        Args:
+            rows_per_file: Maximum rows written to each Parquet file.
+        """
+        self.rows_per_file = rows_per_file
+
+    @property
+    def local_dir(self) -> str | None:
+        """Local directory the SQL connector must be allowed to upload from."""
+        return None
+
+    def close(self) -> None:
+        """Release local resources held by the stager (none by default)."""
+        return None
+
+    def __enter__(self) -> ParquetStager:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @abstractmethod
+    def stage(self, cursor: Any, table_name: str, df: pd.DataFrame) -> str:
+        """Stage a DataFrame as Parquet files.
+
+        Args:
+            cursor: Warehouse cursor, for stagers that upload through SQL.
+            table_name: Table the files are destined for.
+            df: Rows to stage.
+
+        Returns:
+            Path of the batch directory, as read by the warehouse.
+        """
+
+    @abstractmethod
+    def remove(self, cursor: Any, location: str) -> None:
+        """Delete a staged batch.
+
+        Args:
+            cursor: Warehouse cursor, for stagers that delete through SQL.
+            location: Batch directory returned by ``stage()``.
+        """
+
+    def _write_parts(self, df: pd.DataFrame, directory: Path) -> list[str]:
+        """Write ``df`` to ``directory`` in chunks, returning the file names."""
+        directory.mkdir(parents=True, exist_ok=True)
+        names = []
+        for part, start in enumerate(range(0, max(len(df), 1), self.rows_per_file)):
+            name = f"part-{part:05d}.parquet"
+            df.iloc[start : start + self.rows_per_file].to_parquet(
+                directory / name,
+                index=False,
+                # Spark cannot read nanosecond timestamps
+                coerce_timestamps="us",
+                allow_truncated_timestamps=True,
+            )
+            names.append(name)
+        return names
+
+    @staticmethod
+    def _batch_name(table_name: str) -> str:
+        # A fresh name per batch: COPY INTO skips files it has loaded before
+        return posixpath.join(table_name, uuid.uuid4().hex)
+
+
+class LocalParquetStager(ParquetStager):
+    """Stage Parquet files in a directory shared with the warehouse.
+
+    Example:
+        >>> stager = LocalParquetStager('/Volumes/healthsim/gold/staging')
+        >>> writer = DatabricksDimensionalWriter(load_mode='parquet', stager=stager)
+    """
+
+    def __init__(self, directory: str | Path, rows_per_file: int = DEFAULT_ROWS_PER_FILE) -> None:
+        """Initialize the stager.
+
+        Args:
+            directory: Root directory for staged batches.
+            rows_per_file: Maximum rows written to each Parquet file.
+        """
+        super().__init__(rows_per_file=rows_per_file)
+        self.directory = Path(directory)
+
+    def stage(self, cursor: Any, table_name: str, df: pd.DataFrame) -> str:
+        """Write the batch directly into the shared directory."""
+        batch_dir = self.directory / self._batch_name(table_name)
+        self._write_parts(df, batch_dir)
+        return batch_dir.as_posix()
+
+    def remove(self, cursor: Any, location: str) -> None:
+        """Delete the batch directory."""
+        shutil.rmtree(location, ignore_errors=True)
+
+
+class VolumeParquetStager(ParquetStager):
+    """Stage Parquet files in a Unity Catalog volume via ``PUT``.
+
+    Files are written to a local scratch directory, uploaded with ``PUT ...
+    INTO ... OVERWRITE`` and deleted locally. The writer's connection must
+    allow uploads from ``local_dir``; ``DatabricksDimensionalWriter`` sets
+    this up automatically. A temporary scratch directory is removed by
+    ``close()``.
+
+    Example:
+        >>> stager = VolumeParquetStager('/Volumes/healthsim/gold/staging')
+    """
+
+    def __init__(
+        self,
+        volume_path: str,
+        rows_per_file: int = DEFAULT_ROWS_PER_FILE,
+        local_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the stager.
+
+        Args:
+            volume_path: Volume directory, e.g. ``/Volumes/catalog/schema/volume``.
+            rows_per_file: Maximum rows written to each Parquet file.
+            local_dir: Scratch directory for files before upload. Defaults
+                to a temporary directory, created on first use.
+        """
+        super().__init__(rows_per_file=rows_per_file)
+        self.volume_path = volume_path.rstrip("/")
+        self._explicit_dir = Path(local_dir) if local_dir else None
+        self._temp_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._files: dict[str, list[str]] = {}
+
+    @property
+    def local_dir(self) -> str:
+        """Local scratch directory uploads are made from."""
+        if self._explicit_dir is not None:
+            return str(self._explicit_dir)
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="healthsim-staging-")
+        return self._temp_dir.name
+
+    def close(self) -> None:
+        """Remove the temporary scratch directory, if one was created."""
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def stage(self, cursor: Any, table_name: str, df: pd.DataFrame) -> str:
+        """Write the batch locally, then upload each file into the volume."""
+        batch = self._batch_name(table_name)
+        local_batch = Path(self.local_dir) / batch
+        location = posixpath.join(self.volume_path, batch)
+        try:
+            names = self._write_parts(df, local_batch)
+            for name in names:
+                cursor.execute(
+                    f"PUT '{(local_batch / name).as_posix()}' "
+                    f"INTO '{posixpath.join(location, name)}' OVERWRITE"
+                )
+        finally:
+            shutil.rmtree(local_batch, ignore_errors=True)
+        self._files[location] = names
+        return location
+
+    def remove(self, cursor: Any, location: str) -> None:
+        """Delete each uploaded file of the batch from the volume."""
+        for name in self._files.pop(location, []):
+            cursor.execute(f"REMOVE '{posixpath.join(location, name)}'")
@@ -13,6 +13,7 @@ from healthsim.formats.transformer import (
 from healthsim.formats.utils import (
     CSVExporter,
     JSONExporter,
+    chunked,
     format_date,
     format_datetime,
     safe_str,
@@ -29,6 +30,7 @@ __all__ = [
     "JSONExporter",
     "CSVExporter",
     # Utilities
+    "chunked",
     "format_date",
     "format_datetime",
     "safe_str",
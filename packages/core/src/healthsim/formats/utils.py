@@ -5,8 +5,10 @@ Provides JSON and CSV export functionality and format helper functions.
 
 import csv
 import json
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime
 from io import StringIO
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -41,6 +43,13 @@ def truncate(text: str, max_length: int, suffix: str = "...") -> str:
     return text[: max_length - len(suffix)] + suffix
 
 
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive lists of up to ``size`` items from an iterable."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class JSONExporter:
     """Export data to JSON format.
 
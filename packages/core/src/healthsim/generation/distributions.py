@@ -4,10 +4,14 @@ Provides distribution classes for generating values according
 to various statistical distributions.
 """
 
+import math
 import random
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, Generic, TypeVar
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -335,8 +339,6 @@ class LogNormalDistribution(Distribution, BaseModel):
         Returns:
             Sampled value (always positive)
         """
-        import math
-
         if rng is None:
             rng = random.Random()
 
@@ -441,9 +443,9 @@ class ExplicitDistribution(Distribution, BaseModel):
             if count > len(items):
                 raise ValueError(f"Cannot select {count} unique from {len(items)}")
             selected = []
-            remaining = list(zip(items, weights))
+            remaining = list(zip(items, weights, strict=True))
             for _ in range(count):
-                vals, wts = zip(*remaining)
+                vals, wts = zip(*remaining, strict=True)
                 choice = rng.choices(vals, weights=wts, k=1)[0]
                 selected.append(choice)
                 remaining = [(v, w) for v, w in remaining if v != choice]
@@ -646,16 +648,25 @@ class ConditionalDistribution:
         Returns:
             Sampled value from matching distribution
         """
+        return create_distribution(self.select(context)).sample(rng)
+
+    def select(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Return the distribution spec of the first rule matching context.
+
+        Args:
+            context: Dictionary of entity attributes for condition evaluation
+
+        Returns:
+            Matching rule's distribution spec, or the default spec
+        """
         for rule in self.rules:
             condition = rule.get("condition", "")
             if self._evaluate_condition(condition, context):
-                dist = create_distribution(rule["distribution"])
-                return dist.sample(rng)
+                return rule["distribution"]
 
         # No condition matched, use default
         if self.default:
-            dist = create_distribution(self.default)
-            return dist.sample(rng)
+            return self.default
 
         raise ValueError("No condition matched and no default distribution")
 
@@ -713,3 +724,203 @@ def create_distribution(spec: dict[str, Any]) -> Distribution:
 
     else:
         raise ValueError(f"Unknown distribution type: {dist_type}")
+
+
+# =============================================================================
+# Vectorized Sampling
+# =============================================================================
+
+
+class VectorizedSampler:
+    """A distribution compiled once to draw whole columns with NumPy.
+
+    Built by compile_sampler(). Draws come from a numpy.random.Generator,
+    so they differ from the scalar sample() methods but are deterministic
+    for a given Generator state.
+
+    Example:
+        >>> sampler = compile_sampler({"type": "normal", "mean": 72, "std_dev": 8})
+        >>> ages = sampler.sample(np.random.default_rng(42), 1_000_000)
+    """
+
+    def __init__(self, draw: Callable[[np.random.Generator, int], np.ndarray]):
+        """Initialize with a draw function.
+
+        Args:
+            draw: Callable taking (generator, count) and returning an array
+        """
+        self._draw = draw
+
+    def sample(
+        self,
+        rng: np.random.Generator,
+        count: int,
+        context: dict[str, Any] | None = None,
+    ) -> np.ndarray:
+        """Draw count values.
+
+        Args:
+            rng: NumPy random generator
+            count: Number of values to draw
+            context: Ignored (used by conditional samplers)
+
+        Returns:
+            Array of count values (float for numeric, object for categories)
+        """
+        return self._draw(rng, count)
+
+
+class ConditionalVectorizedSampler(VectorizedSampler):
+    """Vectorized form of ConditionalDistribution.
+
+    Entities are grouped by their context values; rules are evaluated once
+    per distinct group and each group is drawn from its compiled sampler.
+    """
+
+    def __init__(self, rules: list[dict[str, Any]], default: dict[str, Any] | None = None):
+        """Initialize conditional sampler.
+
+        Args:
+            rules: List of {condition, distribution} dicts
+            default: Default distribution if no condition matches
+        """
+        self._conditional = ConditionalDistribution(rules=rules, default=default)
+        self._compiled: dict[int, VectorizedSampler] = {}
+
+    def _branch(self, context: dict[str, Any]) -> VectorizedSampler:
+        spec = self._conditional.select(context)
+        key = id(spec)
+        if key not in self._compiled:
+            self._compiled[key] = compile_sampler(spec)
+        return self._compiled[key]
+
+    def sample(
+        self,
+        rng: np.random.Generator,
+        count: int,
+        context: dict[str, Any] | None = None,
+    ) -> np.ndarray:
+        """Draw count values, each from the rule matching its context.
+
+        Args:
+            rng: NumPy random generator
+            count: Number of values to draw
+            context: Mapping of attribute name to a column of count values
+                (None entries are left out of that entity's context)
+
+        Returns:
+            Array of count values
+        """
+        columns = {k: np.asarray(v, dtype=object) for k, v in (context or {}).items()}
+        if not columns:
+            return self._branch({}).sample(rng, count)
+
+        # Combine per-column codes into one group code per entity
+        codes = np.zeros(count, dtype=np.int64)
+        for column in columns.values():
+            column_codes, uniques = pd.factorize(column)
+            codes = codes * (len(uniques) + 1) + (column_codes + 1)
+        groups, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+
+        parts = []
+        for group_index, row in enumerate(first):
+            row_context = {k: v[row] for k, v in columns.items() if v[row] is not None}
+            mask = inverse == group_index
+            parts.append((mask, self._branch(row_context).sample(rng, int(mask.sum()))))
+
+        numeric = all(values.dtype.kind in "fiu" for _, values in parts)
+        out = np.empty(count, dtype=np.float64 if numeric else object)
+        for mask, values in parts:
+            out[mask] = values
+        return out
+
+
+def _choice_draw(
+    items: list[Any], weights: list[float]
+) -> Callable[[np.random.Generator, int], np.ndarray]:
+    """Build a weighted-choice draw using an inverse CDF lookup."""
+    if not items:
+        raise ValueError("No values to select from")
+    values = np.empty(len(items), dtype=object)
+    values[:] = items
+    cdf = np.cumsum(np.asarray(weights, dtype=np.float64))
+    cdf /= cdf[-1]
+    last = len(values) - 1
+
+    def draw(rng: np.random.Generator, count: int) -> np.ndarray:
+        index = np.searchsorted(cdf, rng.random(count), side="right")
+        return values[np.minimum(index, last)]
+
+    return draw
+
+
+def compile_sampler(spec: dict[str, Any]) -> VectorizedSampler:
+    """Compile a distribution specification into a VectorizedSampler.
+
+    Accepts the same specifications as create_distribution(), plus
+    "conditional" specs with rules and default.
+
+    Args:
+        spec: Dictionary with 'type' and type-specific parameters
+
+    Returns:
+        Sampler that draws whole columns
+
+    Example:
+        >>> sampler = compile_sampler({"type": "categorical", "weights": {"M": 0.5, "F": 0.5}})
+        >>> genders = sampler.sample(np.random.default_rng(1), 10)
+    """
+    dist_type = spec.get("type", "")
+    dist_type = getattr(dist_type, "value", dist_type).lower()
+    if dist_type == "conditional":
+        return ConditionalVectorizedSampler(
+            rules=spec.get("rules") or [],
+            default=spec.get("default"),
+        )
+
+    dist = create_distribution(spec)
+
+    if isinstance(dist, CategoricalDistribution):
+        if not dist.weights:
+            raise ValueError("No categories defined")
+        return VectorizedSampler(_choice_draw(list(dist.weights), list(dist.weights.values())))
+
+    if isinstance(dist, ExplicitDistribution):
+        return VectorizedSampler(_choice_draw(
+            [v[0] for v in dist.values],
+            [v[1] for v in dist.values],
+        ))
+
+    if isinstance(dist, NormalDistribution):
+        return VectorizedSampler(lambda rng, count: rng.normal(dist.mean, dist.std_dev, count))
+
+    if isinstance(dist, LogNormalDistribution):
+        if dist.mean <= 0:
+            return VectorizedSampler(
+                lambda rng, count: np.full(count, dist.min_val, dtype=np.float64)
+            )
+        # Same method-of-moments conversion as LogNormalDistribution.sample
+        variance = dist.std_dev**2
+        mu = math.log(dist.mean**2 / math.sqrt(variance + dist.mean**2))
+        sigma = math.sqrt(math.log(1 + variance / dist.mean**2))
+        return VectorizedSampler(
+            lambda rng, count: np.maximum(rng.lognormal(mu, sigma, count), dist.min_val)
+        )
+
+    if isinstance(dist, UniformDistribution):
+        return VectorizedSampler(lambda rng, count: rng.uniform(dist.min_val, dist.max_val, count))
+
+    if isinstance(dist, AgeBandDistribution):
+        if not dist.bands:
+            raise ValueError("No age bands defined")
+        bounds = np.array([dist._parse_band(label) for label in dist.bands], dtype=np.int64)
+        band_draw = _choice_draw(list(range(len(bounds))), list(dist.bands.values()))
+
+        def draw_ages(rng: np.random.Generator, count: int) -> np.ndarray:
+            band = band_draw(rng, count).astype(np.int64)
+            low, high = bounds[band, 0], bounds[band, 1]
+            return (low + np.floor(rng.random(count) * (high - low + 1))).astype(np.float64)
+
+        return VectorizedSampler(draw_ages)
+
+    raise ValueError(f"Unknown distribution type: {dist_type}")
@@ -13,9 +13,12 @@ The journey engine follows a timeline-based approach:
 from __future__ import annotations
 
 import hashlib
+import heapq
 import random
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -380,11 +383,56 @@ class TimelineEvent:
     
     # Cross-product tracking
     triggered_events: list[str] = field(default_factory=list)
+    
+    # Compiled parameter plan, shared by events from the same definition
+    plan: ParameterPlan | None = field(default=None, repr=False, compare=False)
+
+
+class _EventList(list):
+    """List of timeline events that counts its own mutations.
+    
+    Timeline compares ``version`` with the version it last indexed, so any
+    direct change to ``Timeline.events`` (append, item assignment, sort,
+    slice deletion, ...) invalidates the index.
+    """
+    
+    version = 0
+    
+    def _mutated(self) -> None:
+        self.version += 1
+
+
+def _mutator(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+    
+    def mutate(self: _EventList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._mutated()
+        return result
+    
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+):
+    setattr(_EventList, _name, _mutator(_name))
+del _name
 
 
 @dataclass 
 class Timeline:
-    """Timeline of events for an entity."""
+    """Timeline of events for an entity.
+    
+    ``events`` is kept in chronological order (events on the same date keep
+    insertion order). Alongside it the timeline keeps a parallel list of
+    dates for binary search and an id -> event index, so inserting,
+    looking up and range queries do not rescan the list. ``events`` is
+    stored as a list that records its own mutations, so the index is
+    rebuilt whenever ``events`` is replaced or changed directly.
+    """
     
     entity_id: str
     entity_type: str  # "patient", "member", "rx_member", etc.
@@ -397,10 +445,74 @@ class Timeline:
     # Cross-product correlation
     linked_timelines: dict[str, str] = field(default_factory=dict)  # product -> timeline_id
     
+    # Index over events (see _ensure_index)
+    _dates: list[date] = field(default_factory=list, init=False, repr=False, compare=False)
+    _by_id: dict[str, TimelineEvent] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: list[TimelineEvent] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_version: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "events" and not isinstance(value, _EventList):
+            value = _EventList(value)
+        super().__setattr__(name, value)
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the date list and id index if events changed underneath."""
+        if self._indexed is self.events and self._indexed_version == self.events.version:
+            return
+        self.events.sort(key=_scheduled_date)
+        self._dates = [e.scheduled_date for e in self.events]
+        self._by_id = {}
+        for event in self.events:
+            self._by_id.setdefault(event.timeline_event_id, event)
+        self._mark_indexed()
+    
+    def _mark_indexed(self) -> None:
+        """Record that the index matches the current events."""
+        self._indexed = self.events
+        self._indexed_version = self.events.version
+    
     def add_event(self, event: TimelineEvent) -> None:
         """Add event to timeline, maintaining chronological order."""
-        self.events.append(event)
-        self.events.sort(key=lambda e: e.scheduled_date)
+        self._ensure_index()
+        position = bisect_right(self._dates, event.scheduled_date)
+        self.events.insert(position, event)
+        self._dates.insert(position, event.scheduled_date)
+        self._by_id.setdefault(event.timeline_event_id, event)
+        self._mark_indexed()
+    
+    def extend(self, events: Iterable[TimelineEvent]) -> None:
+        """Add many events at once.
+        
+        The new events are sorted once and merged with the existing run,
+        which is linear when they are already in order. The result is the
+        same as calling add_event for each event in turn.
+        
+        Args:
+            events: Events to add, in any order
+        """
+        self._ensure_index()
+        new_events = sorted(events, key=_scheduled_date)
+        if not new_events:
+            return
+        if not self.events or new_events[0].scheduled_date >= self._dates[-1]:
+            self.events.extend(new_events)
+        else:
+            # heapq.merge is stable: existing events win ties, as with add_event
+            self.events[:] = heapq.merge(self.events, new_events, key=_scheduled_date)
+        self._dates = [e.scheduled_date for e in self.events]
+        for event in new_events:
+            self._by_id.setdefault(event.timeline_event_id, event)
+        self._mark_indexed()
+    
+    def get_event(self, event_id: str) -> TimelineEvent | None:
+        """Get an event by timeline_event_id."""
+        self._ensure_index()
+        return self._by_id.get(event_id)
     
     def get_pending_events(self) -> list[TimelineEvent]:
         """Get all pending events in chronological order."""
@@ -408,23 +520,29 @@ class Timeline:
     
     def get_events_by_date(self, target_date: date) -> list[TimelineEvent]:
         """Get events scheduled for a specific date."""
-        return [e for e in self.events if e.scheduled_date == target_date]
+        self._ensure_index()
+        start = bisect_left(self._dates, target_date)
+        end = bisect_right(self._dates, target_date, lo=start)
+        return self.events[start:end]
     
     def get_events_up_to(self, target_date: date) -> list[TimelineEvent]:
         """Get pending events up to and including target date."""
-        return [
-            e for e in self.events 
-            if e.status == "pending" and e.scheduled_date <= target_date
-        ]
+        self._ensure_index()
+        end = bisect_right(self._dates, target_date)
+        return [e for e in self.events[:end] if e.status == "pending"]
     
     def mark_executed(self, event_id: str, result: dict[str, Any]) -> None:
         """Mark an event as executed with result."""
-        for event in self.events:
-            if event.timeline_event_id == event_id:
-                event.status = "executed"
-                event.executed_at = datetime.utcnow()
-                event.result = result
-                break
+        event = self.get_event(event_id)
+        if event is not None:
+            event.status = "executed"
+            event.executed_at = datetime.utcnow()
+            event.result = result
+
+
+def _scheduled_date(event: TimelineEvent) -> date:
+    """Sort key for timeline events."""
+    return event.scheduled_date
 
 
 # =============================================================================
@@ -445,6 +563,121 @@ class EventHandler(Protocol):
 
 
 
+# =============================================================================
+# Parameter Resolution Plans
+# =============================================================================
+
+_ENTITY_VAR_PATTERN = re.compile(r"\$\{entity\.(\w+)\}")
+
+# Plan modes, matching the three resolution modes of execute_event
+PLAN_DIRECT = "direct"
+PLAN_SKILL_REF = "skill_ref"
+PLAN_AUTO = "auto"
+
+# Slot kinds
+_SLOT_CONSTANT = 0
+_SLOT_VARIABLE = 1  # whole value is ${entity.x}
+_SLOT_TEMPLATE = 2  # ${entity.x} embedded in text
+
+
+@dataclass(frozen=True)
+class ParameterPlan:
+    """Event parameters compiled once per event definition.
+    
+    Each parameter becomes a slot: a constant, a whole-value entity
+    variable, or a template split into literal text and attribute names.
+    Resolving the plan for an entity only fills the slots in.
+    """
+    
+    mode: str
+    event_type: str | None
+    condition: str | None
+    parameters: dict[str, Any]
+    slots: tuple[tuple[str, int, Any], ...]
+    
+    @classmethod
+    def compile(
+        cls,
+        parameters: dict[str, Any],
+        event_type: str | None = None,
+        condition: str | None = None,
+    ) -> ParameterPlan:
+        """Compile event parameters into a plan.
+        
+        Args:
+            parameters: Event parameters (may contain ${entity.x} or skill_ref)
+            event_type: Event type (for auto-resolution)
+            condition: Condition keyword (for auto-resolution)
+            
+        Returns:
+            ParameterPlan
+        """
+        if condition and "skill_ref" not in parameters and event_type:
+            mode = PLAN_AUTO
+        elif "skill_ref" in parameters:
+            mode = PLAN_SKILL_REF
+        else:
+            mode = PLAN_DIRECT
+        
+        slots = []
+        for key, value in parameters.items():
+            if not (isinstance(value, str) and "${entity." in value):
+                slots.append((key, _SLOT_CONSTANT, value))
+            elif value.startswith("${entity.") and value.endswith("}"):
+                slots.append((key, _SLOT_VARIABLE, (value[9:-1], value)))
+            else:
+                # Alternating literal text and attribute names
+                slots.append((key, _SLOT_TEMPLATE, tuple(_ENTITY_VAR_PATTERN.split(value))))
+        
+        return cls(
+            mode=mode,
+            event_type=event_type,
+            condition=condition,
+            parameters=parameters,
+            slots=tuple(slots),
+        )
+    
+    def fill(
+        self,
+        entity_dict: dict[str, Any],
+        into: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Fill the slots from an entity.
+        
+        Args:
+            entity_dict: Entity attributes for ${entity.x} substitution
+            into: Existing values to keep (slots already present are skipped)
+            
+        Returns:
+            Resolved parameters
+        """
+        resolved = into if into is not None else {}
+        for key, kind, payload in self.slots:
+            if into is not None and key in resolved:
+                continue
+            if kind == _SLOT_CONSTANT:
+                resolved[key] = payload
+            elif kind == _SLOT_VARIABLE:
+                attr, original = payload
+                resolved[key] = entity_dict.get(attr, original)
+            else:
+                resolved[key] = _render_template(payload, entity_dict)
+        return resolved
+
+
+def _render_template(parts: tuple[str, ...], entity_dict: dict[str, Any]) -> str:
+    """Join literal parts with entity attributes (odd positions)."""
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            out.append(part)
+        elif part in entity_dict:
+            out.append(str(entity_dict[part]))
+        else:
+            out.append("${entity." + part + "}")
+    return "".join(out)
+
+
 # =============================================================================
 # Journey Engine
 # =============================================================================
@@ -484,6 +717,9 @@ class JourneyEngine:
         
         # Active timelines for cross-product coordination
         self._active_timelines: dict[str, Timeline] = {}
+        
+        # Compiled parameter plans by event definition
+        self._plans: dict[int, tuple[EventDefinition, ParameterPlan]] = {}
     
     def register_handler(
         self,
@@ -587,6 +823,7 @@ class JourneyEngine:
                 product=event_def.product,
                 condition=event_def.condition,  # For auto-resolution
                 parameters=event_def.parameters.copy(),  # Store original params
+                plan=self._get_plan(event_def),
             )
             
             timeline.add_event(timeline_event)
@@ -598,7 +835,7 @@ class JourneyEngine:
         
         # Set end date
         if timeline.events:
-            timeline.end_date = max(e.scheduled_date for e in timeline.events)
+            timeline.end_date = timeline.events[-1].scheduled_date
         
         # Register as active timeline
         self._active_timelines[timeline.entity_id] = timeline
@@ -612,6 +849,7 @@ class JourneyEngine:
         event: TimelineEvent,
         entity: Any,
         context: dict[str, Any] | None = None,
+        entity_dict: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute a single event from a timeline.
         
@@ -620,6 +858,7 @@ class JourneyEngine:
             event: The event to execute
             entity: The entity
             context: Additional context
+            entity_dict: Entity as a dict, if already converted
             
         Returns:
             Execution result dict
@@ -635,13 +874,13 @@ class JourneyEngine:
         
         try:
             # Resolve skill references in parameters
-            entity_dict = self._entity_to_dict(entity)
-            resolved_params = self._resolve_event_parameters(
-                event.parameters, 
-                entity_dict,
-                event_type=event.event_type,
-                condition=event.condition,
-            )
+            if entity_dict is None:
+                entity_dict = self._entity_to_dict(entity)
+            if event.plan is None or event.plan.parameters != event.parameters:
+                event.plan = ParameterPlan.compile(
+                    event.parameters, event.event_type, event.condition,
+                )
+            resolved_params = self._resolve_plan(event.plan, entity_dict)
             event.resolved_parameters = resolved_params
             
             # Merge resolved parameters into context
@@ -671,6 +910,35 @@ class JourneyEngine:
             return entity.__dict__
         return {}
     
+    def _get_plan(self, event_def: EventDefinition) -> ParameterPlan:
+        """Get the compiled parameter plan for an event definition."""
+        cached = self._plans.get(id(event_def))
+        if cached is not None and cached[0] is event_def:
+            return cached[1]
+        plan = ParameterPlan.compile(
+            event_def.parameters.copy(), event_def.event_type, event_def.condition,
+        )
+        self._plans[id(event_def)] = (event_def, plan)
+        return plan
+    
+    def _resolve_plan(self, plan: ParameterPlan, entity_dict: dict[str, Any]) -> dict[str, Any]:
+        """Resolve a compiled plan for one entity."""
+        if plan.mode == PLAN_AUTO:
+            registry = _get_skill_registry()
+            resolved = registry.resolve_for_event(
+                event_type=plan.event_type,
+                condition=plan.condition,
+                context=entity_dict,
+            )
+            # Merge with any additional provided parameters
+            return plan.fill(entity_dict, into=resolved)
+        
+        if plan.mode == PLAN_SKILL_REF:
+            resolver = _get_parameter_resolver()
+            return resolver.resolve_event_parameters(plan.parameters, entity_dict)
+        
+        return plan.fill(entity_dict)
+    
     def _resolve_event_parameters(
         self,
         parameters: dict[str, Any],
@@ -694,83 +962,13 @@ class JourneyEngine:
         Returns:
             Resolved parameters with concrete values
         """
-        # Auto-resolution: condition is set, no skill_ref
-        if condition and "skill_ref" not in parameters and event_type:
-            return self._auto_resolve_parameters(
-                event_type, condition, parameters, entity_dict
-            )
-        
-        # Explicit skill_ref
-        if "skill_ref" in parameters:
-            resolver = _get_parameter_resolver()
-            return resolver.resolve_event_parameters(parameters, entity_dict)
-        
-        # Direct values - just resolve entity variables
-        if not parameters:
-            return {}
-        
-        resolved = {}
-        for key, value in parameters.items():
-            if isinstance(value, str) and "${entity." in value:
-                resolved[key] = self._resolve_entity_var(value, entity_dict)
-            else:
-                resolved[key] = value
-        
-        return resolved
-    
-    def _auto_resolve_parameters(
-        self,
-        event_type: str,
-        condition: str,
-        parameters: dict[str, Any],
-        entity_dict: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Auto-resolve parameters using SkillRegistry.
-        
-        Args:
-            event_type: Type of event (diagnosis, medication_order, etc.)
-            condition: Condition keyword (diabetes, ckd, etc.)
-            parameters: Additional parameters to merge
-            entity_dict: Entity attributes
-            
-        Returns:
-            Resolved parameters
-        """
-        registry = _get_skill_registry()
-        
-        resolved = registry.resolve_for_event(
-            event_type=event_type,
-            condition=condition,
-            context=entity_dict,
-        )
-        
-        # Merge with any additional provided parameters
-        for key, value in parameters.items():
-            if key not in resolved:
-                if isinstance(value, str) and "${entity." in value:
-                    resolved[key] = self._resolve_entity_var(value, entity_dict)
-                else:
-                    resolved[key] = value
-        
-        return resolved
+        plan = ParameterPlan.compile(parameters, event_type, condition)
+        return self._resolve_plan(plan, entity_dict)
     
     def _resolve_entity_var(self, value: str, entity: dict[str, Any]) -> Any:
         """Resolve ${entity.x} variables in a string."""
-        import re
-        pattern = r"\$\{entity\.(\w+)\}"
-        
-        def replacer(match):
-            attr = match.group(1)
-            return str(entity.get(attr, match.group(0)))
-        
-        result = re.sub(pattern, replacer, value)
-        
-        # If entire string was a variable, return the actual value
-        if value.startswith("${entity.") and value.endswith("}"):
-            attr = value[9:-1]
-            return entity.get(attr, value)
-        
-        return result
+        plan = ParameterPlan.compile({"value": value})
+        return plan.fill(entity)["value"]
     
     def execute_timeline(
         self,
@@ -792,9 +990,10 @@ class JourneyEngine:
         """
         results = []
         target_date = up_to_date or date.max
+        entity_dict = self._entity_to_dict(entity)
         
         for event in timeline.get_events_up_to(target_date):
-            result = self.execute_event(timeline, event, entity, context)
+            result = self.execute_event(timeline, event, entity, context, entity_dict)
             results.append({
                 "event_id": event.timeline_event_id,
                 "event_type": event.event_type,
@@ -848,11 +1047,11 @@ class JourneyEngine:
     def _get_entity_id(self, entity: Any) -> str:
         """Extract entity ID from entity."""
         # Try common ID field names
-        for field in ["entity_id", "patient_id", "member_id", "id"]:
-            if hasattr(entity, field):
-                return str(getattr(entity, field))
-            if isinstance(entity, dict) and field in entity:
-                return str(entity[field])
+        for name in ["entity_id", "patient_id", "member_id", "id"]:
+            if hasattr(entity, name):
+                return str(getattr(entity, name))
+            if isinstance(entity, dict) and name in entity:
+                return str(entity[name])
         
         # Fallback to hash
         return hashlib.md5(str(entity).encode()).hexdigest()[:12]
@@ -21,7 +21,10 @@ Example:
 
 from __future__ import annotations
 
+import math
+import pickle
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
@@ -170,9 +173,16 @@ class ProfileJourneyOrchestrator:
         start_date: date | None = None,
         execute_events: bool = False,
         up_to_date: date | None = None,
+        workers: int = 1,
     ) -> OrchestratorResult:
         """Execute profile generation with journey assignment.
         
+        With workers > 1, entity indices are sharded across a process pool.
+        Each worker rebuilds the profile executor and journey engine from
+        the specs and the engine's registered handlers, so handlers must be
+        picklable (module-level functions). The result is identical to the
+        serial run for the same seed.
+        
         Args:
             profile: Profile template name, spec object, or dict
             journey: Journey template name, spec object, dict, or list of journeys
@@ -180,6 +190,7 @@ class ProfileJourneyOrchestrator:
             start_date: Base date for journey timelines
             execute_events: If True, execute events up to up_to_date
             up_to_date: Date to execute events up to (defaults to start_date)
+            workers: Number of worker processes (1 runs in-process)
             
         Returns:
             OrchestratorResult with entities and their timelines
@@ -198,55 +209,31 @@ class ProfileJourneyOrchestrator:
         if count:
             profile_spec.generation.count = count
         
-        # Execute profile to generate entities
-        executor = ProfileExecutor(profile_spec, seed=self.seed)
-        profile_result = executor.execute()
-        
-        # Assign journeys to entities
         timeline_start = start_date or date.today()
-        entities_with_timelines = []
+        entity_type = self._get_entity_type(profile_spec)
         
-        for entity in profile_result.entities:
-            # Create entity-specific seed
-            entity_seed = self.seed_manager.get_entity_seed(entity.index)
-            
-            # Build entity context for journey
-            entity_context = self._build_entity_context(entity)
-            
-            # Create combined timeline for all journeys
-            combined_timeline = Timeline(
-                entity_id=str(entity.index),
-                entity_type=self._get_entity_type(profile_spec),
-                journey_ids=journey_ids,
-                start_date=timeline_start,
+        if workers > 1:
+            entities_with_timelines = self._execute_parallel(
+                profile_spec, journeys, entity_type, timeline_start,
+                execute_events, up_to_date, workers,
             )
+        else:
+            # Execute profile to generate entities
+            executor = ProfileExecutor(profile_spec, seed=self.seed)
+            profile_result = executor.execute()
             
-            # Add events from each journey
-            for journey_spec in journeys:
-                timeline = self.journey_engine.create_timeline(
-                    entity=entity_context,
-                    entity_type=self._get_entity_type(profile_spec),
-                    journey=journey_spec,
-                    start_date=timeline_start,
+            # Assign journeys to entities
+            entities_with_timelines = []
+            for entity in profile_result.entities:
+                timeline = self._build_timeline(
+                    entity, journeys, entity_type, timeline_start,
+                    execute_events, up_to_date,
                 )
-                # Merge events into combined timeline
-                for event in timeline.events:
-                    combined_timeline.add_event(event)
-            
-            # Optionally execute events
-            if execute_events and combined_timeline.events:
-                exec_date = up_to_date or timeline_start
-                self.journey_engine.execute_timeline(
-                    combined_timeline,
-                    entity_context,
-                    up_to_date=exec_date,
-                )
-            
-            entities_with_timelines.append(EntityWithTimeline(
-                entity=entity,
-                timeline=combined_timeline,
-                journey_ids=journey_ids,
-            ))
+                entities_with_timelines.append(EntityWithTimeline(
+                    entity=entity,
+                    timeline=timeline,
+                    journey_ids=journey_ids,
+                ))
         
         duration = time.time() - start_time
         
@@ -270,6 +257,7 @@ class ProfileJourneyOrchestrator:
         description: str | None = None,
         tags: list[str] | None = None,
         persist_entities: bool = True,
+        workers: int = 1,
     ) -> OrchestratorResult:
         """Execute profile with automatic persistence tracking.
         
@@ -290,6 +278,7 @@ class ProfileJourneyOrchestrator:
             description: Profile description
             tags: Profile tags for filtering
             persist_entities: If True, persist generated entities
+            workers: Number of worker processes (see execute)
             
         Returns:
             OrchestratorResult with persistence tracking info
@@ -328,6 +317,7 @@ class ProfileJourneyOrchestrator:
             start_date=start_date,
             execute_events=execute_events,
             up_to_date=up_to_date,
+            workers=workers,
         )
         
         # Persist entities if requested
@@ -371,6 +361,107 @@ class ProfileJourneyOrchestrator:
             cohort_id=cohort_id,
         )
     
+    def _build_timeline(
+        self,
+        entity: GeneratedEntity,
+        journeys: list[JourneySpecification],
+        entity_type: str,
+        timeline_start: date,
+        execute_events: bool,
+        up_to_date: date | None,
+    ) -> Timeline:
+        """Create (and optionally execute) the combined timeline for one entity."""
+        # Build entity context for journey
+        entity_context = self._build_entity_context(entity)
+        
+        # Create combined timeline for all journeys
+        combined_timeline = Timeline(
+            entity_id=str(entity.index),
+            entity_type=entity_type,
+            journey_ids=[j.journey_id for j in journeys],
+            start_date=timeline_start,
+        )
+        
+        # Add events from each journey
+        for journey_spec in journeys:
+            timeline = self.journey_engine.create_timeline(
+                entity=entity_context,
+                entity_type=entity_type,
+                journey=journey_spec,
+                start_date=timeline_start,
+            )
+            # Merge events into combined timeline
+            combined_timeline.extend(timeline.events)
+        
+        # Optionally execute events
+        if execute_events and combined_timeline.events:
+            exec_date = up_to_date or timeline_start
+            self.journey_engine.execute_timeline(
+                combined_timeline,
+                entity_context,
+                up_to_date=exec_date,
+            )
+        
+        return combined_timeline
+    
+    def _execute_parallel(
+        self,
+        profile_spec: ProfileSpecification,
+        journeys: list[JourneySpecification],
+        entity_type: str,
+        timeline_start: date,
+        execute_events: bool,
+        up_to_date: date | None,
+        workers: int,
+    ) -> list[EntityWithTimeline]:
+        """Generate entities and timelines in a process pool.
+        
+        The journey engine draws event probabilities from one shared
+        random.Random, a fixed number of draws per entity. Each shard
+        starts from the engine's current state advanced past the entities
+        before it, and the parent's engine is advanced past all of them
+        afterwards, so the output and the engine state match a serial run.
+        """
+        count = profile_spec.generation.count
+        engine = self.journey_engine
+        handlers = (engine._handlers, engine._trigger_handlers)
+        try:
+            pickle.dumps(handlers)
+        except Exception as e:
+            raise ValueError(
+                "Journey engine handlers must be picklable (module-level "
+                f"functions) to run with workers > 1: {e}"
+            ) from e
+        
+        draws_per_entity = _probability_draws_per_entity(journeys)
+        rng_state = engine._rng.getstate()
+        
+        # A few shards per worker balances uneven shards
+        shard_size = max(1, math.ceil(count / (workers * 4)))
+        shards = [(start, min(start + shard_size, count)) for start in range(0, count, shard_size)]
+        
+        journey_ids = [j.journey_id for j in journeys]
+        entities_with_timelines = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                profile_spec, journeys, entity_type, timeline_start,
+                execute_events, up_to_date, self.seed, engine.seed,
+                rng_state, draws_per_entity, handlers,
+            ),
+        ) as pool:
+            for shard in pool.map(_execute_shard, shards):
+                for entity, timeline in shard:
+                    entities_with_timelines.append(EntityWithTimeline(
+                        entity=entity,
+                        timeline=timeline,
+                        journey_ids=journey_ids,
+                    ))
+        
+        _advance_rng(engine._rng, count * draws_per_entity)
+        return entities_with_timelines
+    
     def _resolve_profile(
         self,
         profile: str | ProfileSpecification | dict,
@@ -442,6 +533,81 @@ class ProfileJourneyOrchestrator:
         return "entity"
 
 
+# =============================================================================
+# Parallel Workers
+# =============================================================================
+
+# Per-process state set up by _init_worker
+_worker_state: dict[str, Any] = {}
+
+
+def _probability_draws_per_entity(journeys: list[JourneySpecification]) -> int:
+    """Number of engine RNG draws create_timeline makes per entity."""
+    return sum(
+        1 for journey in journeys for event_def in journey.events
+        if event_def.probability < 1.0
+    )
+
+
+def _advance_rng(rng: Any, draws: int) -> None:
+    """Advance a random.Random by the given number of random() calls."""
+    for _ in range(draws):
+        rng.random()
+
+
+def _init_worker(
+    profile_spec: ProfileSpecification,
+    journeys: list[JourneySpecification],
+    entity_type: str,
+    timeline_start: date,
+    execute_events: bool,
+    up_to_date: date | None,
+    seed: int,
+    engine_seed: int | None,
+    rng_state: tuple,
+    draws_per_entity: int,
+    handlers: tuple[dict, dict],
+) -> None:
+    """Rebuild the executor, journey engine and handlers in a worker."""
+    engine = JourneyEngine(seed=engine_seed)
+    engine._handlers, engine._trigger_handlers = handlers
+    _worker_state.update(
+        executor=ProfileExecutor(profile_spec, seed=seed),
+        orchestrator=ProfileJourneyOrchestrator(seed=seed, journey_engine=engine),
+        journeys=journeys,
+        entity_type=entity_type,
+        timeline_start=timeline_start,
+        execute_events=execute_events,
+        up_to_date=up_to_date,
+        rng_state=rng_state,
+        draws_per_entity=draws_per_entity,
+    )
+
+
+def _execute_shard(shard: tuple[int, int]) -> list[tuple[GeneratedEntity, Timeline]]:
+    """Generate entities start..stop-1 with their timelines."""
+    start, stop = shard
+    state = _worker_state
+    orchestrator = state["orchestrator"]
+    engine = orchestrator.journey_engine
+    
+    # Put the shared engine RNG where the serial run would be at entity start
+    engine._rng.setstate(state["rng_state"])
+    _advance_rng(engine._rng, start * state["draws_per_entity"])
+    
+    results = []
+    for index in range(start, stop):
+        entity = state["executor"]._generate_entity(index)
+        timeline = orchestrator._build_timeline(
+            entity, state["journeys"], state["entity_type"],
+            state["timeline_start"], state["execute_events"], state["up_to_date"],
+        )
+        results.append((entity, timeline))
+    # Timelines are returned to the parent; don't keep them alive here
+    engine._active_timelines.clear()
+    return results
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
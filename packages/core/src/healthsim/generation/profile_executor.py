@@ -6,25 +6,41 @@ This is Phase 2 of the two-phase architecture:
 
 The executor is deterministic: given the same ProfileSpecification and seed,
 it produces identical output.
+
+Two execution modes are available:
+  Scalar (default): each entity draws its attributes from its own
+    random.Random seeded by HierarchicalSeedManager.
+  Vectorized: each attribute is drawn as a whole column for all entities
+    from a numpy.random.Generator stream, using distributions compiled
+    once per profile. Much faster for large cohorts; values differ from
+    scalar mode but are equally deterministic for a given seed.
 """
 
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
+import zlib
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import date, datetime, timedelta
+from itertools import repeat
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel
 
 from healthsim.generation.distributions import (
     AgeBandDistribution,
     CategoricalDistribution,
     ConditionalDistribution,
+    Distribution,
     ExplicitDistribution,
     LogNormalDistribution,
     NormalDistribution,
     UniformDistribution,
+    VectorizedSampler,
+    compile_sampler,
     create_distribution,
 )
 from healthsim.generation.profile_schema import (
@@ -33,6 +49,9 @@ from healthsim.generation.profile_schema import (
     ProfileSpecification,
 )
 
+# Entities per generator block in vectorized mode. Each block draws from its
+# own stream, so the first N entities are the same whatever the total count.
+VECTOR_BLOCK_SIZE = 8192
 
 
 class HierarchicalSeedManager:
@@ -81,6 +100,24 @@ class HierarchicalSeedManager:
         """
         return random.Random(self.get_entity_seed(entity_index))
 
+    def get_stream_rng(self, stream: str, block: int = 0) -> np.random.Generator:
+        """Get a NumPy generator for a named attribute stream.
+
+        Used by vectorized execution: each attribute (e.g. "demographics.age")
+        draws its column from its own stream, so adding or removing one
+        attribute does not shift the values of the others.
+
+        Args:
+            stream: Stable name of the attribute stream
+            block: Index of the entity block within the stream
+
+        Returns:
+            Generator seeded from the master seed, stream name and block
+        """
+        return np.random.default_rng(
+            [self.master_seed, zlib.crc32(stream.encode("utf-8")), block]
+        )
+
     def reset(self) -> None:
         """Reset to initial state."""
         self._master_rng = random.Random(self.master_seed)
@@ -196,17 +233,23 @@ class ProfileExecutor:
         self.seed = seed or profile.generation.seed or random.randint(0, 2**31 - 1)
         self.seed_manager = HierarchicalSeedManager(self.seed)
         self._reference_data: dict[str, Any] = {}
+        # Distributions built from DistributionSpecs, keyed by spec identity
+        self._distributions: dict[int, Distribution] = {}
+        self._samplers: dict[int, VectorizedSampler] = {}
 
     def execute(
         self,
         count_override: int | None = None,
         dry_run: bool = False,
+        vectorized: bool = False,
     ) -> ExecutionResult:
         """Execute the profile to generate entities.
 
         Args:
             count_override: Override the count from profile
             dry_run: If True, generate sample only
+            vectorized: Draw attributes column-wise with NumPy (see module
+                docstring); recommended for large counts
 
         Returns:
             ExecutionResult with generated entities and validation
@@ -218,10 +261,13 @@ class ProfileExecutor:
         if dry_run:
             count = min(count, 5)  # Sample only
 
-        entities: list[GeneratedEntity] = []
-        for i in range(count):
-            entity = self._generate_entity(i)
-            entities.append(entity)
+        if vectorized:
+            entities = self._generate_entities_vectorized(count)
+        else:
+            entities = []
+            for i in range(count):
+                entity = self._generate_entity(i)
+                entities.append(entity)
 
         duration = time.time() - start_time
         validation = self._validate(entities)
@@ -396,18 +442,15 @@ class ProfileExecutor:
         Returns:
             Sampled value
         """
-        spec_dict = dist_spec.model_dump(exclude_none=True)
-        dist = create_distribution(spec_dict)
-
         # Handle conditional distributions
-        if dist_spec.type == DistributionType.CONDITIONAL and context:
+        if dist_spec.type == DistributionType.CONDITIONAL:
             cond_dist = ConditionalDistribution(
                 rules=dist_spec.rules or [],
                 default=dist_spec.default,
             )
-            value = cond_dist.sample(context, rng)
+            value = cond_dist.sample(context or {}, rng)
         else:
-            value = dist.sample(rng)
+            value = self._get_distribution(dist_spec).sample(rng)
 
         # Apply bounds if specified
         if dist_spec.min is not None and value < dist_spec.min:
@@ -420,6 +463,223 @@ class ProfileExecutor:
 
         return value
 
+    def _get_distribution(self, dist_spec: DistributionSpec) -> Distribution:
+        """Build a spec's distribution once and reuse it for every entity."""
+        key = id(dist_spec)
+        if key not in self._distributions:
+            self._distributions[key] = create_distribution(dist_spec.model_dump(exclude_none=True))
+        return self._distributions[key]
+
+    # =========================================================================
+    # Vectorized execution
+    # =========================================================================
+
+    def _draw_blocks(
+        self,
+        stream: str,
+        size: int,
+        draw: Callable[[np.random.Generator, int, slice], np.ndarray],
+    ) -> np.ndarray:
+        """Draw a column block by block from per-block generators.
+
+        Each block of VECTOR_BLOCK_SIZE entities has its own generator, so an
+        entity's values depend only on the seed and its block, not on the
+        total count.
+
+        Args:
+            stream: Seed stream name for this attribute
+            size: Column length (a multiple of VECTOR_BLOCK_SIZE)
+            draw: Callable taking (generator, block length, block slice)
+
+        Returns:
+            Array of size values
+        """
+        blocks = []
+        for block, start in enumerate(range(0, size, VECTOR_BLOCK_SIZE)):
+            rng = self.seed_manager.get_stream_rng(stream, block)
+            blocks.append(draw(rng, VECTOR_BLOCK_SIZE, slice(start, start + VECTOR_BLOCK_SIZE)))
+        return np.concatenate(blocks)
+
+    def _sample_column(
+        self,
+        stream: str,
+        dist_spec: DistributionSpec,
+        size: int,
+        as_int: bool = False,
+        context: dict[str, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Draw a whole attribute column from a compiled distribution.
+
+        Args:
+            stream: Seed stream name for this attribute
+            dist_spec: The distribution specification
+            size: Column length (a multiple of VECTOR_BLOCK_SIZE)
+            as_int: Round result to integer
+            context: Columns for conditional distributions
+
+        Returns:
+            Array of size sampled values
+        """
+        key = id(dist_spec)
+        if key not in self._samplers:
+            self._samplers[key] = compile_sampler(
+                dist_spec.model_dump(mode="json", exclude_none=True)
+            )
+        sampler = self._samplers[key]
+
+        values = self._draw_blocks(stream, size, lambda rng, n, block: sampler.sample(
+            rng, n, {k: v[block] for k, v in context.items()} if context else None,
+        ))
+
+        if values.dtype.kind in "fiu":
+            # Apply bounds if specified
+            if dist_spec.min is not None or dist_spec.max is not None:
+                values = np.clip(values, dist_spec.min, dist_spec.max)
+            if as_int:
+                values = np.rint(values).astype(np.int64)
+
+        return values
+
+    def _sample_flags(self, stream: str, size: int, prevalence: float) -> np.ndarray:
+        """Draw a boolean column that is True with the given prevalence."""
+        return self._draw_blocks(stream, size, lambda rng, n, _: rng.random(n) < prevalence)
+
+    def _generate_entities_vectorized(self, count: int) -> list[GeneratedEntity]:
+        """Generate count entities by drawing each attribute column-wise.
+
+        Args:
+            count: Number of entities
+
+        Returns:
+            Generated entities, indexed 0..count-1
+        """
+        # Columns are drawn in whole blocks and truncated to count at the end
+        size = -(-count // VECTOR_BLOCK_SIZE) * VECTOR_BLOCK_SIZE
+        columns: dict[str, list[Any]] = {}
+        constants: dict[str, Any] = {}
+
+        seeds = self._draw_blocks(
+            "entity_seed", size, lambda rng, n, _: rng.integers(0, 2**31 - 1, n),
+        )
+        columns["index"] = range(count)
+        columns["seed"] = seeds[:count].tolist()
+
+        demo = self.profile.demographics
+        if demo:
+            if demo.age:
+                ages = self._sample_column("demographics.age", demo.age, size, as_int=True)[:count]
+                months = self._draw_blocks(
+                    "demographics.birth_month", size, lambda rng, n, _: rng.integers(1, 13, n),
+                )[:count]
+                days = self._draw_blocks(
+                    "demographics.birth_day", size, lambda rng, n, _: rng.integers(1, 29, n),
+                )[:count]
+                years = date.today().year - ages
+                months_since_epoch = (years - 1970) * 12 + months - 1
+                birth_dates = (
+                    months_since_epoch.astype("datetime64[M]").astype("datetime64[D]")
+                    + (days - 1)
+                )
+                columns["age"] = ages.tolist()
+                columns["birth_date"] = birth_dates.tolist()
+
+            for name in ("gender", "race", "ethnicity"):
+                dist_spec = getattr(demo, name)
+                if dist_spec:
+                    values = self._sample_column(f"demographics.{name}", dist_spec, size)
+                    columns[name] = values[:count].tolist()
+
+            if demo.geography or demo.reference:
+                template = GeneratedEntity(index=0, seed=0)
+                self._generate_geography(template, random.Random(self.seed))
+                constants["state"] = template.state
+                constants["county_fips"] = template.county_fips
+
+        clinical = self.profile.clinical
+        if clinical:
+            condition_flags: list[tuple[str, np.ndarray]] = []
+            if clinical.primary_condition:
+                pc = clinical.primary_condition
+                condition_flags.append(
+                    (pc.code, self._sample_flags("clinical.primary_condition", size, pc.prevalence))
+                )
+
+            severity = None
+            if clinical.severity:
+                severity = self._sample_column("clinical.severity", clinical.severity, size)
+                columns["severity"] = severity[:count].tolist()
+                columns["attributes"] = [{"severity": s} for s in columns["severity"]]
+
+            for comorbidity in clinical.comorbidities or []:
+                stream = f"clinical.comorbidity.{comorbidity.code}"
+                condition_flags.append(
+                    (comorbidity.code, self._sample_flags(stream, size, comorbidity.prevalence))
+                )
+
+            if condition_flags:
+                # Encode each entity's conditions as a bitmask, then copy the
+                # matching pre-built list
+                bits = np.zeros(count, dtype=np.int64)
+                for position, (_, flags) in enumerate(condition_flags):
+                    bits |= flags[:count].astype(np.int64) << position
+                codes = [code for code, _ in condition_flags]
+                combos = [
+                    [code for position, code in enumerate(codes) if mask >> position & 1]
+                    for mask in range(1 << len(codes))
+                ] if len(codes) <= 16 else None
+                if combos is not None:
+                    columns["conditions"] = [combos[mask][:] for mask in bits.tolist()]
+                else:
+                    columns["conditions"] = [
+                        [code for code, hit in zip(codes, row, strict=True) if hit]
+                        for row in zip(
+                            *(flags[:count].tolist() for _, flags in condition_flags), strict=True
+                        )
+                    ]
+
+            if clinical.lab_values:
+                context = {"severity": severity} if severity is not None else None
+                lab_names = list(clinical.lab_values)
+                lab_columns = [
+                    self._sample_column(
+                        f"clinical.lab.{name}", dist_spec, size, context=context
+                    )[:count].tolist()
+                    for name, dist_spec in clinical.lab_values.items()
+                ]
+                columns["lab_values"] = [
+                    dict(zip(lab_names, row, strict=True))
+                    for row in zip(*lab_columns, strict=True)
+                ]
+
+        coverage = self.profile.coverage
+        if coverage:
+            constants["coverage_type"] = coverage.type
+            if coverage.plan_distribution:
+                plan_spec = DistributionSpec(
+                    type=DistributionType.EXPLICIT,
+                    values=[
+                        {"value": k, "weight": v} for k, v in coverage.plan_distribution.items()
+                    ],
+                )
+                plan_types = self._sample_column("coverage.plan_type", plan_spec, size)
+                columns["plan_type"] = plan_types[:count].tolist()
+            elif coverage.plan_type:
+                plan_types = self._sample_column("coverage.plan_type", coverage.plan_type, size)
+                columns["plan_type"] = plan_types[:count].tolist()
+
+        # Build entities positionally, one argument column per dataclass field
+        args = []
+        for f in fields(GeneratedEntity):
+            if f.name in columns:
+                args.append(columns[f.name])
+            elif f.name in constants:
+                args.append(repeat(constants[f.name], count))
+            elif f.default_factory is not MISSING:
+                args.append([f.default_factory() for _ in range(count)])
+            else:
+                args.append(repeat(f.default, count))
+        return list(map(GeneratedEntity, *args))
+
     def _validate(self, entities: list[GeneratedEntity]) -> ValidationReport:
         """Validate generated entities against profile specification.
 
@@ -478,8 +738,9 @@ class ProfileExecutor:
 
         # Validate gender distribution
         if demo.gender and demo.gender.type == DistributionType.CATEGORICAL:
+            gender_counts = Counter(e.gender for e in entities)
             for gender, target_pct in (demo.gender.weights or {}).items():
-                actual_count = sum(1 for e in entities if e.gender == gender)
+                actual_count = gender_counts[gender]
                 actual_pct = actual_count / count if count > 0 else 0
                 report.metrics.append(ValidationMetric(
                     name=f"Gender {gender}",
@@ -499,13 +760,15 @@ class ProfileExecutor:
             return
 
         count = len(entities)
+        # Count each code once per entity in a single pass
+        condition_counts = Counter(
+            code for e in entities for code in set(e.conditions)
+        )
 
         # Validate primary condition prevalence
         if clinical.primary_condition:
             pc = clinical.primary_condition
-            actual_count = sum(
-                1 for e in entities if pc.code in e.conditions
-            )
+            actual_count = condition_counts[pc.code]
             actual_pct = actual_count / count if count > 0 else 0
             report.metrics.append(ValidationMetric(
                 name=f"Primary condition {pc.code}",
@@ -517,9 +780,7 @@ class ProfileExecutor:
         # Validate comorbidities
         if clinical.comorbidities:
             for comorbidity in clinical.comorbidities:
-                actual_count = sum(
-                    1 for e in entities if comorbidity.code in e.conditions
-                )
+                actual_count = condition_counts[comorbidity.code]
                 actual_pct = actual_count / count if count > 0 else 0
                 report.metrics.append(ValidationMetric(
                     name=f"Comorbidity {comorbidity.code}",
@@ -543,10 +804,9 @@ class ProfileExecutor:
 
         # Validate plan distribution
         if coverage.plan_distribution:
+            plan_counts = Counter(e.plan_type for e in entities)
             for plan, target_pct in coverage.plan_distribution.items():
-                actual_count = sum(
-                    1 for e in entities if e.plan_type == plan
-                )
+                actual_count = plan_counts[plan]
                 actual_pct = actual_count / count if count > 0 else 0
                 report.metrics.append(ValidationMetric(
                     name=f"Plan {plan}",
@@ -560,6 +820,7 @@ def execute_profile(
     profile: ProfileSpecification | dict[str, Any] | str,
     seed: int | None = None,
     count: int | None = None,
+    vectorized: bool = False,
 ) -> ExecutionResult:
     """Convenience function to execute a profile specification.
 
@@ -567,6 +828,7 @@ def execute_profile(
         profile: ProfileSpecification, dict, or JSON string
         seed: Optional seed override
         count: Optional count override
+        vectorized: Draw attributes column-wise with NumPy
 
     Returns:
         ExecutionResult with generated entities
@@ -590,4 +852,4 @@ def execute_profile(
         spec = profile
 
     executor = ProfileExecutor(spec, seed=seed)
-    return executor.execute(count_override=count)
+    return executor.execute(count_override=count, vectorized=vectorized)
@@ -241,6 +241,8 @@ class SkillRegistry:
         self._registrations: dict[str, SkillRegistration] = {}
         self._condition_index: dict[str, list[str]] = {}  # condition -> skill_names
         self._skill_resolver = None  # Lazy loaded
+        # (event_type, condition, product) -> (skill_name, lookup_key) or None
+        self._event_lookups: dict[tuple[str, str, str | None], tuple[str, str] | None] = {}
         
         # Load default registrations
         for reg_dict in DEFAULT_REGISTRATIONS:
@@ -253,6 +255,7 @@ class SkillRegistry:
             registration: The skill registration
         """
         self._registrations[registration.skill_name] = registration
+        self._event_lookups.clear()
         
         # Index by conditions
         for condition in registration.conditions:
@@ -386,21 +389,10 @@ class SkillRegistry:
             >>> print(params["icd10"])
             'E11.65'
         """
-        # Find the skill
-        registration = self.find_skill_for_condition(condition, product)
-        if not registration:
-            return {}
-        
-        # Map event type to capability
-        capability = self._event_type_to_capability(event_type)
-        if not capability:
+        lookup = self.get_event_lookup(event_type, condition, product)
+        if not lookup:
             return {}
-        
-        # Get the lookup key for this capability
-        lookup_key = self.get_capability_lookup(registration.skill_name, capability)
-        if not lookup_key:
-            # Try to use the capability name as lookup key
-            lookup_key = capability.value
+        skill_name, lookup_key = lookup
         
         # Resolve using SkillResolver
         resolver = self._get_skill_resolver()
@@ -408,7 +400,7 @@ class SkillRegistry:
         from healthsim.generation.skill_reference import SkillReference
         
         skill_ref = SkillReference(
-            skill=registration.skill_name,
+            skill=skill_name,
             lookup=lookup_key,
             context=context or {},
         )
@@ -416,6 +408,41 @@ class SkillRegistry:
         result = resolver.resolve(skill_ref, entity or {})
         return result.parameters
     
+    def get_event_lookup(
+        self,
+        event_type: str,
+        condition: str,
+        product: str | None = None,
+    ) -> tuple[str, str] | None:
+        """Find the skill and lookup key that resolve an event.
+        
+        Results are memoized per (event_type, condition, product) until the
+        next register() call.
+        
+        Args:
+            event_type: Type of event (diagnosis, lab_order, etc.)
+            condition: Clinical condition (diabetes, ckd, etc.)
+            product: Optional product filter
+            
+        Returns:
+            (skill_name, lookup_key), or None if nothing can resolve it
+        """
+        key = (event_type, condition, product)
+        if key in self._event_lookups:
+            return self._event_lookups[key]
+        
+        lookup = None
+        registration = self.find_skill_for_condition(condition, product)
+        # Map event type to capability
+        capability = self._event_type_to_capability(event_type) if registration else None
+        if registration and capability:
+            # Get the lookup key for this capability, falling back to its name
+            lookup_key = self.get_capability_lookup(registration.skill_name, capability)
+            lookup = (registration.skill_name, lookup_key or capability.value)
+        
+        self._event_lookups[key] = lookup
+        return lookup
+    
     def _event_type_to_capability(self, event_type: str) -> SkillCapability | None:
         """Map an event type to a skill capability."""
         mapping = {
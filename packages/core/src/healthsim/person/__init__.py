@@ -11,7 +11,14 @@ from healthsim.person.demographics import (
     Person,
     PersonName,
 )
-from healthsim.person.identifiers import Identifier, IdentifierType
+from healthsim.person.identifiers import (
+    Identifier,
+    IdentifierAllocator,
+    IdentifierBlock,
+    IdentifierNamespace,
+    IdentifierType,
+    NamespaceFormat,
+)
 from healthsim.person.relationships import Relationship, RelationshipType
 
 __all__ = [
@@ -24,6 +31,10 @@ __all__ = [
     # Identifiers
     "IdentifierType",
     "Identifier",
+    "IdentifierNamespace",
+    "NamespaceFormat",
+    "IdentifierBlock",
+    "IdentifierAllocator",
     # Relationships
     "RelationshipType",
     "Relationship",
@@ -1,11 +1,18 @@
 """Person identifier management.
 
 Provides classes for managing various types of identifiers
-associated with a person.
+associated with a person, and an allocator that hands out unique
+entity IDs (patient, MRN, member, claim, subject) for large cohorts.
 """
 
+import hashlib
+import re
+import secrets
+import threading
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -169,3 +176,324 @@ class IdentifierSet(BaseModel):
     def __iter__(self):
         """Iterate over identifiers."""
         return iter(self.identifiers)
+
+
+# =============================================================================
+# Unique ID Allocation
+# =============================================================================
+
+
+class IdentifierNamespace(str, Enum):
+    """Namespaces with their own ID sequence.
+
+    Attributes:
+        PATIENT: Patient resource ID (patient-000001)
+        MRN: Medical record number (MRN000001)
+        MEMBER: Health plan member ID (M000001)
+        CLAIM: Claim ID (CLM0000001)
+        SUBJECT: Clinical trial subject ID (SUBJ-00001)
+    """
+
+    PATIENT = "patient"
+    MRN = "mrn"
+    MEMBER = "member"
+    CLAIM = "claim"
+    SUBJECT = "subject"
+
+
+@dataclass(frozen=True)
+class NamespaceFormat:
+    """How IDs in a namespace are written and where they are persisted.
+
+    Attributes:
+        prefix: Text before the number
+        width: Minimum number of digits (zero-padded; grows past it)
+        table: Canonical table holding persisted IDs (for resume)
+        column: Column in that table
+    """
+
+    prefix: str
+    width: int
+    table: str | None = None
+    column: str | None = None
+
+    def format(self, number: int) -> str:
+        """Write a sequence number as an ID."""
+        return f"{self.prefix}{number:0{self.width}d}"
+
+    def parse(self, value: str) -> int | None:
+        """Get the sequence number from an ID, or None if it doesn't match."""
+        match = re.fullmatch(re.escape(self.prefix) + r"(\d+)", value)
+        return int(match.group(1)) if match else None
+
+
+DEFAULT_NAMESPACE_FORMATS: dict[str, NamespaceFormat] = {
+    IdentifierNamespace.PATIENT.value: NamespaceFormat("patient-", 6, "patients", "id"),
+    IdentifierNamespace.MRN.value: NamespaceFormat("MRN", 6, "patients", "mrn"),
+    IdentifierNamespace.MEMBER.value: NamespaceFormat("M", 6, "members", "member_id"),
+    IdentifierNamespace.CLAIM.value: NamespaceFormat("CLM", 7, "claims", "claim_id"),
+    IdentifierNamespace.SUBJECT.value: NamespaceFormat("SUBJ-", 5, "subjects", "subject_id"),
+}
+
+
+# Allocators created with IdentifierAllocator.for_seed() start each seed in
+# its own range of SEED_ID_SPAN sequence numbers, one of SEED_ID_RANGES ranges
+SEED_ID_SPAN = 1_000_000
+SEED_ID_RANGES = 1_000_000
+
+
+def seed_id_start(seed: int | None) -> int:
+    """Get the first sequence number of a seed's ID range.
+
+    A seed always maps to the same range, picked by hashing the seed, so
+    seeded output stays reproducible while different seeds (in one process
+    or across runs) are unlikely to share IDs: two seeds hash to the same
+    range with probability 1/SEED_ID_RANGES. Without a seed a random range
+    is used. A generator that hands out more than SEED_ID_SPAN IDs in one
+    namespace runs into the next range. Share one allocator when IDs must
+    be guaranteed unique.
+
+    Args:
+        seed: Generator seed, or None
+
+    Returns:
+        First sequence number of the range
+    """
+    if seed is None:
+        slot = secrets.randbelow(SEED_ID_RANGES)
+    else:
+        digest = hashlib.sha256(str(seed).encode()).digest()
+        slot = int.from_bytes(digest[:8], "big") % SEED_ID_RANGES
+    return slot * SEED_ID_SPAN + 1
+
+
+@dataclass
+class IdentifierBlock:
+    """A leased, contiguous range of sequence numbers in one namespace.
+
+    Blocks are plain picklable objects: a parent process can reserve one
+    block per worker and send it along, so workers never collide.
+
+    Attributes:
+        namespace: Namespace the block belongs to
+        format: How to write IDs from this block
+        start: First sequence number (inclusive)
+        stop: End of the range (exclusive)
+
+    Example:
+        >>> block = allocator.reserve("patient", 1000)
+        >>> block.next()
+        'patient-000001'
+    """
+
+    namespace: str
+    format: NamespaceFormat
+    start: int
+    stop: int
+    position: int = field(default=-1)
+
+    def __post_init__(self) -> None:
+        if self.position < 0:
+            self.position = self.start
+
+    def __len__(self) -> int:
+        """Return the size of the block."""
+        return self.stop - self.start
+
+    @property
+    def remaining(self) -> int:
+        """Number of IDs not yet handed out."""
+        return self.stop - self.position
+
+    def next(self) -> str:
+        """Take the next ID from the block.
+
+        Raises:
+            ValueError: If the block is exhausted
+        """
+        if self.position >= self.stop:
+            raise ValueError(
+                f"Identifier block {self.namespace}[{self.start}:{self.stop}] is exhausted"
+            )
+        number = self.position
+        self.position += 1
+        return self.format.format(number)
+
+    def take(self, count: int) -> list[str]:
+        """Take the next count IDs from the block.
+
+        Raises:
+            ValueError: If fewer than count IDs remain
+        """
+        if count > self.remaining:
+            raise ValueError(
+                f"Identifier block {self.namespace}[{self.start}:{self.stop}] has "
+                f"{self.remaining} IDs left, {count} requested"
+            )
+        fmt = self.format.format
+        ids = [fmt(n) for n in range(self.position, self.position + count)]
+        self.position += count
+        return ids
+
+
+class IdentifierAllocator:
+    """Collision-free ID allocation by namespace.
+
+    Each namespace has a high-water mark. IDs are handed out from leased
+    blocks of sequence numbers, and every lease moves the mark past the
+    block, so IDs never repeat within an allocator. Allocation does not
+    use randomness: the same sequence of calls always produces the same
+    IDs, so generators stay deterministic for a seed.
+
+    To run several worker processes, reserve() a block per worker in the
+    parent and pass it to the worker. To add to an existing database,
+    resume_from_db() moves each mark past the largest persisted ID.
+    Generators that are not given an allocator use for_seed(), so
+    generators with different seeds do not share IDs.
+
+    Example:
+        >>> allocator = IdentifierAllocator()
+        >>> allocator.next_id("patient")
+        'patient-000001'
+        >>> allocator.next_id(IdentifierNamespace.MRN)
+        'MRN000001'
+        >>> worker_block = allocator.reserve("patient", 10_000)
+    """
+
+    def __init__(
+        self,
+        block_size: int = 1000,
+        formats: dict[str, NamespaceFormat] | None = None,
+        start: int = 1,
+    ) -> None:
+        """Initialize the allocator.
+
+        Args:
+            block_size: IDs leased at a time by next_id()
+            formats: Namespace formats (defaults to DEFAULT_NAMESPACE_FORMATS;
+                entries here override or extend the defaults)
+            start: First sequence number in every namespace
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.block_size = block_size
+        self.formats = {**DEFAULT_NAMESPACE_FORMATS, **(formats or {})}
+        self._start = start
+        self._high_water: dict[str, int] = {}
+        self._blocks: dict[str, IdentifierBlock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_seed(cls, seed: int | None, **kwargs: Any) -> "IdentifierAllocator":
+        """Create an allocator starting at the seed's ID range.
+
+        Args:
+            seed: Generator seed, or None for a random range
+            **kwargs: Other IdentifierAllocator arguments
+
+        Returns:
+            Allocator whose namespaces start at seed_id_start(seed)
+        """
+        return cls(start=seed_id_start(seed), **kwargs)
+
+    def _namespace(self, namespace: str | IdentifierNamespace) -> str:
+        name = namespace.value if isinstance(namespace, IdentifierNamespace) else namespace
+        if name not in self.formats:
+            raise ValueError(f"Unknown identifier namespace: {name}")
+        return name
+
+    def high_water(self, namespace: str | IdentifierNamespace) -> int:
+        """Get the next sequence number that has not been leased."""
+        return self._high_water.get(self._namespace(namespace), self._start)
+
+    def reserve(
+        self, namespace: str | IdentifierNamespace, count: int | None = None
+    ) -> IdentifierBlock:
+        """Lease a block of IDs that no other caller will receive.
+
+        Args:
+            namespace: Namespace to allocate from
+            count: Block size (defaults to the allocator's block_size)
+
+        Returns:
+            IdentifierBlock covering the leased range
+        """
+        name = self._namespace(namespace)
+        count = self.block_size if count is None else count
+        if count < 0:
+            raise ValueError("count must not be negative")
+        with self._lock:
+            start = self._high_water.get(name, self._start)
+            self._high_water[name] = start + count
+        return IdentifierBlock(name, self.formats[name], start, start + count)
+
+    def next_id(self, namespace: str | IdentifierNamespace) -> str:
+        """Get the next ID in a namespace.
+
+        Args:
+            namespace: Namespace to allocate from
+
+        Returns:
+            Formatted ID
+        """
+        name = self._namespace(namespace)
+        block = self._blocks.get(name)
+        if block is None or block.remaining == 0:
+            block = self._blocks[name] = self.reserve(name)
+        return block.next()
+
+    def next_ids(self, namespace: str | IdentifierNamespace, count: int) -> list[str]:
+        """Get the next count IDs in a namespace.
+
+        Args:
+            namespace: Namespace to allocate from
+            count: Number of IDs
+
+        Returns:
+            List of formatted IDs
+        """
+        return [self.next_id(namespace) for _ in range(count)]
+
+    def reset(self) -> None:
+        """Forget all leases and start every namespace over."""
+        with self._lock:
+            self._high_water.clear()
+            self._blocks.clear()
+
+    def resume_from_db(self, conn: Any, namespaces: list[str] | None = None) -> dict[str, int]:
+        """Move high-water marks past the largest IDs already persisted.
+
+        Only IDs written in the namespace's format are considered. Tables
+        that don't exist are skipped.
+
+        Args:
+            conn: DuckDB connection
+            namespaces: Namespaces to resume (defaults to all with a table)
+
+        Returns:
+            Dict of namespace to its new high-water mark
+        """
+        resumed = {}
+        for name in namespaces or list(self.formats):
+            name = self._namespace(name)
+            fmt = self.formats[name]
+            if not fmt.table or not fmt.column:
+                continue
+            try:
+                row = conn.execute(
+                    f"""
+                    SELECT MAX(CAST(substr({fmt.column}, ?) AS BIGINT))
+                    FROM {fmt.table}
+                    WHERE regexp_full_match({fmt.column}, ?)
+                    """,
+                    [len(fmt.prefix) + 1, re.escape(fmt.prefix) + r"\d+"],
+                ).fetchone()
+            except Exception:
+                continue
+            if row and row[0] is not None:
+                with self._lock:
+                    current = self._high_water.get(name, self._start)
+                    self._high_water[name] = max(current, row[0] + 1)
+                    self._blocks.pop(name, None)
+            resumed[name] = self.high_water(name)
+        return resumed
@@ -11,18 +11,28 @@ This service is the primary interface for the auto-persist feature,
 coordinating between auto-naming, summary generation, and database operations.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 from pathlib import Path
+import gzip
 import re
 import json
 
 from ..db import get_connection
 from .serializers import get_serializer, get_table_info, ENTITY_TABLE_MAP
 from .auto_naming import generate_cohort_name, ensure_unique_name, sanitize_name
-from .summary import CohortSummary, generate_summary, get_cohort_by_name
+from .summary import (
+    CohortSummary,
+    apply_stats_delta,
+    generate_summary,
+    get_cohort_by_name,
+    init_cohort_stats,
+    invalidate_cohort_stats,
+    refresh_cohort_stats,
+)
 
 
 @dataclass
@@ -38,6 +48,8 @@ class PersistResult:
     is_new_cohort: bool
     batch_number: Optional[int] = None
     total_batches: Optional[int] = None
+    rows_inserted: int = 0
+    rows_updated: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -50,6 +62,8 @@ class PersistResult:
             'is_new_cohort': self.is_new_cohort,
             'batch_number': self.batch_number,
             'total_batches': self.total_batches,
+            'rows_inserted': self.rows_inserted,
+            'rows_updated': self.rows_updated,
             'summary': self.summary.to_dict(),
         }
 
@@ -197,6 +211,22 @@ DISALLOWED_SQL_PATTERNS = [
     r';.*\S',  # Multiple statements
 ]
 
+# Compression codecs accepted by export_cohort, per format
+EXPORT_COMPRESSIONS = {
+    'json': ('gzip',),
+    'csv': ('zstd', 'gzip'),
+    'parquet': ('zstd', 'gzip', 'snappy'),
+}
+
+# Rows fetched per round trip when streaming a JSON export
+EXPORT_BATCH_SIZE = 10_000
+
+# Columns dropped from exports when include_provenance is False
+EXPORT_PROVENANCE_COLUMNS = {
+    'source_type', 'source_system', 'skill_used',
+    'generation_seed', 'cohort_id'
+}
+
 # Tables that contain entity data (for cloning/merging/export)
 CANONICAL_TABLES = [
     # Core
@@ -247,6 +277,122 @@ CANONICAL_TABLES = [
 ]
 
 
+@contextmanager
+def staged_rows(conn, rows: List[Dict[str, Any]]) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Register a batch of row dicts as a temporary DuckDB view.
+    
+    Rows are staged as an object-typed DataFrame so DuckDB casts the
+    original Python values to the target column types on insert.
+    Columns are the union of row keys in first-seen order; missing
+    keys become NULL.
+    
+    Args:
+        conn: DuckDB connection
+        rows: Row dictionaries to stage
+        
+    Yields:
+        Tuple of (view_name, columns)
+    """
+    import pandas as pd
+    
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    column_list = list(columns)
+    
+    batch = pd.DataFrame(
+        [[row.get(col) for col in column_list] for row in rows],
+        columns=column_list,
+        dtype=object,
+    )
+    
+    view_name = f"_staged_rows_{uuid4().hex}"
+    conn.register(view_name, batch)
+    try:
+        yield view_name, column_list
+    finally:
+        conn.unregister(view_name)
+
+
+def bulk_upsert_rows(
+    conn,
+    table_name: str,
+    id_column: str,
+    rows: List[Dict[str, Any]],
+) -> Tuple[int, int]:
+    """
+    Upsert serialized rows into a canonical table in one statement.
+    
+    Rows must have unique values in id_column.
+    
+    Args:
+        conn: DuckDB connection
+        table_name: Canonical table to write
+        id_column: Entity ID column used to detect existing rows
+        rows: Serialized row dictionaries
+        
+    Returns:
+        Tuple of (rows_inserted, rows_updated)
+    """
+    with staged_rows(conn, rows) as (view_name, columns):
+        return upsert_staged_rows(conn, table_name, id_column, view_name, columns)
+
+
+def upsert_staged_rows(
+    conn,
+    table_name: str,
+    id_column: str,
+    view_name: str,
+    columns: List[str],
+) -> Tuple[int, int]:
+    """
+    Upsert rows from a staged view (see staged_rows) into a canonical table.
+    
+    Existing rows get every staged column overwritten, NULLs included,
+    matching the per-entity UPDATE of the serialized row.
+    
+    Args:
+        conn: DuckDB connection
+        table_name: Canonical table to write
+        id_column: Entity ID column used to detect existing rows
+        view_name: Staged view holding rows with unique IDs
+        columns: Columns to write
+        
+    Returns:
+        Tuple of (rows_inserted, rows_updated)
+    """
+    column_str = ', '.join(columns)
+    total, rows_updated = conn.execute(f"""
+        SELECT COUNT(*), COUNT(t.{id_column}) FROM {view_name} b
+        LEFT JOIN {table_name} t ON t.{id_column} = b.{id_column}
+    """).fetchone()
+    
+    updates = [col for col in columns if col != id_column]
+    if updates:
+        set_clause = ', '.join(
+            f"{col} = excluded.{col}" for col in updates
+        )
+        conflict_action = f"DO UPDATE SET {set_clause}"
+    else:
+        conflict_action = "DO NOTHING"
+    
+    conn.execute(f"""
+        INSERT INTO {table_name} ({column_str})
+        SELECT {column_str} FROM {view_name}
+        ON CONFLICT ({id_column}) {conflict_action}
+    """)
+    
+    return total - rows_updated, rows_updated
+
+
+def _json_default(value: Any) -> str:
+    """Serialize dates as ISO strings and anything else via str()."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
 def _validate_query(query: str) -> bool:
     """
     Validate that a query is SELECT-only.
@@ -361,6 +507,9 @@ class AutoPersistService:
             VALUES (?, ?, ?, ?, ?)
         """, [cohort_id, name, description, now, now])
         
+        # New cohort has no entities, so its stats cache starts complete
+        init_cohort_stats(cohort_id, self.conn)
+        
         # Add tags
         if tags:
             for tag in tags:
@@ -442,6 +591,160 @@ class AutoPersistService:
         if not entities:
             raise ValueError("No entities to persist")
         
+        entity_type, table_name, id_column, serializer = self._resolve_entity_table(entity_type)
+        cohort_id, cohort_name, is_new_cohort = self._resolve_persist_cohort(
+            entity_type=entity_type,
+            cohort_id=cohort_id,
+            cohort_name=cohort_name,
+            cohort_description=cohort_description,
+            context_keywords=context_keywords,
+            tags=tags,
+        )
+        
+        # Persist entities
+        entity_ids = []
+        inserted = []
+        rows_updated = 0
+        
+        for entity in entities:
+            serialized = self._serialize_for_persist(entity, serializer, cohort_id, id_column)
+            entity_id = serialized[id_column]
+            entity_ids.append(entity_id)
+            
+            # Build insert statement
+            columns = list(serialized.keys())
+            placeholders = ', '.join(['?' for _ in columns])
+            column_str = ', '.join(columns)
+            
+            try:
+                self.conn.execute(f"""
+                    INSERT INTO {table_name} ({column_str})
+                    VALUES ({placeholders})
+                """, list(serialized.values()))
+                inserted.append(serialized)
+            except Exception as e:
+                # Handle duplicate key by updating
+                if 'duplicate' in str(e).lower() or 'unique' in str(e).lower():
+                    # Update existing record
+                    set_clause = ', '.join([f"{col} = ?" for col in columns if col != id_column])
+                    values = [v for k, v in serialized.items() if k != id_column]
+                    values.append(entity_id)
+                    
+                    self.conn.execute(f"""
+                        UPDATE {table_name}
+                        SET {set_clause}
+                        WHERE {id_column} = ?
+                    """, values)
+                    rows_updated += 1
+                else:
+                    raise
+        
+        if rows_updated:
+            self._update_cohort_stats(cohort_id, table_name, None, rows_updated)
+        elif inserted:
+            with staged_rows(self.conn, inserted) as (view_name, _):
+                self._update_cohort_stats(cohort_id, table_name, view_name, rows_updated)
+        
+        rows_inserted = len(inserted)
+        return self._finish_persist(
+            cohort_id=cohort_id,
+            cohort_name=cohort_name,
+            entity_type=entity_type,
+            entities_persisted=len(entities),
+            entity_ids=entity_ids,
+            is_new_cohort=is_new_cohort,
+            batch_number=batch_number,
+            total_batches=total_batches,
+            rows_inserted=rows_inserted,
+            rows_updated=rows_updated,
+        )
+    
+    def persist_entities_bulk(
+        self,
+        entities: List[Dict],
+        entity_type: str,
+        cohort_id: Optional[str] = None,
+        cohort_name: Optional[str] = None,
+        cohort_description: Optional[str] = None,
+        context_keywords: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        batch_number: Optional[int] = None,
+        total_batches: Optional[int] = None,
+    ) -> PersistResult:
+        """
+        Persist entities with a single set-based write per batch.
+        
+        Same contract as persist_entities(), but instead of one INSERT
+        (plus UPDATE fallback) per entity, the serialized batch is staged
+        as a DataFrame and written with one INSERT ... ON CONFLICT DO UPDATE.
+        Use this for large cohorts; results are identical.
+        
+        If the same entity ID appears more than once in the batch, the
+        last occurrence wins (matching the row-by-row behavior).
+        
+        Args:
+            entities: List of entity dictionaries to persist
+            entity_type: Type of entities (patient, claim, etc.)
+            cohort_id: Existing cohort ID to add to (optional)
+            cohort_name: Name for new cohort (optional, auto-generated if not provided)
+            cohort_description: Description for cohort (optional)
+            context_keywords: Keywords from generation context for auto-naming
+            tags: Tags for the cohort
+            batch_number: Current batch number (for progress tracking)
+            total_batches: Total number of batches (for progress tracking)
+            
+        Returns:
+            PersistResult with summary and rows_inserted / rows_updated
+        """
+        if not entities:
+            raise ValueError("No entities to persist")
+        
+        entity_type, table_name, id_column, serializer = self._resolve_entity_table(entity_type)
+        cohort_id, cohort_name, is_new_cohort = self._resolve_persist_cohort(
+            entity_type=entity_type,
+            cohort_id=cohort_id,
+            cohort_name=cohort_name,
+            cohort_description=cohort_description,
+            context_keywords=context_keywords,
+            tags=tags,
+        )
+        
+        # Serialize the batch, keeping the last row for a repeated ID
+        entity_ids = []
+        rows_by_id: Dict[str, Dict[str, Any]] = {}
+        for entity in entities:
+            serialized = self._serialize_for_persist(entity, serializer, cohort_id, id_column)
+            entity_id = serialized[id_column]
+            entity_ids.append(entity_id)
+            rows_by_id.pop(entity_id, None)
+            rows_by_id[entity_id] = serialized
+        
+        with staged_rows(self.conn, list(rows_by_id.values())) as (view_name, columns):
+            rows_inserted, rows_updated = upsert_staged_rows(
+                self.conn, table_name, id_column, view_name, columns
+            )
+            self._update_cohort_stats(cohort_id, table_name, view_name, rows_updated)
+        
+        return self._finish_persist(
+            cohort_id=cohort_id,
+            cohort_name=cohort_name,
+            entity_type=entity_type,
+            entities_persisted=len(entities),
+            entity_ids=entity_ids,
+            is_new_cohort=is_new_cohort,
+            batch_number=batch_number,
+            total_batches=total_batches,
+            rows_inserted=rows_inserted,
+            rows_updated=rows_updated,
+        )
+    
+    def _resolve_entity_table(self, entity_type: str) -> Tuple[str, str, str, Any]:
+        """
+        Normalize an entity type and look up its table, ID column and serializer.
+        
+        Returns:
+            Tuple of (entity_type, table_name, id_column, serializer)
+        """
         # Normalize entity type
         entity_type = entity_type.lower().rstrip('s') + 's'  # Ensure plural
         
@@ -452,14 +755,24 @@ class AutoPersistService:
         
         table_name, id_column = table_info
         
-        # Get serializer
-        serializer = get_serializer(entity_type)
+        return entity_type, table_name, id_column, get_serializer(entity_type)
+    
+    def _resolve_persist_cohort(
+        self,
+        entity_type: str,
+        cohort_id: Optional[str],
+        cohort_name: Optional[str],
+        cohort_description: Optional[str],
+        context_keywords: Optional[List[str]],
+        tags: Optional[List[str]],
+    ) -> Tuple[str, str, bool]:
+        """
+        Create a new cohort or look up an existing one for persisting.
         
-        # Create or use existing cohort
-        is_new_cohort = False
+        Returns:
+            Tuple of (cohort_id, cohort_name, is_new_cohort)
+        """
         if not cohort_id:
-            is_new_cohort = True
-            
             # Generate name if not provided
             if not cohort_name:
                 cohort_name = generate_cohort_name(
@@ -478,61 +791,75 @@ class AutoPersistService:
                 description=cohort_description,
                 tags=tags,
             )
+            return cohort_id, cohort_name, True
+        
+        # Get existing cohort name
+        result = self.conn.execute("""
+            SELECT name FROM cohorts WHERE id = ?
+        """, [cohort_id]).fetchone()
+        
+        if not result:
+            raise ValueError(f"Cohort not found: {cohort_id}")
+        
+        return cohort_id, result[0], False
+    
+    @staticmethod
+    def _serialize_for_persist(
+        entity: Dict,
+        serializer: Any,
+        cohort_id: str,
+        id_column: str,
+    ) -> Dict[str, Any]:
+        """Serialize an entity and stamp its cohort_id and entity ID."""
+        if serializer:
+            serialized = serializer(entity)
         else:
-            # Get existing cohort name
-            result = self.conn.execute("""
-                SELECT name FROM cohorts WHERE id = ?
-            """, [cohort_id]).fetchone()
-            
-            if not result:
-                raise ValueError(f"Cohort not found: {cohort_id}")
-            
-            cohort_name = result[0]
+            serialized = entity.copy()
         
-        # Persist entities
-        entity_ids = []
+        # Add cohort_id (database column)
+        serialized['cohort_id'] = cohort_id
         
-        for entity in entities:
-            # Serialize entity
-            if serializer:
-                serialized = serializer(entity)
-            else:
-                serialized = entity.copy()
-            
-            # Add cohort_id (database column)
-            serialized['cohort_id'] = cohort_id
-            
-            # Get or generate entity ID
-            entity_id = serialized.get(id_column) or str(uuid4())
-            serialized[id_column] = entity_id
-            entity_ids.append(entity_id)
-            
-            # Build insert statement
-            columns = list(serialized.keys())
-            placeholders = ', '.join(['?' for _ in columns])
-            column_str = ', '.join(columns)
-            
-            try:
-                self.conn.execute(f"""
-                    INSERT INTO {table_name} ({column_str})
-                    VALUES ({placeholders})
-                """, list(serialized.values()))
-            except Exception as e:
-                # Handle duplicate key by updating
-                if 'duplicate' in str(e).lower() or 'unique' in str(e).lower():
-                    # Update existing record
-                    set_clause = ', '.join([f"{col} = ?" for col in columns if col != id_column])
-                    values = [v for k, v in serialized.items() if k != id_column]
-                    values.append(entity_id)
-                    
-                    self.conn.execute(f"""
-                        UPDATE {table_name}
-                        SET {set_clause}
-                        WHERE {id_column} = ?
-                    """, values)
-                else:
-                    raise
+        # Get or generate entity ID
+        serialized[id_column] = serialized.get(id_column) or str(uuid4())
         
+        return serialized
+    
+    def _update_cohort_stats(
+        self,
+        cohort_id: str,
+        table_name: str,
+        view_name: Optional[str],
+        rows_updated: int,
+    ) -> None:
+        """
+        Keep cohort_stats current after writing a batch.
+        
+        Insert-only batches are folded in from the staged view; batches that
+        updated existing rows refresh that table's stats from scratch.
+        """
+        try:
+            if rows_updated or view_name is None:
+                refresh_cohort_stats(cohort_id, tables=[table_name], connection=self.conn)
+            else:
+                apply_stats_delta(cohort_id, table_name, view_name, connection=self.conn)
+        except Exception:
+            # Never leave stale stats behind; the next summary rebuilds them
+            invalidate_cohort_stats(cohort_id, self.conn)
+    
+    def _finish_persist(
+        self,
+        cohort_id: str,
+        cohort_name: str,
+        entity_type: str,
+        entities_persisted: int,
+        entity_ids: List[str],
+        is_new_cohort: bool,
+        batch_number: Optional[int],
+        total_batches: Optional[int],
+        rows_inserted: int,
+        rows_updated: int,
+    ) -> PersistResult:
+        """Touch the cohort timestamp and build the PersistResult with summary."""
         # Update cohort timestamp
         self._update_cohort_timestamp(cohort_id)
         
@@ -548,12 +875,14 @@ class AutoPersistService:
             cohort_id=cohort_id,
             cohort_name=cohort_name,
             entity_type=entity_type,
-            entities_persisted=len(entities),
+            entities_persisted=entities_persisted,
             entity_ids=entity_ids,
             summary=summary,
             is_new_cohort=is_new_cohort,
             batch_number=batch_number,
             total_batches=total_batches,
+            rows_inserted=rows_inserted,
+            rows_updated=rows_updated,
         )
     
     def get_cohort_summary(
@@ -869,10 +1198,11 @@ class AutoPersistService:
                 except Exception:
                     pass
         
-        # Delete tags
+        # Delete tags and cached stats
         self.conn.execute("""
             DELETE FROM cohort_tags WHERE cohort_id = ?
         """, [cohort_id])
+        invalidate_cohort_stats(cohort_id, self.conn)
         
         # Delete cohort
         self.conn.execute("""
@@ -1204,6 +1534,10 @@ class AutoPersistService:
                 continue
         
         self._update_cohort_timestamp(new_cohort_id)
+        try:
+            refresh_cohort_stats(new_cohort_id, connection=self.conn)
+        except Exception:
+            invalidate_cohort_stats(new_cohort_id, self.conn)
         
         return CloneResult(
             source_cohort_id=source_cohort_id,
@@ -1351,6 +1685,10 @@ class AutoPersistService:
                     continue
         
         self._update_cohort_timestamp(target_cohort_id)
+        try:
+            refresh_cohort_stats(target_cohort_id, connection=self.conn)
+        except Exception:
+            invalidate_cohort_stats(target_cohort_id, self.conn)
         
         return MergeResult(
             source_cohort_ids=source_cohort_ids,
@@ -1373,28 +1711,62 @@ class AutoPersistService:
         output_path: Optional[str] = None,
         include_entity_types: Optional[List[str]] = None,
         include_provenance: bool = True,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        row_groups_per_file: Optional[int] = None,
+        max_file_size_bytes: Optional[int] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
     ) -> ExportResult:
         """
         Export a cohort to a file.
         
+        Rows are streamed from the database rather than loaded into memory:
+        CSV and Parquet are written by DuckDB's COPY, and JSON is written in
+        batches of ``batch_size`` rows, so memory use does not grow with the
+        size of the cohort.
+        
+        CSV and Parquet exports produce a directory with one file per entity
+        type. When ``max_file_size_bytes`` or ``row_groups_per_file`` is set,
+        each entity type becomes a subdirectory of ``data_<n>`` part files.
+        
         Args:
             cohort_id: Scenario to export
             format: Export format ("json", "csv", "parquet")
             output_path: Path to save the export (defaults to ~/Downloads)
             include_entity_types: Optional list of entity types to include
             include_provenance: Whether to include provenance columns
+            compression: Optional codec ("zstd", "gzip"; Parquet also
+                "snappy"; JSON supports "gzip" only)
+            row_group_size: Rows per Parquet row group
+            row_groups_per_file: Start a new Parquet file after this many
+                row groups
+            max_file_size_bytes: Start a new CSV/Parquet file once a file
+                reaches roughly this size
+            batch_size: Rows fetched per batch for JSON export
             
         Returns:
             ExportResult with export details
             
         Raises:
-            ValueError: If cohort not found or unsupported format
+            ValueError: If cohort not found, or unsupported format or options
         """
         # Validate format
         format = format.lower()
-        if format not in ('json', 'csv', 'parquet'):
+        if format not in EXPORT_COMPRESSIONS:
             raise ValueError(f"Unsupported export format: {format}")
         
+        if compression:
+            compression = compression.lower()
+            if compression not in EXPORT_COMPRESSIONS[format]:
+                raise ValueError(
+                    f"Unsupported compression for {format} export: {compression}"
+                )
+        
+        if format != 'parquet' and (row_group_size or row_groups_per_file):
+            raise ValueError("Row group options only apply to parquet export")
+        if format == 'json' and max_file_size_bytes:
+            raise ValueError("File size splitting only applies to csv and parquet export")
+        
         # Get cohort info
         info = self._get_cohort_info(cohort_id)
         if not info:
@@ -1403,26 +1775,20 @@ class AutoPersistService:
         cohort_name = info['name']
         
         # Set output path
+        extension = f"{format}.gz" if format == 'json' and compression else format
         if not output_path:
             downloads_dir = Path.home() / "Downloads"
             downloads_dir.mkdir(exist_ok=True)
-            output_path = str(downloads_dir / f"{cohort_name}.{format}")
+            output_path = str(downloads_dir / f"{cohort_name}.{extension}")
         else:
             # If output_path is a directory, create filename within it
             output_path_obj = Path(output_path)
             if output_path_obj.is_dir():
-                output_path = str(output_path_obj / f"{cohort_name}.{format}")
-        
-        # Columns to exclude if not including provenance
-        provenance_columns = {
-            'source_type', 'source_system', 'skill_used',
-            'generation_seed', 'cohort_id'
-        }
+                output_path = str(output_path_obj / f"{cohort_name}.{extension}")
         
-        # Collect all entity data
+        # Resolve tables and columns to export, skipping empty tables
         entities_exported = {}
-        all_data = {}
-        total_entities = 0
+        export_columns = {}
         
         for table_name, id_column in CANONICAL_TABLES:
             if not self._table_exists(table_name):
@@ -1434,100 +1800,81 @@ class AutoPersistService:
                 continue
             
             try:
-                result = self.conn.execute(f"""
-                    SELECT * FROM {table_name}
+                count = self.conn.execute(f"""
+                    SELECT COUNT(*) FROM {table_name}
                     WHERE cohort_id = ?
-                """, [cohort_id])
+                """, [cohort_id]).fetchone()[0]
                 
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                
-                if not rows:
+                if not count:
                     continue
                 
-                # Filter columns if not including provenance
+                columns = [
+                    desc[0] for desc in
+                    self.conn.execute(f"SELECT * FROM {table_name} LIMIT 0").description
+                ]
                 if not include_provenance:
-                    filtered_indices = [
-                        i for i, col in enumerate(columns)
-                        if col not in provenance_columns
-                    ]
-                    columns = [columns[i] for i in filtered_indices]
-                    rows = [[row[i] for i in filtered_indices] for row in rows]
-                
-                # Convert rows to dicts
-                data = []
-                for row in rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        if isinstance(value, datetime):
-                            value = value.isoformat()
-                        row_dict[col] = value
-                    data.append(row_dict)
+                    columns = [c for c in columns if c not in EXPORT_PROVENANCE_COLUMNS]
                 
-                all_data[table_name] = data
-                entities_exported[table_name] = len(data)
-                total_entities += len(data)
+                export_columns[table_name] = columns
+                entities_exported[table_name] = count
                 
             except Exception:
                 continue
         
+        total_entities = sum(entities_exported.values())
+        
         # Write to file based on format
         if format == 'json':
-            export_obj = {
+            header = {
                 'cohort_id': cohort_id,
                 'cohort_name': cohort_name,
                 'description': info.get('description'),
                 'tags': self.get_tags(cohort_id),
                 'exported_at': datetime.utcnow().isoformat(),
-                'entities': all_data,
             }
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_obj, f, indent=2, default=str)
+            self._write_json_export(
+                output_path, header, cohort_id, export_columns, batch_size, compression,
+            )
         
-        elif format == 'csv':
-            import csv
-            
-            # For CSV, create a directory with separate files per entity type
+        else:
+            # For CSV and Parquet, create a directory with separate files per entity type
             output_dir = Path(output_path).with_suffix('')
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            for table_name, data in all_data.items():
-                if not data:
-                    continue
-                
-                csv_path = output_dir / f"{table_name}.csv"
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(data)
+            options = [f"FORMAT {format.upper()}"]
+            if format == 'csv':
+                options.append("HEADER")
+            if compression:
+                options.append(f"COMPRESSION {compression.upper()}")
+            if row_group_size:
+                options.append(f"ROW_GROUP_SIZE {int(row_group_size)}")
+            if row_groups_per_file:
+                options.append(f"ROW_GROUPS_PER_FILE {int(row_groups_per_file)}")
+            if max_file_size_bytes:
+                options.append(f"FILE_SIZE_BYTES {int(max_file_size_bytes)}")
+            
+            # Parquet compresses pages internally; CSV compresses the whole file
+            suffix = format
+            if format == 'csv' and compression:
+                suffix += '.zst' if compression == 'zstd' else '.gz'
+            split_files = bool(row_groups_per_file or max_file_size_bytes)
+            if split_files:
+                options.append(f"FILE_EXTENSION '{suffix}'")
+            
+            for table_name, columns in export_columns.items():
+                target = output_dir / table_name if split_files else output_dir / f"{table_name}.{suffix}"
+                column_sql = ", ".join(f'"{c}"' for c in columns)
+                target_sql = str(target).replace("'", "''")
+                self.conn.execute(f"""
+                    COPY (
+                        SELECT {column_sql} FROM {table_name}
+                        WHERE cohort_id = ?
+                    ) TO '{target_sql}' ({', '.join(options)})
+                """, [cohort_id])
             
             # Update output_path to directory
             output_path = str(output_dir)
         
-        elif format == 'parquet':
-            try:
-                import pyarrow as pa
-                import pyarrow.parquet as pq
-                
-                # Create a directory with separate files per entity type
-                output_dir = Path(output_path).with_suffix('')
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                for table_name, data in all_data.items():
-                    if not data:
-                        continue
-                    
-                    parquet_path = output_dir / f"{table_name}.parquet"
-                    table = pa.Table.from_pylist(data)
-                    pq.write_table(table, str(parquet_path))
-                
-                output_path = str(output_dir)
-                
-            except ImportError:
-                raise ValueError("Parquet export requires pyarrow: pip install pyarrow")
-        
         # Calculate file size
         output_path_obj = Path(output_path)
         if output_path_obj.is_dir():
@@ -1545,6 +1892,52 @@ class AutoPersistService:
             file_size_bytes=file_size,
         )
     
+    def _write_json_export(
+        self,
+        output_path: str,
+        header: Dict[str, Any],
+        cohort_id: str,
+        export_columns: Dict[str, List[str]],
+        batch_size: int,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Stream a JSON export document, one entity per line.
+        
+        The document has the same shape as a single ``json.dump`` of the
+        header plus an ``entities`` mapping, but rows are written as they
+        are fetched so only one batch is held in memory at a time.
+        """
+        opener = gzip.open if compression == 'gzip' else open
+        
+        with opener(output_path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps(header, indent=2, default=str)[:-2])
+            f.write(',\n  "entities": {')
+            
+            for table_index, (table_name, columns) in enumerate(export_columns.items()):
+                f.write(',' if table_index else '')
+                f.write(f'\n    {json.dumps(table_name)}: [')
+                
+                column_sql = ", ".join(f'"{c}"' for c in columns)
+                result = self.conn.execute(f"""
+                    SELECT {column_sql} FROM {table_name}
+                    WHERE cohort_id = ?
+                """, [cohort_id])
+                
+                separator = '\n      '
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        f.write(separator)
+                        f.write(json.dumps(dict(zip(columns, row)), default=_json_default))
+                        separator = ',\n      '
+                
+                f.write('\n    ]')
+            
+            f.write('\n  }\n}\n')
+    
     def export_to_csv(
         self,
         cohort_id: str,
@@ -12,6 +12,7 @@ from uuid import uuid4
 from datetime import datetime
 from pathlib import Path
 import json
+import logging
 import re
 
 import duckdb
@@ -27,9 +28,13 @@ from .auto_persist import (
     PersistResult,
     QueryResult,
     CohortBrief,
+    bulk_upsert_rows,
     get_auto_persist_service,
+    staged_rows,
 )
-from .summary import CohortSummary
+from .summary import CohortSummary, invalidate_cohort_stats, refresh_cohort_stats
+
+logger = logging.getLogger(__name__)
 
 
 class StateManager:
@@ -336,12 +341,17 @@ class StateManager:
                 VALUES (?, ?, ?, ?, ?, ?)
             """, [cohort_id, name, description, now, now, json.dumps(metadata)])
         
-        # Insert entities
+        # Insert entities (set-based, one batch per entity type)
         entity_count = 0
         for entity_type, entity_list in entities.items():
-            for entity in entity_list:
-                self._save_entity(cohort_id, entity_type, entity)
-                entity_count += 1
+            self._save_entities(cohort_id, entity_type, entity_list)
+            entity_count += len(entity_list)
+        
+        # Canonical rows changed outside the persist path; rebuild stats
+        try:
+            refresh_cohort_stats(cohort_id, connection=self.conn)
+        except Exception:
+            invalidate_cohort_stats(cohort_id, self.conn)
         
         # Save tags
         if tags:
@@ -529,8 +539,9 @@ class StateManager:
             except Exception:
                 pass  # Table may not have cohort_id column yet
         
-        # Delete in order: tags, entity links, cohort
+        # Delete in order: tags, cached stats, entity links, cohort
         self.conn.execute("DELETE FROM cohort_tags WHERE cohort_id = ?", [cohort_id])
+        invalidate_cohort_stats(cohort_id, self.conn)
         self.conn.execute("DELETE FROM cohort_entities WHERE cohort_id = ?", [cohort_id])
         self.conn.execute("DELETE FROM cohorts WHERE id = ?", [cohort_id])
         
@@ -636,48 +647,59 @@ class StateManager:
         
         Returns entity_id.
         """
-        # Determine entity ID
+        return self._save_entities(cohort_id, entity_type, [entity])[0]
+    
+    def _save_entities(self, cohort_id: str, entity_type: str, entity_list: List[Dict]) -> List[str]:
+        """
+        Save a batch of same-typed entities with set-based statements.
+        
+        All entities are staged once, then merged into cohort_entities and
+        (if a serializer exists) the canonical table with one statement each.
+        cohort_entities ids are allocated from the sequence in a single query.
+        If an entity ID repeats within the batch, the last entity's data wins.
+        
+        Returns entity_ids in input order.
+        """
+        if not entity_list:
+            return []
+        
         table_name, id_column = get_table_info(entity_type)
-        entity_id = entity.get(id_column) or entity.get('id') or entity.get(f'{entity_type}_id') or str(uuid4())
         
         # Store full entity as JSON in cohort_entities
-        entity_json = json.dumps(entity, default=str)
+        entity_ids = []
+        json_rows: Dict[str, Dict[str, Any]] = {}
+        for entity in entity_list:
+            entity_id = entity.get(id_column) or entity.get('id') or entity.get(f'{entity_type}_id') or str(uuid4())
+            entity_ids.append(entity_id)
+            json_rows[entity_id] = {
+                'entity_id': entity_id,
+                'entity_data': json.dumps(entity, default=str),
+            }
         
-        # Check if entity already exists for this cohort
-        existing = self.conn.execute("""
-            SELECT id FROM cohort_entities 
-            WHERE cohort_id = ? AND entity_type = ? AND entity_id = ?
-        """, [cohort_id, entity_type, entity_id]).fetchone()
+        # Allocate sequence ids in bulk; sorted so load order follows input order
+        allocated = self.conn.execute(
+            "SELECT nextval('cohort_entities_seq') FROM range(?)", [len(json_rows)]
+        ).fetchall()
+        for row, (new_id,) in zip(json_rows.values(), sorted(allocated)):
+            row['id'] = new_id
         
-        if existing:
-            # Update existing
-            self.conn.execute("""
-                UPDATE cohort_entities 
-                SET entity_data = ?
-                WHERE cohort_id = ? AND entity_type = ? AND entity_id = ?
-            """, [entity_json, cohort_id, entity_type, entity_id])
-        else:
-            # Insert new (explicitly use sequence for id)
-            self.conn.execute("""
+        with staged_rows(self.conn, list(json_rows.values())) as (view_name, _):
+            self.conn.execute(f"""
                 INSERT INTO cohort_entities (id, cohort_id, entity_type, entity_id, entity_data, created_at)
-                VALUES (nextval('cohort_entities_seq'), ?, ?, ?, ?, ?)
-            """, [cohort_id, entity_type, entity_id, entity_json, datetime.utcnow()])
+                SELECT id, ?, ?, entity_id, entity_data, ? FROM {view_name}
+                ON CONFLICT (cohort_id, entity_type, entity_id)
+                DO UPDATE SET entity_data = excluded.entity_data
+            """, [cohort_id, entity_type, datetime.utcnow()])
         
         # Also try to insert into canonical table if serializer exists
         serializer = get_serializer(entity_type)
         if serializer:
-            try:
-                self._insert_canonical_entity(cohort_id, entity_type, entity, serializer)
-            except Exception:
-                # Canonical insert is optional - JSON storage is the primary
-                pass
+            self._insert_canonical_entities(cohort_id, entity_type, entity_list, serializer)
         
-        return entity_id
+        return entity_ids
     
-    def _insert_canonical_entity(self, cohort_id: str, entity_type: str, entity: Dict, serializer) -> None:
-        """Insert entity into canonical table using serializer."""
-        table_name, id_column = get_table_info(entity_type)
-        
+    def _serialize_canonical(self, cohort_id: str, entity: Dict, serializer) -> Dict[str, Any]:
+        """Serialize entity for its canonical table, including provenance and cohort_id."""
         # Get provenance from entity
         provenance = entity.get('_provenance', {})
         if 'provenance' in entity:
@@ -690,6 +712,68 @@ class StateManager:
         
         # Add cohort_id to data
         data['cohort_id'] = cohort_id
+        return data
+    
+    def _insert_canonical_entities(
+        self,
+        cohort_id: str,
+        entity_type: str,
+        entity_list: List[Dict],
+        serializer,
+    ) -> int:
+        """
+        Upsert a batch of entities into their canonical table in one statement.
+        
+        Canonical storage is optional (JSON in cohort_entities is primary), so
+        entities that fail to serialize or have no ID are skipped. If the
+        set-based write fails, falls back to row-by-row so one bad row doesn't
+        drop the batch. Every skipped or failed row is logged as a warning.
+        
+        Returns:
+            Number of entities not written to the canonical table
+        """
+        table_name, id_column = get_table_info(entity_type)
+        
+        rows: Dict[Any, Dict[str, Any]] = {}
+        skipped = 0
+        for entity in entity_list:
+            try:
+                data = self._serialize_canonical(cohort_id, entity, serializer)
+            except Exception as e:
+                skipped += 1
+                logger.warning("Skipping %s entity that failed to serialize: %s", entity_type, e)
+                continue
+            if data.get(id_column) is None:
+                skipped += 1
+                logger.warning("Skipping %s entity without %s", entity_type, id_column)
+                continue
+            rows[data[id_column]] = data
+        
+        if not rows:
+            return skipped
+        
+        try:
+            bulk_upsert_rows(self.conn, table_name, id_column, list(rows.values()))
+        except duckdb.Error as e:
+            logger.warning(
+                "Bulk upsert into %s failed (%s); retrying row by row", table_name, e
+            )
+            for entity_id, data in rows.items():
+                try:
+                    bulk_upsert_rows(self.conn, table_name, id_column, [data])
+                except duckdb.Error as row_error:
+                    skipped += 1
+                    logger.warning(
+                        "Failed to upsert %s %s into %s: %s",
+                        entity_type, entity_id, table_name, row_error,
+                    )
+        return skipped
+    
+    def _insert_canonical_entity(self, cohort_id: str, entity_type: str, entity: Dict, serializer) -> None:
+        """Insert entity into canonical table using serializer."""
+        table_name, id_column = get_table_info(entity_type)
+        
+        data = self._serialize_canonical(cohort_id, entity, serializer)
         
         # Build INSERT statement
         columns = list(data.keys())
@@ -715,7 +799,7 @@ class StateManager:
             SELECT entity_type, entity_id, entity_data
             FROM cohort_entities
             WHERE cohort_id = ?
-            ORDER BY entity_type, created_at
+            ORDER BY entity_type, created_at, id
         """, [cohort_id]).fetchall()
         
         entities: Dict[str, List[Dict]] = {}
@@ -11,7 +11,7 @@ This implements the "summary-in-context" part of the Structured RAG pattern:
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 import json
@@ -141,176 +141,452 @@ ENTITY_COUNT_TABLES = {
 }
 
 
-def _get_entity_counts(cohort_id: str, connection=None) -> Dict[str, int]:
-    """Get entity counts for all tables in a cohort."""
-    conn = connection or get_connection()
-    counts = {}
+# Stats rows live in cohort_stats keyed by (cohort_id, entity_type).
+# The marker row records that every entity type has been computed for the
+# cohort, so a missing type means zero rows rather than "not cached yet".
+STATS_MARKER = '_cohort'
+
+# Mergeable aggregates maintained per entity type in cohort_stats:
+#   range:  name -> SQL expression, stored as [min, max]
+#   sum:    name -> SQL expression, stored as [total, non-null count]
+#   counts: name -> SQL expression, stored as {value: count}
+# Expressions use TRY_CAST so the same SQL runs over canonical tables and
+# over staged batches whose columns still carry raw serialized values.
+# Patients also count birth days modulo the four-year age cycle, which with
+# the sum of birth days gives the exact mean of whole-year ages for any date.
+AGE_CYCLE_DAYS = 1461  # four years of 365.25 days
+_BIRTH_DAYS_SQL = "date_diff('day', DATE '1970-01-01', TRY_CAST(birth_date AS DATE))"
+STATS_AGGREGATES = {
+    'patients': {
+        'range': {'birth_date': "TRY_CAST(birth_date AS DATE)"},
+        'sum': {'birth_days': _BIRTH_DAYS_SQL},
+        'counts': {
+            'gender': "CAST(gender AS VARCHAR)",
+            'birth_cycle_day': (
+                f"CAST((({_BIRTH_DAYS_SQL} % {AGE_CYCLE_DAYS}) + {AGE_CYCLE_DAYS})"
+                f" % {AGE_CYCLE_DAYS} AS VARCHAR)"
+            ),
+        },
+    },
+    'encounters': {
+        'range': {'admission_date': "CAST(TRY_CAST(admission_time AS TIMESTAMP) AS DATE)"},
+        'counts': {'class_code': "CAST(class_code AS VARCHAR)"},
+    },
+    'claims': {
+        'sum': {
+            'total_charge': "TRY_CAST(total_charge AS DOUBLE)",
+            'total_paid': "TRY_CAST(total_paid AS DOUBLE)",
+            'patient_responsibility': "TRY_CAST(patient_responsibility AS DOUBLE)",
+        },
+        'counts': {'claim_type': "CAST(claim_type AS VARCHAR)"},
+    },
+    'diagnoses': {
+        'counts': {
+            'diagnosis': "to_json([CAST(code AS VARCHAR), CAST(description AS VARCHAR)])",
+        },
+    },
+}
+
+# Canonical table name -> entity type key in ENTITY_COUNT_TABLES
+_TABLE_ENTITY_TYPES = {table: entity_type for entity_type, table in ENTITY_COUNT_TABLES.items()}
+
+
+def _aggregate_stats(
+    conn,
+    entity_type: str,
+    source: str,
+    params: List[Any],
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Compute the row count and mergeable aggregates for one entity type.
     
-    for entity_type, table_name in ENTITY_COUNT_TABLES.items():
-        try:
+    Args:
+        conn: Database connection
+        entity_type: Key in ENTITY_COUNT_TABLES
+        source: SQL relation to aggregate (table, view or subquery)
+        params: Parameters for the source relation
+        
+    Returns:
+        Tuple of (row count, statistics dict)
+    """
+    spec = STATS_AGGREGATES.get(entity_type, {})
+    selects = ['COUNT(*)']
+    for expr in spec.get('range', {}).values():
+        selects += [f"MIN({expr})", f"MAX({expr})"]
+    for expr in spec.get('sum', {}).values():
+        selects += [f"SUM({expr})", f"COUNT({expr})"]
+    
+    row = conn.execute(f"SELECT {', '.join(selects)} FROM {source}", params).fetchone()
+    count = row[0]
+    values = iter(row[1:])
+    
+    stats: Dict[str, Dict[str, Any]] = {'range': {}, 'sum': {}, 'counts': {}}
+    for name in spec.get('range', {}):
+        low, high = next(values), next(values)
+        if low is not None:
+            stats['range'][name] = [str(low), str(high)]
+    for name in spec.get('sum', {}):
+        total, non_null = next(values), next(values)
+        if non_null:
+            stats['sum'][name] = [float(total), non_null]
+    
+    if count:
+        for name, expr in spec.get('counts', {}).items():
             result = conn.execute(f"""
-                SELECT COUNT(*) FROM {table_name}
-                WHERE cohort_id = ?
-            """, [cohort_id]).fetchone()
-            
-            count = result[0] if result else 0
-            if count > 0:
-                counts[entity_type] = count
+                SELECT {expr} AS value, COUNT(*) FROM {source}
+                GROUP BY value
+            """, params).fetchall()
+            stats['counts'][name] = {value: n for value, n in result if value is not None}
+    
+    return count, stats
+
+
+def _merge_stats(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge aggregates from a batch of new rows into existing aggregates."""
+    merged = {
+        'range': dict(base.get('range', {})),
+        'sum': dict(base.get('sum', {})),
+        'counts': {name: dict(values) for name, values in base.get('counts', {}).items()},
+    }
+    
+    for name, (low, high) in delta.get('range', {}).items():
+        current = merged['range'].get(name)
+        merged['range'][name] = [min(current[0], low), max(current[1], high)] if current else [low, high]
+    
+    for name, (total, non_null) in delta.get('sum', {}).items():
+        current = merged['sum'].get(name, [0.0, 0])
+        merged['sum'][name] = [current[0] + total, current[1] + non_null]
+    
+    for name, values in delta.get('counts', {}).items():
+        counts = merged['counts'].setdefault(name, {})
+        for value, n in values.items():
+            counts[value] = counts.get(value, 0) + n
+    
+    return merged
+
+
+def _compute_cohort_stats(
+    cohort_id: str,
+    conn,
+    entity_types: Optional[List[str]] = None,
+) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Aggregate stats from canonical tables for types that have rows."""
+    computed = {}
+    
+    for entity_type in entity_types or list(ENTITY_COUNT_TABLES):
+        table_name = ENTITY_COUNT_TABLES[entity_type]
+        try:
+            count, stats = _aggregate_stats(
+                conn, entity_type,
+                f"(SELECT * FROM {table_name} WHERE cohort_id = ?) AS src",
+                [cohort_id],
+            )
         except Exception:
             # Table may not exist or have cohort_id column
-            pass
+            continue
+        
+        if count > 0:
+            computed[entity_type] = (count, stats)
     
-    return counts
+    return computed
 
 
-def _calculate_patient_statistics(cohort_id: str, connection=None) -> Dict[str, Any]:
-    """Calculate statistics for patient data."""
-    conn = connection or get_connection()
-    stats = {}
+def _store_stats(conn, cohort_id: str, entity_type: str, count: int, stats: Dict[str, Any]) -> None:
+    """Write one cohort_stats row, removing it when the type has no rows."""
+    if count <= 0:
+        conn.execute("""
+            DELETE FROM cohort_stats WHERE cohort_id = ? AND entity_type = ?
+        """, [cohort_id, entity_type])
+        return
+    
+    conn.execute("""
+        INSERT OR REPLACE INTO cohort_stats
+            (cohort_id, entity_type, entity_count, statistics, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+    """, [cohort_id, entity_type, count, json.dumps(stats), datetime.utcnow()])
+
+
+def _has_stats_marker(conn, cohort_id: str) -> bool:
+    """Check whether a cohort's stats cache is complete."""
+    result = conn.execute("""
+        SELECT COUNT(*) FROM cohort_stats
+        WHERE cohort_id = ? AND entity_type = ?
+    """, [cohort_id, STATS_MARKER]).fetchone()
+    return bool(result and result[0])
+
+
+def init_cohort_stats(cohort_id: str, connection=None) -> None:
+    """
+    Mark the stats cache of a newly created (empty) cohort as complete.
     
+    Args:
+        cohort_id: UUID of the new cohort
+        connection: Optional database connection
+    """
+    conn = connection or get_connection()
     try:
-        # Age statistics
-        result = conn.execute("""
-            SELECT 
-                MIN(CAST((julianday('now') - julianday(birth_date)) / 365.25 AS INTEGER)) as min_age,
-                MAX(CAST((julianday('now') - julianday(birth_date)) / 365.25 AS INTEGER)) as max_age,
-                AVG(CAST((julianday('now') - julianday(birth_date)) / 365.25 AS INTEGER)) as avg_age
-            FROM patients
-            WHERE cohort_id = ? AND birth_date IS NOT NULL
-        """, [cohort_id]).fetchone()
-        
-        if result and result[0] is not None:
-            stats['age_range'] = {
-                'min': result[0],
-                'max': result[1],
-                'avg': round(result[2], 1) if result[2] else None
-            }
-        
-        # Gender distribution
-        result = conn.execute("""
-            SELECT gender, COUNT(*) as count
-            FROM patients
-            WHERE cohort_id = ?
-            GROUP BY gender
-        """, [cohort_id]).fetchall()
-        
-        if result:
-            stats['gender_distribution'] = {row[0]: row[1] for row in result if row[0]}
-        
+        conn.execute("""
+            INSERT OR REPLACE INTO cohort_stats (cohort_id, entity_type, entity_count, updated_at)
+            VALUES (?, ?, 0, ?)
+        """, [cohort_id, STATS_MARKER, datetime.utcnow()])
     except Exception:
+        # Database predates cohort_stats; summaries fall back to live queries
         pass
-    
-    return stats
 
 
-def _calculate_encounter_statistics(cohort_id: str, connection=None) -> Dict[str, Any]:
-    """Calculate statistics for encounter data."""
-    conn = connection or get_connection()
-    stats = {}
+def invalidate_cohort_stats(cohort_id: str, connection=None) -> None:
+    """
+    Drop cached stats for a cohort.
+    
+    Use when deleting a cohort, or when stats cannot be rebuilt after a
+    write. Summaries compute stats live until the next write to the cohort
+    rebuilds the cache.
     
+    Args:
+        cohort_id: UUID of the cohort
+        connection: Optional database connection
+    """
+    conn = connection or get_connection()
     try:
-        # Date range
-        result = conn.execute("""
-            SELECT 
-                MIN(DATE(admission_time)) as min_date,
-                MAX(DATE(admission_time)) as max_date
-            FROM encounters
-            WHERE cohort_id = ? AND admission_time IS NOT NULL
-        """, [cohort_id]).fetchone()
-        
-        if result and result[0]:
-            stats['date_range'] = {
-                'min': str(result[0]),
-                'max': str(result[1])
-            }
-        
-        # Encounter class distribution
-        result = conn.execute("""
-            SELECT class_code, COUNT(*) as count
-            FROM encounters
-            WHERE cohort_id = ?
-            GROUP BY class_code
-            ORDER BY count DESC
-            LIMIT 5
-        """, [cohort_id]).fetchall()
-        
-        if result:
-            stats['encounter_types'] = {row[0]: row[1] for row in result if row[0]}
-        
+        conn.execute("DELETE FROM cohort_stats WHERE cohort_id = ?", [cohort_id])
     except Exception:
+        # Database predates cohort_stats; nothing cached to drop
         pass
-    
-    return stats
 
 
-def _calculate_claims_statistics(cohort_id: str, connection=None) -> Dict[str, Any]:
-    """Calculate statistics for claims data."""
-    conn = connection or get_connection()
-    stats = {}
+def refresh_cohort_stats(
+    cohort_id: str,
+    tables: Optional[List[str]] = None,
+    connection=None,
+) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """
+    Recompute cached stats from the canonical tables.
     
-    try:
-        # Financial totals
-        result = conn.execute("""
-            SELECT 
-                SUM(total_charge) as total_billed,
-                SUM(total_paid) as total_paid,
-                SUM(patient_responsibility) as total_patient_resp,
-                AVG(total_charge) as avg_charge
-            FROM claims
-            WHERE cohort_id = ?
-        """, [cohort_id]).fetchone()
-        
-        if result and result[0]:
-            stats['financials'] = {
-                'total_billed': round(result[0], 2),
-                'total_paid': round(result[1], 2) if result[1] else 0,
-                'total_patient_resp': round(result[2], 2) if result[2] else 0,
-                'avg_charge': round(result[3], 2) if result[3] else 0
-            }
-        
-        # Claim type distribution
-        result = conn.execute("""
-            SELECT claim_type, COUNT(*) as count
-            FROM claims
-            WHERE cohort_id = ?
-            GROUP BY claim_type
-        """, [cohort_id]).fetchall()
-        
-        if result:
-            stats['claim_types'] = {row[0]: row[1] for row in result if row[0]}
+    Args:
+        cohort_id: UUID of the cohort
+        tables: Canonical tables to refresh (all tracked tables if None)
+        connection: Optional database connection
         
-    except Exception:
-        pass
+    Returns:
+        Dict of entity type -> (count, statistics) for the refreshed types
+    """
+    conn = connection or get_connection()
+    
+    # A partial refresh cannot complete a missing cache; rebuild all of it
+    if tables is None or not _has_stats_marker(conn, cohort_id):
+        computed = _compute_cohort_stats(cohort_id, conn)
+        conn.execute("DELETE FROM cohort_stats WHERE cohort_id = ?", [cohort_id])
+        for entity_type, (count, stats) in computed.items():
+            _store_stats(conn, cohort_id, entity_type, count, stats)
+        init_cohort_stats(cohort_id, conn)
+        return computed
+    
+    entity_types = [_TABLE_ENTITY_TYPES[t] for t in tables if t in _TABLE_ENTITY_TYPES]
+    computed = _compute_cohort_stats(cohort_id, conn, entity_types)
+    for entity_type in entity_types:
+        count, stats = computed.get(entity_type, (0, {}))
+        _store_stats(conn, cohort_id, entity_type, count, stats)
+    return computed
+
+
+def apply_stats_delta(
+    cohort_id: str,
+    table_name: str,
+    source: str,
+    connection=None,
+) -> None:
+    """
+    Fold a batch of newly inserted rows into the cached stats.
     
-    return stats
+    Only valid for insert-only batches; use refresh_cohort_stats() when a
+    batch updated existing rows. If the cohort's cache is incomplete, it is
+    rebuilt from the canonical tables instead. No-op for untracked tables.
+    
+    Args:
+        cohort_id: UUID of the cohort
+        table_name: Canonical table the rows were inserted into
+        source: SQL relation holding exactly the inserted rows
+        connection: Optional database connection
+    """
+    conn = connection or get_connection()
+    entity_type = _TABLE_ENTITY_TYPES.get(table_name)
+    if entity_type is None:
+        return
+    if not _has_stats_marker(conn, cohort_id):
+        refresh_cohort_stats(cohort_id, connection=conn)
+        return
+    
+    delta_count, delta_stats = _aggregate_stats(conn, entity_type, source, [])
+    
+    current = conn.execute("""
+        SELECT entity_count, statistics FROM cohort_stats
+        WHERE cohort_id = ? AND entity_type = ?
+    """, [cohort_id, entity_type]).fetchone()
+    
+    if current:
+        count = current[0] + delta_count
+        stats = _merge_stats(json.loads(current[1]) if current[1] else {}, delta_stats)
+    else:
+        count, stats = delta_count, delta_stats
+    
+    _store_stats(conn, cohort_id, entity_type, count, stats)
 
 
-def _calculate_diagnosis_statistics(cohort_id: str, connection=None) -> Dict[str, Any]:
-    """Calculate statistics for diagnosis data."""
+def load_cohort_stats(
+    cohort_id: str,
+    connection=None,
+) -> Optional[Dict[str, Tuple[int, Dict[str, Any]]]]:
+    """
+    Read cached stats for a cohort.
+    
+    Returns:
+        Dict of entity type -> (count, statistics), or None if the cache
+        is incomplete for this cohort
+    """
     conn = connection or get_connection()
-    stats = {}
     
     try:
-        # Top diagnoses
-        result = conn.execute("""
-            SELECT code, description, COUNT(*) as count
-            FROM diagnoses
+        rows = conn.execute("""
+            SELECT entity_type, entity_count, statistics FROM cohort_stats
             WHERE cohort_id = ?
-            GROUP BY code, description
-            ORDER BY count DESC
-            LIMIT 5
         """, [cohort_id]).fetchall()
-        
-        if result:
-            stats['top_diagnoses'] = [
-                {'code': row[0], 'description': row[1], 'count': row[2]}
-                for row in result if row[0]
-            ]
-        
     except Exception:
-        pass
+        # Database predates cohort_stats
+        return None
+    
+    cached = {}
+    complete = False
+    for entity_type, count, statistics in rows:
+        if entity_type == STATS_MARKER:
+            complete = True
+        elif entity_type in ENTITY_COUNT_TABLES and count > 0:
+            cached[entity_type] = (count, json.loads(statistics) if statistics else {})
+    
+    return cached if complete else None
+
+
+def _top_counts(values: Dict[str, int], limit: int) -> List[Tuple[str, int]]:
+    """Most frequent values first, ties broken by value."""
+    return sorted(values.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+def _age_years(birth_date: date, today: date) -> int:
+    """Whole years between a birth date and today."""
+    return int((today - birth_date).days / 365.25)
+
+
+def _mean_age_years(birth_days: List[float], cycle_days: Dict[str, int], today: date) -> float:
+    """
+    Mean of whole-year ages from the birth-day sum and cycle-day counts.
     
-    return stats
+    A whole-year age is floor(4 * days / 1461). Splitting each age in days
+    into whole four-year cycles and a remainder, the cycles sum from the
+    birth-day total and the remainders from the cycle-day counts.
+    """
+    today_days = (today - date(1970, 1, 1)).days
+    total_days = birth_days[1] * today_days - round(birth_days[0])
+    remainder_days = 0
+    remainder_years = 0
+    for cycle_day, count in cycle_days.items():
+        remainder = (today_days - int(cycle_day)) % AGE_CYCLE_DAYS
+        remainder_days += count * remainder
+        remainder_years += count * (4 * remainder // AGE_CYCLE_DAYS)
+    total_years = 4 * (total_days - remainder_days) // AGE_CYCLE_DAYS + remainder_years
+    return total_years / birth_days[1]
+
+
+def _patient_statistics(stats: Dict[str, Any], today: date) -> Dict[str, Any]:
+    """Render patient age and gender statistics; the average is of whole-year ages."""
+    result = {}
+    
+    birth_range = stats.get('range', {}).get('birth_date')
+    birth_days = stats.get('sum', {}).get('birth_days')
+    cycle_days = stats.get('counts', {}).get('birth_cycle_day')
+    if birth_range and birth_days and cycle_days:
+        result['age_range'] = {
+            'min': _age_years(date.fromisoformat(birth_range[1]), today),
+            'max': _age_years(date.fromisoformat(birth_range[0]), today),
+            'avg': round(_mean_age_years(birth_days, cycle_days, today), 1),
+        }
+    
+    genders = {k: v for k, v in stats.get('counts', {}).get('gender', {}).items() if k}
+    if genders:
+        result['gender_distribution'] = genders
+    
+    return result
+
+
+def _encounter_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Render encounter date range and top encounter classes."""
+    result = {}
+    
+    admission_range = stats.get('range', {}).get('admission_date')
+    if admission_range:
+        result['date_range'] = {'min': admission_range[0], 'max': admission_range[1]}
+    
+    class_codes = {k: v for k, v in stats.get('counts', {}).get('class_code', {}).items() if k}
+    if class_codes:
+        result['encounter_types'] = dict(_top_counts(class_codes, 5))
+    
+    return result
+
+
+def _claims_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Render claim financial totals and claim type distribution."""
+    result = {}
+    sums = stats.get('sum', {})
+    
+    charge = sums.get('total_charge')
+    if charge and charge[0]:
+        paid = sums.get('total_paid')
+        patient_resp = sums.get('patient_responsibility')
+        result['financials'] = {
+            'total_billed': round(charge[0], 2),
+            'total_paid': round(paid[0], 2) if paid and paid[0] else 0,
+            'total_patient_resp': round(patient_resp[0], 2) if patient_resp and patient_resp[0] else 0,
+            'avg_charge': round(charge[0] / charge[1], 2),
+        }
+    
+    claim_types = {k: v for k, v in stats.get('counts', {}).get('claim_type', {}).items() if k}
+    if claim_types:
+        result['claim_types'] = claim_types
+    
+    return result
+
+
+def _diagnosis_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the most frequent diagnoses."""
+    diagnoses = {
+        key: n for key, n in stats.get('counts', {}).get('diagnosis', {}).items()
+        if json.loads(key)[0]
+    }
+    if not diagnoses:
+        return {}
+    
+    top = []
+    for key, n in _top_counts(diagnoses, 5):
+        code, description = json.loads(key)
+        top.append({'code': code, 'description': description, 'count': n})
+    return {'top_diagnoses': top}
+
+
+def _render_statistics(cached: Dict[str, Tuple[int, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Turn cached aggregates into the summary statistics dict."""
+    statistics = {}
+    
+    if 'patients' in cached:
+        statistics.update(_patient_statistics(cached['patients'][1], date.today()))
+    
+    if 'encounters' in cached:
+        statistics.update(_encounter_statistics(cached['encounters'][1]))
+    
+    if 'claims' in cached:
+        statistics.update(_claims_statistics(cached['claims'][1]))
+    
+    if 'diagnoses' in cached:
+        statistics.update(_diagnosis_statistics(cached['diagnoses'][1]))
+    
+    return statistics
 
 
 def _get_diverse_samples(
@@ -319,51 +595,61 @@ def _get_diverse_samples(
     table_name: str,
     count: int = 3,
     connection=None,
+    total: Optional[int] = None,
 ) -> List[Dict]:
     """
     Get diverse sample entities for pattern consistency.
     
-    Tries to select samples that show variety (e.g., different genders,
-    age ranges, conditions) rather than just random selection.
+    Takes evenly spaced rows in created_at order. The pick happens in SQL
+    with row_number(), so only the sampled rows leave the database.
+    
+    Args:
+        total: Number of rows for this cohort, if already known
     """
     conn = connection or get_connection()
     samples = []
     
     try:
-        # Get column names for this table
-        columns_result = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
-        columns = [col[1] for col in columns_result]
+        if total is None:
+            total = conn.execute(f"""
+                SELECT COUNT(*) FROM {table_name} WHERE cohort_id = ?
+            """, [cohort_id]).fetchone()[0]
         
-        # Simple diverse sampling: order by created_at and take evenly spaced
+        if total <= count:
+            indices = list(range(total))
+        else:
+            # Take evenly spaced samples
+            step = total / count
+            indices = [int(i * step) for i in range(count)]
+        
+        if not indices:
+            return samples
+        
+        placeholders = ', '.join(['?' for _ in indices])
         result = conn.execute(f"""
-            SELECT * FROM {table_name}
-            WHERE cohort_id = ?
-            ORDER BY created_at
-        """, [cohort_id]).fetchall()
+            SELECT * EXCLUDE (_sample_rn) FROM (
+                SELECT *, row_number() OVER (ORDER BY created_at) - 1 AS _sample_rn
+                FROM {table_name}
+                WHERE cohort_id = ?
+            )
+            WHERE _sample_rn IN ({placeholders})
+            ORDER BY _sample_rn
+        """, [cohort_id, *indices])
+        columns = [desc[0] for desc in result.description]
         
-        if result:
-            total = len(result)
-            if total <= count:
-                indices = list(range(total))
-            else:
-                # Take evenly spaced samples
-                step = total / count
-                indices = [int(i * step) for i in range(count)]
-            
-            for idx in indices:
-                row = result[idx]
-                sample = {}
-                for i, col in enumerate(columns):
-                    value = row[i]
-                    # Convert special types to strings
-                    if isinstance(value, (datetime, date)):
-                        value = str(value)
-                    elif isinstance(value, UUID):
-                        value = str(value)
-                    # Skip internal columns
-                    if col not in ('cohort_id', 'created_at', 'generation_seed'):
-                        sample[col] = value
-                samples.append(sample)
+        for row in result.fetchall():
+            sample = {}
+            for i, col in enumerate(columns):
+                value = row[i]
+                # Convert special types to strings
+                if isinstance(value, (datetime, date)):
+                    value = str(value)
+                elif isinstance(value, UUID):
+                    value = str(value)
+                # Skip internal columns
+                if col not in ('cohort_id', 'created_at', 'generation_seed'):
+                    sample[col] = value
+            samples.append(sample)
         
     except Exception:
         pass
@@ -380,6 +666,9 @@ def generate_summary(
     """
     Generate a token-efficient summary of a cohort.
     
+    Read-only: cached stats are used when complete, otherwise computed from
+    the canonical tables without being stored.
+    
     Args:
         cohort_id: UUID of the cohort
         include_samples: Whether to include sample entities
@@ -421,25 +710,18 @@ def generate_summary(
     """, [cohort_id]).fetchall()
     summary.tags = [row[0] for row in tags_result]
     
-    # Get entity counts
-    summary.entity_counts = _get_entity_counts(cohort_id, conn)
-    
-    # Calculate statistics based on what entities exist
-    statistics = {}
-    
-    if summary.entity_counts.get('patients', 0) > 0:
-        statistics.update(_calculate_patient_statistics(cohort_id, conn))
-    
-    if summary.entity_counts.get('encounters', 0) > 0:
-        statistics.update(_calculate_encounter_statistics(cohort_id, conn))
-    
-    if summary.entity_counts.get('claims', 0) > 0:
-        statistics.update(_calculate_claims_statistics(cohort_id, conn))
-    
-    if summary.entity_counts.get('diagnoses', 0) > 0:
-        statistics.update(_calculate_diagnosis_statistics(cohort_id, conn))
+    # Counts and aggregates come from the cohort_stats cache; on a miss they
+    # are computed live, since only the write paths store cohort_stats
+    cached = load_cohort_stats(cohort_id, conn)
+    if cached is None:
+        cached = _compute_cohort_stats(cohort_id, conn)
     
-    summary.statistics = statistics
+    summary.entity_counts = {
+        entity_type: cached[entity_type][0]
+        for entity_type in ENTITY_COUNT_TABLES
+        if entity_type in cached
+    }
+    summary.statistics = _render_statistics(cached)
     
     # Get samples if requested
     if include_samples:
@@ -459,7 +741,8 @@ def generate_summary(
             if summary.entity_counts.get(entity_type, 0) > 0:
                 entity_samples = _get_diverse_samples(
                     cohort_id, entity_type, table_name,
-                    count=samples_per_type, connection=conn
+                    count=samples_per_type, connection=conn,
+                    total=summary.entity_counts[entity_type],
                 )
                 if entity_samples:
                     samples[entity_type] = entity_samples
@@ -0,0 +1,193 @@
+"""Tests for the array-backed accumulator ledger."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from healthsim.benefits import (
+    AccumulatorLedger,
+    BenefitType,
+    NetworkTier,
+    create_medical_accumulators,
+    create_pharmacy_accumulators,
+)
+from healthsim.benefits.ledger import FAMILY_FIELDS, INDIVIDUAL_FIELDS
+
+
+def _medical(member_id: str):
+    return create_medical_accumulators(
+        member_id=member_id,
+        plan_year=2024,
+        deductible_individual=Decimal("500"),
+        deductible_family=Decimal("1000"),
+        oop_individual=Decimal("3000"),
+        oop_family=Decimal("6000"),
+    )
+
+
+class TestAccumulatorLedger:
+    """Tests for AccumulatorLedger."""
+
+    def test_matches_accumulator_set(self):
+        """Test a single member's claims apply as AccumulatorSet would."""
+        amounts = [Decimal("120.50"), Decimal("300"), Decimal("200"), Decimal("75")]
+        acc_set = _medical("MEM-001")
+        expected = []
+        for amount in amounts:
+            acc_set, applied = acc_set.apply_to_deductible(amount)
+            expected.append(float(applied))
+
+        ledger = AccumulatorLedger([_medical("MEM-001")])
+        applied = ledger.apply_to_deductible(["MEM-001"] * len(amounts), amounts)
+
+        assert applied.tolist() == expected
+        snapshot = ledger.snapshot("MEM-001")
+        assert snapshot.deductible_individual_in.applied == acc_set.deductible_individual_in.applied
+        assert snapshot.deductible_family_in.applied == acc_set.deductible_family_in.applied
+        assert snapshot.oop_individual_in.applied == Decimal("0")
+
+    def test_claim_streams_match_accumulator_set(self):
+        """Test mixed claim streams apply exactly as AccumulatorSet would."""
+        base = create_medical_accumulators(
+            "STD",
+            2024,
+            Decimal("500"),
+            Decimal("1000"),
+            Decimal("3000"),
+            Decimal("6000"),
+            deductible_individual_oon=Decimal("1000"),
+            deductible_family_oon=Decimal("2000"),
+            oop_individual_oon=Decimal("6000"),
+            oop_family_oon=Decimal("12000"),
+        )
+        nearly_met = base.deductible_family_in.model_copy(update={"applied": Decimal("900")})
+        pharmacy = create_pharmacy_accumulators("RX", 2024, Decimal("100"), Decimal("2000"))
+        sets = [
+            base,
+            base.model_copy(update={"member_id": "NEAR", "deductible_family_in": nearly_met}),
+            base.model_copy(update={"member_id": "FAM", "deductible_individual_in": None}),
+            base.model_copy(update={"member_id": "IND", "oop_family_in": None}),
+            base.model_copy(
+                update={
+                    "member_id": "RX",
+                    "rx_deductible": pharmacy.rx_deductible,
+                    "rx_oop": pharmacy.rx_oop,
+                }
+            ),
+        ]
+        rng = np.random.default_rng(7)
+        count = 400
+        member_ids = [sets[i].member_id for i in rng.integers(0, len(sets), count)]
+        amounts = [Decimal(int(cents)).scaleb(-2) for cents in rng.integers(1, 40_000, count)]
+        networks = [
+            (NetworkTier.IN_NETWORK, NetworkTier.OUT_OF_NETWORK)[i]
+            for i in rng.integers(0, 2, count)
+        ]
+        benefits = [
+            (BenefitType.MEDICAL, BenefitType.PHARMACY)[i] for i in rng.integers(0, 2, count)
+        ]
+
+        by_member = {acc_set.member_id: acc_set for acc_set in sets}
+        expected = {"deductible": [], "oop": []}
+        for member_id, amount, network, benefit in zip(
+            member_ids, amounts, networks, benefits, strict=True
+        ):
+            acc_set, applied = by_member[member_id].apply_to_deductible(amount, network, benefit)
+            expected["deductible"].append(float(applied))
+            acc_set, applied = acc_set.apply_to_oop(amount, network, benefit)
+            expected["oop"].append(float(applied))
+            by_member[member_id] = acc_set
+
+        ledger = AccumulatorLedger(sets)
+        deductible = ledger.apply_to_deductible(member_ids, amounts, networks, benefits)
+        oop = ledger.apply_to_oop(member_ids, amounts, networks, benefits)
+
+        assert deductible.tolist() == expected["deductible"]
+        assert oop.tolist() == expected["oop"]
+        for snapshot in ledger.snapshots():
+            acc_set = by_member[snapshot.member_id]
+            for name in INDIVIDUAL_FIELDS + FAMILY_FIELDS:
+                ours, theirs = getattr(snapshot, name), getattr(acc_set, name)
+                assert (ours and ours.applied) == (theirs and theirs.applied), name
+
+    def test_embedded_family_limit(self):
+        """Test individual limits stop at the shared family limit."""
+        sets = [_medical(member_id) for member_id in ("A", "B", "C")]
+        ledger = AccumulatorLedger(sets, family_ids={"A": "F1", "B": "F1", "C": "F1"})
+
+        applied = ledger.apply_to_deductible(["A", "B", "C", "A", "C"], [600, 400, 300, 50, 10])
+
+        assert applied.tolist() == [500.0, 400.0, 100.0, 0.0, 0.0]
+        assert ledger.snapshot("C").deductible_family_in.met
+        assert ledger.snapshot("C").deductible_individual_in.applied == Decimal("100")
+        assert ledger.get_remaining(["A", "B", "C"]).tolist() == [0.0, 0.0, 0.0]
+
+    def test_families_are_independent(self):
+        """Test members without a family id keep their own family limits."""
+        ledger = AccumulatorLedger([_medical("A"), _medical("B")])
+
+        applied = ledger.apply_to_deductible(["A", "A", "B"], [500, 500, 500])
+
+        assert applied.tolist() == [500.0, 0.0, 500.0]
+        assert ledger.get_remaining(["A", "B"], network=NetworkTier.OUT_OF_NETWORK).tolist() == [
+            1000.0,
+            1000.0,
+        ]
+
+    def test_network_and_pharmacy_routing(self):
+        """Test claims draw on the accumulators for their network and benefit."""
+        ledger = AccumulatorLedger(
+            [
+                _medical("MED"),
+                create_pharmacy_accumulators(
+                    "RX", 2024, Decimal("100"), Decimal("2000"), specialty_oop=Decimal("250")
+                ),
+            ]
+        )
+
+        applied = ledger.apply_to_oop(
+            ["MED", "MED", "RX", "RX"],
+            [100, 200, 150, 50],
+            network=[
+                NetworkTier.IN_NETWORK,
+                NetworkTier.OUT_OF_NETWORK,
+                NetworkTier.PREFERRED_PHARMACY,
+                NetworkTier.PREFERRED_PHARMACY,
+            ],
+            benefit_type=BenefitType.PHARMACY,
+        )
+        specialty = ledger.apply_to_specialty_oop(["RX", "RX", "MED"], [200, 200, 200])
+
+        assert applied.tolist() == [100.0, 200.0, 150.0, 50.0]
+        assert specialty.tolist() == [200.0, 50.0, 0.0]
+        med, rx = ledger.snapshots()
+        assert med.oop_individual_in.applied == Decimal("100")
+        assert med.oop_individual_out.applied == Decimal("200")
+        assert rx.rx_oop.applied == Decimal("200")
+        assert rx.specialty_oop.met
+
+    def test_reset_for_new_year(self):
+        """Test reset clears balances and moves snapshots to the new year."""
+        ledger = AccumulatorLedger([_medical("A")])
+        ledger.apply_to_deductible(["A"], np.array([250.0]))
+
+        ledger.reset_for_new_year()
+
+        snapshot = ledger.snapshot("A")
+        assert snapshot.plan_year == 2025
+        assert snapshot.deductible_individual_in.applied == Decimal("0")
+        assert snapshot.deductible_individual_in.plan_year == 2025
+
+    def test_invalid_input(self):
+        """Test unknown members, bad amounts and duplicate members are rejected."""
+        ledger = AccumulatorLedger([_medical("A")])
+
+        with pytest.raises(ValueError, match="not in the ledger"):
+            ledger.apply_to_deductible(["Z"], [10])
+        with pytest.raises(ValueError, match="non-negative"):
+            ledger.apply_to_deductible(["A"], [-10])
+        with pytest.raises(ValueError, match="accumulator must be one of"):
+            ledger.get_remaining(["A"], accumulator="copay")
+        with pytest.raises(ValueError, match="duplicate member_id"):
+            AccumulatorLedger([_medical("A"), _medical("A")])
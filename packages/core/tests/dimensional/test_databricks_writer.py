@@ -0,0 +1,289 @@
+"""Tests for the Databricks dimensional writer.
+
+The SQL connector is replaced by a recording stand-in, so these tests check
+the statements the writer issues and the Parquet it stages, not Databricks.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from healthsim.dimensional.writers import LocalParquetStager, VolumeParquetStager
+from healthsim.dimensional.writers.databricks_writer import DatabricksDimensionalWriter
+
+pytest.importorskip("pyarrow")
+
+
+class RecordingWarehouse:
+    """Records statements from every connection and reads staged Parquet."""
+
+    def __init__(self, existing_tables: tuple[str, ...] = ()) -> None:
+        self.existing_tables = set(existing_tables)
+        self.statements: list[str] = []
+        self.loaded: dict[str, pd.DataFrame] = {}
+        self.connections = 0
+        self.threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def connect(self) -> RecordingConnection:
+        with self._lock:
+            self.connections += 1
+        return RecordingConnection(self)
+
+
+class RecordingConnection:
+    def __init__(self, warehouse: RecordingWarehouse) -> None:
+        self.warehouse = warehouse
+        self.closed = False
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self.warehouse)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class RecordingCursor:
+    def __init__(self, warehouse: RecordingWarehouse) -> None:
+        self.warehouse = warehouse
+        self._row = None
+
+    def __enter__(self) -> RecordingCursor:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, sql: str, parameters=None) -> None:
+        sql = " ".join(sql.split())
+        warehouse = self.warehouse
+        with warehouse._lock:
+            warehouse.statements.append(sql)
+            warehouse.threads.add(threading.get_ident())
+
+        table = re.search(r"table_name = '(\w+)'", sql)
+        self._row = (1,) if table and table.group(1) in warehouse.existing_tables else None
+
+        # Read staged files while they still exist, as the warehouse would
+        source = re.search(r"parquet\.`([^`]+)`|FROM '([^']+)' FILEFORMAT", sql)
+        if source:
+            target = re.search(r"(?:TABLE|INTO) \w+\.\w+\.(\w+)", sql).group(1)
+            location = source.group(1) or source.group(2)
+            with warehouse._lock:
+                warehouse.loaded[target] = pd.read_parquet(location)
+
+    def executemany(self, sql: str, rows) -> None:
+        with self.warehouse._lock:
+            self.warehouse.statements.append(" ".join(sql.split()))
+            self.warehouse.loaded.setdefault("rows", []).extend(rows)
+
+    def fetchone(self):
+        return self._row
+
+
+def make_writer(warehouse: RecordingWarehouse, **kwargs) -> DatabricksDimensionalWriter:
+    return DatabricksDimensionalWriter(
+        host="https://example.cloud.databricks.com",
+        http_path="/sql/1.0/warehouses/abc",
+        access_token="token",
+        connection_factory=warehouse.connect,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "member_key": [1, 2, 3],
+            "plan_code": ["PPO", None, "HMO"],
+            "paid_amount": [10.5, 20.0, None],
+            "service_date": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+        }
+    )
+
+
+class TestParquetLoad:
+    """Tests for the 'parquet' load mode."""
+
+    def test_requires_staging(self):
+        """Test parquet mode without a staging area is rejected."""
+        with pytest.raises(ValueError, match="staging_path"):
+            make_writer(RecordingWarehouse(), load_mode="parquet")
+
+    def test_invalid_load_mode(self):
+        """Test unknown load modes are rejected."""
+        with pytest.raises(ValueError, match="load_mode"):
+            make_writer(RecordingWarehouse(), load_mode="bulk")
+
+    def test_staging_path_selects_stager(self, tmp_path):
+        """Test /Volumes paths are uploaded, other paths written directly."""
+        volume = make_writer(
+            RecordingWarehouse(), load_mode="parquet", staging_path="/Volumes/hs/gold/stage"
+        )
+        local = make_writer(RecordingWarehouse(), load_mode="parquet", staging_path=str(tmp_path))
+
+        assert isinstance(volume.stager, VolumeParquetStager)
+        assert isinstance(local.stager, LocalParquetStager)
+
+    def test_replace_uses_ctas(self, tmp_path, df):
+        """Test replace loads with CREATE OR REPLACE ... AS SELECT from Parquet."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(warehouse, load_mode="parquet", staging_path=str(tmp_path))
+
+        assert writer.write_table("fact_claims", df) == 3
+
+        ctas = [s for s in warehouse.statements if s.startswith("CREATE OR REPLACE TABLE")]
+        assert ctas == [
+            f"CREATE OR REPLACE TABLE healthsim.gold.fact_claims USING DELTA "
+            f"AS SELECT * FROM parquet.`{ctas[0].split('`')[1]}`"
+        ]
+        assert not any(s.startswith("INSERT") for s in warehouse.statements)
+        pd.testing.assert_frame_equal(
+            warehouse.loaded["fact_claims"], df, check_dtype=False, check_exact=False
+        )
+        # The staged batch is removed once loaded
+        assert list(tmp_path.rglob("*.parquet")) == []
+
+    def test_append_existing_uses_copy_into(self, tmp_path, df):
+        """Test appending to an existing table loads with COPY INTO."""
+        warehouse = RecordingWarehouse(existing_tables=("fact_claims",))
+        writer = make_writer(warehouse, load_mode="parquet", staging_path=str(tmp_path))
+
+        writer.write_table("fact_claims", df, if_exists="append")
+
+        copy = [s for s in warehouse.statements if s.startswith("COPY INTO")]
+        assert len(copy) == 1
+        assert re.fullmatch(
+            r"COPY INTO healthsim\.gold\.fact_claims FROM '.+' FILEFORMAT = PARQUET", copy[0]
+        )
+        assert not any(s.startswith("CREATE OR REPLACE") for s in warehouse.statements)
+        assert len(warehouse.loaded["fact_claims"]) == 3
+
+    def test_append_missing_creates_table(self, tmp_path, df):
+        """Test appending to a missing table creates it from the Parquet."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(warehouse, load_mode="parquet", staging_path=str(tmp_path))
+
+        writer.write_table("fact_claims", df, if_exists="append")
+
+        assert any(
+            s.startswith("CREATE TABLE healthsim.gold.fact_claims USING DELTA AS SELECT")
+            for s in warehouse.statements
+        )
+
+    def test_files_split_by_rows_per_file(self, tmp_path, df):
+        """Test large tables are staged as several Parquet files."""
+        warehouse = RecordingWarehouse()
+        stager = LocalParquetStager(tmp_path, rows_per_file=2)
+        writer = make_writer(warehouse, load_mode="parquet", stager=stager)
+
+        location = stager.stage(None, "fact_claims", df)
+        assert sorted(p.name for p in (tmp_path / "fact_claims").rglob("*.parquet")) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+        ]
+        stager.remove(None, location)
+
+        writer.write_table("fact_claims", df)
+        assert len(warehouse.loaded["fact_claims"]) == 3
+
+
+class TestVolumeParquetStager:
+    """Tests for uploading staged Parquet into a volume."""
+
+    def test_put_and_remove(self, tmp_path, df):
+        """Test files are uploaded with PUT and deleted with REMOVE."""
+        warehouse = RecordingWarehouse()
+        cursor = RecordingCursor(warehouse)
+        stager = VolumeParquetStager("/Volumes/hs/gold/stage/", rows_per_file=2, local_dir=tmp_path)
+
+        location = stager.stage(cursor, "dim_member", df)
+        stager.remove(cursor, location)
+
+        assert location.startswith("/Volumes/hs/gold/stage/dim_member/")
+        assert warehouse.statements == [
+            f"PUT '{tmp_path.as_posix()}/{location[len('/Volumes/hs/gold/stage/'):]}/"
+            f"part-0000{i}.parquet' INTO '{location}/part-0000{i}.parquet' OVERWRITE"
+            for i in range(2)
+        ] + [f"REMOVE '{location}/part-0000{i}.parquet'" for i in range(2)]
+        # Local copies are cleaned up after upload
+        assert list(tmp_path.rglob("*.parquet")) == []
+
+    def test_close_removes_temporary_dir(self, df):
+        """Test the default scratch directory is removed when the writer closes."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(warehouse, load_mode="parquet", staging_path="/Volumes/hs/gold/stage")
+        writer.connect()
+        writer.stager.stage(writer.connection.cursor(), "dim_member", df)
+        local_dir = Path(writer.stager.local_dir)
+        assert local_dir.is_dir()
+
+        writer.close()
+
+        assert not local_dir.exists()
+
+
+class TestWriteDimensionalModel:
+    """Tests for parallel model writes."""
+
+    def test_parallel_parquet_load(self, tmp_path, df):
+        """Test every table is loaded over its own connection, dimensions first."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(
+            warehouse, load_mode="parquet", staging_path=str(tmp_path), max_workers=3
+        )
+        dimensions = {f"dim_{i}": df for i in range(3)}
+        facts = {"fact_claims": df, "fact_empty": df.iloc[0:0]}
+
+        results = writer.write_dimensional_model(dimensions, facts)
+
+        assert list(results) == ["dim_0", "dim_1", "dim_2", "fact_claims", "fact_empty"]
+        assert results == {**{name: 3 for name in dimensions}, "fact_claims": 3, "fact_empty": 0}
+        # One connection for the schema plus one per table
+        assert warehouse.connections == 6
+        creates = [
+            re.search(r"TABLE \w+\.\w+\.(\w+)", s).group(1)
+            for s in warehouse.statements
+            if s.startswith("CREATE OR REPLACE TABLE")
+        ]
+        assert set(creates[:3]) == set(dimensions)
+        assert set(creates[3:]) == set(facts)
+        assert set(warehouse.loaded) == set(dimensions) | {"fact_claims"}
+        writer.close()
+
+    def test_insert_mode_is_sequential(self, df):
+        """Test the insert load mode keeps using a single connection."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(warehouse)
+
+        results = writer.write_dimensional_model({"dim_member": df}, {"fact_claims": df})
+
+        assert results == {"dim_member": 3, "fact_claims": 3}
+        assert warehouse.connections == 1
+        assert len(warehouse.threads) == 1
+
+
+class TestInsertLoad:
+    """Tests for the default 'insert' load mode."""
+
+    def test_insert_converts_missing_to_none(self, df):
+        """Test NaN and NaT values are sent as NULL."""
+        warehouse = RecordingWarehouse()
+        writer = make_writer(warehouse)
+
+        writer.write_table("fact_claims", df)
+
+        rows = warehouse.loaded["rows"]
+        assert len(rows) == 3
+        assert rows[1][1] is None
+        assert rows[2][2] is None
+        assert rows[0][:3] == (1, "PPO", 10.5)
+        assert any(
+            s.startswith("INSERT INTO healthsim.gold.fact_claims") for s in warehouse.statements
+        )
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from datetime import date
 
+import pandas as pd
 import pytest
 
-from healthsim.dimensional import generate_dim_date
+from healthsim.dimensional import clear_dim_date_cache, generate_dim_date
 
 
 class TestGenerateDimDate:
@@ -283,3 +284,48 @@ class TestGenerateDimDate:
         assert df.iloc[0]["is_month_end"] == False  # noqa: E712
         assert df.iloc[1]["is_month_end"] == True  # noqa: E712
         assert df.iloc[2]["is_month_start"] == True  # noqa: E712
+
+    def test_matches_rowwise_attributes(self):
+        """Vectorized columns agree with datetime's per-day attributes."""
+        df = generate_dim_date("1999-12-25", "2005-01-10", use_cache=False)
+
+        for row in df.sample(n=200, random_state=7).itertuples():
+            d = row.full_date
+            assert row.date_key == int(d.strftime("%Y%m%d"))
+            assert row.day_of_year == d.timetuple().tm_yday
+            assert row.week_of_year == d.isocalendar()[1]
+            assert row.day_name == d.strftime("%A")
+            assert row.month_name == d.strftime("%B")
+            assert row.year_month == d.strftime("%Y-%m")
+            assert row.year_quarter == f"{d.year}-Q{(d.month - 1) // 3 + 1}"
+
+    def test_holiday_free_range(self):
+        """A range without holidays has no flags and no names."""
+        df = generate_dim_date("2024-02-02", "2024-02-10")
+
+        assert not df["is_us_federal_holiday"].any()
+        assert df["holiday_name"].isna().all()
+
+
+class TestDimDateCache:
+    """Test suite for the dim_date LRU cache."""
+
+    def test_cached_equals_uncached(self):
+        """Cached and freshly built frames are identical."""
+        clear_dim_date_cache()
+        cached = generate_dim_date("2020-01-01", "2024-12-31")
+        again = generate_dim_date(date(2020, 1, 1), date(2024, 12, 31))
+        fresh = generate_dim_date("2020-01-01", "2024-12-31", use_cache=False)
+
+        pd.testing.assert_frame_equal(cached, fresh)
+        pd.testing.assert_frame_equal(again, fresh)
+
+    def test_cache_returns_copies(self):
+        """Mutating a returned frame does not affect later calls."""
+        df = generate_dim_date("2024-01-01", "2024-01-31")
+        df.loc[0, "holiday_name"] = "Tampered"
+        df.drop(columns=["year"], inplace=True)
+
+        again = generate_dim_date("2024-01-01", "2024-01-31")
+        assert again.loc[0, "holiday_name"] == "New Year's Day"
+        assert "year" in again.columns
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -175,6 +176,157 @@ class TestDuckDBWriterWriteDimensionalModel:
             assert result["dim_date"] == 366  # Leap year
 
 
+class TestDuckDBWriterIncremental:
+    """Tests for merge mode and load watermarks."""
+
+    def test_merge_inserts_only_new_keys(self):
+        """Test merge skips rows whose natural key is already loaded."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            loaded = pd.DataFrame({"patient_key": ["A", "B"], "v": [1, 2]})
+            writer.write_table("dim_patient", loaded)
+            df = pd.DataFrame({"patient_key": ["B", "C", "D"], "v": [20, 3, 4]})
+
+            count = writer.write_table(
+                "dim_patient", df, if_exists="merge", key_columns=["patient_key"]
+            )
+
+            assert count == 2
+            result = writer.query("SELECT * FROM analytics.dim_patient ORDER BY patient_key")
+            assert result["patient_key"].tolist() == ["A", "B", "C", "D"]
+            assert result["v"].tolist() == [1, 2, 3, 4]
+
+    def test_merge_composite_and_null_keys(self):
+        """Test composite keys match column-wise and NULLs match each other."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            df = pd.DataFrame({"claim_id": ["C1", "C1", None], "line": [1, 2, 1]})
+            writer.write_table("fact_claims", df)
+
+            count = writer.write_table(
+                "fact_claims", df, if_exists="merge", key_columns=["claim_id", "line"]
+            )
+
+            assert count == 0
+            result = writer.query("SELECT COUNT(*) AS cnt FROM analytics.fact_claims")
+            assert result.iloc[0]["cnt"] == 3
+
+    def test_merge_creates_if_not_exists(self):
+        """Test merge creates a missing table from all rows."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            df = pd.DataFrame({"id": [1, 2, 3]})
+            assert writer.write_table("t", df, if_exists="merge", key_columns=["id"]) == 3
+
+    def test_merge_requires_key_columns(self):
+        """Test merge without key columns raises ValueError."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            with pytest.raises(ValueError, match="key_columns"):
+                writer.write_table("t", pd.DataFrame({"id": [1]}), if_exists="merge")
+
+    def test_write_dimensional_model_merge(self):
+        """Test keyed tables are merged and unkeyed tables replaced."""
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            writer.write_dimensional_model(
+                {
+                    "dim_patient": pd.DataFrame({"patient_key": ["A"]}),
+                    "dim_facility": pd.DataFrame({"facility_key": [1]}),
+                },
+                {},
+            )
+
+            result = writer.write_dimensional_model(
+                {
+                    "dim_patient": pd.DataFrame({"patient_key": ["A", "B"]}),
+                    "dim_facility": pd.DataFrame({"facility_key": [1, 2]}),
+                },
+                {},
+                if_exists="merge",
+                key_columns={"dim_patient": ("patient_key",)},
+            )
+
+            assert result == {"dim_patient": 1, "dim_facility": 2}
+            stats = writer.get_table_stats().set_index("table_name")["row_count"]
+            assert stats.to_dict() == {"dim_facility": 2, "dim_patient": 2}
+
+    def test_merge_rekeys_positional_dimensions(self):
+        """Test a new facility keeps stored keys stable and facts re-keyed."""
+        merge_keys = {
+            "key_columns": {
+                "dim_facility": ("facility_name",),
+                "fact_encounters": ("encounter_key",),
+            },
+            "surrogate_keys": {"dim_facility": "facility_key"},
+            "foreign_keys": {"fact_encounters": {"facility_key": "dim_facility"}},
+        }
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            writer.write_dimensional_model(
+                {
+                    "dim_facility": pd.DataFrame(
+                        {"facility_key": [1, 2], "facility_name": ["Alpha", "Gamma"]}
+                    )
+                },
+                {
+                    "fact_encounters": pd.DataFrame(
+                        {"encounter_key": ["E1", "E2"], "facility_key": [2, -1]}
+                    )
+                },
+            )
+
+            # "Beta" sorts between the loaded names, shifting Gamma to 3.
+            result = writer.write_dimensional_model(
+                {
+                    "dim_facility": pd.DataFrame(
+                        {"facility_key": [1, 2, 3], "facility_name": ["Alpha", "Beta", "Gamma"]}
+                    )
+                },
+                {
+                    "fact_encounters": pd.DataFrame(
+                        {"encounter_key": ["E1", "E3", "E4"], "facility_key": [3, 2, 3]}
+                    )
+                },
+                if_exists="merge",
+                **merge_keys,
+            )
+
+            assert result == {"dim_facility": 1, "fact_encounters": 2}
+            dim = writer.query(
+                "SELECT facility_key, facility_name FROM analytics.dim_facility ORDER BY 1"
+            )
+            assert dim.values.tolist() == [[1, "Alpha"], [2, "Gamma"], [3, "Beta"]]
+            facts = writer.query(
+                "SELECT e.encounter_key, e.facility_key, coalesce(d.facility_name, '-') "
+                "FROM analytics.fact_encounters e "
+                "LEFT JOIN analytics.dim_facility d USING (facility_key) ORDER BY 1"
+            )
+            assert facts.values.tolist() == [
+                ["E1", 2, "Gamma"],
+                ["E2", -1, "-"],
+                ["E3", 3, "Beta"],
+                ["E4", 2, "Gamma"],
+            ]
+            assert not writer.query(
+                "SELECT * FROM duckdb_tables() WHERE table_name LIKE '_key_map%'"
+            ).shape[0]
+
+    def test_watermark_skips_loaded_tables(self):
+        """Test tables already loaded up to the watermark are not rewritten."""
+        first, second = datetime(2024, 6, 1, 12), datetime(2024, 6, 2, 12)
+        with DuckDBDimensionalWriter(":memory:") as writer:
+            dims = {"dim_patient": pd.DataFrame({"patient_key": ["A"]})}
+            writer.write_dimensional_model(dims, {}, watermark=first)
+
+            assert writer.get_watermark("dim_patient") == first
+            assert writer.get_watermark("dim_other") is None
+            assert writer.get_table_list() == ["dim_patient"]
+
+            dims = {"dim_patient": pd.DataFrame({"patient_key": ["A", "B"]})}
+            assert writer.write_dimensional_model(dims, {}, watermark=first) == {
+                "dim_patient": 0
+            }
+            assert writer.write_dimensional_model(dims, {}, watermark=second) == {
+                "dim_patient": 2
+            }
+            assert writer.get_watermark("dim_patient") == second
+
+
 class TestDuckDBWriterGetTableList:
     """Tests for get_table_list method."""
 
@@ -0,0 +1,164 @@
+"""Tests for the shared utilization metrics."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta
+
+import duckdb
+import pytest
+
+from healthsim.dimensional import (
+    is_mortality,
+    is_mortality_sql,
+    length_of_stay,
+    length_of_stay_days_sql,
+    length_of_stay_hours_sql,
+    readmission_flags,
+    readmission_flags_sql,
+)
+
+
+def pairwise_flags(stays, windows=(7, 30)):
+    """Reference implementation comparing every pair of stays."""
+    flags = []
+    for key, admitted, _ in stays:
+        gaps = [
+            (admitted.date() - prior_discharged.date()).days
+            for prior_key, prior_admitted, prior_discharged in stays
+            if prior_key == key and prior_discharged and prior_admitted < admitted
+        ]
+        flags.append(tuple(any(0 <= gap <= window for gap in gaps) for window in windows))
+    return flags
+
+
+def random_stays(seed: int, count: int = 400):
+    """Overlapping, same-day and open stays across a handful of patients."""
+    rng = random.Random(seed)
+    stays = []
+    for _ in range(count):
+        admitted = datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, 24 * 120))
+        discharged = (
+            admitted + timedelta(hours=rng.choice([0, 3, 20, 72, 400]))
+            if rng.random() < 0.85
+            else None
+        )
+        stays.append((f"MRN{rng.randint(1, 8)}", admitted, discharged))
+    # Exact admission-time ties
+    stays.append(stays[0])
+    return stays
+
+
+def sql_flags(stays, windows=(7, 30)):
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE stays (stay_id INTEGER, group_key VARCHAR, "
+        "admitted TIMESTAMP, discharged TIMESTAMP)"
+    )
+    conn.executemany(
+        "INSERT INTO stays VALUES (?, ?, ?, ?)",
+        [[i, key, admitted, discharged] for i, (key, admitted, discharged) in enumerate(stays)],
+    )
+    rows = conn.execute(
+        f"SELECT * FROM ({readmission_flags_sql('SELECT * FROM stays', windows)}) "
+        "ORDER BY stay_id"
+    ).fetchall()
+    return [tuple(row[1:]) for row in rows]
+
+
+class TestReadmissionFlags:
+    """Tests for readmission_flags and readmission_flags_sql."""
+
+    def test_seven_and_thirty_day(self):
+        """Test gaps inside and outside each window."""
+        stays = [
+            ("MRN1", datetime(2024, 6, 1, 10), datetime(2024, 6, 5, 14)),
+            ("MRN1", datetime(2024, 6, 10, 10), datetime(2024, 6, 12, 14)),
+            ("MRN1", datetime(2024, 7, 1, 10), None),
+            ("MRN1", datetime(2024, 9, 1, 10), None),
+            ("MRN2", datetime(2024, 6, 8, 10), None),
+        ]
+
+        assert readmission_flags(stays) == [
+            (False, False),
+            (True, True),
+            (False, True),
+            (False, False),
+            (False, False),
+        ]
+
+    def test_same_day_discharge_counts_only_for_earlier_admissions(self):
+        """Test a discharge on the admission day counts only if admitted earlier."""
+        stays = [
+            ("MRN1", datetime(2024, 6, 1, 8), datetime(2024, 6, 1, 9)),
+            ("MRN1", datetime(2024, 6, 1, 12), datetime(2024, 6, 1, 13)),
+            ("MRN1", datetime(2024, 6, 1, 12), None),
+        ]
+
+        assert readmission_flags(stays) == [(False, False), (True, True), (True, True)]
+
+    def test_custom_windows_and_dates(self):
+        """Test date stays and non-default windows."""
+        stays = [
+            ("M1", date(2024, 1, 1), date(2024, 1, 3)),
+            ("M1", date(2024, 2, 1), date(2024, 2, 2)),
+        ]
+
+        assert readmission_flags(stays, windows=(14, 60, 90)) == [
+            (False, False, False),
+            (False, True, True),
+        ]
+
+    def test_empty(self):
+        """Test no stays yields no flags."""
+        assert readmission_flags([]) == []
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_pairwise_reference(self, seed):
+        """Test the sorted pass agrees with comparing every pair of stays."""
+        stays = random_stays(seed)
+        assert readmission_flags(stays) == pairwise_flags(stays)
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_sql_matches_python(self, seed):
+        """Test the window query agrees with the Python pass."""
+        stays = random_stays(seed)
+        assert sql_flags(stays) == readmission_flags(stays)
+
+
+class TestLengthOfStay:
+    """Tests for length_of_stay and its SQL equivalents."""
+
+    def test_length_of_stay(self):
+        """Test hours and whole days."""
+        assert length_of_stay(datetime(2024, 6, 1, 10), datetime(2024, 6, 4, 14)) == (76.0, 3)
+        assert length_of_stay(date(2024, 6, 1), date(2024, 6, 4)) == (72.0, 3)
+
+    def test_open_stay(self):
+        """Test a stay without discharge has no length."""
+        assert length_of_stay(datetime(2024, 6, 1, 10), None) == (None, None)
+
+    def test_sql_matches_python(self):
+        """Test the SQL expressions agree with the Python values."""
+        admitted, discharged = datetime(2024, 6, 1, 10, 15), datetime(2024, 6, 4, 8, 40)
+        hours, days = duckdb.execute(
+            f"SELECT {length_of_stay_hours_sql('$a', '$d')}, "
+            f"{length_of_stay_days_sql('$a', '$d')}",
+            {"a": admitted, "d": discharged},
+        ).fetchone()
+
+        assert (pytest.approx(hours), days) == length_of_stay(admitted, discharged)
+
+
+class TestMortality:
+    """Tests for is_mortality and is_mortality_sql."""
+
+    @pytest.mark.parametrize(
+        "disposition,expected",
+        [("Expired", True), ("Patient died", True), ("Home", False), ("", False), (None, False)],
+    )
+    def test_is_mortality(self, disposition, expected):
+        """Test disposition keywords, case-insensitively, in Python and SQL."""
+        assert is_mortality(disposition) is expected
+        sql = f"SELECT {is_mortality_sql('$d')}"
+        assert duckdb.execute(sql, {"d": disposition}).fetchone()[0] is expected
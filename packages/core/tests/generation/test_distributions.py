@@ -1,5 +1,6 @@
 """Tests for statistical distributions module."""
 
+import numpy as np
 import pytest
 import random
 from unittest.mock import MagicMock
@@ -14,6 +15,7 @@ from healthsim.generation.distributions import (
     AgeBandDistribution,
     AgeDistribution,
     ConditionalDistribution,
+    compile_sampler,
     create_distribution,
 )
 
@@ -733,3 +735,89 @@ class TestCreateDistribution:
         assert isinstance(dist, NormalDistribution)
         assert dist.mean == 0
         assert dist.std_dev == 1
+
+
+# =============================================================================
+# compile_sampler Tests
+# =============================================================================
+
+class TestCompileSampler:
+    """Tests for vectorized samplers built by compile_sampler."""
+
+    def test_normal_column(self):
+        """Test normal sampler moments over a large column."""
+        sampler = compile_sampler({"type": "normal", "mean": 50, "std_dev": 10})
+
+        values = sampler.sample(np.random.default_rng(42), 50_000)
+
+        assert len(values) == 50_000
+        assert abs(values.mean() - 50) < 0.5
+        assert abs(values.std() - 10) < 0.5
+
+    def test_categorical_proportions(self):
+        """Test categorical sampler matches weights."""
+        sampler = compile_sampler({"type": "categorical", "weights": {"M": 0.3, "F": 0.7}})
+
+        values = sampler.sample(np.random.default_rng(42), 20_000)
+
+        assert set(values.tolist()) == {"M", "F"}
+        assert abs((values == "F").mean() - 0.7) < 0.02
+
+    def test_explicit_values(self):
+        """Test explicit sampler only returns listed values."""
+        sampler = compile_sampler({
+            "type": "explicit",
+            "values": [{"value": "x", "weight": 1}, {"value": "y", "weight": 3}],
+        })
+
+        values = sampler.sample(np.random.default_rng(42), 20_000)
+
+        assert abs((values == "y").mean() - 0.75) < 0.02
+
+    def test_uniform_range(self):
+        """Test uniform sampler stays in range."""
+        sampler = compile_sampler({"type": "uniform", "min": 5, "max": 10})
+
+        values = sampler.sample(np.random.default_rng(42), 10_000)
+
+        assert values.min() >= 5
+        assert values.max() <= 10
+
+    def test_age_bands_are_integers_in_bands(self):
+        """Test age band sampler draws whole ages inside the bands."""
+        sampler = compile_sampler({"type": "age_bands", "bands": {"18-25": 0.5, "65-70": 0.5}})
+
+        values = sampler.sample(np.random.default_rng(42), 10_000)
+
+        assert np.array_equal(values, np.floor(values))
+        assert all(18 <= v <= 25 or 65 <= v <= 70 for v in set(values.tolist()))
+
+    def test_conditional_uses_context(self):
+        """Test conditional sampler picks the branch per entity."""
+        sampler = compile_sampler({
+            "type": "conditional",
+            "rules": [
+                {"condition": "severity == 'mild'", "distribution": {"type": "normal", "mean": 1, "std_dev": 0.01}},
+                {"condition": "severity == 'severe'", "distribution": {"type": "normal", "mean": 9, "std_dev": 0.01}},
+            ],
+        })
+        severity = np.array(["mild", "severe"] * 500)
+
+        values = sampler.sample(np.random.default_rng(42), 1000, {"severity": severity})
+
+        assert np.allclose(values[severity == "mild"], 1, atol=0.1)
+        assert np.allclose(values[severity == "severe"], 9, atol=0.1)
+
+    def test_same_rng_seed_is_deterministic(self):
+        """Test same generator seed gives the same column."""
+        sampler = compile_sampler({"type": "lognormal", "mean": 100, "std_dev": 30})
+
+        a = sampler.sample(np.random.default_rng(7), 100)
+        b = sampler.sample(np.random.default_rng(7), 100)
+
+        assert np.array_equal(a, b)
+
+    def test_unknown_type_raises(self):
+        """Test that unknown type raises error."""
+        with pytest.raises(ValueError, match="Unknown distribution type"):
+            compile_sampler({"type": "unknown_distribution"})
@@ -499,6 +499,86 @@ class TestTimeline:
         assert timeline.events[0].result["output"] == "success"
         assert timeline.events[0].executed_at is not None
 
+    @staticmethod
+    def _event(event_id, day, status="pending"):
+        return TimelineEvent(
+            timeline_event_id=event_id, journey_id="j1", event_definition_id=event_id,
+            scheduled_date=date(2024, 1, 1) + timedelta(days=day),
+            event_type="a", event_name=event_id, status=status,
+        )
+
+    def test_same_date_keeps_insertion_order(self):
+        """Test ties are appended after existing events on that date."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        for event_id, day in [("a", 5), ("b", 1), ("c", 5), ("d", 1)]:
+            timeline.add_event(self._event(event_id, day))
+
+        assert [e.timeline_event_id for e in timeline.events] == ["b", "d", "a", "c"]
+
+    def test_extend_matches_add_event(self):
+        """Test bulk extend gives the same order as repeated add_event."""
+        existing = [self._event(f"x{i}", day) for i, day in enumerate([0, 3, 3, 9])]
+        incoming = [self._event(f"y{i}", day) for i, day in enumerate([3, 1, 12, 9, 0])]
+
+        one_by_one = Timeline(entity_id="P001", entity_type="patient")
+        for event in existing + incoming:
+            one_by_one.add_event(event)
+        bulk = Timeline(entity_id="P001", entity_type="patient")
+        bulk.extend(existing)
+        bulk.extend(incoming)
+
+        assert [e.timeline_event_id for e in bulk.events] == [
+            e.timeline_event_id for e in one_by_one.events
+        ]
+        assert bulk.get_event("y2").scheduled_date == date(2024, 1, 13)
+
+    def test_range_queries_use_sorted_dates(self):
+        """Test by-date and up-to queries on a long timeline."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.extend(self._event(f"e{i}", i // 2) for i in range(2000))
+        timeline.mark_executed("e0", {})
+
+        assert [e.timeline_event_id for e in timeline.get_events_by_date(date(2024, 1, 11))] == ["e20", "e21"]
+        up_to = timeline.get_events_up_to(date(2024, 1, 3))
+        assert [e.timeline_event_id for e in up_to] == ["e1", "e2", "e3", "e4", "e5"]
+
+    def test_index_follows_direct_assignment(self):
+        """Test replacing or appending to events directly keeps lookups valid."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.add_event(self._event("a", 0))
+        timeline.events = [self._event("c", 9), self._event("b", 2)]
+        timeline.events.append(self._event("d", 1))
+
+        assert timeline.get_event("a") is None
+        timeline.mark_executed("c", {"ok": True})
+        assert timeline.get_event("c").status == "executed"
+        assert [e.timeline_event_id for e in timeline.events] == ["d", "b", "c"]
+
+    def test_index_follows_same_length_mutations(self):
+        """Test in-place changes that keep the list length invalidate the index."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.extend([self._event("a", 0), self._event("b", 5)])
+        assert timeline.get_event("a") is not None
+
+        timeline.events[0] = self._event("c", 9)
+        assert timeline.get_event("a") is None
+        assert timeline.get_event("c").scheduled_date == date(2024, 1, 10)
+        assert [e.timeline_event_id for e in timeline.events] == ["b", "c"]
+
+        del timeline.events[0]
+        timeline.events.append(self._event("d", 1))
+        assert timeline.get_event("b") is None
+        assert [e.timeline_event_id for e in timeline.get_events_up_to(date(2024, 1, 5))] == ["d"]
+
+    def test_mark_executed_unknown_id_is_noop(self):
+        """Test unknown ids are ignored."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        timeline.add_event(self._event("a", 0))
+
+        timeline.mark_executed("missing", {})
+
+        assert timeline.events[0].status == "pending"
+
 
 # =============================================================================
 # JourneyEngine Tests
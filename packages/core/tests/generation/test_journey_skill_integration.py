@@ -8,6 +8,7 @@ from healthsim.generation.journey_engine import (
     JourneySpecification,
     EventDefinition,
     DelaySpec,
+    ParameterPlan,
 )
 
 
@@ -240,3 +241,94 @@ class TestSkillRefFallback:
         
         # Should be empty (no fallback provided)
         assert resolved == {}
+
+
+class TestParameterPlans:
+    """Tests for compiled parameter plans."""
+
+    def test_plan_fills_slots(self):
+        """Test constants, variables and templates resolve like before."""
+        plan = ParameterPlan.compile({
+            "static": 5,
+            "age": "${entity.age}",
+            "note": "${entity.name} is ${entity.age} (${entity.missing})",
+            "missing": "${entity.missing}",
+        })
+
+        resolved = plan.fill({"age": 67, "name": "Ada"})
+
+        assert resolved == {
+            "static": 5,
+            "age": 67,
+            "note": "Ada is 67 (${entity.missing})",
+            "missing": "${entity.missing}",
+        }
+        assert list(resolved) == ["static", "age", "note", "missing"]
+
+    def test_plan_modes(self):
+        """Test the resolution mode is chosen at compile time."""
+        assert ParameterPlan.compile({"a": 1}).mode == "direct"
+        assert ParameterPlan.compile({"skill_ref": {}}).mode == "skill_ref"
+        assert ParameterPlan.compile({}, "diagnosis", "diabetes").mode == "auto"
+
+    def test_plan_shared_across_entities(self):
+        """Test events from one definition share a plan."""
+        engine = JourneyEngine(seed=42)
+        journey = JourneySpecification(
+            journey_id="j",
+            name="J",
+            events=[EventDefinition(
+                event_id="e1", name="E1", event_type="encounter",
+                parameters={"who": "${entity.patient_id}"},
+            )],
+        )
+
+        t1 = engine.create_timeline({"patient_id": "P1"}, "patient", journey)
+        t2 = engine.create_timeline({"patient_id": "P2"}, "patient", journey)
+
+        assert t1.events[0].plan is t2.events[0].plan
+
+    def test_execute_timeline_converts_entity_once(self):
+        """Test the entity is converted to a dict once per execution."""
+        engine = JourneyEngine(seed=42)
+        engine.register_handler("core", "encounter", lambda entity, event, ctx: {})
+        journey = JourneySpecification(
+            journey_id="j",
+            name="J",
+            events=[
+                EventDefinition(
+                    event_id=f"e{i}", name="E", event_type="encounter",
+                    delay=DelaySpec(days=1), parameters={"who": "${entity.patient_id}"},
+                )
+                for i in range(5)
+            ],
+        )
+        entity = {"patient_id": "P1"}
+        timeline = engine.create_timeline(entity, "patient", journey, start_date=date(2024, 1, 1))
+        calls = []
+        original = engine._entity_to_dict
+        engine._entity_to_dict = lambda e: calls.append(e) or original(e)
+
+        results = engine.execute_timeline(timeline, entity)
+
+        assert len(calls) == 1
+        assert [r["parameters"] for r in results] == [{"who": "P1"}] * 5
+
+    def test_edited_parameters_recompile(self):
+        """Test changing an event's parameters after scheduling is honoured."""
+        engine = JourneyEngine(seed=42)
+        engine.register_handler("core", "encounter", lambda entity, event, ctx: {})
+        journey = JourneySpecification(
+            journey_id="j",
+            name="J",
+            events=[EventDefinition(
+                event_id="e1", name="E1", event_type="encounter", parameters={"a": 1},
+            )],
+        )
+        timeline = engine.create_timeline({"patient_id": "P1"}, "patient", journey)
+        event = timeline.events[0]
+        event.parameters["a"] = 2
+
+        result = engine.execute_event(timeline, event, {"patient_id": "P1"})
+
+        assert result["parameters"] == {"a": 2}
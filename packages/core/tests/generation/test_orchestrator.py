@@ -267,3 +267,85 @@ class TestMultipleJourneys:
         # Each entity should have events from both journeys
         for entity in result.entities:
             assert len(entity.timeline.events) == 2
+
+
+def _lab_handler(entity, event, context):
+    """Module-level (picklable) handler used by parallel tests."""
+    return {"entity_id": entity["entity_id"], "age": entity["age"]}
+
+
+class TestParallelExecution:
+    """Tests for workers > 1."""
+
+    @pytest.fixture
+    def profile(self):
+        return ProfileSpecification.model_validate({
+            "id": "parallel",
+            "name": "Parallel",
+            "generation": {"count": 37},
+            "demographics": {
+                "age": {"type": "normal", "mean": 60, "std_dev": 10},
+                "gender": {"type": "categorical", "weights": {"M": 0.5, "F": 0.5}},
+            },
+        })
+
+    @pytest.fixture
+    def journey(self):
+        return JourneySpecification(
+            journey_id="labs",
+            name="Labs",
+            events=[
+                EventDefinition(event_id="a", name="A", event_type="lab_order",
+                                delay=DelaySpec(days=5, days_min=0, days_max=30)),
+                EventDefinition(event_id="b", name="B", event_type="lab_order",
+                                delay=DelaySpec(days=30), probability=0.5),
+                EventDefinition(event_id="c", name="C", event_type="lab_order",
+                                delay=DelaySpec(days=10), depends_on="a", probability=0.3),
+            ],
+        )
+
+    def _run(self, profile, journey, workers, execute_events=False):
+        orch = ProfileJourneyOrchestrator(seed=7)
+        orch.journey_engine.register_handler("core", "lab_order", _lab_handler)
+        result = orch.execute(
+            profile=profile.model_copy(deep=True),
+            journey=journey,
+            start_date=date(2025, 1, 1),
+            execute_events=execute_events,
+            up_to_date=date(2025, 3, 1),
+            workers=workers,
+        )
+        return orch, result
+
+    def test_matches_serial(self, profile, journey):
+        """Test parallel output is identical to the serial run."""
+        serial_orch, serial = self._run(profile, journey, workers=1)
+        parallel_orch, parallel = self._run(profile, journey, workers=3)
+
+        assert parallel.entity_count == 37
+        assert [e.entity for e in parallel.entities] == [e.entity for e in serial.entities]
+        assert [e.timeline for e in parallel.entities] == [e.timeline for e in serial.entities]
+        # The engine RNG ends where the serial run left it
+        assert parallel_orch.journey_engine._rng.getstate() == serial_orch.journey_engine._rng.getstate()
+
+    def test_executes_events_in_workers(self, profile, journey):
+        """Test handlers run in workers and results match serial."""
+        _, serial = self._run(profile, journey, workers=1, execute_events=True)
+        _, parallel = self._run(profile, journey, workers=2, execute_events=True)
+
+        def summary(result):
+            return [
+                (ev.timeline_event_id, ev.status, ev.result)
+                for ent in result.entities for ev in ent.timeline.events
+            ]
+
+        assert summary(parallel) == summary(serial)
+        assert any(status == "executed" for _, status, _ in summary(parallel))
+
+    def test_unpicklable_handler_raises(self, profile, journey):
+        """Test lambdas are rejected before starting workers."""
+        orch = ProfileJourneyOrchestrator(seed=7)
+        orch.journey_engine.register_handler("core", "lab_order", lambda e, ev, ctx: {})
+
+        with pytest.raises(ValueError, match="picklable"):
+            orch.execute(profile=profile, journey=journey, workers=2)
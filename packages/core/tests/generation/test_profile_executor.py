@@ -773,3 +773,125 @@ class TestEdgeCases:
         ages = [e.age for e in result.entities]
         mean_age = sum(ages) / len(ages)
         assert 47 < mean_age < 53  # Within 3 of target
+
+
+# =============================================================================
+# Vectorized Execution Tests
+# =============================================================================
+
+class TestVectorizedExecution:
+    """Tests for ProfileExecutor vectorized mode."""
+
+    @pytest.fixture
+    def diabetes_profile(self):
+        """Create Medicare diabetes profile with conditional labs."""
+        return ProfileSpecification.model_validate({
+            "id": "test-vectorized",
+            "name": "Vectorized Test",
+            "generation": {"count": 5000, "seed": 42},
+            "demographics": {
+                "age": {"type": "normal", "mean": 72, "std_dev": 8, "min": 65, "max": 95},
+                "gender": {"type": "categorical", "weights": {"M": 0.48, "F": 0.52}},
+            },
+            "clinical": {
+                "primary_condition": {"code": "E11", "prevalence": 1.0},
+                "severity": {"type": "categorical", "weights": {"controlled": 0.6, "uncontrolled": 0.4}},
+                "comorbidities": [{"code": "I10", "prevalence": 0.7}],
+                "lab_values": {
+                    "a1c": {
+                        "type": "conditional",
+                        "rules": [
+                            {"condition": "severity == 'controlled'",
+                             "distribution": {"type": "normal", "mean": 6.5, "std_dev": 0.3}},
+                            {"condition": "severity == 'uncontrolled'",
+                             "distribution": {"type": "normal", "mean": 8.5, "std_dev": 1.0}},
+                        ],
+                    },
+                },
+            },
+            "coverage": {"type": "Medicare", "plan_distribution": {"MA": 0.45, "FFS": 0.55}},
+        })
+
+    def test_count_and_indexes(self, diabetes_profile):
+        """Test vectorized mode generates indexed entities."""
+        result = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        assert result.count == 5000
+        assert [e.index for e in result.entities[:3]] == [0, 1, 2]
+
+    def test_deterministic(self, diabetes_profile):
+        """Test same seed gives identical entities."""
+        a = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+        b = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        assert a.entities == b.entities
+
+    def test_prefix_stable_across_counts(self, diabetes_profile):
+        """Test the first entities do not depend on the total count."""
+        small = ProfileExecutor(diabetes_profile).execute(count_override=50, vectorized=True)
+        large = ProfileExecutor(diabetes_profile).execute(count_override=10_000, vectorized=True)
+
+        assert small.entities == large.entities[:50]
+
+    def test_demographics(self, diabetes_profile):
+        """Test ages stay in bounds and birth dates match ages."""
+        result = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        ages = [e.age for e in result.entities]
+        assert min(ages) >= 65
+        assert max(ages) <= 95
+        assert 71 < sum(ages) / len(ages) < 73
+        for e in result.entities[:100]:
+            assert e.birth_date.year == date.today().year - e.age
+            assert e.gender in ("M", "F")
+
+    def test_conditions(self, diabetes_profile):
+        """Test primary and comorbid conditions follow prevalence."""
+        result = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        assert all(e.conditions[0] == "E11" for e in result.entities)
+        i10 = sum(1 for e in result.entities if "I10" in e.conditions) / result.count
+        assert abs(i10 - 0.7) < 0.03
+        # Entities must not share condition lists
+        result.entities[0].conditions.append("Z00")
+        assert "Z00" not in result.entities[1].conditions
+
+    def test_conditional_labs_follow_severity(self, diabetes_profile):
+        """Test lab values use the branch for each entity's severity."""
+        result = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        by_severity = {"controlled": [], "uncontrolled": []}
+        for e in result.entities:
+            by_severity[e.severity].append(e.lab_values["a1c"])
+
+        assert abs(sum(by_severity["controlled"]) / len(by_severity["controlled"]) - 6.5) < 0.1
+        assert abs(sum(by_severity["uncontrolled"]) / len(by_severity["uncontrolled"]) - 8.5) < 0.1
+
+    def test_coverage_and_validation(self, diabetes_profile):
+        """Test plan mix and validation report."""
+        result = ProfileExecutor(diabetes_profile).execute(vectorized=True)
+
+        assert all(e.coverage_type == "Medicare" for e in result.entities)
+        ma = sum(1 for e in result.entities if e.plan_type == "MA") / result.count
+        assert abs(ma - 0.45) < 0.03
+        assert result.validation.passed
+
+    def test_execute_profile_passthrough(self, diabetes_profile):
+        """Test execute_profile forwards the vectorized flag."""
+        result = execute_profile(diabetes_profile, count=10, vectorized=True)
+        expected = ProfileExecutor(diabetes_profile).execute(count_override=10, vectorized=True)
+
+        assert result.entities == expected.entities
+
+    def test_stream_rng_is_keyed_by_stream_and_block(self):
+        """Test stream generators are stable and independent."""
+        manager = HierarchicalSeedManager(master_seed=42)
+
+        a = manager.get_stream_rng("demographics.age").random(3)
+        again = manager.get_stream_rng("demographics.age").random(3)
+        other = manager.get_stream_rng("demographics.gender").random(3)
+        next_block = manager.get_stream_rng("demographics.age", block=1).random(3)
+
+        assert list(a) == list(again)
+        assert list(a) != list(other)
+        assert list(a) != list(next_block)
@@ -167,6 +167,43 @@ class TestSkillRegistry:
         assert reg.skill_name == "my-custom-skill"
 
 
+class TestEventLookupMemo:
+    """Tests for memoized (event_type, condition) lookups."""
+
+    def test_lookup_is_memoized(self):
+        """Test repeated lookups reuse the first result."""
+        registry = SkillRegistry()
+
+        first = registry.get_event_lookup("diagnosis", "diabetes")
+
+        assert first is not None
+        assert first[0] == "diabetes-management"
+        assert registry._event_lookups[("diagnosis", "diabetes", None)] == first
+        assert registry.get_event_lookup("diagnosis", "diabetes") is first
+
+    def test_unknown_lookup_cached_as_none(self):
+        """Test misses are cached too."""
+        registry = SkillRegistry()
+
+        assert registry.get_event_lookup("diagnosis", "no-such-condition-xyz") is None
+        assert ("diagnosis", "no-such-condition-xyz", None) in registry._event_lookups
+
+    def test_register_invalidates(self):
+        """Test registering a skill clears memoized lookups."""
+        registry = SkillRegistry()
+        assert registry.get_event_lookup("diagnosis", "zebra fever") is None
+
+        registry.register(SkillRegistration(
+            skill_name="zebra-fever",
+            conditions=["zebra fever"],
+            capabilities=[SkillCapabilityDeclaration(
+                capability=SkillCapability.DIAGNOSIS, lookup_key="diagnosis_code",
+            )],
+        ))
+
+        assert registry.get_event_lookup("diagnosis", "zebra fever") == ("zebra-fever", "diagnosis_code")
+
+
 class TestAutoResolution:
     """Tests for auto-resolution of parameters."""
 
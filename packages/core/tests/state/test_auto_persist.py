@@ -115,6 +115,126 @@ class TestPersistEntities:
         with pytest.raises(ValueError, match="No entities"):
             service.persist_entities(entities=[], entity_type='patient')
 
+    def test_persist_reports_inserted_and_updated(self, service):
+        """Row-by-row path reports inserts and duplicate-key updates."""
+        patient_id = str(uuid4())
+        entity = {'patient_id': patient_id, 'mrn': 'MRN001', 'given_name': 'John',
+                  'family_name': 'Doe', 'birth_date': '1980-01-15', 'gender': 'male'}
+
+        result1 = service.persist_entities(entities=[entity], entity_type='patient')
+        result2 = service.persist_entities(
+            entities=[{**entity, 'given_name': 'Johnny'}],
+            entity_type='patient',
+            cohort_id=result1.cohort_id,
+        )
+
+        assert (result1.rows_inserted, result1.rows_updated) == (1, 0)
+        assert (result2.rows_inserted, result2.rows_updated) == (0, 1)
+
+
+def _bulk_patients(count, prefix='MRN'):
+    return [
+        {'patient_id': str(uuid4()), 'mrn': f'{prefix}{i:05d}', 'given_name': f'Patient{i}',
+         'family_name': 'Test', 'birth_date': '1980-01-01', 'gender': 'male' if i % 2 else 'female'}
+        for i in range(count)
+    ]
+
+
+class TestPersistEntitiesBulk:
+    """Tests for the set-based persist_entities_bulk path."""
+
+    def test_bulk_persist_creates_cohort(self, service, test_db):
+        """Bulk persist writes all rows and returns a summary."""
+        result = service.persist_entities_bulk(
+            entities=_bulk_patients(50),
+            entity_type='patient',
+        )
+
+        assert result.is_new_cohort is True
+        assert result.entities_persisted == 50
+        assert result.rows_inserted == 50
+        assert result.rows_updated == 0
+        assert result.summary.entity_counts['patients'] == 50
+
+        count = test_db.execute(
+            "SELECT COUNT(*) FROM patients WHERE cohort_id = ?", [result.cohort_id]
+        ).fetchone()[0]
+        assert count == 50
+
+    def test_bulk_persist_matches_row_by_row(self, service, test_db):
+        """Bulk and row-by-row paths store identical rows."""
+        entities = _bulk_patients(20)
+
+        loop_result = service.persist_entities(entities=entities, entity_type='patient')
+        loop_rows = test_db.execute(
+            "SELECT * EXCLUDE (cohort_id, created_at) FROM patients ORDER BY id"
+        ).fetchall()
+
+        test_db.execute("DELETE FROM patients")
+        bulk_result = service.persist_entities_bulk(
+            entities=entities,
+            entity_type='patient',
+            cohort_id=loop_result.cohort_id,
+        )
+        bulk_rows = test_db.execute(
+            "SELECT * EXCLUDE (cohort_id, created_at) FROM patients ORDER BY id"
+        ).fetchall()
+
+        assert bulk_rows == loop_rows
+        assert bulk_result.entity_ids == loop_result.entity_ids
+
+    def test_bulk_persist_updates_existing(self, service, test_db):
+        """Re-persisting existing IDs updates them and reports the split."""
+        entities = _bulk_patients(10)
+        first = service.persist_entities_bulk(entities=entities, entity_type='patient')
+
+        changed = [{**e, 'family_name': 'Changed'} for e in entities[:4]]
+        result = service.persist_entities_bulk(
+            entities=changed + _bulk_patients(3, prefix='NEW'),
+            entity_type='patient',
+            cohort_id=first.cohort_id,
+        )
+
+        assert result.rows_inserted == 3
+        assert result.rows_updated == 4
+        assert result.summary.entity_counts['patients'] == 13
+
+        changed_count = test_db.execute(
+            "SELECT COUNT(*) FROM patients WHERE family_name = 'Changed'"
+        ).fetchone()[0]
+        assert changed_count == 4
+
+    def test_bulk_persist_null_clears_stored_value(self, service, test_db):
+        """A NULL in a re-persisted row overwrites the stored value, as row by row."""
+        entity = {**_bulk_patients(1)[0], 'city': 'Austin', 'state': 'TX'}
+        changed = {**entity, 'family_name': 'Changed', 'city': None}
+        rows = []
+        for persist in (service.persist_entities, service.persist_entities_bulk):
+            test_db.execute("DELETE FROM patients")
+            first = persist(entities=[entity], entity_type='patient')
+            persist(entities=[changed], entity_type='patient', cohort_id=first.cohort_id)
+            rows.append(test_db.execute("SELECT family_name, city, state FROM patients").fetchall())
+
+        assert rows[0] == rows[1] == [('Changed', None, 'TX')]
+
+    def test_bulk_persist_duplicate_ids_last_wins(self, service, test_db):
+        """A repeated ID within one batch keeps the last occurrence."""
+        entity = _bulk_patients(1)[0]
+        result = service.persist_entities_bulk(
+            entities=[entity, {**entity, 'given_name': 'Latest'}],
+            entity_type='patient',
+        )
+
+        assert result.entities_persisted == 2
+        assert result.rows_inserted == 1
+        rows = test_db.execute("SELECT given_name FROM patients").fetchall()
+        assert rows == [('Latest',)]
+
+    def test_bulk_persist_empty_raises_error(self, service):
+        """Bulk persisting an empty list raises error."""
+        with pytest.raises(ValueError, match="No entities"):
+            service.persist_entities_bulk(entities=[], entity_type='patient')
+
 
 class TestGetCohortSummary:
     """Tests for get_cohort_summary functionality."""
@@ -11,6 +11,7 @@ These tests complement test_auto_persist.py which covers Phase 1 functionality.
 """
 
 import pytest
+import gzip
 import json
 import csv
 import tempfile
@@ -670,6 +671,90 @@ class TestExport:
         with pytest.raises(ValueError, match="not found"):
             service.export_cohort('nonexistent-id')
     
+    def test_export_json_gzip(self, service, populated_cohort):
+        """Test gzip-compressed JSON export streams a valid document."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / 'export.json.gz'
+            
+            result = service.export_cohort(
+                populated_cohort.cohort_id,
+                format='json',
+                output_path=str(output_path),
+                compression='gzip',
+                batch_size=1,
+            )
+            
+            with gzip.open(output_path, 'rt') as f:
+                data = json.load(f)
+            
+            assert result.total_entities == 3
+            assert data['tags'] == ['initial', 'test']
+            assert len(data['entities']['patients']) == 3
+            assert {p['given_name'] for p in data['entities']['patients']} == {'John', 'Jane', 'Bob'}
+    
+    def test_export_parquet_zstd(self, service, populated_cohort):
+        """Test Parquet export with zstd compression and row groups."""
+        import duckdb
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = service.export_cohort(
+                populated_cohort.cohort_id,
+                format='parquet',
+                output_path=str(Path(tmpdir) / 'export'),
+                compression='zstd',
+                row_group_size=2,
+                include_provenance=False,
+            )
+            
+            parquet_path = Path(result.file_path) / 'patients.parquet'
+            conn = duckdb.connect()
+            names = conn.execute(
+                f"SELECT given_name FROM '{parquet_path}' ORDER BY given_name"
+            ).fetchall()
+            codecs = conn.execute(
+                f"SELECT DISTINCT compression FROM parquet_metadata('{parquet_path}')"
+            ).fetchall()
+            columns = [d[0] for d in conn.execute(f"SELECT * FROM '{parquet_path}'").description]
+            conn.close()
+            
+            assert [n[0] for n in names] == ['Bob', 'Jane', 'John']
+            assert codecs == [('ZSTD',)]
+            assert 'cohort_id' not in columns
+    
+    def test_export_parquet_split_files(self, service, populated_cohort):
+        """Test Parquet export split into part files per entity type."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = service.export_cohort(
+                populated_cohort.cohort_id,
+                format='parquet',
+                output_path=str(Path(tmpdir) / 'export'),
+                row_group_size=1,
+                row_groups_per_file=1,
+            )
+            
+            parts = sorted((Path(result.file_path) / 'patients').glob('*.parquet'))
+            assert len(parts) >= 2
+            assert result.entities_exported == {'patients': 3}
+    
+    def test_export_csv_compressed(self, service, populated_cohort):
+        """Test zstd-compressed CSV export."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = service.export_cohort(
+                populated_cohort.cohort_id,
+                format='csv',
+                output_path=str(Path(tmpdir) / 'export'),
+                compression='zstd',
+            )
+            
+            assert (Path(result.file_path) / 'patients.csv.zst').exists()
+    
+    def test_export_invalid_options(self, service, populated_cohort):
+        """Test that options that don't apply to a format raise errors."""
+        with pytest.raises(ValueError, match="compression"):
+            service.export_cohort(populated_cohort.cohort_id, format='json', compression='zstd')
+        with pytest.raises(ValueError, match="Row group"):
+            service.export_cohort(populated_cohort.cohort_id, format='csv', row_group_size=10)
+    
     def test_export_result_to_dict(self, service, populated_cohort):
         """Test ExportResult.to_dict() method."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -8,6 +8,7 @@ from uuid import uuid4
 
 from healthsim.db import DatabaseConnection
 from healthsim.state.manager import StateManager, reset_manager
+from healthsim.state.serializers import serialize_patient
 
 
 @pytest.fixture
@@ -132,6 +133,101 @@ class TestSaveScenario:
         assert loaded['entities']['patients'][0]['given_name'] == 'Updated'
 
 
+class TestSetBasedSave:
+    """Tests for the batched save path behind save_cohort."""
+
+    def _patients(self, count):
+        return [
+            {'patient_id': str(uuid4()), 'mrn': f'MRN{i:05d}', 'given_name': f'Patient{i}',
+             'family_name': 'Batch', 'birth_date': '1975-03-01', 'gender': 'female'}
+            for i in range(count)
+        ]
+
+    def test_large_batch_writes_both_tables(self, state_manager, test_db):
+        """Every entity lands in cohort_entities and the canonical table."""
+        patients = self._patients(500)
+        cohort_id = state_manager.save_cohort(name='batch-test', entities={'patients': patients})
+
+        json_count = test_db.execute(
+            "SELECT COUNT(*) FROM cohort_entities WHERE cohort_id = ?", [cohort_id]
+        ).fetchone()[0]
+        canonical_count = test_db.execute(
+            "SELECT COUNT(*) FROM patients WHERE cohort_id = ?", [cohort_id]
+        ).fetchone()[0]
+
+        assert json_count == 500
+        assert canonical_count == 500
+
+    def test_load_preserves_input_order(self, state_manager):
+        """Bulk-allocated ids keep entities in the order they were saved."""
+        patients = self._patients(50)
+        state_manager.save_cohort(name='order-test', entities={'patients': patients})
+
+        loaded = state_manager.load_cohort('order-test')
+        assert [p['mrn'] for p in loaded['entities']['patients']] == [p['mrn'] for p in patients]
+
+    def test_duplicate_ids_in_batch_last_wins(self, state_manager, test_db):
+        """A repeated entity ID is stored once with the last entity's data."""
+        patient = self._patients(1)[0]
+        patient['id'] = patient['patient_id']
+        cohort_id = state_manager.save_cohort(
+            name='dup-test',
+            entities={'patients': [patient, {**patient, 'given_name': 'Latest'}]},
+        )
+
+        loaded = state_manager.load_cohort('dup-test')
+        assert len(loaded['entities']['patients']) == 1
+        assert loaded['entities']['patients'][0]['given_name'] == 'Latest'
+
+        rows = test_db.execute(
+            "SELECT given_name FROM patients WHERE cohort_id = ?", [cohort_id]
+        ).fetchall()
+        assert rows == [('Latest',)]
+
+    def test_canonical_rows_without_id_are_skipped(self, state_manager, test_db, caplog):
+        """Rows serialized without an ID are skipped and reported, not merged."""
+        patients = self._patients(3)
+
+        def serializer(entity, provenance):
+            data = serialize_patient(entity, provenance)
+            if entity['mrn'] != 'MRN00000':
+                data['id'] = None
+            return data
+
+        skipped = state_manager._insert_canonical_entities(
+            'c1', 'patients', patients, serializer
+        )
+
+        assert skipped == 2
+        assert caplog.text.count('without id') == 2
+        rows = test_db.execute("SELECT mrn FROM patients").fetchall()
+        assert rows == [('MRN00000',)]
+
+    def test_canonical_fallback_reports_failed_rows(self, state_manager, test_db, caplog):
+        """A row the row-by-row fallback cannot write is counted and logged."""
+        patients = self._patients(3)
+        patients[1]['birth_date'] = 'not-a-date'
+
+        skipped = state_manager._insert_canonical_entities(
+            'c1', 'patients', patients, serialize_patient
+        )
+
+        assert skipped == 1
+        assert patients[1]['patient_id'] in caplog.text
+        rows = test_db.execute("SELECT mrn FROM patients ORDER BY mrn").fetchall()
+        assert rows == [('MRN00000',), ('MRN00002',)]
+
+    def test_unknown_entity_type_stored_as_json(self, state_manager, test_db):
+        """Types without a canonical table are still saved to cohort_entities."""
+        state_manager.save_cohort(
+            name='custom-test',
+            entities={'widgets': [{'id': 'w1', 'size': 3}, {'id': 'w2', 'size': 5}]},
+        )
+
+        loaded = state_manager.load_cohort('custom-test')
+        assert [w['id'] for w in loaded['entities']['widgets']] == ['w1', 'w2']
+
+
 class TestLoadScenario:
     """Tests for load_cohort functionality."""
     
@@ -1,16 +1,19 @@
 """Tests for cohort summary generation."""
 
 import pytest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import tempfile
 from pathlib import Path
 from uuid import uuid4
 
 from healthsim.db import DatabaseConnection
+from healthsim.state.auto_persist import AutoPersistService
 from healthsim.state.summary import (
     CohortSummary,
     generate_summary,
     get_cohort_by_name,
+    invalidate_cohort_stats,
+    load_cohort_stats,
 )
 
 
@@ -176,6 +179,128 @@ class TestGenerateSummary:
             )
 
 
+class TestCohortStatsCache:
+    """Tests for the incremental cohort_stats cache."""
+    
+    def _patients(self, genders):
+        return [
+            {'patient_id': str(uuid4()), 'mrn': f'MRN{i:04d}', 'given_name': f'P{i}',
+             'family_name': 'Stats', 'birth_date': f'19{60 + i % 30}-06-15', 'gender': gender}
+            for i, gender in enumerate(genders)
+        ]
+    
+    def test_summary_computes_without_caching(self, test_db, cohort_with_data):
+        """Summaries of uncached cohorts compute stats but never write them."""
+        assert load_cohort_stats(cohort_with_data, test_db) is None
+        
+        summary = generate_summary(cohort_with_data, include_samples=False, connection=test_db)
+        
+        assert load_cohort_stats(cohort_with_data, test_db) is None
+        assert summary.entity_counts['patients'] == 5
+        assert summary.statistics['gender_distribution'] == {'male': 3, 'female': 2}
+        assert summary.statistics['age_range']['min'] <= summary.statistics['age_range']['max']
+    
+    def test_next_persist_rebuilds_cache(self, test_db, cohort_with_data):
+        """A write into an uncached cohort rebuilds its whole stats cache."""
+        service = AutoPersistService(connection=test_db)
+        service.persist_entities_bulk(
+            entities=self._patients(['other']), entity_type='patient',
+            cohort_id=cohort_with_data,
+        )
+        
+        cached = load_cohort_stats(cohort_with_data, test_db)
+        assert cached['patients'][0] == 6
+        assert cached['patients'][1]['counts']['gender'] == {
+            'male': 3, 'female': 2, 'other': 1,
+        }
+    
+    def test_average_age_is_mean_of_whole_year_ages(self, test_db):
+        """The average age averages whole-year ages, across batches too."""
+        today = date.today()
+        ages = [30.75, 40.75, 7.2, 64.99, 88.01]
+        patients = [
+            {'patient_id': str(uuid4()), 'mrn': f'MRN{i}', 'given_name': f'P{i}',
+             'family_name': 'Age', 'gender': 'female',
+             'birth_date': (today - timedelta(days=round(years * 365.25))).isoformat()}
+            for i, years in enumerate(ages)
+        ]
+        service = AutoPersistService(connection=test_db)
+        first = service.persist_entities_bulk(entities=patients[:2], entity_type='patient')
+        
+        # 30.75 and 40.75 years are whole-year ages 30 and 40
+        assert first.summary.statistics['age_range'] == {'min': 30, 'max': 40, 'avg': 35.0}
+        
+        result = service.persist_entities_bulk(
+            entities=patients[2:], entity_type='patient', cohort_id=first.cohort_id,
+        )
+        assert result.summary.statistics['age_range'] == {
+            'min': 7, 'max': 88, 'avg': round((30 + 40 + 7 + 64 + 88) / 5, 1),
+        }
+    
+    def test_persist_batches_update_stats_incrementally(self, test_db):
+        """Each insert-only batch folds into the cached counts and aggregates."""
+        service = AutoPersistService(connection=test_db)
+        first = service.persist_entities_bulk(
+            entities=self._patients(['male', 'female', 'female']), entity_type='patient',
+        )
+        second = service.persist_entities(
+            entities=self._patients(['male', 'other']), entity_type='patient',
+            cohort_id=first.cohort_id,
+        )
+        
+        assert second.summary.entity_counts['patients'] == 5
+        assert second.summary.statistics['gender_distribution'] == {
+            'male': 2, 'female': 2, 'other': 1,
+        }
+        
+        # Cached result matches a recompute from the canonical table
+        invalidate_cohort_stats(first.cohort_id, test_db)
+        fresh = generate_summary(first.cohort_id, include_samples=False, connection=test_db)
+        assert fresh.entity_counts == second.summary.entity_counts
+        assert fresh.statistics == second.summary.statistics
+    
+    def test_updates_refresh_stats(self, test_db):
+        """Batches that update existing rows recompute that table's stats."""
+        service = AutoPersistService(connection=test_db)
+        patients = self._patients(['male', 'male'])
+        first = service.persist_entities_bulk(entities=patients, entity_type='patient')
+        
+        result = service.persist_entities_bulk(
+            entities=[{**patients[0], 'gender': 'female'}], entity_type='patient',
+            cohort_id=first.cohort_id,
+        )
+        
+        assert result.rows_updated == 1
+        assert result.summary.entity_counts['patients'] == 2
+        assert result.summary.statistics['gender_distribution'] == {'male': 1, 'female': 1}
+    
+    def test_delete_clears_stats(self, test_db):
+        """Deleting a cohort removes its cached stats."""
+        service = AutoPersistService(connection=test_db)
+        result = service.persist_entities_bulk(
+            entities=self._patients(['male']), entity_type='patient',
+        )
+        
+        service.delete_cohort(result.cohort_id, confirm=True)
+        
+        rows = test_db.execute(
+            "SELECT COUNT(*) FROM cohort_stats WHERE cohort_id = ?", [result.cohort_id]
+        ).fetchone()[0]
+        assert rows == 0
+    
+    def test_samples_evenly_spaced(self, test_db):
+        """SQL-side sampling returns the requested number of distinct rows."""
+        service = AutoPersistService(connection=test_db)
+        result = service.persist_entities_bulk(
+            entities=self._patients(['male'] * 30), entity_type='patient',
+        )
+        
+        samples = result.summary.samples['patients']
+        assert len(samples) == 3
+        assert len({s['id'] for s in samples}) == 3
+        assert 'cohort_id' not in samples[0]
+
+
 class TestGetCohortByName:
     """Tests for get_cohort_by_name function."""
     
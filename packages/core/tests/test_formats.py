@@ -13,6 +13,7 @@ from healthsim.formats import (
     JSONExporter,
     JsonTransformer,
     Transformer,
+    chunked,
     format_date,
     format_datetime,
     safe_str,
@@ -327,6 +328,11 @@ class TestFormatUtilities:
         result = truncate(text, max_length=5)
         assert result == "Hello"
 
+    def test_chunked(self) -> None:
+        """Test an iterable is split into lists of up to size items."""
+        assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 2)) == []
+
 
 class TestTransformerBase:
     """Tests for Transformer abstract base class."""
@@ -1,7 +1,10 @@
 """Tests for healthsim.person module."""
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 
+import duckdb
 import pytest
 
 from healthsim.person import (
@@ -9,12 +12,16 @@ from healthsim.person import (
     ContactInfo,
     Gender,
     Identifier,
+    IdentifierAllocator,
+    IdentifierBlock,
+    IdentifierNamespace,
     IdentifierType,
     Person,
     PersonName,
     Relationship,
     RelationshipType,
 )
+from healthsim.person.identifiers import SEED_ID_SPAN, seed_id_start
 
 
 class TestGender:
@@ -317,6 +324,113 @@ class TestIdentifier:
         assert expired_id.is_valid is False
 
 
+
+def _drain_block(block: IdentifierBlock) -> list[str]:
+    """Worker used by the process test (module-level so it pickles)."""
+    return block.take(block.remaining)
+
+
+class TestIdentifierAllocator:
+    """Tests for IdentifierAllocator."""
+
+    def test_sequential_ids_per_namespace(self) -> None:
+        """Test each namespace has its own sequence and format."""
+        allocator = IdentifierAllocator()
+
+        assert allocator.next_ids("patient", 2) == ["patient-000001", "patient-000002"]
+        assert allocator.next_id(IdentifierNamespace.MRN) == "MRN000001"
+        assert allocator.next_id("member") == "M000001"
+        assert allocator.next_id("claim") == "CLM0000001"
+        assert allocator.next_id("subject") == "SUBJ-00001"
+
+    def test_no_collisions_across_blocks(self) -> None:
+        """Test IDs stay unique across many leased blocks."""
+        allocator = IdentifierAllocator(block_size=7)
+
+        ids = allocator.next_ids("patient", 150_000)
+        ids += allocator.reserve("patient", 1000).take(1000)
+
+        assert len(set(ids)) == len(ids)
+        # next_id leased 21,429 blocks of 7; the reserved block follows them
+        assert ids[-1] == "patient-151003"
+
+    def test_deterministic(self) -> None:
+        """Test the same calls give the same IDs."""
+        def run() -> list[str]:
+            allocator = IdentifierAllocator(block_size=10)
+            block = allocator.reserve("claim", 5)
+            return allocator.next_ids("claim", 12) + block.take(5)
+
+        assert run() == run()
+
+    def test_blocks_are_disjoint_across_processes(self) -> None:
+        """Test blocks leased in the parent don't collide in workers."""
+        allocator = IdentifierAllocator()
+        blocks = [allocator.reserve("member", 500) for _ in range(3)]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_drain_block, blocks))
+
+        ids = [i for chunk in results for i in chunk]
+        assert len(ids) == len(set(ids)) == 1500
+        assert allocator.next_id("member") == "M001501"
+
+    def test_block_exhaustion(self) -> None:
+        """Test an exhausted block raises."""
+        block = IdentifierAllocator().reserve("mrn", 1)
+        block.next()
+
+        with pytest.raises(ValueError, match="exhausted"):
+            block.next()
+        # Blocks survive pickling with their position
+        assert pickle.loads(pickle.dumps(block)).remaining == 0
+
+    def test_unknown_namespace(self) -> None:
+        """Test unknown namespaces are rejected."""
+        with pytest.raises(ValueError, match="Unknown identifier namespace"):
+            IdentifierAllocator().next_id("provider")
+
+    def test_resume_from_db(self) -> None:
+        """Test allocation continues after the largest persisted ID."""
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE patients (id VARCHAR, mrn VARCHAR)")
+        conn.execute("""
+            INSERT INTO patients VALUES
+                ('patient-000041', 'MRN000007'),
+                ('patient-legacy', 'MRN000002'),
+                ('patient-000009', 'external-99999')
+        """)
+        allocator = IdentifierAllocator(block_size=1)
+        allocator.next_id("patient")
+
+        resumed = allocator.resume_from_db(conn)
+
+        # members/claims/subjects tables don't exist and are skipped
+        assert resumed == {"patient": 42, "mrn": 8}
+        assert allocator.next_id("patient") == "patient-000042"
+        assert allocator.next_id("mrn") == "MRN000008"
+
+    def test_for_seed_ranges(self) -> None:
+        """Test seeded allocators are reproducible and disjoint across seeds."""
+        first = IdentifierAllocator.for_seed(1).next_ids("patient", 1000)
+        again = IdentifierAllocator.for_seed(1).next_ids("patient", 1000)
+        other = IdentifierAllocator.for_seed(2).next_ids("patient", 1000)
+
+        assert first == again
+        assert not set(first) & set(other)
+        assert IdentifierAllocator.for_seed(1).high_water("mrn") == seed_id_start(1)
+        assert (seed_id_start(1) - 1) % SEED_ID_SPAN == 0
+
+    def test_reset(self) -> None:
+        """Test reset starts the sequences over."""
+        allocator = IdentifierAllocator()
+        allocator.next_ids("patient", 3)
+
+        allocator.reset()
+
+        assert allocator.next_id("patient") == "patient-000001"
+
+
 class TestRelationship:
     """Tests for Relationship."""
 
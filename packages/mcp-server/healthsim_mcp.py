@@ -2,14 +2,18 @@
 HealthSim MCP Server.
 
 Provides MCP tools for interacting with the HealthSim DuckDB database.
-Uses close-before-write pattern for reliable database access:
-- Persistent read-only connection for queries (shared lock, fast repeated reads)
-- Write operations close read connection first, then open read-write connection
-- Read connection reopens lazily after writes complete
-
-This pattern is required because DuckDB does not allow simultaneous connections
-with different read_only configurations to the same database file, even within
-the same process.
+By default holds a read-only connection and reopens read-write only around
+writes, so other processes can read the database file while the server runs.
+DuckDB does not allow simultaneous connections with different read_only
+configurations to the same database file, even within the same process.
+
+Set HEALTHSIM_MCP_CONNECTION_MODE=pooled to instead hold one long-lived
+read-write connection per process when nothing else uses the file:
+- Reads use per-thread cursors on the owner connection, each read in a
+  read-only transaction
+- Writes are serialized through a background write queue that batches
+  queued writes and coalesces checkpoints
+- Tool latency and write-queue depth are tracked in-process
 
 See docs/mcp/duckdb-connection-architecture.md for design details.
 
@@ -24,6 +28,7 @@ Tools provided:
 - healthsim_query_reference: Query PopulationSim reference data
 - healthsim_search_providers: Search real NPPES provider data
 - healthsim_tables: List all tables in the database
+- healthsim_server_metrics: Tool latency and write-queue metrics
 
 DATA SOURCE DECISION GUIDE:
 - Providers/Facilities: Use healthsim_search_providers to query REAL NPPES data (8.9M providers)
@@ -41,14 +46,23 @@ Configuration in claude_desktop_config.json:
 
 Environment Variables:
     HEALTHSIM_DB_PATH: Override default database path
+    HEALTHSIM_MCP_CONNECTION_MODE: "close-before-write" (default) or "pooled"
+    HEALTHSIM_MCP_CHECKPOINT_INTERVAL: Minimum seconds between checkpoints
+        in pooled mode (default 1.0)
 """
 
 import atexit
+import functools
 import json
 import os
+import queue
 import re
 import signal
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -77,6 +91,7 @@ from healthsim.db import DEFAULT_DB_PATH
 from healthsim.state import StateManager
 from healthsim.state.auto_persist import AutoPersistService
 from healthsim.state.serializers import get_serializer, get_table_info
+from healthsim.state.summary import invalidate_cohort_stats, refresh_cohort_stats
 
 
 # =============================================================================
@@ -133,6 +148,16 @@ if IS_MOTHERDUCK:
 else:
     DB_PATH = Path(_db_env)
 
+CONNECTION_MODE_POOLED = "pooled"
+CONNECTION_MODE_CLOSE_BEFORE_WRITE = "close-before-write"
+CONNECTION_MODE = os.environ.get(
+    "HEALTHSIM_MCP_CONNECTION_MODE", CONNECTION_MODE_CLOSE_BEFORE_WRITE
+)
+
+# Pooled mode: minimum seconds between checkpoints, and max writes per batch
+CHECKPOINT_INTERVAL = float(os.environ.get("HEALTHSIM_MCP_CHECKPOINT_INTERVAL", "1.0"))
+WRITE_BATCH_MAX = 64
+
 # Log startup configuration (to stderr so it doesn't interfere with MCP protocol)
 _display_path = re.sub(r'motherduck_token=[^&\s]+', 'motherduck_token=***', str(DB_PATH))
 print(f"HealthSim MCP Server starting...", file=sys.stderr)
@@ -140,65 +165,379 @@ print(f"  Database: {_display_path}", file=sys.stderr)
 if IS_MOTHERDUCK:
     print(f"  Connection mode: MotherDuck (cloud)", file=sys.stderr)
 else:
-    print(f"  Connection mode: dual (read-only persistent + on-demand write)", file=sys.stderr)
+    print(f"  Connection mode: {CONNECTION_MODE}", file=sys.stderr)
     print(f"  DB exists: {DB_PATH.exists()}", file=sys.stderr)
 
 
 # =============================================================================
-# Connection Manager - Close-Before-Write Pattern
+# Server Metrics
 # =============================================================================
 
-class ConnectionManager:
+class ServerMetrics:
+    """
+    In-process counters for tool latency and write-queue activity.
+    
+    Exposed through the healthsim_server_metrics tool. Latency percentiles
+    are computed over a sliding window of recent calls per tool.
     """
-    Manages DuckDB connections using close-before-write pattern.
+    
+    LATENCY_WINDOW = 512
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Clear all counters."""
+        with self._lock:
+            self._tools: Dict[str, Dict[str, Any]] = {}
+            self._latencies: Dict[str, deque] = {}
+            self._queue = {
+                "depth": 0,
+                "max_depth": 0,
+                "writes": 0,
+                "write_errors": 0,
+                "batches": 0,
+                "max_batch_size": 0,
+                "total_wait_ms": 0.0,
+                "checkpoints": 0,
+            }
+    
+    def record_tool(self, name: str, elapsed_ms: float, error: bool = False):
+        """Record one tool call."""
+        with self._lock:
+            stats = self._tools.setdefault(
+                name, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            self._latencies.setdefault(name, deque(maxlen=self.LATENCY_WINDOW)).append(elapsed_ms)
+    
+    def record_queue_depth(self, depth: int):
+        """Record the current number of queued writes."""
+        with self._lock:
+            self._queue["depth"] = depth
+            self._queue["max_depth"] = max(self._queue["max_depth"], depth)
+    
+    def record_write_batch(self, size: int, wait_ms: float, errors: int):
+        """Record a drained batch of writes and their total queue wait."""
+        with self._lock:
+            self._queue["writes"] += size
+            self._queue["write_errors"] += errors
+            self._queue["batches"] += 1
+            self._queue["max_batch_size"] = max(self._queue["max_batch_size"], size)
+            self._queue["total_wait_ms"] += wait_ms
+    
+    def record_checkpoint(self):
+        """Record a checkpoint issued by the write queue."""
+        with self._lock:
+            self._queue["checkpoints"] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of all metrics."""
+        with self._lock:
+            tools = {}
+            for name, stats in self._tools.items():
+                window = sorted(self._latencies[name])
+                tools[name] = {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["total_ms"] / stats["calls"], 3),
+                    "p50_ms": round(window[len(window) // 2], 3),
+                    "p95_ms": round(window[min(len(window) - 1, int(len(window) * 0.95))], 3),
+                    "max_ms": round(stats["max_ms"], 3),
+                }
+            write_queue = dict(self._queue)
+            write_queue["avg_wait_ms"] = round(
+                write_queue.pop("total_wait_ms") / write_queue["writes"], 3
+            ) if write_queue["writes"] else 0.0
+        return {"tools": tools, "write_queue": write_queue}
+
+
+METRICS = ServerMetrics()
+
+
+def _is_error_result(result: Any) -> bool:
+    """Whether a tool result is an {"error": ...} JSON payload."""
+    if not isinstance(result, str) or not result.lstrip().startswith("{"):
+        return False
+    try:
+        payload = json.loads(result)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and "error" in payload
+
+
+def _instrumented(fn):
+    """Record latency and error counts for a tool function in METRICS."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        error = True
+        try:
+            result = fn(*args, **kwargs)
+            # Tools report failures as {"error": ...} payloads rather than raising
+            error = _is_error_result(result)
+            return result
+        finally:
+            METRICS.record_tool(fn.__name__, (time.perf_counter() - start) * 1000, error)
+    return wrapper
 
-    For local files:
+
+# =============================================================================
+# Write Queue - Serialized Writes on the Owner Connection
+# =============================================================================
+
+class WriteQueue:
+    """
+    Serializes writes onto one cursor from a single background thread.
+    
+    Jobs are callables taking the write cursor; ``submit`` returns a Future
+    for the job's result. Jobs queued while a write runs are drained and
+    executed back-to-back as one batch, and the database is checkpointed at
+    most once per ``checkpoint_interval`` seconds (plus once on close)
+    rather than after every write.
+    """
+    
+    def __init__(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        metrics: ServerMetrics,
+        checkpoint: bool = True,
+        checkpoint_interval: float = CHECKPOINT_INTERVAL,
+        max_batch: int = WRITE_BATCH_MAX,
+    ):
+        self.connection = conn
+        self._metrics = metrics
+        self._checkpoint_enabled = checkpoint
+        self._checkpoint_interval = checkpoint_interval
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="healthsim-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, fn) -> Future:
+        """Queue ``fn(conn)`` for execution on the writer thread."""
+        future: Future = Future()
+        self._queue.put((fn, future, time.perf_counter()))
+        self._metrics.record_queue_depth(self._queue.qsize())
+        return future
+    
+    def in_writer_thread(self) -> bool:
+        """Whether the caller is running on the writer thread."""
+        return threading.current_thread() is self._thread
+    
+    def close(self, timeout: Optional[float] = None):
+        """Finish queued writes, checkpoint, and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+    
+    def _run(self):
+        dirty = False
+        last_checkpoint = time.monotonic()
+        
+        while True:
+            timeout = None
+            if dirty:
+                timeout = max(0.0, self._checkpoint_interval - (time.monotonic() - last_checkpoint))
+            try:
+                job = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Idle with unflushed writes: checkpoint now
+                self._checkpoint()
+                dirty, last_checkpoint = False, time.monotonic()
+                continue
+            
+            batch = [job]
+            while job is not None and len(batch) < self._max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(job)
+            self._metrics.record_queue_depth(self._queue.qsize())
+            
+            stopping = batch[-1] is None
+            jobs = batch[:-1] if stopping else batch
+            
+            if jobs:
+                started = time.perf_counter()
+                wait_ms = sum(started - enqueued for _, _, enqueued in jobs) * 1000
+                errors = 0
+                for fn, future, _ in jobs:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        future.set_result(fn(self.connection))
+                    except BaseException as e:
+                        errors += 1
+                        future.set_exception(e)
+                self._metrics.record_write_batch(len(jobs), wait_ms, errors)
+                dirty = True
+            
+            if dirty and (stopping or time.monotonic() - last_checkpoint >= self._checkpoint_interval):
+                self._checkpoint()
+                dirty, last_checkpoint = False, time.monotonic()
+            
+            if stopping:
+                return
+    
+    def _checkpoint(self):
+        if not self._checkpoint_enabled:
+            return
+        try:
+            self.connection.execute("CHECKPOINT")
+            self._metrics.record_checkpoint()
+        except Exception as e:
+            print(f"  Checkpoint warning: {e}", file=sys.stderr)
+
+
+# =============================================================================
+# Connection Manager
+# =============================================================================
+
+class ConnectionManager:
+    """
+    Manages DuckDB connections for the MCP server.
+    
+    Close-before-write mode (default, local files only):
       DuckDB Constraint: Cannot have simultaneous connections with different
       read_only configurations to the same database file, even in the same process.
-      Solution: read-only persistent + close-before-write for writes.
-
-    For MotherDuck:
-      Single persistent connection (MotherDuck handles concurrency server-side).
+      Solution: read-only persistent + close-before-write for writes. Lets
+      external read-only processes share the file, at the cost of reopening
+      connections around every write.
+    
+    Pooled mode (opt-in):
+      One long-lived read-write owner connection per process. Reads use
+      per-thread cursors on it, inside read-only transactions (see
+      read_connection()); writes go through a WriteQueue that serializes
+      them on a dedicated cursor and coalesces checkpoints. Holds an
+      exclusive lock on local files, so other processes cannot open the
+      database while the server runs.
+    
+    MotherDuck always uses pooled mode without checkpoints (MotherDuck
+    handles concurrency and durability server-side).
     """
 
-    def __init__(self, db_path, is_motherduck: bool = False):
+    def __init__(self, db_path, is_motherduck: bool = False, mode: Optional[str] = None):
         self.db_path = db_path
         self.is_motherduck = is_motherduck
+        self.mode = CONNECTION_MODE_POOLED if is_motherduck else (mode or CONNECTION_MODE)
+        if self.mode not in (CONNECTION_MODE_POOLED, CONNECTION_MODE_CLOSE_BEFORE_WRITE):
+            raise ValueError(f"Unknown connection mode: {self.mode}")
+        
+        # Close-before-write state
         self._read_conn: Optional[duckdb.DuckDBPyConnection] = None
         self._read_manager: Optional[StateManager] = None
+        
+        # Pooled state
+        self._owner_conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._owner_lock = threading.Lock()
+        self._local = threading.local()
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+        self._writes: Optional[WriteQueue] = None
+
+    @property
+    def pooled(self) -> bool:
+        """Whether this manager uses the pooled owner connection."""
+        return self.mode == CONNECTION_MODE_POOLED
+
+    def _connect(self, read_only: bool = False) -> duckdb.DuckDBPyConnection:
+        """Open a connection, retrying briefly if another process holds the lock."""
+        if self.is_motherduck:
+            conn = duckdb.connect(self.db_path)
+            print(f"  Opened MotherDuck connection", file=sys.stderr)
+            return conn
+        
+        max_retries = 3
+        retry_delay = 0.1
+        for attempt in range(max_retries):
+            try:
+                conn = duckdb.connect(str(self.db_path), read_only=read_only)
+                kind = "read-only" if read_only else "read-write"
+                print(f"  Opened {kind} connection to {self.db_path}", file=sys.stderr)
+                return conn
+            except Exception as e:
+                if attempt < max_retries - 1 and "lock" in str(e).lower():
+                    print(f"  Connection attempt {attempt + 1} failed (lock), retrying...", file=sys.stderr)
+                    time.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    raise
+
+    def _get_owner(self) -> duckdb.DuckDBPyConnection:
+        """Open the owner connection and start the write queue on first use."""
+        with self._owner_lock:
+            if self._owner_conn is None:
+                self._owner_conn = self._connect()
+                write_cursor = self._owner_conn.cursor()
+                self._cursors.append(write_cursor)
+                self._writes = WriteQueue(
+                    write_cursor, METRICS, checkpoint=not self.is_motherduck,
+                )
+            return self._owner_conn
+
+    def _get_write_queue(self) -> WriteQueue:
+        self._get_owner()
+        return self._writes
 
     def get_read_connection(self) -> duckdb.DuckDBPyConnection:
         """
-        Get persistent read connection.
+        Get the persistent read connection for the calling thread.
 
-        Local: read-only with shared lock and retry logic.
-        MotherDuck: single persistent connection (no read_only flag).
+        Pooled: a cursor on the owner connection, cached per thread. The
+        cursor itself can write; tools read through read_connection().
+        Close-before-write: read-only with shared lock and retry logic.
         """
-        import time
-
+        if self.pooled:
+            cursor = getattr(self._local, "cursor", None)
+            if cursor is None:
+                owner = self._get_owner()
+                with self._owner_lock:
+                    cursor = owner.cursor()
+                    self._cursors.append(cursor)
+                self._local.cursor = cursor
+            return cursor
+        
         if self._read_conn is None:
-            if self.is_motherduck:
-                self._read_conn = duckdb.connect(self.db_path)
-                print(f"  Opened MotherDuck connection", file=sys.stderr)
-            else:
-                max_retries = 3
-                retry_delay = 0.1
-                for attempt in range(max_retries):
-                    try:
-                        self._read_conn = duckdb.connect(str(self.db_path), read_only=True)
-                        print(f"  Opened read-only connection to {self.db_path}", file=sys.stderr)
-                        break
-                    except Exception as e:
-                        if attempt < max_retries - 1 and "lock" in str(e).lower():
-                            print(f"  Read connection attempt {attempt + 1} failed (lock), retrying...", file=sys.stderr)
-                            time.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
-                            raise
+            self._read_conn = self._connect(read_only=True)
         return self._read_conn
     
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager for read operations.
+        
+        Pooled: yields the thread's cursor inside a read-only transaction,
+        so statements run through it cannot write to the database. Nested
+        blocks share the outer transaction.
+        Close-before-write: yields the read-only connection.
+        """
+        conn = self.get_read_connection()
+        if not self.pooled or getattr(self._local, "read_only", False):
+            yield conn
+            return
+        
+        conn.execute("BEGIN TRANSACTION READ ONLY")
+        self._local.read_only = True
+        try:
+            yield conn
+        finally:
+            self._local.read_only = False
+            conn.execute("ROLLBACK")
+    
     def get_read_manager(self) -> StateManager:
-        """Get StateManager backed by read-only connection."""
+        """Get StateManager backed by the read connection."""
+        if self.pooled:
+            manager = getattr(self._local, "manager", None)
+            if manager is None:
+                manager = StateManager(connection=self.get_read_connection())
+                self._local.manager = manager
+            return manager
+        
         if self._read_manager is None:
             self._read_manager = StateManager(connection=self.get_read_connection())
         return self._read_manager
@@ -216,25 +555,95 @@ class ConnectionManager:
             self._read_manager = None
             print(f"  Closed read-only connection (preparing for write)", file=sys.stderr)
     
+    def submit_write(self, fn) -> Future:
+        """
+        Queue a write without waiting for it.
+        
+        Args:
+            fn: Callable taking the write connection; its return value
+                becomes the Future's result
+        
+        Returns:
+            Future resolved once the write has run
+        """
+        if self.pooled:
+            return self._get_write_queue().submit(fn)
+        
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            with self.write_connection() as conn:
+                future.set_result(fn(conn))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def run_write(self, fn):
+        """Run ``fn(conn)`` as a serialized write and return its result."""
+        self._check_not_leased("run_write()")
+        return self.submit_write(fn).result()
+    
+    def _check_not_leased(self, operation: str):
+        """
+        Fail fast instead of deadlocking on a nested pooled write.
+        
+        A thread holding a write_connection() lease blocks the writer
+        thread, so queueing another write from it and waiting would never
+        return.
+        
+        Raises:
+            RuntimeError: If the calling thread holds a write lease
+        """
+        if self.pooled and getattr(self._local, "write_lease", False):
+            raise RuntimeError(
+                f"{operation} called inside write_connection(); "
+                "use the connection from the outer write_connection() instead"
+            )
+    
     @contextmanager
     def write_connection(self):
         """
         Context manager for write operations.
 
-        Local: close-before-write pattern to avoid DuckDB lock conflicts.
-        MotherDuck: reuses the persistent connection (server-side concurrency).
+        Pooled: waits for this write's turn in the write queue, then yields
+        the write cursor while the writer thread holds off other writes.
+        Nesting is allowed inside queued write jobs, but not inside another
+        write_connection() block on the same thread.
+        Close-before-write: closes the read connection, opens a read-write
+        connection, checkpoints and closes it afterwards.
+        
+        Raises:
+            RuntimeError: Pooled mode, if the calling thread already holds
+                a write_connection() lease
         """
-        if self.is_motherduck:
-            # MotherDuck: just yield the persistent connection
-            yield self.get_read_connection()
+        if self.pooled:
+            writes = self._get_write_queue()
+            if writes.in_writer_thread():
+                yield writes.connection
+                return
+            self._check_not_leased("write_connection()")
+            
+            granted = threading.Event()
+            released = threading.Event()
+            
+            def lease(conn):
+                granted.set()
+                released.wait()
+            
+            future = writes.submit(lease)
+            granted.wait()
+            self._local.write_lease = True
+            try:
+                yield writes.connection
+            finally:
+                self._local.write_lease = False
+                released.set()
+                future.result()
         else:
-            import time
-
             self._close_read_connection()
             time.sleep(0.05)
 
-            conn = duckdb.connect(str(self.db_path))
-            print(f"  Opened read-write connection for write operation", file=sys.stderr)
+            conn = self._connect()
             try:
                 yield conn
             finally:
@@ -272,12 +681,28 @@ class ConnectionManager:
             yield AutoPersistService(connection=conn)
     
     def close(self):
-        """Close all connections."""
+        """Flush queued writes and close all connections."""
         if self._read_conn:
             self._read_conn.close()
             self._read_conn = None
             self._read_manager = None
             print(f"  Closed read-only connection", file=sys.stderr)
+        
+        with self._owner_lock:
+            if self._writes is not None:
+                self._writes.close()
+                self._writes = None
+            for cursor in self._cursors:
+                try:
+                    cursor.close()
+                except duckdb.Error as e:
+                    print(f"  Cursor close warning: {e}", file=sys.stderr)
+            self._cursors = []
+            self._local = threading.local()
+            if self._owner_conn is not None:
+                self._owner_conn.close()
+                self._owner_conn = None
+                print(f"  Closed owner connection", file=sys.stderr)
 
 
 # Global connection manager
@@ -292,6 +717,15 @@ def _get_manager() -> ConnectionManager:
     return _manager
 
 
+def _read_only(fn):
+    """Run a read tool inside ConnectionManager.read_connection()."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _get_manager().read_connection():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
 def _cleanup_connections():
     """Clean up database connections on shutdown."""
     global _manager
@@ -647,6 +1081,8 @@ def validate_entity_types(
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def list_cohorts(params: ListCohortsInput) -> str:
     """List all saved cohorts in the HealthSim database.
     
@@ -690,6 +1126,8 @@ def list_cohorts(params: ListCohortsInput) -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def load_cohort(params: LoadCohortInput) -> str:
     """Load a cohort by name or ID.
     
@@ -722,6 +1160,8 @@ def load_cohort(params: LoadCohortInput) -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def query(params: QueryInput) -> str:
     """Execute a SQL query against the HealthSim database.
     
@@ -744,6 +1184,14 @@ def query(params: QueryInput) -> str:
             "error": "Only SELECT, SHOW, DESCRIBE, and WITH queries are allowed",
         })
     
+    # One statement only: a second could end the read-only transaction
+    try:
+        statements = conn.extract_statements(params.sql)
+    except duckdb.Error as e:
+        return json.dumps({"error": str(e)})
+    if len(statements) != 1:
+        return json.dumps({"error": "Only a single SQL statement is allowed"})
+    
     # Check for dangerous keywords
     dangerous = ["insert", "update", "delete", "drop", "alter", "create", "truncate"]
     for keyword in dangerous:
@@ -785,6 +1233,8 @@ def query(params: QueryInput) -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def get_summary(params: GetSummaryInput) -> str:
     """Get a token-efficient summary of a cohort.
     
@@ -818,6 +1268,8 @@ def get_summary(params: GetSummaryInput) -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def query_reference(params: QueryReferenceInput) -> str:
     """Query PopulationSim reference data tables.
     
@@ -938,6 +1390,8 @@ def query_reference(params: QueryReferenceInput) -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def list_tables() -> str:
     """List all tables in the HealthSim database.
     
@@ -967,6 +1421,30 @@ def list_tables() -> str:
     }, indent=2)
 
 
+@mcp.tool(
+    name="healthsim_server_metrics",
+    annotations={
+        "title": "HealthSim Server Metrics",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+    }
+)
+def server_metrics() -> str:
+    """Report in-process server metrics.
+    
+    Returns per-tool call counts, error counts and latency (avg/p50/p95/max
+    in milliseconds), plus write-queue depth, batch sizes, average queue
+    wait and checkpoint count.
+    
+    Returns:
+        JSON with connection mode, tool latency and write-queue metrics
+    """
+    metrics = METRICS.snapshot()
+    metrics["connection_mode"] = _get_manager().mode
+    return json.dumps(metrics, indent=2)
+
+
 @mcp.tool(
     name="healthsim_search_providers",
     annotations={
@@ -976,6 +1454,8 @@ def list_tables() -> str:
         "idempotentHint": True,
     }
 )
+@_instrumented
+@_read_only
 def search_providers(params: SearchProvidersInput) -> str:
     """Search real healthcare providers from NPPES data (8.9M records).
     
@@ -1140,6 +1620,7 @@ def search_providers(params: SearchProvidersInput) -> str:
         "idempotentHint": False,
     }
 )
+@_instrumented
 def save_cohort(params: SaveCohortInput) -> str:
     """Save a cohort to the HealthSim database.
     
@@ -1208,6 +1689,7 @@ def save_cohort(params: SaveCohortInput) -> str:
         "idempotentHint": True,  # Upsert behavior makes it idempotent
     }
 )
+@_instrumented
 def add_entities(params: AddEntitiesInput) -> str:
     """Add entities incrementally to a cohort (RECOMMENDED for most use cases).
     
@@ -1324,6 +1806,7 @@ def add_entities(params: AddEntitiesInput) -> str:
             entity_counts = {}
             entity_ids_added = {}
             canonical_errors = {}  # Track canonical table insert failures
+            canonical_tables = set()  # Canonical tables written, for the stats cache
             
             for entity_type, entity_list in params.entities.items():
                 if not entity_list:
@@ -1382,6 +1865,7 @@ def add_entities(params: AddEntitiesInput) -> str:
                     
                     added_ids.append(entity_id)
                 
+                canonical_tables.add(get_table_info(entity_type_normalized)[0])
                 entity_counts[entity_type_normalized] = len(added_ids)
                 entity_ids_added[entity_type_normalized] = added_ids[:5]  # Only return first 5 IDs as sample
                 if canonical_failures:
@@ -1392,6 +1876,15 @@ def add_entities(params: AddEntitiesInput) -> str:
                 UPDATE cohorts SET updated_at = ? WHERE id = ?
             """, [datetime.utcnow(), cohort_id])
             
+            # Canonical rows were upserted one by one; refresh the touched tables' stats
+            try:
+                refresh_cohort_stats(
+                    cohort_id, tables=sorted(canonical_tables), connection=service.conn
+                )
+            except duckdb.Error:
+                # Never leave stale stats behind; the next summary rebuilds them
+                invalidate_cohort_stats(cohort_id, service.conn)
+            
             # Get total entity count for cohort
             total_result = service.conn.execute("""
                 SELECT entity_type, COUNT(*) as count 
@@ -1445,6 +1938,7 @@ def add_entities(params: AddEntitiesInput) -> str:
         "idempotentHint": False,
     }
 )
+@_instrumented
 def delete_cohort(params: DeleteCohortInput) -> str:
     """Delete a cohort from the database.
     
@@ -584,3 +584,52 @@ class TestToolAnnotations:
         assert add_tool is not None
         # Note: FastMCP may store annotations differently, 
         # but the key behavior is tested in TestUpsertBehavior
+
+
+class TestAddEntitiesStats:
+    """add_entities keeps the cohort stats cache current."""
+    
+    def test_stats_refreshed_after_add(self, tmp_path):
+        """Each call refreshes the touched tables' stats instead of dropping them."""
+        from unittest.mock import patch
+
+        from healthsim.db.schema import apply_schema
+
+        import healthsim_mcp as mcp_module
+        from healthsim_mcp import AddEntitiesInput
+        
+        db_path = tmp_path / "stats.duckdb"
+        conn = duckdb.connect(str(db_path))
+        apply_schema(conn)
+        conn.close()
+        
+        def patients(*mrns):
+            return [
+                {"patient_id": mrn, "mrn": mrn, "given_name": "Ada", "family_name": "Stats",
+                 "birth_date": "1980-01-01", "gender": "female"}
+                for mrn in mrns
+            ]
+        
+        with patch.object(mcp_module, 'DB_PATH', db_path):
+            mcp_module._manager = None
+            try:
+                first = json.loads(mcp_module.add_entities(AddEntitiesInput(
+                    cohort_name="stats-cohort", entities={"patients": patients("P1", "P2")},
+                )))
+                mcp_module.add_entities(AddEntitiesInput(
+                    cohort_id=first["cohort_id"], entities={"patients": patients("P2", "P3")},
+                ))
+            finally:
+                if mcp_module._manager:
+                    mcp_module._manager.close()
+                mcp_module._manager = None
+        
+        conn = duckdb.connect(str(db_path))
+        rows = dict(conn.execute(
+            "SELECT entity_type, entity_count FROM cohort_stats WHERE cohort_id = ?",
+            [first["cohort_id"]],
+        ).fetchall())
+        conn.close()
+        
+        assert rows["patients"] == 3
+        assert "_cohort" in rows
@@ -0,0 +1,285 @@
+"""
+Tests for the pooled connection mode of the MCP server.
+
+Pooled mode (opt-in) holds one read-write owner connection per process:
+- Reads use per-thread cursors on the owner connection, in read-only
+  transactions
+- Writes are serialized through a WriteQueue on a dedicated cursor
+- Checkpoints are coalesced across queued writes
+- Tool latency and queue depth are recorded in METRICS
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import duckdb
+import pytest
+
+# Add packages to path
+WORKSPACE_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(WORKSPACE_ROOT / "packages" / "core" / "src"))
+sys.path.insert(0, str(WORKSPACE_ROOT / "packages" / "mcp-server"))
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create a temporary database for testing."""
+    db_path = tmp_path / "test.duckdb"
+    
+    conn = duckdb.connect(str(db_path))
+    conn.execute("CREATE TABLE test (id INTEGER, value TEXT)")
+    conn.execute("INSERT INTO test VALUES (1, 'initial')")
+    conn.close()
+    
+    return db_path
+
+
+@pytest.fixture
+def manager(temp_db):
+    """Pooled ConnectionManager, closed after the test."""
+    from healthsim_mcp import CONNECTION_MODE_POOLED, ConnectionManager
+    
+    manager = ConnectionManager(temp_db, mode=CONNECTION_MODE_POOLED)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def metrics():
+    """Reset the global metrics around a test."""
+    from healthsim_mcp import METRICS
+    
+    METRICS.reset()
+    yield METRICS
+    METRICS.reset()
+
+
+class TestPooledConnections:
+    """Reads and writes share one owner connection."""
+    
+    def test_default_mode_is_close_before_write(self, temp_db):
+        from healthsim_mcp import CONNECTION_MODE_CLOSE_BEFORE_WRITE, ConnectionManager
+        
+        manager = ConnectionManager(temp_db)
+        try:
+            assert manager.mode == CONNECTION_MODE_CLOSE_BEFORE_WRITE
+            assert not manager.pooled
+        finally:
+            manager.close()
+    
+    def test_unknown_mode_rejected(self, temp_db):
+        from healthsim_mcp import ConnectionManager
+        
+        with pytest.raises(ValueError, match="Unknown connection mode"):
+            ConnectionManager(temp_db, mode="sometimes")
+    
+    def test_read_cursor_cached_per_thread(self, manager):
+        main_cursor = manager.get_read_connection()
+        assert manager.get_read_connection() is main_cursor
+        
+        other = {}
+        thread = threading.Thread(target=lambda: other.setdefault("cursor", manager.get_read_connection()))
+        thread.start()
+        thread.join()
+        
+        assert other["cursor"] is not main_cursor
+    
+    def test_owner_connection_survives_writes(self, manager):
+        read_conn = manager.get_read_connection()
+        owner = manager._owner_conn
+        
+        with manager.write_connection() as conn:
+            conn.execute("UPDATE test SET value = 'updated' WHERE id = 1")
+        
+        # No reconnect: same owner and same read cursor see the write
+        assert manager._owner_conn is owner
+        assert manager.get_read_connection() is read_conn
+        assert read_conn.execute("SELECT value FROM test WHERE id = 1").fetchone()[0] == "updated"
+    
+    def test_writes_durable_after_close(self, temp_db, manager):
+        manager.run_write(lambda conn: conn.execute("INSERT INTO test VALUES (2, 'queued')"))
+        manager.close()
+        
+        conn = duckdb.connect(str(temp_db), read_only=True)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 2
+        finally:
+            conn.close()
+
+
+class TestWriteQueue:
+    """Writes are serialized, batched and checkpointed lazily."""
+    
+    def test_run_write_returns_result(self, manager):
+        count = manager.run_write(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM test").fetchone()[0]
+        )
+        assert count == 1
+    
+    def test_write_errors_propagate(self, manager):
+        with pytest.raises(duckdb.CatalogException):
+            manager.run_write(lambda conn: conn.execute("SELECT * FROM missing_table"))
+        
+        # Queue keeps working after a failed job
+        assert manager.run_write(lambda conn: 42) == 42
+    
+    def test_concurrent_writes_are_serialized(self, manager):
+        def insert(i):
+            def job(conn):
+                conn.execute("INSERT INTO test VALUES (?, 'concurrent')", [i])
+            return job
+        
+        threads = []
+        for i in range(10):
+            thread = threading.Thread(target=lambda i=i: manager.run_write(insert(100 + i)))
+            threads.append(thread)
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        count = manager.get_read_connection().execute(
+            "SELECT COUNT(*) FROM test WHERE value = 'concurrent'"
+        ).fetchone()[0]
+        assert count == 10
+    
+    def test_queued_writes_drain_as_batch(self, manager, metrics):
+        # Hold the writer so later submissions pile up behind it
+        started = threading.Event()
+        release = threading.Event()
+        blocker = manager.submit_write(lambda conn: (started.set(), release.wait()))
+        started.wait()
+        futures = [
+            manager.submit_write(lambda conn, i=i: conn.execute("INSERT INTO test VALUES (?, 'batched')", [i]))
+            for i in range(5)
+        ]
+        assert metrics.snapshot()["write_queue"]["max_depth"] >= 5
+        
+        release.set()
+        blocker.result()
+        for future in futures:
+            future.result()
+        
+        queue_stats = metrics.snapshot()["write_queue"]
+        assert queue_stats["writes"] == 6
+        assert queue_stats["max_batch_size"] == 5
+    
+    def test_checkpoints_coalesced(self, temp_db, metrics):
+        from healthsim_mcp import CONNECTION_MODE_POOLED, ConnectionManager
+        
+        manager = ConnectionManager(temp_db, mode=CONNECTION_MODE_POOLED)
+        manager._get_write_queue()._checkpoint_interval = 60
+        for i in range(5):
+            manager.run_write(lambda conn, i=i: conn.execute("INSERT INTO test VALUES (?, 'x')", [i]))
+        manager.close()
+        
+        # Five writes inside one interval: one checkpoint, issued on close
+        assert metrics.snapshot()["write_queue"]["checkpoints"] == 1
+    
+    def test_nested_write_connection_on_writer_thread(self, manager):
+        def job(conn):
+            with manager.write_connection() as inner:
+                return inner is conn
+        
+        assert manager.run_write(job) is True
+    
+    def test_nested_write_connection_in_lease_raises(self, manager):
+        with manager.write_connection():
+            with pytest.raises(RuntimeError, match="inside write_connection"), \
+                    manager.write_connection():
+                pass
+            with pytest.raises(RuntimeError, match="inside write_connection"):
+                manager.run_write(lambda conn: None)
+        
+        # The lease was released and the queue still runs writes
+        assert manager.run_write(lambda conn: 42) == 42
+
+
+class TestReadOnlyReads:
+    """Pooled reads run in read-only transactions."""
+    
+    def test_read_connection_rejects_writes(self, manager):
+        with manager.read_connection() as conn, pytest.raises(duckdb.TransactionException):
+            conn.execute("DROP TABLE test")
+        
+        assert manager.get_read_connection().execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+    
+    def test_read_connection_sees_later_writes(self, manager):
+        with manager.read_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+        manager.run_write(lambda conn: conn.execute("INSERT INTO test VALUES (2, 'later')"))
+        with manager.read_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 2
+    
+    @pytest.mark.parametrize("sql", [
+        "select 1 limit 1;drop table test",
+        "select 1 limit 1;commit;drop table test",
+    ])
+    def test_query_tool_cannot_write(self, temp_db, sql):
+        from unittest.mock import patch
+        
+        import healthsim_mcp as mcp_module
+        from healthsim_mcp import QueryInput
+        
+        with patch.object(mcp_module, 'DB_PATH', temp_db), \
+                patch.object(mcp_module, 'CONNECTION_MODE', mcp_module.CONNECTION_MODE_POOLED):
+            mcp_module._manager = None
+            try:
+                result = json.loads(mcp_module.query(QueryInput(sql=sql)))
+                count = mcp_module.query(QueryInput(sql="SELECT COUNT(*) AS n FROM test"))
+            finally:
+                if mcp_module._manager:
+                    mcp_module._manager.close()
+                mcp_module._manager = None
+        
+        assert "error" in result
+        assert json.loads(count)["rows"] == [{"n": 1}]
+
+
+class TestMetrics:
+    """Per-tool latency is recorded by the instrumented tools."""
+    
+    def test_tool_latency_recorded(self, temp_db, metrics):
+        from unittest.mock import patch
+
+        import healthsim_mcp as mcp_module
+        from healthsim_mcp import QueryInput
+        
+        with patch.object(mcp_module, 'DB_PATH', temp_db), \
+                patch.object(mcp_module, 'CONNECTION_MODE', mcp_module.CONNECTION_MODE_POOLED):
+            mcp_module._manager = None
+            try:
+                mcp_module.query(QueryInput(sql="SELECT * FROM test"))
+                mcp_module.query(QueryInput(sql="SELECT * FROM no_such_table"))
+                
+                data = json.loads(mcp_module.server_metrics())
+            finally:
+                if mcp_module._manager:
+                    mcp_module._manager.close()
+                mcp_module._manager = None
+        
+        assert data["connection_mode"] == "pooled"
+        query_stats = data["tools"]["query"]
+        assert query_stats["calls"] == 2
+        assert query_stats["errors"] == 1
+        assert query_stats["max_ms"] >= query_stats["p50_ms"] >= 0
+    
+    def test_error_results_detected_by_payload(self):
+        from healthsim_mcp import _is_error_result
+        
+        assert _is_error_result(json.dumps({"error": "boom"}))
+        assert _is_error_result(json.dumps({"error": "boom"}, indent=2))
+        assert _is_error_result(json.dumps({"rows": [], "error": "late key"}))
+        assert not _is_error_result(json.dumps({"rows": [{"error": "a value"}]}))
+        assert not _is_error_result(json.dumps([{"error": "in a list"}]))
+        assert not _is_error_result('{"error" truncated')
+        assert not _is_error_result(None)
+    
+    def test_instrumented_tools_keep_signature(self):
+        import inspect
+
+        import healthsim_mcp as mcp_module
+        
+        params = inspect.signature(mcp_module.add_entities).parameters
+        assert list(params) == ["params"]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming X12 837P output throughput and peak memory.
+
+Writes 837P interchanges for increasing claim counts to a temporary file
+with ``EDI837PGenerator.write``. Claims come from a generator, so peak RSS
+growth should stay flat as the batch grows. The buffered ``generate()`` is
+timed alongside for the smallest size.
+
+Usage:
+    python benchmarks/bench_x12_stream.py
+    python benchmarks/bench_x12_stream.py --sizes 100000 1000000 --claims-per-transaction 5000
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from membersim import Claim, ClaimLine  # noqa: E402
+from membersim.formats.x12 import EDI837PGenerator  # noqa: E402
+
+
+def make_claims(count: int):
+    """Yield ``count`` two-line professional claims."""
+    for i in range(count):
+        yield Claim(
+            claim_id=f"CLM{i:09d}",
+            claim_type="PROFESSIONAL",
+            member_id=f"M{i % 50000:06d}",
+            subscriber_id=f"M{i % 50000:06d}",
+            provider_npi="1234567890",
+            service_date=date(2024, 3, 15),
+            place_of_service="11",
+            principal_diagnosis="E11.9",
+            claim_lines=[
+                ClaimLine(
+                    line_number=n,
+                    procedure_code="99213",
+                    service_date=date(2024, 3, 15),
+                    charge_amount=Decimal("150.00"),
+                )
+                for n in (1, 2)
+            ],
+        )
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--claims-per-transaction", type=int, default=5000)
+    parser.add_argument("--transactions-per-group", type=int, default=100)
+    args = parser.parse_args()
+
+    smallest = min(args.sizes)
+    start = time.perf_counter()
+    edi = EDI837PGenerator().generate(list(make_claims(smallest)))
+    elapsed = time.perf_counter() - start
+    print(f"generate() {smallest:,} claims: {elapsed:.2f}s, {len(edi) / 1e6:.1f} MB")
+    del edi
+
+    print(f"{'claims':>10} {'time (s)':>9} {'claims/s':>10} {'ST/SE':>6} {'GS':>4} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in sorted(args.sizes):
+            with open(Path(tmpdir) / f"837p-{size}.x12", "w") as sink:
+                start = time.perf_counter()
+                result = EDI837PGenerator().write(
+                    make_claims(size),
+                    sink,
+                    claims_per_transaction=args.claims_per_transaction,
+                    transactions_per_group=args.transactions_per_group,
+                )
+                elapsed = time.perf_counter() - start
+            print(
+                f"{size:>10,} {elapsed:>9.2f} {size / elapsed:>10,.0f} "
+                f"{result.transaction_sets:>6} {result.groups:>4} {peak_rss_mb():>8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 from healthsim.generation import BaseGenerator
+from healthsim.person import IdentifierAllocator
 
 from membersim.core.models import (
     Claim,
@@ -34,16 +35,33 @@ class MemberGenerator(BaseGenerator):
         John Doe, age 45
     """
 
-    def __init__(self, seed: int | None = None, locale: str = "en_US") -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        locale: str = "en_US",
+        id_allocator: IdentifierAllocator | None = None,
+    ) -> None:
         """Initialize the member generator.
 
         Args:
             seed: Random seed for reproducibility
             locale: Locale for Faker (default: en_US)
+            id_allocator: Allocator for member and claim IDs (shared or
+                resumed from the database); by default each generator has its
+                own, starting in the seed's ID range so generators with
+                different seeds are unlikely to share IDs
         """
         super().__init__(seed=seed, locale=locale)
         self._member_counter = 0
         self._claim_counter = 0
+        self._owns_allocator = id_allocator is None
+        self.id_allocator = id_allocator or IdentifierAllocator.for_seed(seed)
+
+    def reset(self) -> None:
+        """Reset to initial seed state, restarting ID allocation if owned."""
+        super().reset()
+        if self._owns_allocator:
+            self.id_allocator.reset()
 
     def generate_member(
         self,
@@ -78,7 +96,10 @@ class MemberGenerator(BaseGenerator):
         else:
             given_name = self.faker.first_name_female()
 
-        member_id = f"M{self.random_int(100000, 999999)}"
+        # The draw the random member ID used is kept so seeded output stays
+        # the same for every other field
+        self.random_int(100000, 999999)
+        member_id = self.id_allocator.next_id("member")
         if subscriber_id is None:
             subscriber_id = f"S{self.random_int(100000, 999999)}"
 
@@ -248,8 +269,9 @@ class MemberGenerator(BaseGenerator):
         else:
             status = ClaimStatus.PAID
 
+        self.random_int(1000000, 9999999)  # keep the random claim ID's draw
         return Claim(
-            claim_id=f"CLM{self.random_int(1000000, 9999999)}",
+            claim_id=self.id_allocator.next_id("claim"),
             member_id=member.member_id,
             service_date=service_date,
             submission_date=submission_date,
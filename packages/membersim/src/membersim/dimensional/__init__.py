@@ -4,6 +4,7 @@ Transforms MemberSim canonical models into dimensional (star schema) format
 for analytics, reporting, and BI tools.
 """
 
+from .sql_transformer import MemberSimSQLDimensionalTransformer
 from .transformer import MemberSimDimensionalTransformer
 
-__all__ = ["MemberSimDimensionalTransformer"]
+__all__ = ["MemberSimDimensionalTransformer", "MemberSimSQLDimensionalTransformer"]
@@ -0,0 +1,379 @@
+"""MemberSim SQL Dimensional Transformer.
+
+Builds the MemberSim star schema as DuckDB SQL over the canonical tables
+(``members``, ``claims``, ``claim_lines``) instead of from lists of model
+objects.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from healthsim.dimensional import (
+    SQLDimensionalTransformer,
+    length_of_stay_days_sql,
+    readmission_flags_sql,
+)
+
+from .transformer import (
+    GENDER_DESCRIPTIONS,
+    PLACE_OF_SERVICE_CODES,
+    RELATIONSHIP_DESCRIPTIONS,
+    SERVICE_CATEGORIES,
+    MemberSimDimensionalTransformer,
+)
+
+# Payment columns of fact_claims; payments have no canonical table
+PAYMENT_AMOUNT_COLUMNS = [
+    "charged_amount",
+    "allowed_amount",
+    "paid_amount",
+    "deductible_amount",
+    "copay_amount",
+    "coinsurance_amount",
+    "member_responsibility",
+]
+
+
+class MemberSimSQLDimensionalTransformer(SQLDimensionalTransformer):
+    """Columnar counterpart of ``MemberSimDimensionalTransformer``.
+
+    Produces the same tables, columns, keys and row order as the object
+    transformer fed with the same members and claims in table order, and no
+    plans, providers or payments: those have no canonical tables, so
+    ``dim_plan`` is not produced, provider and facility dimensions carry only
+    the NPIs seen on claims, payment columns of ``fact_claims`` are null and
+    ``plan_key`` is -1.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from membersim.dimensional import MemberSimSQLDimensionalTransformer
+        >>>
+        >>> transformer = MemberSimSQLDimensionalTransformer(
+        ...     get_connection(), cohort_id="commercial-cohort"
+        ... )
+        >>> dimensions, facts = transformer.transform()
+    """
+
+    NATURAL_KEYS = MemberSimDimensionalTransformer.NATURAL_KEYS
+    SURROGATE_KEYS = MemberSimDimensionalTransformer.SURROGATE_KEYS
+    FOREIGN_KEYS = MemberSimDimensionalTransformer.FOREIGN_KEYS
+
+    def _build_queries(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Build queries for every table whose source has rows."""
+        dimensions: dict[str, str] = {}
+        facts: dict[str, str] = {}
+
+        has_members = self.has_rows("members")
+        has_claims = self.has_rows("claims")
+
+        # Build dimensions
+        if has_members:
+            dimensions["dim_member"] = self._dim_member_sql()
+
+        if has_claims and self.has_rows("claims", self.truthy_sql("provider_npi")):
+            dimensions["dim_provider"] = self._dim_provider_sql()
+        if has_claims and self.has_rows("claims", self.truthy_sql("facility_npi")):
+            dimensions["dim_facility"] = self._dim_facility_sql()
+
+        if has_claims:
+            dimensions["dim_diagnosis"] = self._dim_diagnosis_sql()
+            dimensions["dim_procedure"] = self._dim_procedure_sql()
+            dimensions["dim_service_category"] = self._dim_service_category_sql()
+
+        # Build facts
+        if has_claims:
+            facts["fact_claims"] = self._fact_claims_sql()
+
+        if has_members:
+            facts["fact_eligibility_spans"] = self._fact_eligibility_spans_sql()
+
+        return dimensions, facts
+
+    # -------------------------------------------------------------------------
+    # Dimension Queries
+    # -------------------------------------------------------------------------
+
+    def _dim_member_sql(self) -> str:
+        """Member dimension with demographics and coverage info."""
+        return f"""
+            SELECT
+                member_id AS member_key,
+                member_id,
+                subscriber_id,
+                id AS person_id,
+                given_name,
+                family_name,
+                given_name || ' ' || family_name AS full_name,
+                {self.date_key_sql("birth_date")} AS birth_date_key,
+                birth_date,
+                gender AS gender_code,
+                {self.case_sql("gender", GENDER_DESCRIPTIONS, "Unknown")} AS gender_description,
+                relationship_code,
+                {self.case_sql("relationship_code", RELATIONSHIP_DESCRIPTIONS, "Other")}
+                    AS relationship_description,
+                group_id,
+                plan_code,
+                pcp_npi,
+                {self.age_sql("birth_date", self.snapshot_date)} AS age_at_snapshot,
+                {self.age_band_sql("age_at_snapshot")} AS age_band,
+                city,
+                state,
+                postal_code,
+                coalesce(relationship_code = '18', false) AS is_subscriber,
+                {self._is_active_sql()} AS is_active
+            FROM {self.source("members")}
+            ORDER BY _row
+        """
+
+    def _dim_provider_sql(self) -> str:
+        """Provider dimension from the rendering NPIs on claims."""
+        return f"""
+            SELECT
+                key AS provider_key,
+                npi AS provider_npi,
+                NULL::VARCHAR AS tax_id,
+                npi AS provider_name,
+                NULL::VARCHAR AS specialty,
+                'INDIVIDUAL' AS provider_type,
+                'UNKNOWN' AS network_status,
+                NULL::VARCHAR AS city,
+                NULL::VARCHAR AS state
+            FROM ({self._npi_keys_sql("provider_npi")})
+            ORDER BY key
+        """
+
+    def _dim_facility_sql(self) -> str:
+        """Facility dimension from the facility NPIs on claims."""
+        return f"""
+            SELECT
+                key AS facility_key,
+                npi AS facility_npi,
+                NULL::VARCHAR AS tax_id,
+                npi AS facility_name,
+                NULL::VARCHAR AS facility_type,
+                'UNKNOWN' AS network_status,
+                NULL::VARCHAR AS city,
+                NULL::VARCHAR AS state
+            FROM ({self._npi_keys_sql("facility_npi")})
+            ORDER BY key
+        """
+
+    def _dim_diagnosis_sql(self) -> str:
+        """Diagnosis dimension from principal and secondary claim diagnoses."""
+        return f"""
+            SELECT
+                key AS diagnosis_key,
+                code AS diagnosis_code,
+                NULL::VARCHAR AS diagnosis_description,
+                {self.icd10_category_sql("code")} AS diagnosis_category,
+                'ICD-10-CM' AS code_system
+            FROM ({self._diagnosis_keys_sql()})
+            ORDER BY key
+        """
+
+    def _dim_procedure_sql(self) -> str:
+        """Procedure dimension from claim line procedure codes."""
+        return f"""
+            SELECT
+                key AS procedure_key,
+                code AS procedure_code,
+                NULL::VARCHAR AS procedure_description,
+                {self.procedure_code_system_sql("code")} AS code_system
+            FROM ({self._procedure_keys_sql()})
+            ORDER BY key
+        """
+
+    def _dim_service_category_sql(self) -> str:
+        """Service category dimension from claim and line places of service."""
+        return f"""
+            SELECT
+                key AS service_category_key,
+                code AS place_of_service_code,
+                {self.case_sql("code", PLACE_OF_SERVICE_CODES, "Unknown")}
+                    AS place_of_service_description,
+                {self.case_sql("code", SERVICE_CATEGORIES, "Other")} AS service_category
+            FROM ({self._service_category_keys_sql()})
+            ORDER BY key
+        """
+
+    # -------------------------------------------------------------------------
+    # Fact Queries
+    # -------------------------------------------------------------------------
+
+    def _fact_claims_sql(self) -> str:
+        """Claim line-level facts (one row per claim line)."""
+        payment_columns = ",\n                ".join(
+            f"NULL::DOUBLE AS {column}" for column in PAYMENT_AMOUNT_COLUMNS
+        )
+        stays = f"""
+            SELECT claim_id AS stay_id, member_id AS group_key,
+                   admission_date AS admitted, discharge_date AS discharged
+            FROM {self.source("claims")}
+            WHERE admission_date IS NOT NULL
+        """
+        return f"""
+            WITH lines AS (
+                SELECT
+                    c._row AS claim_row,
+                    l._row AS line_row,
+                    c.claim_id,
+                    c.member_id,
+                    c.subscriber_id,
+                    c.provider_npi,
+                    c.facility_npi,
+                    c.claim_type,
+                    c.principal_diagnosis,
+                    c.authorization_number,
+                    c.admission_date,
+                    c.discharge_date,
+                    l.line_number,
+                    l.procedure_code,
+                    l.service_date,
+                    l.place_of_service,
+                    l.revenue_code,
+                    l.ndc_code,
+                    l.units,
+                    l.charge_amount,
+                    from_json(l.procedure_modifiers, '["VARCHAR"]') AS modifiers,
+                    list_prepend(
+                        c.principal_diagnosis,
+                        coalesce(from_json(c.other_diagnoses, '["VARCHAR"]'), [])
+                    ) AS all_dx,
+                    coalesce(from_json(l.diagnosis_pointers, '["INTEGER"]')[1], 1) - 1 AS dx_idx
+                FROM {self.source("claims")} c
+                JOIN {self.source("claim_lines")} l ON l.claim_id = c.claim_id
+            ),
+            providers AS ({self._npi_keys_sql("provider_npi")}),
+            facilities AS ({self._npi_keys_sql("facility_npi")}),
+            diagnoses AS ({self._diagnosis_keys_sql()}),
+            procedures AS ({self._procedure_keys_sql()}),
+            service_categories AS ({self._service_category_keys_sql()}),
+            readmits AS ({readmission_flags_sql(stays)})
+            SELECT
+                row_number() OVER (ORDER BY l.claim_row, l.line_row) AS claim_fact_key,
+                l.claim_id,
+                l.line_number AS claim_line_number,
+                l.member_id AS member_key,
+                l.subscriber_id AS subscriber_key,
+                coalesce(p.key, -1) AS provider_key,
+                CASE WHEN {self.truthy_sql("l.facility_npi")}
+                     THEN coalesce(f.key, -1) END AS facility_key,
+                coalesce(dx.key, -1) AS diagnosis_key,
+                coalesce(pr.key, -1) AS procedure_key,
+                coalesce(sc.key, -1) AS service_category_key,
+                {self.date_key_sql("l.service_date")} AS service_date_key,
+                l.service_date,
+                NULL::INTEGER AS paid_date_key,
+                NULL::DATE AS paid_date,
+                l.claim_type,
+                l.place_of_service AS place_of_service_code,
+                l.revenue_code,
+                l.procedure_code,
+                CASE WHEN len(l.modifiers) > 0
+                     THEN array_to_string(l.modifiers, ',') END AS procedure_modifiers,
+                l.ndc_code,
+                CAST(l.units AS DOUBLE) AS units,
+                CAST(l.charge_amount * l.units AS DOUBLE) AS line_charge_amount,
+                {payment_columns},
+                NULL::VARCHAR AS adjustment_reason,
+                l.principal_diagnosis AS principal_diagnosis_code,
+                l.authorization_number,
+                {length_of_stay_days_sql("l.admission_date", "l.discharge_date")}
+                    AS length_of_stay_days,
+                coalesce(r.is_readmission_7_day, false) AS is_readmission_7_day,
+                coalesce(r.is_readmission_30_day, false) AS is_readmission_30_day
+            FROM lines l
+            LEFT JOIN providers p ON p.npi = l.provider_npi
+            LEFT JOIN facilities f ON f.npi = l.facility_npi
+            LEFT JOIN diagnoses dx ON dx.code = CASE
+                WHEN l.dx_idx >= len(l.all_dx) THEN l.principal_diagnosis
+                WHEN l.dx_idx >= 0 THEN l.all_dx[l.dx_idx + 1]
+                ELSE l.all_dx[l.dx_idx]
+            END
+            LEFT JOIN procedures pr ON pr.code = l.procedure_code
+            LEFT JOIN service_categories sc ON sc.code = l.place_of_service
+            LEFT JOIN readmits r ON r.stay_id = l.claim_id
+            ORDER BY l.claim_row, l.line_row
+        """
+
+    def _fact_eligibility_spans_sql(self) -> str:
+        """Eligibility span facts, one per member."""
+        snapshot = self.literal_sql(self.snapshot_date)
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY _row) AS eligibility_span_key,
+                member_id AS member_key,
+                -1 AS plan_key,
+                {self.date_key_sql("coverage_start")} AS effective_date_key,
+                coverage_start AS effective_date,
+                {self.date_key_sql("coverage_end")} AS termination_date_key,
+                coverage_end AS termination_date,
+                date_diff('day', coverage_start, coalesce(coverage_end, {snapshot})) + 1
+                    AS coverage_days,
+                {self._is_active_sql()} AS is_active,
+                group_id,
+                relationship_code
+            FROM {self.source("members")}
+            ORDER BY _row
+        """
+
+    # -------------------------------------------------------------------------
+    # Key Lookups
+    # -------------------------------------------------------------------------
+
+    def _npi_keys_sql(self, column: str) -> str:
+        """Claim NPI column to surrogate key, numbered in sorted order."""
+        return f"""
+            SELECT npi, row_number() OVER (ORDER BY npi) AS key
+            FROM (
+                SELECT DISTINCT {column} AS npi FROM {self.source("claims")}
+                WHERE {self.truthy_sql(column)}
+            )
+        """
+
+    def _diagnosis_keys_sql(self) -> str:
+        """Principal and secondary diagnosis codes to surrogate keys."""
+        return f"""
+            SELECT code, row_number() OVER (ORDER BY code) AS key
+            FROM (
+                SELECT principal_diagnosis AS code FROM {self.source("claims")}
+                UNION
+                SELECT unnest(from_json(other_diagnoses, '["VARCHAR"]'))
+                FROM {self.source("claims")}
+            )
+            WHERE code IS NOT NULL
+        """
+
+    def _procedure_keys_sql(self) -> str:
+        """Claim line procedure codes to surrogate keys."""
+        return f"""
+            SELECT code, row_number() OVER (ORDER BY code) AS key
+            FROM (
+                SELECT DISTINCT l.procedure_code AS code
+                FROM {self.source("claim_lines")} l
+                SEMI JOIN {self.source("claims")} c ON c.claim_id = l.claim_id
+            )
+        """
+
+    def _service_category_keys_sql(self) -> str:
+        """Claim and line place of service codes to surrogate keys."""
+        return f"""
+            SELECT code, row_number() OVER (ORDER BY code) AS key
+            FROM (
+                SELECT place_of_service AS code FROM {self.source("claims")}
+                UNION
+                SELECT l.place_of_service
+                FROM {self.source("claim_lines")} l
+                SEMI JOIN {self.source("claims")} c ON c.claim_id = l.claim_id
+            )
+            WHERE code IS NOT NULL
+        """
+
+    def _is_active_sql(self) -> str:
+        """Coverage active as of today, matching ``Member.is_active``."""
+        today = self.literal_sql(date.today())
+        return (
+            f"(coverage_start <= {today} "
+            f"AND (coverage_end IS NULL OR {today} <= coverage_end))"
+        )
@@ -10,7 +10,11 @@ from datetime import date
 from typing import TYPE_CHECKING
 
 import pandas as pd
-from healthsim.dimensional import BaseDimensionalTransformer
+from healthsim.dimensional import (
+    BaseDimensionalTransformer,
+    length_of_stay,
+    readmission_flags,
+)
 
 if TYPE_CHECKING:
     from membersim.claims.claim import Claim
@@ -50,6 +54,40 @@ PLACE_OF_SERVICE_CODES = {
     "99": "Other",
 }
 
+# Broader service categories by place of service code
+SERVICE_CATEGORIES = {
+    **dict.fromkeys(("21", "51", "61"), "Inpatient"),
+    **dict.fromkeys(("22", "24", "52", "62"), "Outpatient"),
+    **dict.fromkeys(("11", "02"), "Office"),
+    "23": "Emergency",
+    **dict.fromkeys(("31", "32", "33", "34", "54"), "Skilled Nursing"),
+    "12": "Home Health",
+    **dict.fromkeys(("41", "42"), "Ambulance"),
+    **dict.fromkeys(("50", "71", "72"), "Clinic"),
+}
+
+GENDER_DESCRIPTIONS = {
+    "M": "Male",
+    "F": "Female",
+    "MALE": "Male",
+    "FEMALE": "Female",
+    "O": "Other",
+    "U": "Unknown",
+}
+
+# X12 individual relationship codes
+RELATIONSHIP_DESCRIPTIONS = {
+    "18": "Self",
+    "01": "Spouse",
+    "19": "Child",
+    "20": "Employee",
+    "21": "Unknown",
+    "39": "Organ Donor",
+    "40": "Cadaver Donor",
+    "53": "Life Partner",
+    "G8": "Other Relationship",
+}
+
 
 class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
     """Transform MemberSim canonical models into dimensional format.
@@ -87,6 +125,37 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    NATURAL_KEYS = {
+        "dim_member": ("member_key",),
+        "dim_plan": ("plan_code",),
+        "dim_provider": ("provider_npi",),
+        "dim_facility": ("facility_npi",),
+        "dim_diagnosis": ("diagnosis_code",),
+        "dim_procedure": ("procedure_code",),
+        "dim_service_category": ("place_of_service_code",),
+        "fact_claims": ("claim_id", "claim_line_number"),
+    }
+
+    SURROGATE_KEYS = {
+        "dim_plan": "plan_key",
+        "dim_provider": "provider_key",
+        "dim_facility": "facility_key",
+        "dim_diagnosis": "diagnosis_key",
+        "dim_procedure": "procedure_key",
+        "dim_service_category": "service_category_key",
+    }
+
+    FOREIGN_KEYS = {
+        "fact_claims": {
+            "provider_key": "dim_provider",
+            "facility_key": "dim_facility",
+            "diagnosis_key": "dim_diagnosis",
+            "procedure_key": "dim_procedure",
+            "service_category_key": "dim_service_category",
+        },
+        "fact_eligibility_spans": {"plan_key": "dim_plan"},
+    }
+
     def __init__(
         self,
         members: list[Member] | None = None,
@@ -430,11 +499,22 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         diagnosis_lookup = self._build_diagnosis_lookup()
         procedure_lookup = self._build_procedure_lookup()
         service_category_lookup = self._build_service_category_lookup()
+        readmission_lookup = self._build_readmission_lookup()
 
         records = []
         fact_key = 0
 
         for claim in self.claims:
+            # Inpatient stay metrics, repeated on each line of the claim
+            is_readmission_7_day, is_readmission_30_day = readmission_lookup.get(
+                claim.claim_id, (False, False)
+            )
+            _, los_days = (
+                length_of_stay(claim.admission_date, claim.discharge_date)
+                if claim.admission_date
+                else (None, None)
+            )
+
             # Get payment if available
             payment = self._payment_lookup.get(claim.claim_id)
 
@@ -515,6 +595,9 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
                         "adjustment_reason": line_pay.get("adjustment_reason"),
                         "principal_diagnosis_code": claim.principal_diagnosis,
                         "authorization_number": claim.authorization_number,
+                        "length_of_stay_days": los_days,
+                        "is_readmission_7_day": is_readmission_7_day,
+                        "is_readmission_30_day": is_readmission_30_day,
                     }
                 )
 
@@ -527,7 +610,8 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
             "units", "line_charge_amount", "charged_amount", "allowed_amount",
             "paid_amount", "deductible_amount", "copay_amount", "coinsurance_amount",
             "member_responsibility", "adjustment_reason", "principal_diagnosis_code",
-            "authorization_number"
+            "authorization_number", "length_of_stay_days", "is_readmission_7_day",
+            "is_readmission_30_day"
         ])
 
     def _build_fact_eligibility_spans(self) -> pd.DataFrame:
@@ -622,36 +706,28 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
         """Build plan code to key lookup."""
         return {plan.plan_code: idx for idx, plan in enumerate(self.plans, start=1)}
 
+    def _build_readmission_lookup(self) -> dict[str, tuple[bool, bool]]:
+        """Build claim ID to (7-day, 30-day) readmission flags for inpatient claims.
+
+        A claim is an inpatient stay when it carries an admission date.
+        """
+        stays = [claim for claim in self.claims if claim.admission_date]
+        flags = readmission_flags(
+            (claim.member_id, claim.admission_date, claim.discharge_date) for claim in stays
+        )
+        return {claim.claim_id: flag for claim, flag in zip(stays, flags, strict=True)}
+
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
 
     def _get_gender_description(self, gender_code: str) -> str:
         """Get human-readable gender description."""
-        descriptions = {
-            "M": "Male",
-            "F": "Female",
-            "MALE": "Male",
-            "FEMALE": "Female",
-            "O": "Other",
-            "U": "Unknown",
-        }
-        return descriptions.get(gender_code, "Unknown")
+        return GENDER_DESCRIPTIONS.get(gender_code, "Unknown")
 
     def _get_relationship_description(self, relationship_code: str) -> str:
         """Get human-readable relationship description."""
-        descriptions = {
-            "18": "Self",
-            "01": "Spouse",
-            "19": "Child",
-            "20": "Employee",
-            "21": "Unknown",
-            "39": "Organ Donor",
-            "40": "Cadaver Donor",
-            "53": "Life Partner",
-            "G8": "Other Relationship",
-        }
-        return descriptions.get(relationship_code, "Other")
+        return RELATIONSHIP_DESCRIPTIONS.get(relationship_code, "Other")
 
     def _get_icd10_category(self, code: str) -> str:
         """Get ICD-10 category from code.
@@ -738,30 +814,4 @@ class MemberSimDimensionalTransformer(BaseDimensionalTransformer):
 
     def _get_service_category(self, pos_code: str) -> str:
         """Categorize place of service into broader service categories."""
-        inpatient_codes = {"21", "51", "61"}
-        outpatient_codes = {"22", "24", "52", "62"}
-        office_codes = {"11", "02"}
-        er_codes = {"23"}
-        snf_codes = {"31", "32", "33", "34", "54"}
-        home_codes = {"12"}
-        ambulance_codes = {"41", "42"}
-        clinic_codes = {"50", "71", "72"}
-
-        if pos_code in inpatient_codes:
-            return "Inpatient"
-        elif pos_code in outpatient_codes:
-            return "Outpatient"
-        elif pos_code in office_codes:
-            return "Office"
-        elif pos_code in er_codes:
-            return "Emergency"
-        elif pos_code in snf_codes:
-            return "Skilled Nursing"
-        elif pos_code in home_codes:
-            return "Home Health"
-        elif pos_code in ambulance_codes:
-            return "Ambulance"
-        elif pos_code in clinic_codes:
-            return "Clinic"
-        else:
-            return "Other"
+        return SERVICE_CATEGORIES.get(pos_code, "Other")
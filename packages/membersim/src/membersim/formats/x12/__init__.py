@@ -1,6 +1,6 @@
 """X12 EDI transaction formats."""
 
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import X12Config, X12Generator, X12StreamResult
 from membersim.formats.x12.edi_270_271 import (
     EDI270Generator,
     EDI271Generator,
@@ -26,6 +26,7 @@ __all__ = [
     # Base
     "X12Config",
     "X12Generator",
+    "X12StreamResult",
     # 834 Enrollment
     "EDI834Generator",
     "generate_834",
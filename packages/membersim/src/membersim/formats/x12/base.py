@@ -1,9 +1,17 @@
 """Base classes for X12 EDI generation."""
 
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+from typing import Any, TextIO
 
 from pydantic import BaseModel, Field
 
+# Default split sizes for streamed interchanges
+DEFAULT_ITEMS_PER_TRANSACTION = 5000
+DEFAULT_TRANSACTIONS_PER_GROUP = 100
+
 
 class X12Config(BaseModel):
     """Configuration for X12 transaction generation."""
@@ -19,15 +27,59 @@ class X12Config(BaseModel):
     st_control_number: int = Field(1, description="ST02 Transaction Set Control Number")
 
 
+@dataclass
+class X12StreamResult:
+    """Summary of a streamed interchange.
+
+    Attributes:
+        items: Claims, payments or members written
+        transaction_sets: ST/SE pairs written
+        groups: GS/GE functional groups written
+        segments: Total segments written, ISA through IEA
+    """
+
+    items: int = 0
+    transaction_sets: int = 0
+    groups: int = 0
+    segments: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "items": self.items,
+            "transaction_sets": self.transaction_sets,
+            "groups": self.groups,
+            "segments": self.segments,
+        }
+
+
 class X12Generator:
-    """Base class for X12 transaction generators."""
+    """Base class for X12 transaction generators.
+
+    Segments are buffered in memory for ``generate()``/``to_string()``, or
+    written straight to a text sink while ``_stream()`` runs. Either way the
+    segment count of the open transaction set and the ST/GS counts of the
+    open group/interchange are tracked as segments are added, so trailers
+    never rescan what was written.
+    """
 
     ELEMENT_SEPARATOR = "*"
     SEGMENT_TERMINATOR = "~"
+    SEGMENT_SEPARATOR = "\n"
 
     def __init__(self, config: X12Config | None = None):
         self.config = config or X12Config()
         self._segments: list[str] = []
+        self._sink: TextIO | None = None
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        """Reset the incremental segment and envelope counters."""
+        self._segments_written = 0  # all segments in the interchange
+        self._transaction_segments = 0  # segments since the open ST
+        self._group_transactions = 0  # ST/SE pairs in the open GS
+        self._interchange_groups = 0  # GS/GE pairs in the interchange
+        self._transactions_started = 0  # ST count across the interchange
 
     def _segment(self, *elements) -> str:
         """Create a segment from elements."""
@@ -36,8 +88,16 @@ class X12Generator:
         return self.ELEMENT_SEPARATOR.join(parts) + self.SEGMENT_TERMINATOR
 
     def _add(self, *elements) -> None:
-        """Add a segment to the transaction."""
-        self._segments.append(self._segment(*elements))
+        """Add a segment to the transaction (or write it to the sink)."""
+        segment = self._segment(*elements)
+        if self._sink is None:
+            self._segments.append(segment)
+        else:
+            if self._segments_written:
+                self._sink.write(self.SEGMENT_SEPARATOR)
+            self._sink.write(segment)
+        self._segments_written += 1
+        self._transaction_segments += 1
 
     def _isa_segment(self, _functional_group_id: str) -> None:
         """Generate ISA Interchange Control Header."""
@@ -64,6 +124,8 @@ class X12Generator:
 
     def _gs_segment(self, functional_id: str, sender: str, receiver: str) -> None:
         """Generate GS Functional Group Header."""
+        self._interchange_groups += 1
+        self._group_transactions = 0
         now = datetime.now()
         self._add(
             "GS",
@@ -72,34 +134,43 @@ class X12Generator:
             receiver,
             now.strftime("%Y%m%d"),
             now.strftime("%H%M"),
-            str(self.config.gs_control_number),
+            str(self._gs_control_number()),
             "X",
             "005010X220A1",
         )
 
     def _st_segment(self, transaction_code: str) -> None:
         """Generate ST Transaction Set Header."""
+        self._transactions_started += 1
+        self._group_transactions += 1
+        self._transaction_segments = 0
         self._add(
             "ST",
             transaction_code,
-            str(self.config.st_control_number).zfill(4),
+            str(self._st_control_number()).zfill(4),
         )
 
     def _se_segment(self) -> None:
         """Generate SE Transaction Set Trailer."""
-        # Count segments from ST to SE (inclusive)
-        segment_count = len(
-            [s for s in self._segments if s.startswith("ST") or not s.startswith(("ISA", "GS"))]
-        )
-        self._add("SE", str(segment_count + 1), str(self.config.st_control_number).zfill(4))
+        # Segments from ST to SE (inclusive)
+        segment_count = self._transaction_segments + 1
+        self._add("SE", str(segment_count), str(self._st_control_number()).zfill(4))
 
     def _ge_segment(self) -> None:
         """Generate GE Functional Group Trailer."""
-        self._add("GE", "1", str(self.config.gs_control_number))
+        self._add("GE", str(self._group_transactions), str(self._gs_control_number()))
 
     def _iea_segment(self) -> None:
         """Generate IEA Interchange Control Trailer."""
-        self._add("IEA", "1", str(self.config.isa_control_number).zfill(9))
+        self._add("IEA", str(self._interchange_groups), str(self.config.isa_control_number).zfill(9))
+
+    def _st_control_number(self) -> int:
+        """ST02/SE02 control number of the open transaction set."""
+        return self.config.st_control_number + max(self._transactions_started - 1, 0)
+
+    def _gs_control_number(self) -> int:
+        """GS06/GE02 control number of the open functional group."""
+        return self.config.gs_control_number + max(self._interchange_groups - 1, 0)
 
     def to_string(self) -> str:
         """Convert segments to X12 string."""
@@ -108,3 +179,79 @@ class X12Generator:
     def reset(self) -> None:
         """Clear segments for new transaction."""
         self._segments = []
+        self._reset_counters()
+
+    # =========================================================================
+    # Streaming
+    # =========================================================================
+
+    def _stream(
+        self,
+        items: Iterable[Any],
+        sink: TextIO,
+        functional_id: str,
+        transaction_code: str,
+        header: Callable[[list[Any]], None],
+        item_loop: Callable[[Any, int], None],
+        items_per_transaction: int = DEFAULT_ITEMS_PER_TRANSACTION,
+        transactions_per_group: int = DEFAULT_TRANSACTIONS_PER_GROUP,
+    ) -> X12StreamResult:
+        """Write one interchange to ``sink``, splitting items across envelopes.
+
+        Items are consumed ``items_per_transaction`` at a time; each batch
+        becomes one ST/SE transaction set, and every ``transactions_per_group``
+        sets the GS group is closed and a new one opened. Only the current
+        batch is held in memory. ST and GS control numbers count up from the
+        configured values.
+
+        Args:
+            items: Claims, payments or members (any iterable)
+            sink: Text file-like object to write segments to
+            functional_id: GS01 functional identifier code (e.g. "HC")
+            transaction_code: ST01 transaction set identifier (e.g. "837")
+            header: Writes the segments after ST for a batch (BHT, BPR, ...)
+            item_loop: Writes the loop for one item, given its 1-based index
+                within the transaction set
+            items_per_transaction: Maximum items per ST/SE transaction set
+            transactions_per_group: Maximum transaction sets per GS group
+
+        Returns:
+            X12StreamResult with item, envelope and segment counts
+        """
+        if items_per_transaction < 1:
+            raise ValueError("items_per_transaction must be at least 1")
+        if transactions_per_group < 1:
+            raise ValueError("transactions_per_group must be at least 1")
+
+        self.reset()
+        self._sink = sink
+        result = X12StreamResult()
+        try:
+            self._isa_segment(functional_id)
+            iterator = iter(items)
+            batch = list(islice(iterator, items_per_transaction))
+            while True:
+                if self._group_transactions in (0, transactions_per_group):
+                    if self._interchange_groups:
+                        self._ge_segment()
+                    self._gs_segment(functional_id, self.config.sender_id, self.config.receiver_id)
+                    result.groups += 1
+
+                self._st_segment(transaction_code)
+                header(batch)
+                for index, item in enumerate(batch, 1):
+                    item_loop(item, index)
+                self._se_segment()
+                result.transaction_sets += 1
+                result.items += len(batch)
+
+                batch = list(islice(iterator, items_per_transaction))
+                if not batch:
+                    break
+
+            self._ge_segment()
+            self._iea_segment()
+            result.segments = self._segments_written
+        finally:
+            self._sink = None
+        return result
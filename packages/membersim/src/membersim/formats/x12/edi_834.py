@@ -1,9 +1,17 @@
 """X12 834 Benefit Enrollment generator."""
 
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.core.member import Member
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import (
+    DEFAULT_ITEMS_PER_TRANSACTION,
+    DEFAULT_TRANSACTIONS_PER_GROUP,
+    X12Config,
+    X12Generator,
+    X12StreamResult,
+)
 
 
 class EDI834Generator(X12Generator):
@@ -35,14 +43,7 @@ class EDI834Generator(X12Generator):
         self._isa_segment("BE")
         self._gs_segment("BE", self.config.sender_id, self.config.receiver_id)
         self._st_segment("834")
-
-        # BGN - Beginning Segment
-        today_str = date.today().strftime("%Y%m%d")
-        self._add("BGN", "00", f"REF{today_str}", today_str)
-
-        # N1 Loop - Sponsor/Payer
-        self._add("N1", "P5", "SPONSOR NAME", "FI", "123456789")
-        self._add("N1", "IN", "PAYER NAME", "FI", "987654321")
+        self._transaction_header(members)
 
         # Process each member
         for member in members:
@@ -55,6 +56,49 @@ class EDI834Generator(X12Generator):
 
         return self.to_string()
 
+    def write(
+        self,
+        members: Iterable[Member],
+        sink: TextIO,
+        maintenance_type: str = "021",
+        group_id: str | None = None,
+        members_per_transaction: int = DEFAULT_ITEMS_PER_TRANSACTION,
+        transactions_per_group: int = DEFAULT_TRANSACTIONS_PER_GROUP,
+    ) -> X12StreamResult:
+        """Stream an 834 interchange to a text sink in constant memory.
+
+        Args:
+            members: Members to write (any iterable, consumed lazily)
+            sink: Text file-like object
+            maintenance_type: 021=Addition, 001=Change, 024=Termination
+            group_id: Override group ID (uses member's group_id if not specified)
+            members_per_transaction: Maximum members per ST/SE transaction set
+            transactions_per_group: Maximum transaction sets per GS group
+
+        Returns:
+            X12StreamResult with member, envelope and segment counts
+        """
+        return self._stream(
+            members,
+            sink,
+            "BE",
+            "834",
+            self._transaction_header,
+            lambda member, _index: self._generate_member_loop(member, maintenance_type, group_id),
+            members_per_transaction,
+            transactions_per_group,
+        )
+
+    def _transaction_header(self, _members: list[Member]) -> None:
+        """Generate BGN and sponsor/payer loops."""
+        # BGN - Beginning Segment
+        today_str = date.today().strftime("%Y%m%d")
+        self._add("BGN", "00", f"REF{today_str}", today_str)
+
+        # N1 Loop - Sponsor/Payer
+        self._add("N1", "P5", "SPONSOR NAME", "FI", "123456789")
+        self._add("N1", "IN", "PAYER NAME", "FI", "987654321")
+
     def _generate_member_loop(
         self,
         member: Member,
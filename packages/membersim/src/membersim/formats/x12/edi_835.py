@@ -1,10 +1,18 @@
 """X12 835 Healthcare Claim Payment/Remittance generator."""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
+from typing import TextIO
 
 from membersim.claims.payment import Payment
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import (
+    DEFAULT_ITEMS_PER_TRANSACTION,
+    DEFAULT_TRANSACTIONS_PER_GROUP,
+    X12Config,
+    X12Generator,
+    X12StreamResult,
+)
 
 
 class EDI835Generator(X12Generator):
@@ -17,7 +25,51 @@ class EDI835Generator(X12Generator):
         self._isa_segment("HP")
         self._gs_segment("HP", self.config.sender_id, self.config.receiver_id)
         self._st_segment("835")
+        self._transaction_header(payments)
 
+        # Process each payment
+        for payment in payments:
+            self._generate_payment_loop(payment)
+
+        self._se_segment()
+        self._ge_segment()
+        self._iea_segment()
+
+        return self.to_string()
+
+    def write(
+        self,
+        payments: Iterable[Payment],
+        sink: TextIO,
+        payments_per_transaction: int = DEFAULT_ITEMS_PER_TRANSACTION,
+        transactions_per_group: int = DEFAULT_TRANSACTIONS_PER_GROUP,
+    ) -> X12StreamResult:
+        """Stream an 835 interchange to a text sink in constant memory.
+
+        Each transaction set's BPR total covers only the payments in it.
+
+        Args:
+            payments: Payments to write (any iterable, consumed lazily)
+            sink: Text file-like object
+            payments_per_transaction: Maximum payments per ST/SE transaction set
+            transactions_per_group: Maximum transaction sets per GS group
+
+        Returns:
+            X12StreamResult with payment, envelope and segment counts
+        """
+        return self._stream(
+            payments,
+            sink,
+            "HP",
+            "835",
+            self._transaction_header,
+            lambda payment, _index: self._generate_payment_loop(payment),
+            payments_per_transaction,
+            transactions_per_group,
+        )
+
+    def _transaction_header(self, payments: list[Payment]) -> None:
+        """Generate BPR, TRN, REF, DTM and payer/payee loops."""
         # BPR - Financial Information
         total_amount = sum(p.total_paid for p in payments)
         today = date.today()
@@ -57,16 +109,6 @@ class EDI835Generator(X12Generator):
         # N1 - Payee Identification
         self._add("N1", "PE", "PAYEE NAME", "XX", "PAYEENPI")
 
-        # Process each payment
-        for payment in payments:
-            self._generate_payment_loop(payment)
-
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
-
     def _generate_payment_loop(self, payment: Payment) -> None:
         """Generate CLP loop for a payment."""
 
@@ -1,23 +1,79 @@
 """X12 837 Healthcare Claim generators."""
 
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import date
+from typing import TextIO
 
 from membersim.claims.claim import Claim
-from membersim.formats.x12.base import X12Config, X12Generator
+from membersim.formats.x12.base import (
+    DEFAULT_ITEMS_PER_TRANSACTION,
+    DEFAULT_TRANSACTIONS_PER_GROUP,
+    X12Config,
+    X12Generator,
+    X12StreamResult,
+)
 
 
-class EDI837PGenerator(X12Generator):
-    """Generate X12 837P Professional Claims."""
+class _EDI837Generator(X12Generator, ABC):
+    """Shared 837 header and streaming for professional/institutional claims."""
+
+    @abstractmethod
+    def _claim_loop(self, claim: Claim, hl_id: int) -> None:
+        """Generate the claim loops for one claim."""
 
     def generate(self, claims: list[Claim]) -> str:
-        """Generate 837P for professional claims."""
+        """Generate an 837 with all claims in one transaction set."""
         self.reset()
 
         # Envelope
         self._isa_segment("HC")
         self._gs_segment("HC", self.config.sender_id, self.config.receiver_id)
         self._st_segment("837")
+        self._transaction_header(claims)
+
+        # Process each claim
+        for idx, claim in enumerate(claims, 1):
+            self._claim_loop(claim, idx)
+
+        # Trailers
+        self._se_segment()
+        self._ge_segment()
+        self._iea_segment()
+
+        return self.to_string()
+
+    def write(
+        self,
+        claims: Iterable[Claim],
+        sink: TextIO,
+        claims_per_transaction: int = DEFAULT_ITEMS_PER_TRANSACTION,
+        transactions_per_group: int = DEFAULT_TRANSACTIONS_PER_GROUP,
+    ) -> X12StreamResult:
+        """Stream an 837 interchange to a text sink in constant memory.
+
+        Args:
+            claims: Claims to write (any iterable, consumed lazily)
+            sink: Text file-like object
+            claims_per_transaction: Maximum claims per ST/SE transaction set
+            transactions_per_group: Maximum transaction sets per GS group
+
+        Returns:
+            X12StreamResult with claim, envelope and segment counts
+        """
+        return self._stream(
+            claims,
+            sink,
+            "HC",
+            "837",
+            self._transaction_header,
+            self._claim_loop,
+            claims_per_transaction,
+            transactions_per_group,
+        )
 
+    def _transaction_header(self, _claims: list[Claim]) -> None:
+        """Generate BHT and submitter/receiver loops."""
         # BHT - Beginning of Hierarchical Transaction
         today = date.today()
         self._add(
@@ -37,16 +93,13 @@ class EDI837PGenerator(X12Generator):
         # NM1 - Receiver
         self._add("NM1", "40", "2", "RECEIVER NAME", "", "", "", "", "46", "RECEIVERID")
 
-        # Process each claim
-        for idx, claim in enumerate(claims, 1):
-            self._generate_claim_loop(claim, idx)
 
-        # Trailers
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
+class EDI837PGenerator(_EDI837Generator):
+    """Generate X12 837P Professional Claims."""
 
-        return self.to_string()
+    def _claim_loop(self, claim: Claim, hl_id: int) -> None:
+        """Generate professional claim loops."""
+        self._generate_claim_loop(claim, hl_id)
 
     def _generate_claim_loop(self, claim: Claim, hl_id: int) -> None:
         """Generate 2000A/B/C loops for a claim."""
@@ -112,47 +165,15 @@ class EDI837PGenerator(X12Generator):
             self._add("DTP", "472", "D8", line.service_date.strftime("%Y%m%d"))
 
 
-class EDI837IGenerator(X12Generator):
+class EDI837IGenerator(_EDI837Generator):
     """Generate X12 837I Institutional Claims."""
 
-    def generate(self, claims: list[Claim]) -> str:
-        """Generate 837I for institutional claims."""
-        self.reset()
-
-        # Similar structure to 837P but with institutional segments
-        # SV2 instead of SV1, revenue codes, etc.
-
-        self._isa_segment("HC")
-        self._gs_segment("HC", self.config.sender_id, self.config.receiver_id)
-        self._st_segment("837")
-
-        # BHT
-        today = date.today()
-        self._add(
-            "BHT",
-            "0019",
-            "00",
-            f"CLM{today.strftime('%Y%m%d%H%M%S')}",
-            today.strftime("%Y%m%d"),
-            today.strftime("%H%M"),
-            "CH",
-        )
+    # Similar structure to 837P but with institutional segments
+    # SV2 instead of SV1, revenue codes, etc.
 
-        # NM1 - Submitter
-        self._add("NM1", "41", "2", "SUBMITTER NAME", "", "", "", "", "46", "SUBMITTERID")
-        self._add("PER", "IC", "CONTACT NAME", "TE", "5551234567")
-
-        # NM1 - Receiver
-        self._add("NM1", "40", "2", "RECEIVER NAME", "", "", "", "", "46", "RECEIVERID")
-
-        for idx, claim in enumerate(claims, 1):
-            self._generate_institutional_claim(claim, idx)
-
-        self._se_segment()
-        self._ge_segment()
-        self._iea_segment()
-
-        return self.to_string()
+    def _claim_loop(self, claim: Claim, hl_id: int) -> None:
+        """Generate institutional claim loops."""
+        self._generate_institutional_claim(claim, hl_id)
 
     def _generate_institutional_claim(self, claim: Claim, hl_id: int) -> None:
         """Generate institutional claim loops."""
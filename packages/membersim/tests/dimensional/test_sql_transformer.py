@@ -0,0 +1,238 @@
+"""Tests for MemberSim SQL Dimensional Transformer."""
+
+import json
+import math
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import duckdb
+import pandas as pd
+import pytest
+from healthsim.db.schema import apply_schema
+
+from membersim import Claim, ClaimLine, MemberGenerator
+from membersim.dimensional import (
+    MemberSimDimensionalTransformer,
+    MemberSimSQLDimensionalTransformer,
+)
+
+SNAPSHOT = date(2025, 1, 1)
+
+
+def _normalize(value):
+    """Normalize a cell so object and SQL outputs compare equal."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, pd.Timestamp):
+        value = value.item()
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def _rows(df: pd.DataFrame) -> list[list]:
+    return [[_normalize(v) for v in row] for row in df.itertuples(index=False)]
+
+
+def _assert_same_tables(expected: dict, actual: dict) -> None:
+    assert list(actual) == list(expected)
+    for name, df in expected.items():
+        assert list(actual[name].columns) == list(df.columns), name
+        assert _rows(actual[name]) == _rows(df), name
+
+
+def _insert(conn, table: str, rows: list[dict]) -> None:
+    keys = list(rows[0])
+    placeholders = ", ".join("?" * len(keys))
+    conn.executemany(
+        f"INSERT INTO {table} ({', '.join(keys)}) VALUES ({placeholders})",
+        [list(row.values()) for row in rows],
+    )
+
+
+@pytest.fixture
+def members():
+    """Members, a quarter of them with a terminated coverage span."""
+    generated = MemberGenerator(seed=7).generate_many(10)
+    return [
+        member
+        if i % 4
+        else member.model_copy(update={"coverage_end": member.coverage_start + timedelta(days=200)})
+        for i, member in enumerate(generated)
+    ]
+
+
+@pytest.fixture
+def claims(members):
+    """Claims mixing code systems, modifiers and diagnosis pointers."""
+    rng = random.Random(7)
+    claims = []
+    for i in range(40):
+        member = rng.choice(members)
+        service_date = date(2024, 1, 1) + timedelta(days=i)
+        diagnoses = rng.sample(["E11.9", "I10", "Z00.00", "J45.909", "M54.5"], rng.randint(1, 4))
+        lines = [
+            ClaimLine(
+                line_number=n,
+                procedure_code=rng.choice(["99213", "80053", "J1100", "0DTJ4ZZ", "1234"]),
+                procedure_modifiers=rng.choice([[], ["25"], ["59", "LT"]]),
+                service_date=service_date,
+                units=Decimal(rng.choice(["1", "2", "1.5"])),
+                charge_amount=Decimal(rng.randint(1000, 90000)) / 100,
+                diagnosis_pointers=rng.choice([[1], [2, 1], [], [4], [0]]),
+                revenue_code=rng.choice([None, "0450"]),
+                ndc_code=rng.choice([None, "00002-1433-80"]),
+                place_of_service=rng.choice(["11", "21", "23", "99"]),
+            )
+            for n in range(1, rng.randint(0, 3) + 1)
+        ]
+        admission_date = service_date if rng.random() < 0.4 else None
+        discharge_date = (
+            service_date + timedelta(days=rng.randint(0, 5))
+            if admission_date and rng.random() < 0.8
+            else None
+        )
+        claims.append(
+            Claim(
+                claim_id=f"CLM{i:05d}",
+                claim_type=rng.choice(["PROFESSIONAL", "INSTITUTIONAL"]),
+                member_id=member.member_id,
+                subscriber_id=member.subscriber_id or member.member_id,
+                provider_npi=rng.choice(["1111111111", "2222222222"]),
+                facility_npi=rng.choice([None, "9999999999"]),
+                service_date=service_date,
+                admission_date=admission_date,
+                discharge_date=discharge_date,
+                place_of_service=rng.choice(["11", "21", "22"]),
+                claim_lines=lines,
+                principal_diagnosis=diagnoses[0],
+                other_diagnoses=diagnoses[1:],
+            )
+        )
+    return claims
+
+
+@pytest.fixture
+def conn(members, claims):
+    """In-memory database holding members and claims in canonical tables."""
+    connection = duckdb.connect()
+    apply_schema(connection)
+    _insert(connection, "members", [
+        {
+            "id": m.id,
+            "member_id": m.member_id,
+            "subscriber_id": m.subscriber_id,
+            "relationship_code": m.relationship_code,
+            "given_name": m.name.given_name,
+            "family_name": m.name.family_name,
+            "birth_date": m.birth_date,
+            "gender": getattr(m.gender, "value", m.gender),
+            "city": m.address.city,
+            "state": m.address.state,
+            "group_id": m.group_id,
+            "plan_code": m.plan_code,
+            "coverage_start": m.coverage_start,
+            "coverage_end": m.coverage_end,
+            "pcp_npi": m.pcp_npi,
+        }
+        for m in members
+    ])
+    _insert(connection, "claims", [
+        {
+            "claim_id": c.claim_id,
+            "claim_type": c.claim_type,
+            "member_id": c.member_id,
+            "subscriber_id": c.subscriber_id,
+            "provider_npi": c.provider_npi,
+            "facility_npi": c.facility_npi,
+            "service_date": c.service_date,
+            "admission_date": c.admission_date,
+            "discharge_date": c.discharge_date,
+            "place_of_service": c.place_of_service,
+            "principal_diagnosis": c.principal_diagnosis,
+            "other_diagnoses": json.dumps(c.other_diagnoses),
+        }
+        for c in claims
+    ])
+    _insert(connection, "claim_lines", [
+        {
+            "id": f"{c.claim_id}-{line.line_number}",
+            "claim_id": c.claim_id,
+            "line_number": line.line_number,
+            "procedure_code": line.procedure_code,
+            "procedure_modifiers": json.dumps(line.procedure_modifiers),
+            "service_date": line.service_date,
+            "units": line.units,
+            "charge_amount": line.charge_amount,
+            "diagnosis_pointers": json.dumps(line.diagnosis_pointers),
+            "revenue_code": line.revenue_code,
+            "ndc_code": line.ndc_code,
+            "place_of_service": line.place_of_service,
+        }
+        for c in claims
+        for line in c.claim_lines
+    ])
+    yield connection
+    connection.close()
+
+
+class TestMemberSimSQLDimensionalTransformer:
+    """Tests for MemberSimSQLDimensionalTransformer."""
+
+    def test_matches_object_transformer(self, conn, members, claims):
+        """Test SQL output equals the object transformer on the same records."""
+        expected = MemberSimDimensionalTransformer(
+            members=members, claims=claims, snapshot_date=SNAPSHOT
+        ).transform()
+        actual = MemberSimSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).transform()
+
+        for expected_tables, actual_tables in zip(expected, actual, strict=True):
+            _assert_same_tables(expected_tables, actual_tables)
+
+    def test_claim_line_explosion(self, conn, claims):
+        """Test one fact row per claim line, in claim and line order."""
+        _, facts = MemberSimSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).transform()
+        fact_claims = facts["fact_claims"]
+
+        expected = [(c.claim_id, line.line_number) for c in claims for line in c.claim_lines]
+        actual = list(zip(fact_claims["claim_id"], fact_claims["claim_line_number"], strict=True))
+        assert actual == expected
+
+    def test_inpatient_readmission_flags(self, conn, claims):
+        """Test only inpatient claims carry stay length and readmission flags."""
+        _, facts = MemberSimSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).transform()
+        fact_claims = facts["fact_claims"]
+
+        inpatient_ids = {c.claim_id for c in claims if c.admission_date}
+        outpatient = fact_claims[~fact_claims["claim_id"].isin(inpatient_ids)]
+        assert fact_claims["is_readmission_30_day"].any()
+        assert not outpatient["is_readmission_30_day"].any()
+        assert outpatient["length_of_stay_days"].isna().all()
+
+    def test_cohort_filter(self, conn, members):
+        """Test only members in the requested cohort are transformed."""
+        conn.execute("UPDATE members SET cohort_id = 'c1' WHERE rowid < 4")
+
+        dimensions, facts = MemberSimSQLDimensionalTransformer(
+            conn, cohort_id="c1", snapshot_date=SNAPSHOT
+        ).transform()
+        expected = MemberSimDimensionalTransformer(
+            members=members[:4], snapshot_date=SNAPSHOT
+        ).transform()
+
+        _assert_same_tables(expected[0], dimensions)
+        _assert_same_tables(expected[1], facts)
+
+    def test_materialize(self, conn, claims):
+        """Test tables are written to the target schema."""
+        counts = MemberSimSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).materialize()
+
+        rows = conn.execute("SELECT COUNT(*) FROM analytics.fact_claims").fetchone()[0]
+        assert rows == counts["fact_claims"]
+        assert counts["dim_member"] == 10
+        assert counts["fact_eligibility_spans"] == 10
@@ -3,6 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
+import pandas as pd
 import pytest
 
 from membersim import (
@@ -376,6 +377,47 @@ class TestMemberSimDimensionalTransformer:
         for col in required_columns:
             assert col in fact_claims.columns, f"Missing column: {col}"
 
+    def test_fact_claims_inpatient_readmission(self, sample_claim):
+        """Test inpatient claims carry length of stay and readmission flags."""
+        line = ClaimLine(
+            line_number=1,
+            procedure_code="99223",
+            service_date=date(2024, 6, 1),
+            charge_amount=Decimal("900.00"),
+        )
+        index_stay = Claim(
+            claim_id="IP001",
+            claim_type="INSTITUTIONAL",
+            member_id=sample_claim.member_id,
+            subscriber_id=sample_claim.subscriber_id,
+            provider_npi="1234567890",
+            service_date=date(2024, 6, 1),
+            admission_date=date(2024, 6, 1),
+            discharge_date=date(2024, 6, 4),
+            place_of_service="21",
+            principal_diagnosis="I50.9",
+            claim_lines=[line],
+        )
+        readmit = index_stay.model_copy(
+            update={
+                "claim_id": "IP002",
+                "service_date": date(2024, 6, 20),
+                "admission_date": date(2024, 6, 20),
+                "discharge_date": date(2024, 6, 22),
+            }
+        )
+
+        transformer = MemberSimDimensionalTransformer(claims=[index_stay, sample_claim, readmit])
+        _, facts = transformer.transform()
+
+        fact_claims = facts["fact_claims"].set_index("claim_id")
+        assert fact_claims.loc["IP001", "length_of_stay_days"] == 3
+        assert fact_claims.loc["IP001", "is_readmission_30_day"] == False  # noqa: E712
+        assert fact_claims.loc["IP002", "is_readmission_7_day"] == False  # noqa: E712
+        assert fact_claims.loc["IP002", "is_readmission_30_day"] == True  # noqa: E712
+        assert pd.isna(fact_claims.loc["CLM001", "length_of_stay_days"])
+        assert fact_claims.loc["CLM001", "is_readmission_30_day"] == False  # noqa: E712
+
     def test_fact_eligibility_spans(self, sample_member, sample_plan):
         """Test fact_eligibility_spans records member coverage periods."""
         transformer = MemberSimDimensionalTransformer(
@@ -131,3 +131,25 @@ class TestMemberGenerator:
         # Test faker
         name = gen.faker.first_name()
         assert isinstance(name, str)
+
+    def test_member_and_claim_ids_unique(self) -> None:
+        """Test member and claim IDs never collide within a generator."""
+        gen = MemberGenerator(seed=7)
+
+        members = [gen.generate_member() for _ in range(2000)]
+        claims = [gen.generate_claim(members[0]) for _ in range(2000)]
+
+        assert len({m.member_id for m in members}) == 2000
+        assert len({c.claim_id for c in claims}) == 2000
+
+    def test_ids_unique_across_seeds(self) -> None:
+        """Test generators with different seeds never share IDs by default."""
+        gen1 = MemberGenerator(seed=1)
+        gen2 = MemberGenerator(seed=2)
+
+        members = [gen1.generate_member() for _ in range(500)]
+        members += [gen2.generate_member() for _ in range(500)]
+        claims = [gen1.generate_claim(members[0]), gen2.generate_claim(members[-1])]
+
+        assert len({m.member_id for m in members}) == 1000
+        assert claims[0].claim_id != claims[1].claim_id
@@ -1,13 +1,18 @@
 """Tests for X12 EDI format module."""
 
+import io
 from datetime import date
 from decimal import Decimal
 
+import pytest
 from healthsim.person import Address, Gender, PersonName
 
 from membersim import Claim, ClaimLine, Member, Payment, Plan
 from membersim.claims.payment import LinePayment
 from membersim.formats.x12 import (
+    EDI834Generator,
+    EDI835Generator,
+    EDI837PGenerator,
     X12Config,
     X12Generator,
     generate_270,
@@ -147,6 +152,162 @@ class TestEDI834Generator:
         assert "INS*N*19*" in edi  # Not subscriber, child
 
 
+# ============================================================================
+# Streaming Writer Tests
+# ============================================================================
+
+
+def _make_claims(count: int):
+    """Yield simple professional claims."""
+    for i in range(count):
+        yield Claim(
+            claim_id=f"CLM{i:06d}",
+            claim_type="PROFESSIONAL",
+            member_id="MEM001",
+            subscriber_id="MEM001",
+            provider_npi="1234567890",
+            service_date=date(2024, 3, 15),
+            place_of_service="11",
+            principal_diagnosis="E11.9",
+            claim_lines=[
+                ClaimLine(
+                    line_number=1,
+                    procedure_code="99213",
+                    service_date=date(2024, 3, 15),
+                    charge_amount=Decimal("150.00"),
+                ),
+            ],
+        )
+
+
+def _check_envelopes(edi: str) -> dict[str, list[str]]:
+    """Validate SE/GE/IEA counts against the segments and return control numbers."""
+    controls: dict[str, list[str]] = {"GS": [], "ST": []}
+    groups = transactions = segments = 0
+    for segment in edi.split("\n"):
+        elements = segment.rstrip("~").split("*")
+        tag = elements[0]
+        segments += 1
+        if tag == "GS":
+            groups += 1
+            transactions = 0
+            controls["GS"].append(elements[6])
+        elif tag == "ST":
+            transactions += 1
+            segments = 1
+            controls["ST"].append(elements[2])
+        elif tag == "SE":
+            assert int(elements[1]) == segments
+            assert elements[2] == controls["ST"][-1]
+        elif tag == "GE":
+            assert int(elements[1]) == transactions
+            assert elements[2] == controls["GS"][-1]
+        elif tag == "IEA":
+            assert int(elements[1]) == groups
+    return controls
+
+
+class TestX12StreamWriter:
+    """Tests for streaming X12 output with ST/SE and GS splitting."""
+
+    def test_splits_transactions_and_groups(self) -> None:
+        """Claims are split by count; every trailer carries the right totals."""
+        sink = io.StringIO()
+        result = EDI837PGenerator().write(
+            _make_claims(7), sink, claims_per_transaction=3, transactions_per_group=2
+        )
+        edi = sink.getvalue()
+
+        assert result.to_dict() == {
+            "items": 7,
+            "transaction_sets": 3,
+            "groups": 2,
+            "segments": len(edi.split("\n")),
+        }
+        controls = _check_envelopes(edi)
+        assert controls["ST"] == ["0001", "0002", "0003"]
+        assert controls["GS"] == ["1", "2"]
+        assert edi.count("CLM*CLM") == 7
+
+    def test_single_transaction_matches_generate(self, sample_claim: Claim) -> None:
+        """A batch that fits in one transaction set matches generate()."""
+        generator = EDI837PGenerator()
+        sink = io.StringIO()
+        generator.write([sample_claim], sink)
+
+        # Skip ISA/GS, whose timestamps may differ between calls
+        assert sink.getvalue().split("\n")[2:] == generator.generate([sample_claim]).split("\n")[2:]
+
+    def test_control_numbers_start_from_config(self) -> None:
+        """ST and GS control numbers count up from the configured values."""
+        config = X12Config(gs_control_number=40, st_control_number=900)
+        sink = io.StringIO()
+        EDI837PGenerator(config).write(
+            _make_claims(4), sink, claims_per_transaction=1, transactions_per_group=3
+        )
+
+        controls = _check_envelopes(sink.getvalue())
+        assert controls["ST"] == ["0900", "0901", "0902", "0903"]
+        assert controls["GS"] == ["40", "41"]
+
+    def test_835_totals_per_transaction(self) -> None:
+        """Each 835 transaction set's BPR total covers only its payments."""
+        payments = [
+            Payment(
+                payment_id=f"PAY{i}",
+                claim_id=f"CLM{i}",
+                payment_date=date(2024, 4, 1),
+                check_number=f"CHK{i}",
+                line_payments=[
+                    LinePayment(
+                        line_number=1,
+                        charged_amount=Decimal("150.00"),
+                        allowed_amount=Decimal("100.00"),
+                        paid_amount=Decimal("75.00"),
+                    ),
+                ],
+            )
+            for i in range(3)
+        ]
+        sink = io.StringIO()
+        EDI835Generator().write(payments, sink, payments_per_transaction=2)
+        edi = sink.getvalue()
+
+        _check_envelopes(edi)
+        assert [s.split("*")[2] for s in edi.split("\n") if s.startswith("BPR*")] == [
+            "150.00",
+            "75.00",
+        ]
+        assert "TRN*1*CHK2*" in edi
+
+    def test_834_stream(self, sample_member: Member) -> None:
+        """834 members stream with the given maintenance type."""
+        sink = io.StringIO()
+        result = EDI834Generator().write(
+            [sample_member] * 5, sink, maintenance_type="024", members_per_transaction=2
+        )
+
+        _check_envelopes(sink.getvalue())
+        assert result.transaction_sets == 3
+        assert sink.getvalue().count("INS*Y*18*024*") == 5
+
+    def test_generator_state_reset_after_stream(self, sample_claim: Claim) -> None:
+        """generate() after write() still produces a single, buffered interchange."""
+        generator = EDI837PGenerator()
+        generator.write(_make_claims(3), io.StringIO(), claims_per_transaction=1)
+        edi = generator.generate([sample_claim])
+
+        controls = _check_envelopes(edi)
+        assert controls["ST"] == ["0001"]
+
+    def test_invalid_split_sizes(self) -> None:
+        """Split sizes must be positive."""
+        with pytest.raises(ValueError, match="items_per_transaction"):
+            EDI837PGenerator().write([], io.StringIO(), claims_per_transaction=0)
+        with pytest.raises(ValueError, match="transactions_per_group"):
+            EDI837PGenerator().write([], io.StringIO(), transactions_per_group=0)
+
+
 # ============================================================================
 # EDI 837 Claims Tests
 # ============================================================================
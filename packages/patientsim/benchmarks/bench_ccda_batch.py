@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch C-CDA document generation throughput (docs/sec).
+
+Renders one CCD per synthetic patient with ``CCDABatchGenerator`` into a
+zip archive and a directory of per-patient files, for each worker count.
+Records are generated up front so the timings cover rendering and writing
+only. A plain ``CCDATransformer.transform`` loop is timed first as the
+single-process reference.
+
+Usage:
+    python benchmarks/bench_ccda_batch.py
+    python benchmarks/bench_ccda_batch.py --patients 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from patientsim.core.generator import PatientGenerator  # noqa: E402
+from patientsim.formats.ccda import (  # noqa: E402
+    CCDABatchGenerator,
+    CCDAConfig,
+    CCDARecord,
+    CCDATransformer,
+    DocumentType,
+)
+
+TIMESTAMP = datetime(2025, 1, 1)
+
+CONFIG = CCDAConfig(
+    document_type=DocumentType.CCD,
+    organization_name="Example Hospital",
+    organization_oid="2.16.840.1.113883.3.1234",
+)
+
+
+def make_records(count: int, seed: int = 42):
+    """Yield ``count`` records with problems, medications, results and vitals."""
+    generator = PatientGenerator(seed=seed)
+    for _ in range(count):
+        patient = generator.generate_patient()
+        encounter = generator.generate_encounter(patient)
+        yield CCDARecord(
+            patient=patient,
+            encounters=[encounter],
+            diagnoses=[generator.generate_diagnosis(patient, encounter) for _ in range(4)],
+            medications=[generator.generate_medication(patient, encounter) for _ in range(4)],
+            labs=[generator.generate_lab_result(patient, encounter) for _ in range(8)],
+            # Hypertensive readings: random pediatric ranges can put diastolic over systolic
+            vitals=[
+                generator.generate_vital_signs(patient, encounter, ["blood_pressure"])
+                for _ in range(3)
+            ],
+        )
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patients", type=int, default=5_000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1})
+    )
+    parser.add_argument("--chunk-size", type=int, default=100)
+    args = parser.parse_args()
+
+    records = list(make_records(args.patients))
+    transformer = CCDATransformer(CONFIG)
+    start = time.perf_counter()
+    for record in records:
+        transformer.transform(
+            record.patient,
+            record.encounters,
+            record.diagnoses,
+            record.medications,
+            record.labs,
+            record.vitals,
+            timestamp=TIMESTAMP,
+        )
+    elapsed = time.perf_counter() - start
+    print(f"transform() {len(records):,} docs: {len(records) / elapsed:,.0f} docs/s")
+
+    print(
+        f"{'output':>6} {'workers':>7} {'docs':>8} {'time (s)':>9} {'docs/s':>8} "
+        f"{'MB out':>8} {'peak MB':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for workers in args.workers:
+            generator = CCDABatchGenerator(
+                CONFIG, workers=workers, chunk_size=args.chunk_size, timestamp=TIMESTAMP
+            )
+            for output in ("zip", "files"):
+                target = Path(tmpdir) / f"{output}-{workers}"
+                start = time.perf_counter()
+                if output == "zip":
+                    result = generator.write_zip(records, f"{target}.zip")
+                else:
+                    result = generator.write_files(records, target)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{output:>6} {workers:>7} {result.documents:>8,} {elapsed:>9.2f} "
+                    f"{result.documents / elapsed:>8,.0f} "
+                    f"{result.bytes_written / 1e6:>8.1f} {peak_rss_mb():>8.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dimensional transform, object transformer versus SQL transformer.
+
+Fills the canonical ``patients``, ``encounters`` and ``diagnoses`` tables of
+an in-memory DuckDB database with synthetic rows (five encounters per
+patient, one diagnosis per encounter, so facts = 2 x encounters), then times
+``PatientSQLDimensionalTransformer`` to pandas, to Arrow and materialized in
+place. ``PatientDimensionalTransformer`` is timed on the same rows loaded as
+model objects up to ``--python-max`` encounters.
+
+Usage:
+    python benchmarks/bench_dimensional_sql.py
+    python benchmarks/bench_dimensional_sql.py --encounters 10000 500000 --python-max 10000
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import duckdb  # noqa: E402
+from healthsim.db.schema import apply_schema  # noqa: E402
+from healthsim.person import PersonName  # noqa: E402
+
+from patientsim.core.models import Diagnosis, Encounter, Patient  # noqa: E402
+from patientsim.dimensional import (  # noqa: E402
+    PatientDimensionalTransformer,
+    PatientSQLDimensionalTransformer,
+)
+
+SNAPSHOT = date(2025, 1, 1)
+ENCOUNTERS_PER_PATIENT = 5
+
+
+def load_cohort(conn, encounters: int) -> None:
+    """Insert synthetic canonical rows with set-based SQL."""
+    patients = max(1, encounters // ENCOUNTERS_PER_PATIENT)
+    conn.execute(
+        f"""
+        INSERT INTO patients (id, mrn, given_name, family_name, birth_date, gender, state)
+        SELECT 'patient-' || i, 'MRN' || lpad(i::VARCHAR, 8, '0'), 'Given' || i, 'Bench',
+               DATE '1940-01-01' + CAST(i % 25000 AS INTEGER),
+               CASE WHEN i % 2 = 0 THEN 'F' ELSE 'M' END,
+               ['TX', 'CA', 'NY', 'FL'][i % 4 + 1]
+        FROM range({patients}) t(i)
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO encounters (encounter_id, patient_mrn, class_code, status,
+                                admission_time, discharge_time, facility,
+                                discharge_disposition, attending_physician)
+        SELECT 'E' || lpad(i::VARCHAR, 9, '0'),
+               'MRN' || lpad((i % {patients})::VARCHAR, 8, '0'),
+               ['I', 'O', 'E', 'OBS'][i % 4 + 1], 'finished',
+               TIMESTAMP '2024-01-01 08:00' + to_days(CAST(i // {patients} * 9 AS INTEGER)),
+               TIMESTAMP '2024-01-01 08:00' + to_days(CAST(i // {patients} * 9 AS INTEGER))
+                   + to_hours(4 + i % 96),
+               'Facility ' || i % 50, CASE WHEN i % 97 = 0 THEN 'Expired' ELSE 'Home' END,
+               'Dr. ' || i % 400
+        FROM range({encounters}) t(i)
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO diagnoses (id, code, description, patient_mrn, encounter_id, diagnosed_date)
+        SELECT 'dx-' || encounter_id,
+               ['E11.9', 'I10', 'J45.909', 'M54.5', 'Z00.00'][
+                   CAST(hash(encounter_id) % 5 AS BIGINT) + 1
+               ],
+               'Benchmark diagnosis', patient_mrn, encounter_id, CAST(admission_time AS DATE)
+        FROM encounters
+        """
+    )
+
+
+def load_models(conn) -> dict:
+    """Read the canonical rows back as model objects for the object transformer."""
+    def rows(sql):
+        cursor = conn.execute(sql)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
+
+    patients = [
+        Patient(
+            id=row["id"], mrn=row["mrn"], birth_date=row["birth_date"], gender=row["gender"],
+            name=PersonName(given_name=row["given_name"], family_name=row["family_name"]),
+        )
+        for row in rows("SELECT * FROM patients ORDER BY rowid")
+    ]
+    encounter_columns = (
+        "encounter_id, patient_mrn, class_code, status, admission_time, discharge_time, "
+        "facility, discharge_disposition, attending_physician"
+    )
+    encounters = [
+        Encounter(**row)
+        for row in rows(f"SELECT {encounter_columns} FROM encounters ORDER BY rowid")
+    ]
+    diagnoses = [
+        Diagnosis(**row)
+        for row in rows(
+            "SELECT code, description, patient_mrn, encounter_id, diagnosed_date "
+            "FROM diagnoses ORDER BY rowid"
+        )
+    ]
+    return {"patients": patients, "encounters": encounters, "diagnoses": diagnoses}
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--encounters", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--python-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+        has_arrow = True
+    except ImportError:
+        has_arrow = False
+
+    print(
+        f"{'facts':>10} {'python (s)':>11} {'sql pandas (s)':>15} "
+        f"{'sql arrow (s)':>14} {'materialize (s)':>16}"
+    )
+    for encounters in args.encounters:
+        conn = duckdb.connect()
+        apply_schema(conn)
+        load_cohort(conn, encounters)
+        transformer = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT)
+
+        python = "-"
+        if encounters <= args.python_max:
+            models = load_models(conn)
+            object_transformer = PatientDimensionalTransformer(**models, snapshot_date=SNAPSHOT)
+            python = f"{timed(object_transformer.transform):.2f}"
+
+        sql_pandas = timed(transformer.transform)
+        sql_arrow = f"{timed(transformer.transform_arrow):.2f}" if has_arrow else "-"
+        materialize = timed(transformer.materialize)
+
+        facts = 2 * encounters
+        print(
+            f"{facts:>10,} {python:>11} {sql_pandas:>15.2f} "
+            f"{sql_arrow:>14} {materialize:>16.2f}"
+        )
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
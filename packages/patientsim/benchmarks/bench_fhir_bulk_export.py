@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: FHIR Bulk Data NDJSON export throughput.
+
+Generates a synthetic cohort (patients, encounters, diagnoses, labs and
+vitals), then exports it with the sequential ``export_to_directory`` and the
+sharded ``export_sharded`` at several worker counts. Sharded export consumes
+a generator, so the cohort is never materialized for it.
+
+Usage:
+    python benchmarks/bench_fhir_bulk_export.py
+    python benchmarks/bench_fhir_bulk_export.py --patients 100000 --workers 1 4 8 --compress
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.person import Gender, PersonName  # noqa: E402
+
+from patientsim.core.models import (  # noqa: E402
+    Diagnosis,
+    Encounter,
+    LabResult,
+    Patient,
+    VitalSign,
+)
+from patientsim.formats.fhir import FHIRBulkExporter  # noqa: E402
+
+
+def make_records(count: int, kind: str):
+    """Yield ``count`` synthetic records of one kind, one per patient."""
+    base = datetime(2024, 1, 1, 8, 0, 0)
+    for i in range(count):
+        mrn = f"MRN{i:08d}"
+        when = base + timedelta(minutes=i)
+        if kind == "patients":
+            yield Patient(
+                id=f"patient-{i:08d}",
+                mrn=mrn,
+                name=PersonName(given_name=f"Given{i}", family_name="Bench"),
+                gender=Gender.MALE if i % 2 else Gender.FEMALE,
+                birth_date=date(1940 + i % 60, 1 + i % 12, 1 + i % 28),
+            )
+        elif kind == "encounters":
+            yield Encounter(
+                encounter_id=f"E{i:08d}", patient_mrn=mrn, class_code="O",
+                status="finished", admission_time=when,
+            )
+        elif kind == "diagnoses":
+            yield Diagnosis(
+                code="E11.9", description="Type 2 diabetes mellitus", patient_mrn=mrn,
+                encounter_id=f"E{i:08d}", diagnosed_date=when.date(),
+            )
+        elif kind == "labs":
+            yield LabResult(
+                test_name="glucose", value=str(80 + i % 60), unit="mg/dL",
+                patient_mrn=mrn, encounter_id=f"E{i:08d}", collected_time=when,
+            )
+        else:
+            yield VitalSign(
+                patient_mrn=mrn, encounter_id=f"E{i:08d}", observation_time=when,
+                heart_rate=60 + i % 40, systolic_bp=120, diastolic_bp=80,
+            )
+
+
+KINDS = ("patients", "encounters", "diagnoses", "labs", "vitals")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patients", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--shard-mb", type=int, default=64)
+    parser.add_argument("--compress", action="store_true")
+    args = parser.parse_args()
+
+    exporter = FHIRBulkExporter(compress=args.compress)
+    print(f"{'mode':>16} {'time (s)':>9} {'resources':>10} {'res/s':>10} {'files':>6}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data = {kind: list(make_records(args.patients, kind)) for kind in KINDS}
+        start = time.perf_counter()
+        result = exporter.export_to_directory(Path(tmpdir) / "sequential", **data)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{'sequential':>16} {elapsed:>9.2f} {result.total_resources:>10,} "
+            f"{result.total_resources / elapsed:>10,.0f} {len(result.files_created):>6}"
+        )
+        del data
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            result = exporter.export_sharded(
+                Path(tmpdir) / f"sharded-{workers}",
+                workers=workers,
+                chunk_size=args.chunk_size,
+                max_shard_bytes=args.shard_mb * 1024 * 1024,
+                **{kind: make_records(args.patients, kind) for kind in KINDS},
+            )
+            elapsed = time.perf_counter() - start
+            label = f"sharded w={workers}"
+            print(
+                f"{label:>16} {elapsed:>9.2f} {result.total_resources:>10,} "
+                f"{result.total_resources / elapsed:>10,.0f} {len(result.files_created):>6}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
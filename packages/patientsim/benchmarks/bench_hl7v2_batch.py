@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming HL7v2 ADT batch output throughput and peak memory.
+
+Replays admit/update/discharge events for a synthetic patient panel into an
+HL7 batch file with ``HL7v2Generator.write_batch``. Events come from a
+generator, so peak RSS should stay flat as the feed grows. Each size is run
+with the PID cache on (each patient's PID built once) and off
+(``pid_cache_size=0``, one PID per message). The one-message-at-a-time
+``generate_adt_*`` API is timed alongside on the smallest size.
+
+Usage:
+    python benchmarks/bench_hl7v2_batch.py
+    python benchmarks/bench_hl7v2_batch.py --patients 10000 100000 --stays-per-patient 4
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.person import PersonName  # noqa: E402
+
+from patientsim.core.models import (  # noqa: E402
+    Encounter,
+    EncounterClass,
+    EncounterStatus,
+    Gender,
+    Patient,
+)
+from patientsim.formats.hl7v2 import HL7v2Generator  # noqa: E402
+
+TIMESTAMP = datetime(2025, 1, 1)
+
+
+def make_patients(count: int) -> list[Patient]:
+    """Build ``count`` patients."""
+    return [
+        Patient(
+            id=f"patient-{i}",
+            mrn=f"MRN{i:08d}",
+            name=PersonName(given_name="Alex", family_name=f"Rivera{i}"),
+            birth_date=date(1950 + i % 50, 1 + i % 12, 1 + i % 28),
+            gender=Gender.FEMALE if i % 2 else Gender.MALE,
+        )
+        for i in range(count)
+    ]
+
+
+def make_events(patients: list[Patient], stays_per_patient: int):
+    """Yield A01/A08/A03 events for a year of stays, interleaving patients."""
+    for stay in range(stays_per_patient):
+        for i, patient in enumerate(patients):
+            admitted = datetime(2024, 1, 1) + timedelta(days=stay * 90 + i % 60, hours=i % 24)
+            encounter = Encounter(
+                encounter_id=f"ENC{i:08d}{stay:02d}",
+                patient_mrn=patient.mrn,
+                class_code=EncounterClass.INPATIENT,
+                status=EncounterStatus.FINISHED,
+                admission_time=admitted,
+                discharge_time=admitted + timedelta(days=3),
+                discharge_disposition="Home",
+            )
+            for event in ("A01", "A08", "A03"):
+                yield patient, encounter, event
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patients", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--stays-per-patient", type=int, default=4)
+    parser.add_argument("--messages-per-batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    generator = HL7v2Generator()
+    builders = {
+        "A01": generator.generate_adt_a01,
+        "A03": generator.generate_adt_a03,
+        "A08": generator.generate_adt_a08,
+    }
+
+    smallest = make_patients(min(args.patients))
+    start = time.perf_counter()
+    messages = [
+        builders[event](patient, encounter, timestamp=TIMESTAMP)
+        for patient, encounter, event in make_events(smallest, args.stays_per_patient)
+    ]
+    elapsed = time.perf_counter() - start
+    print(f"generate_adt_*() {len(messages):,} messages: {len(messages) / elapsed:,.0f} msg/s")
+    del messages
+
+    print(
+        f"{'patients':>9} {'cache':>7} {'messages':>10} {'time (s)':>9} {'msg/s':>8} "
+        f"{'batches':>8} {'PIDs':>8} {'peak MB':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in sorted(args.patients):
+            patients = make_patients(count)
+            rates = {}
+            for label, cache_size in (("off", 0), ("on", count)):
+                with open(Path(tmpdir) / f"adt-{count}.hl7", "w", newline="") as sink:
+                    start = time.perf_counter()
+                    result = generator.write_batch(
+                        make_events(patients, args.stays_per_patient),
+                        sink,
+                        messages_per_batch=args.messages_per_batch,
+                        timestamp=TIMESTAMP,
+                        pid_cache_size=cache_size,
+                    )
+                    elapsed = time.perf_counter() - start
+                rates[label] = result.messages / elapsed
+                print(
+                    f"{count:>9,} {label:>7} {result.messages:>10,} {elapsed:>9.2f} "
+                    f"{rates[label]:>8,.0f} {result.batches:>8} "
+                    f"{result.pid_segments:>8,} {peak_rss_mb():>8.1f}"
+                )
+            print(f"{'':>9} {'speedup':>7} {rates['on'] / rates['off']:>10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
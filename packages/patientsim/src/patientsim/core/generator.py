@@ -8,7 +8,7 @@ from datetime import date, datetime, timedelta
 from typing import Any
 
 from healthsim.generation import AgeDistribution, BaseGenerator
-from healthsim.person import Address, ContactInfo, PersonName
+from healthsim.person import Address, ContactInfo, IdentifierAllocator, PersonName
 
 from patientsim.core.models import (
     Diagnosis,
@@ -50,16 +50,37 @@ class PatientGenerator(BaseGenerator):
         >>> patient = gen.generate_patient(age_range=(65, 85), gender=Gender.FEMALE)
     """
 
-    def __init__(self, seed: int | None = None, locale: str = "en_US") -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        locale: str = "en_US",
+        id_allocator: IdentifierAllocator | None = None,
+    ) -> None:
         """Initialize the patient generator.
 
         Args:
             seed: Random seed for reproducible generation. Same seed produces same data.
             locale: Faker locale for demographic data (default: en_US).
+            id_allocator: Allocator for patient IDs and MRNs. Pass a shared
+                allocator (or one resumed from the database) to keep IDs
+                unique across generators with the same seed; by default each
+                generator has its own, starting in the seed's ID range so
+                generators with different seeds are unlikely to share IDs.
         """
         super().__init__(seed=seed, locale=locale)
         # Store seed for compatibility with existing code
         self.seed = seed
+        self._owns_allocator = id_allocator is None
+        self.id_allocator = id_allocator or IdentifierAllocator.for_seed(seed)
+
+    def reset(self) -> None:
+        """Reset the generator to initial seed state.
+
+        Also restarts ID allocation, unless the allocator was passed in.
+        """
+        super().reset()
+        if self._owns_allocator:
+            self.id_allocator.reset()
 
     def generate_patient(
         self,
@@ -116,9 +137,12 @@ class PatientGenerator(BaseGenerator):
             family_name=family_name,
         )
 
-        # Identifiers
-        patient_id = f"patient-{self.random_int(100000, 999999)}"
-        mrn = f"MRN{self.random_int(100000, 999999)}"
+        # Identifiers; the two draws the random IDs used are kept so seeded
+        # output stays the same for every other field
+        self.random_int(100000, 999999)
+        self.random_int(100000, 999999)
+        patient_id = self.id_allocator.next_id("patient")
+        mrn = self.id_allocator.next_id("mrn")
         ssn = f"{self.random_int(100, 999)}{self.random_int(10, 99)}{self.random_int(1000, 9999)}"
 
         # Build Address
@@ -34,6 +34,14 @@ Example:
     ...         facts
     ...     )
 
+The same star schema can be built as SQL directly over the canonical DuckDB
+tables with PatientSQLDimensionalTransformer, without materializing model
+objects:
+
+    >>> from patientsim.dimensional import PatientSQLDimensionalTransformer
+    >>> transformer = PatientSQLDimensionalTransformer(conn, cohort_id=cohort_id)
+    >>> dimensions, facts = transformer.transform_arrow()
+
 See Also:
     - healthsim.dimensional.generate_dim_date: Date dimension generator
     - healthsim.dimensional.DuckDBDimensionalWriter: DuckDB output writer
@@ -42,8 +50,10 @@ See Also:
 
 from __future__ import annotations
 
+from .sql_transformer import PatientSQLDimensionalTransformer
 from .transformer import PatientDimensionalTransformer
 
 __all__ = [
     "PatientDimensionalTransformer",
+    "PatientSQLDimensionalTransformer",
 ]
@@ -0,0 +1,390 @@
+"""PatientSim SQL Dimensional Transformer.
+
+Builds the PatientSim star schema as DuckDB SQL over the canonical tables
+(``patients``, ``encounters``, ``diagnoses``, ``medications``,
+``lab_results``, ``vital_signs``) instead of from lists of model objects.
+"""
+
+from __future__ import annotations
+
+from healthsim.dimensional import (
+    SQLDimensionalTransformer,
+    is_mortality_sql,
+    length_of_stay_days_sql,
+    length_of_stay_hours_sql,
+    readmission_flags_sql,
+)
+
+from .transformer import GENDER_DESCRIPTIONS, PatientDimensionalTransformer
+
+
+class PatientSQLDimensionalTransformer(SQLDimensionalTransformer):
+    """Columnar counterpart of ``PatientDimensionalTransformer``.
+
+    Produces the same tables, columns, keys and row order as the object
+    transformer fed with the same records in table order. ``dim_procedure``
+    and ``fact_procedures`` are not produced because procedures have no
+    canonical table.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from patientsim.dimensional import PatientSQLDimensionalTransformer
+        >>>
+        >>> transformer = PatientSQLDimensionalTransformer(
+        ...     get_connection(), cohort_id="diabetes-cohort"
+        ... )
+        >>> dimensions, facts = transformer.transform()
+    """
+
+    NATURAL_KEYS = PatientDimensionalTransformer.NATURAL_KEYS
+    SURROGATE_KEYS = PatientDimensionalTransformer.SURROGATE_KEYS
+    FOREIGN_KEYS = PatientDimensionalTransformer.FOREIGN_KEYS
+
+    def _build_queries(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Build queries for every table whose source has rows."""
+        dimensions: dict[str, str] = {}
+        facts: dict[str, str] = {}
+
+        has_patients = self.has_rows("patients")
+        has_encounters = self.has_rows("encounters")
+        has_diagnoses = self.has_rows("diagnoses")
+        has_medications = self.has_rows("medications")
+        has_lab_results = self.has_rows("lab_results")
+        has_vitals = self.has_rows("vital_signs")
+
+        # Build dimensions
+        if has_patients:
+            dimensions["dim_patient"] = self._dim_patient_sql()
+
+        if has_encounters:
+            dimensions["dim_facility"] = self._dim_facility_sql()
+            dimensions["dim_provider"] = self._dim_provider_sql()
+
+        if has_diagnoses:
+            dimensions["dim_diagnosis"] = self._dim_diagnosis_sql()
+
+        if has_medications:
+            dimensions["dim_medication"] = self._dim_medication_sql()
+
+        if has_lab_results:
+            dimensions["dim_lab_test"] = self._dim_lab_test_sql()
+
+        # Build facts
+        if has_encounters:
+            facts["fact_encounters"] = self._fact_encounters_sql()
+
+        if has_diagnoses:
+            facts["fact_diagnoses"] = self._fact_diagnoses_sql()
+
+        if has_medications:
+            facts["fact_medications"] = self._fact_medications_sql()
+
+        if has_lab_results:
+            facts["fact_lab_results"] = self._fact_lab_results_sql()
+
+        if has_vitals:
+            facts["fact_vitals"] = self._fact_vitals_sql()
+
+        return dimensions, facts
+
+    # -------------------------------------------------------------------------
+    # Dimension Queries
+    # -------------------------------------------------------------------------
+
+    def _dim_patient_sql(self) -> str:
+        """Patient dimension with demographics and age bands."""
+        return f"""
+            SELECT
+                mrn AS patient_key,
+                mrn AS patient_mrn,
+                id AS patient_id,
+                given_name,
+                family_name,
+                concat_ws(' ', nullif(prefix, ''), given_name, nullif(middle_name, ''),
+                          family_name, nullif(suffix, '')) AS full_name,
+                {self.date_key_sql("birth_date")} AS birth_date_key,
+                birth_date,
+                gender AS gender_code,
+                {self.case_sql("gender", GENDER_DESCRIPTIONS, "Unknown")} AS gender_description,
+                race,
+                language,
+                {self.age_sql("birth_date", self.snapshot_date)} AS age_at_snapshot,
+                {self.age_band_sql("age_at_snapshot")} AS age_band,
+                city,
+                state,
+                postal_code
+            FROM {self.source("patients")}
+            ORDER BY _row
+        """
+
+    def _dim_facility_sql(self) -> str:
+        """Facility dimension; a single Unknown row when no facility is named."""
+        return f"""
+            SELECT facility_key, facility_name, facility_type FROM (
+                SELECT key AS facility_key, name AS facility_name, 'Hospital' AS facility_type
+                FROM ({self._facility_keys_sql()})
+                UNION ALL
+                SELECT -1, 'Unknown', 'Unknown'
+                WHERE NOT EXISTS (SELECT 1 FROM ({self._facility_keys_sql()}))
+            )
+            ORDER BY facility_key
+        """
+
+    def _dim_provider_sql(self) -> str:
+        """Provider dimension; a single Unknown row when no physician is named."""
+        return f"""
+            SELECT provider_key, provider_id, provider_name, provider_type FROM (
+                SELECT key AS provider_key, name AS provider_id, name AS provider_name,
+                       'Physician' AS provider_type
+                FROM ({self._provider_keys_sql()})
+                UNION ALL
+                SELECT -1, 'UNKNOWN', 'Unknown', 'Unknown'
+                WHERE NOT EXISTS (SELECT 1 FROM ({self._provider_keys_sql()}))
+            )
+            ORDER BY provider_key
+        """
+
+    def _dim_diagnosis_sql(self) -> str:
+        """Diagnosis dimension; descriptions come from each code's first row."""
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY code) AS diagnosis_key,
+                code AS diagnosis_code,
+                description AS diagnosis_description,
+                {self.icd10_category_sql("code")} AS diagnosis_category,
+                'ICD-10-CM' AS code_system
+            FROM (
+                SELECT code, first(description ORDER BY _row) AS description
+                FROM {self.source("diagnoses")}
+                GROUP BY code
+            )
+            ORDER BY diagnosis_key
+        """
+
+    def _dim_medication_sql(self) -> str:
+        """Medication dimension; attributes come from each name's first row."""
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY name) AS medication_key,
+                name AS medication_name,
+                code AS medication_code,
+                CASE WHEN {self.truthy_sql("code")} THEN 'RxNorm' END AS code_system,
+                indication
+            FROM (
+                SELECT name,
+                       first(code ORDER BY _row) AS code,
+                       first(indication ORDER BY _row) AS indication
+                FROM {self.source("medications")}
+                GROUP BY name
+            )
+            ORDER BY medication_key
+        """
+
+    def _dim_lab_test_sql(self) -> str:
+        """Lab test dimension; attributes come from each test's first row."""
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY test_name) AS lab_test_key,
+                test_name,
+                loinc_code,
+                unit,
+                reference_range,
+                CASE WHEN {self.truthy_sql("loinc_code")} THEN 'LOINC' END AS code_system
+            FROM (
+                SELECT test_name,
+                       first(loinc_code ORDER BY _row) AS loinc_code,
+                       first(unit ORDER BY _row) AS unit,
+                       first(reference_range ORDER BY _row) AS reference_range
+                FROM {self.source("lab_results")}
+                GROUP BY test_name
+            )
+            ORDER BY lab_test_key
+        """
+
+    # -------------------------------------------------------------------------
+    # Fact Queries
+    # -------------------------------------------------------------------------
+
+    def _fact_encounters_sql(self) -> str:
+        """Encounter facts with LOS, readmission and mortality flags."""
+        los_hours = length_of_stay_hours_sql("e.admission_time", "e.discharge_time")
+        stays = f"""
+            SELECT _row AS stay_id, patient_mrn AS group_key,
+                   admission_time AS admitted, discharge_time AS discharged
+            FROM {self.source("encounters")}
+        """
+        return f"""
+            WITH enc AS (SELECT * FROM {self.source("encounters")}),
+            facilities AS ({self._facility_keys_sql()}),
+            providers AS ({self._provider_keys_sql()}),
+            readmits AS ({readmission_flags_sql(stays)})
+            SELECT
+                e.encounter_id AS encounter_key,
+                e.patient_mrn AS patient_key,
+                coalesce(f.key, -1) AS facility_key,
+                coalesce(att.key, -1) AS attending_provider_key,
+                coalesce(adm.key, -1) AS admitting_provider_key,
+                {self.date_key_sql("e.admission_time")} AS admission_date_key,
+                {self.date_key_sql("e.discharge_time")} AS discharge_date_key,
+                e.admission_time AS admission_datetime,
+                e.discharge_time AS discharge_datetime,
+                e.class_code AS encounter_class_code,
+                e.status AS encounter_status_code,
+                e.chief_complaint,
+                e.discharge_disposition,
+                e.department,
+                e.room,
+                e.bed,
+                CASE WHEN {los_hours} <> 0
+                     THEN round_even({los_hours}, 2) END AS length_of_stay_hours,
+                {length_of_stay_days_sql("e.admission_time", "e.discharge_time")}
+                    AS length_of_stay_days,
+                r.is_readmission_7_day,
+                r.is_readmission_30_day,
+                {is_mortality_sql("e.discharge_disposition")} AS is_mortality
+            FROM enc e
+            LEFT JOIN facilities f ON f.name = e.facility
+            LEFT JOIN providers att ON att.name = e.attending_physician
+            LEFT JOIN providers adm ON adm.name = e.admitting_physician
+            JOIN readmits r ON r.stay_id = e._row
+            ORDER BY e._row
+        """
+
+    def _fact_diagnoses_sql(self) -> str:
+        """Diagnosis event facts."""
+        return f"""
+            WITH codes AS (
+                SELECT code, row_number() OVER (ORDER BY code) AS key
+                FROM (SELECT DISTINCT code FROM {self.source("diagnoses")})
+            )
+            SELECT
+                row_number() OVER (ORDER BY d._row) AS diagnosis_fact_key,
+                d.patient_mrn AS patient_key,
+                d.encounter_id AS encounter_key,
+                coalesce(c.key, -1) AS diagnosis_key,
+                {self.date_key_sql("d.diagnosed_date")} AS diagnosed_date_key,
+                {self.date_key_sql("d.resolved_date")} AS resolved_date_key,
+                d.type AS diagnosis_type_code,
+                coalesce(d.type = 'admitting', false) AS is_primary,
+                d.resolved_date IS NOT NULL AS is_resolved
+            FROM {self.source("diagnoses")} d
+            LEFT JOIN codes c ON c.code = d.code
+            ORDER BY d._row
+        """
+
+    def _fact_medications_sql(self) -> str:
+        """Medication order facts."""
+        return f"""
+            WITH names AS (
+                SELECT name, row_number() OVER (ORDER BY name) AS key
+                FROM (SELECT DISTINCT name FROM {self.source("medications")})
+            )
+            SELECT
+                row_number() OVER (ORDER BY m._row) AS medication_fact_key,
+                m.patient_mrn AS patient_key,
+                m.encounter_id AS encounter_key,
+                coalesce(n.key, -1) AS medication_key,
+                {self.date_key_sql("m.start_date")} AS start_date_key,
+                {self.date_key_sql("m.end_date")} AS end_date_key,
+                m.start_date AS start_datetime,
+                m.end_date AS end_datetime,
+                m.dose,
+                m.route,
+                m.frequency,
+                m.status AS status_code,
+                m.prescriber,
+                coalesce(m.status = 'active', false) AS is_active
+            FROM {self.source("medications")} m
+            LEFT JOIN names n ON n.name = m.name
+            ORDER BY m._row
+        """
+
+    def _fact_lab_results_sql(self) -> str:
+        """Lab result facts; numeric values follow ``safe_decimal`` rounding."""
+        decimal_value = "TRY_CAST(trim(l.value) AS DECIMAL(38, 2))"
+        return f"""
+            WITH tests AS (
+                SELECT test_name, row_number() OVER (ORDER BY test_name) AS key
+                FROM (SELECT DISTINCT test_name FROM {self.source("lab_results")})
+            )
+            SELECT
+                row_number() OVER (ORDER BY l._row) AS lab_result_fact_key,
+                l.patient_mrn AS patient_key,
+                l.encounter_id AS encounter_key,
+                coalesce(t.key, -1) AS lab_test_key,
+                {self.date_key_sql("l.collected_time")} AS collected_date_key,
+                {self.date_key_sql("l.resulted_time")} AS resulted_date_key,
+                l.collected_time AS collected_datetime,
+                l.resulted_time AS resulted_datetime,
+                l.value AS result_value,
+                CASE
+                    WHEN lower(trim(l.value)) IN ('nan', '+nan', '-nan') THEN 'NaN'::DOUBLE
+                    WHEN {decimal_value} <> 0 THEN CAST({decimal_value} AS DOUBLE)
+                END AS result_numeric,
+                l.unit,
+                l.abnormal_flag,
+                l.abnormal_flag IS NOT NULL AS is_abnormal,
+                coalesce(l.abnormal_flag IN ('HH', 'LL', 'A'), false) AS is_critical,
+                l.performing_lab,
+                l.ordering_provider
+            FROM {self.source("lab_results")} l
+            LEFT JOIN tests t ON t.test_name = l.test_name
+            ORDER BY l._row
+        """
+
+    def _fact_vitals_sql(self) -> str:
+        """Vital sign facts with derived clinical flags."""
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY _row) AS vitals_fact_key,
+                patient_mrn AS patient_key,
+                encounter_id AS encounter_key,
+                {self.date_key_sql("observation_time")} AS observation_date_key,
+                observation_time AS observation_datetime,
+                CAST(temperature AS DOUBLE) AS temperature_f,
+                heart_rate AS heart_rate_bpm,
+                respiratory_rate,
+                systolic_bp,
+                diastolic_bp,
+                CASE WHEN systolic_bp IS NOT NULL AND diastolic_bp IS NOT NULL
+                     THEN systolic_bp || '/' || diastolic_bp END AS blood_pressure,
+                spo2 AS spo2_pct,
+                CAST(height_cm AS DOUBLE) AS height_cm,
+                CAST(weight_kg AS DOUBLE) AS weight_kg,
+                round_even(
+                    CAST(weight_kg AS DOUBLE) / pow(CAST(height_cm AS DOUBLE) / 100, 2), 1
+                ) AS bmi,
+                temperature >= 100.4 AS is_febrile,
+                heart_rate > 100 AS is_tachycardic,
+                systolic_bp < 90 AS is_hypotensive,
+                systolic_bp >= 140 AS is_hypertensive,
+                spo2 < 90 AS is_hypoxic
+            FROM {self.source("vital_signs")}
+            ORDER BY _row
+        """
+
+    # -------------------------------------------------------------------------
+    # Key Lookups
+    # -------------------------------------------------------------------------
+
+    def _facility_keys_sql(self) -> str:
+        """Facility name to surrogate key, numbered in sorted order."""
+        return f"""
+            SELECT facility AS name, row_number() OVER (ORDER BY facility) AS key
+            FROM (
+                SELECT DISTINCT facility FROM {self.source("encounters")}
+                WHERE {self.truthy_sql("facility")}
+            )
+        """
+
+    def _provider_keys_sql(self) -> str:
+        """Attending/admitting physician to surrogate key, in sorted order."""
+        return f"""
+            SELECT physician AS name, row_number() OVER (ORDER BY physician) AS key
+            FROM (
+                SELECT attending_physician AS physician FROM {self.source("encounters")}
+                UNION
+                SELECT admitting_physician FROM {self.source("encounters")}
+            )
+            WHERE {self.truthy_sql("physician")}
+        """
@@ -10,7 +10,12 @@ from datetime import date
 from typing import TYPE_CHECKING
 
 import pandas as pd
-from healthsim.dimensional import BaseDimensionalTransformer
+from healthsim.dimensional import (
+    BaseDimensionalTransformer,
+    is_mortality,
+    length_of_stay,
+    readmission_flags,
+)
 
 if TYPE_CHECKING:
     from patientsim.core.models import (
@@ -24,6 +29,14 @@ if TYPE_CHECKING:
     )
 
 
+GENDER_DESCRIPTIONS = {
+    "M": "Male",
+    "F": "Female",
+    "O": "Other",
+    "U": "Unknown",
+}
+
+
 class PatientDimensionalTransformer(BaseDimensionalTransformer):
     """Transform PatientSim canonical models into dimensional format.
 
@@ -64,6 +77,38 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    NATURAL_KEYS = {
+        "dim_patient": ("patient_key",),
+        "dim_facility": ("facility_name",),
+        "dim_provider": ("provider_id",),
+        "dim_diagnosis": ("diagnosis_code",),
+        "dim_procedure": ("procedure_code",),
+        "dim_medication": ("medication_name",),
+        "dim_lab_test": ("test_name",),
+        "fact_encounters": ("encounter_key",),
+    }
+
+    SURROGATE_KEYS = {
+        "dim_facility": "facility_key",
+        "dim_provider": "provider_key",
+        "dim_diagnosis": "diagnosis_key",
+        "dim_procedure": "procedure_key",
+        "dim_medication": "medication_key",
+        "dim_lab_test": "lab_test_key",
+    }
+
+    FOREIGN_KEYS = {
+        "fact_encounters": {
+            "facility_key": "dim_facility",
+            "attending_provider_key": "dim_provider",
+            "admitting_provider_key": "dim_provider",
+        },
+        "fact_diagnoses": {"diagnosis_key": "dim_diagnosis"},
+        "fact_procedures": {"procedure_key": "dim_procedure"},
+        "fact_medications": {"medication_key": "dim_medication"},
+        "fact_lab_results": {"lab_test_key": "dim_lab_test"},
+    }
+
     def __init__(
         self,
         patients: list[Patient] | None = None,
@@ -395,34 +440,17 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         facility_map = self._build_facility_lookup()
         provider_map = self._build_provider_lookup()
 
-        # Sort encounters by patient and admission time for readmission calc
-        patient_encounters: dict[str, list] = {}
-        for enc in self.encounters:
-            if enc.patient_mrn not in patient_encounters:
-                patient_encounters[enc.patient_mrn] = []
-            patient_encounters[enc.patient_mrn].append(enc)
-
-        # Sort each patient's encounters by admission time
-        for mrn in patient_encounters:
-            patient_encounters[mrn].sort(key=lambda x: x.admission_time)
+        # Readmission flags in one sorted pass over all encounters
+        readmissions = readmission_flags(
+            (enc.patient_mrn, enc.admission_time, enc.discharge_time)
+            for enc in self.encounters
+        )
 
         records = []
-        for enc in self.encounters:
-            # Calculate length of stay
-            los_hours = None
-            los_days = None
-            if enc.discharge_time:
-                delta = enc.discharge_time - enc.admission_time
-                los_hours = delta.total_seconds() / 3600
-                los_days = delta.days
-
-            # Calculate readmission flags
-            is_readmission_7_day, is_readmission_30_day = self._calculate_readmission_flags(
-                enc, patient_encounters.get(enc.patient_mrn, [])
-            )
-
-            # Is patient deceased (based on discharge disposition)
-            is_mortality = self._check_mortality(enc.discharge_disposition)
+        for enc, (is_readmission_7_day, is_readmission_30_day) in zip(
+            self.encounters, readmissions, strict=True
+        ):
+            los_hours, los_days = length_of_stay(enc.admission_time, enc.discharge_time)
 
             records.append(
                 {
@@ -452,7 +480,7 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
                     "length_of_stay_days": los_days,
                     "is_readmission_7_day": is_readmission_7_day,
                     "is_readmission_30_day": is_readmission_30_day,
-                    "is_mortality": is_mortality,
+                    "is_mortality": is_mortality(enc.discharge_disposition),
                 }
             )
 
@@ -643,67 +671,10 @@ class PatientDimensionalTransformer(BaseDimensionalTransformer):
         names = sorted({lab.test_name for lab in self.lab_results})
         return {name: idx for idx, name in enumerate(names, start=1)}
 
-    def _calculate_readmission_flags(
-        self,
-        current_encounter: Encounter,
-        patient_encounters: list[Encounter],
-    ) -> tuple[bool, bool]:
-        """Calculate 7-day and 30-day readmission flags.
-
-        An encounter is a readmission if there was a prior encounter
-        that discharged within 7 or 30 days before this admission.
-
-        Args:
-            current_encounter: The encounter to check.
-            patient_encounters: All encounters for this patient, sorted by admission time.
-
-        Returns:
-            Tuple of (is_readmission_7_day, is_readmission_30_day).
-        """
-        is_readmission_7_day = False
-        is_readmission_30_day = False
-
-        for prior_enc in patient_encounters:
-            # Skip if same encounter or no discharge time
-            if prior_enc.encounter_id == current_encounter.encounter_id:
-                continue
-            if not prior_enc.discharge_time:
-                continue
-            # Only consider prior encounters
-            if prior_enc.admission_time >= current_encounter.admission_time:
-                continue
-
-            days_since_discharge = (
-                current_encounter.admission_time.date() - prior_enc.discharge_time.date()
-            ).days
-
-            if 0 <= days_since_discharge <= 7:
-                is_readmission_7_day = True
-                is_readmission_30_day = True
-                break
-            elif 0 <= days_since_discharge <= 30:
-                is_readmission_30_day = True
-
-        return is_readmission_7_day, is_readmission_30_day
-
-    def _check_mortality(self, discharge_disposition: str | None) -> bool:
-        """Check if discharge disposition indicates mortality."""
-        if not discharge_disposition:
-            return False
-        disposition_lower = discharge_disposition.lower()
-        mortality_keywords = ["expired", "died", "death", "deceased", "morgue"]
-        return any(kw in disposition_lower for kw in mortality_keywords)
-
     def _get_gender_description(self, gender) -> str:
         """Get human-readable gender description."""
         gender_value = gender.value if hasattr(gender, "value") else gender
-        descriptions = {
-            "M": "Male",
-            "F": "Female",
-            "O": "Other",
-            "U": "Unknown",
-        }
-        return descriptions.get(gender_value, "Unknown")
+        return GENDER_DESCRIPTIONS.get(gender_value, "Unknown")
 
     def _get_icd10_category(self, code: str) -> str:
         """Get ICD-10 category from code.
@@ -38,6 +38,7 @@ Example - JSON/CSV Export:
 """
 
 from patientsim.formats.ccda import (
+    CCDABatchGenerator,
     CCDAConfig,
     CCDATransformer,
     CCDAValidator,
@@ -64,6 +65,7 @@ from patientsim.formats.fhir import (
 
 __all__ = [
     # C-CDA
+    "CCDABatchGenerator",
     "CCDAConfig",
     "CCDATransformer",
     "CCDAValidator",
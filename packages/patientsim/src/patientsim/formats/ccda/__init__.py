@@ -28,8 +28,14 @@ Example:
     >>> from patientsim.formats.ccda import CodeSystemRegistry, CodedValue
     >>> registry = CodeSystemRegistry()
     >>> coded = registry.get_snomed_for_icd10("E11.9")
+
+    # Use CCDABatchGenerator for one document per patient across a cohort:
+    >>> from patientsim.formats.ccda import CCDABatchGenerator, CCDARecord
+    >>> generator = CCDABatchGenerator(config, workers=8)
+    >>> result = generator.write_zip((CCDARecord(p) for p in patients), "ccds.zip")
 """
 
+from patientsim.formats.ccda.batch import CCDABatchGenerator, CCDABatchResult, CCDARecord
 from patientsim.formats.ccda.header import HeaderBuilder
 from patientsim.formats.ccda.narratives import NarrativeBuilder
 from patientsim.formats.ccda.sections import SectionBuilder
@@ -47,6 +53,10 @@ __all__ = [
     "CCDAConfig",
     "CCDATransformer",
     "DocumentType",
+    # Batch generation
+    "CCDABatchGenerator",
+    "CCDABatchResult",
+    "CCDARecord",
     # Builders
     "HeaderBuilder",
     "NarrativeBuilder",
@@ -0,0 +1,269 @@
+"""Batch C-CDA document generation.
+
+Generates one C-CDA document per patient for a whole cohort and writes each
+document as soon as it is built, either to a directory of per-patient files
+or to a zip archive, so memory stays bounded by the documents in flight
+rather than the cohort size.
+
+Documents are rendered in chunks, optionally across a process pool. Each
+worker builds its ``CCDATransformer`` (and the configuration-only header
+parts it caches) once, and chunks are written in input order, so output
+files are the same for any ``workers`` value.
+
+Example:
+    >>> from patientsim.formats.ccda import CCDABatchGenerator, CCDAConfig, CCDARecord
+    >>> generator = CCDABatchGenerator(config, workers=8)
+    >>> records = (
+    ...     CCDARecord(patient, encounters=[encounter], diagnoses=diagnoses)
+    ...     for patient, encounter, diagnoses in cohort
+    ... )
+    >>> result = generator.write_zip(records, "ccds.zip")
+    >>> result.documents
+    10000
+"""
+
+import os
+import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from healthsim.formats import chunked
+
+from patientsim.core.models import (
+    Diagnosis,
+    Encounter,
+    LabResult,
+    Medication,
+    Patient,
+    Procedure,
+    VitalSign,
+)
+from patientsim.formats.ccda.transformer import CCDAConfig, CCDATransformer
+
+# Records rendered per worker task
+DEFAULT_CHUNK_SIZE = 100
+
+
+@dataclass
+class CCDARecord:
+    """Clinical data for one patient's C-CDA document.
+
+    Attributes:
+        patient: Patient for the recordTarget
+        encounters: Encounters (the first is the encompassingEncounter)
+        diagnoses: Diagnoses for the Problems section
+        medications: Medications for the Medications section
+        labs: Lab results for the Results section
+        vitals: Vital signs for the Vital Signs section
+        procedures: Procedures for the Procedures section
+    """
+
+    patient: Patient
+    encounters: list[Encounter] = field(default_factory=list)
+    diagnoses: list[Diagnosis] = field(default_factory=list)
+    medications: list[Medication] = field(default_factory=list)
+    labs: list[LabResult] = field(default_factory=list)
+    vitals: list[VitalSign] = field(default_factory=list)
+    procedures: list[Procedure] = field(default_factory=list)
+
+
+@dataclass
+class CCDABatchResult:
+    """Summary of a batch C-CDA run.
+
+    Attributes:
+        documents: Documents written
+        bytes_written: Uncompressed size of all documents in bytes
+        output_path: Directory or zip archive the documents were written to
+    """
+
+    documents: int = 0
+    bytes_written: int = 0
+    output_path: Path | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "documents": self.documents,
+            "bytes_written": self.bytes_written,
+            "output_path": str(self.output_path) if self.output_path else None,
+        }
+
+
+# =============================================================================
+# Workers
+# =============================================================================
+
+# Transformer and document time of a worker process, set by _init_worker()
+_worker_transformer: CCDATransformer | None = None
+_worker_timestamp: datetime | None = None
+
+
+def _init_worker(config: CCDAConfig, timestamp: datetime) -> None:
+    """Build the transformer once per worker process."""
+    global _worker_transformer, _worker_timestamp
+    _worker_transformer = CCDATransformer(config)
+    _worker_timestamp = timestamp
+
+
+def _render_chunk(
+    transformer: CCDATransformer, timestamp: datetime, records: list[CCDARecord]
+) -> list[tuple[str, bytes]]:
+    """Render a chunk of records to ``(mrn, UTF-8 document)`` pairs."""
+    return [
+        (
+            record.patient.mrn,
+            transformer.transform(
+                record.patient,
+                record.encounters,
+                record.diagnoses,
+                record.medications,
+                record.labs,
+                record.vitals,
+                record.procedures,
+                timestamp=timestamp,
+            ).encode("utf-8"),
+        )
+        for record in records
+    ]
+
+
+def _render_worker_chunk(records: list[CCDARecord]) -> list[tuple[str, bytes]]:
+    """Render a chunk with the worker's transformer."""
+    return _render_chunk(_worker_transformer, _worker_timestamp, records)
+
+
+class CCDABatchGenerator:
+    """Generates C-CDA documents for a cohort, one document per patient.
+
+    Example:
+        >>> generator = CCDABatchGenerator(config, workers=4)
+        >>> generator.write_files(records, "./ccda")
+        >>> # Creates ./ccda/<mrn>.xml for every record
+    """
+
+    def __init__(
+        self,
+        config: CCDAConfig,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Initialize the batch generator.
+
+        Args:
+            config: C-CDA configuration settings
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            chunk_size: Records per worker task
+            timestamp: Document and author time for every document
+                (defaults to the start of each run)
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.timestamp = timestamp
+        self._transformer = CCDATransformer(config)
+
+    def iter_documents(self, records: Iterable[CCDARecord]) -> Iterator[tuple[str, bytes]]:
+        """Render documents lazily, in input order.
+
+        Records may come from any iterable (including a generator); they are
+        consumed in chunks, and at most ``2 * workers`` chunks are in flight.
+
+        Args:
+            records: Records to render
+
+        Yields:
+            ``(mrn, document)`` pairs, the document encoded as UTF-8
+        """
+        timestamp = self.timestamp or datetime.now()
+        chunks = chunked(records, self.chunk_size)
+
+        if self.workers == 1:
+            for chunk in chunks:
+                yield from _render_chunk(self._transformer, timestamp, chunk)
+            return
+
+        pending: deque[Future[list[tuple[str, bytes]]]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.config, timestamp),
+        ) as pool:
+            for chunk in chunks:
+                pending.append(pool.submit(_render_worker_chunk, chunk))
+                if len(pending) >= self.workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def write_files(
+        self,
+        records: Iterable[CCDARecord],
+        output_dir: str | Path,
+        on_file: Callable[[Path], None] | None = None,
+    ) -> CCDABatchResult:
+        """Write each document to ``<output_dir>/<mrn>.xml``.
+
+        Paths are not collected, so memory does not grow with the cohort;
+        pass ``on_file`` to receive each path as it is written.
+
+        Args:
+            records: Records to render
+            output_dir: Directory to write documents to
+            on_file: Called with the path of each file after it is written
+
+        Returns:
+            CCDABatchResult with document and byte counts
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        result = CCDABatchResult(output_path=output_path)
+
+        for mrn, document in self.iter_documents(records):
+            path = output_path / f"{mrn}.xml"
+            path.write_bytes(document)
+            result.documents += 1
+            result.bytes_written += len(document)
+            if on_file is not None:
+                on_file(path)
+
+        return result
+
+    def write_zip(
+        self,
+        records: Iterable[CCDARecord],
+        path: str | Path,
+        compression: int = zipfile.ZIP_DEFLATED,
+    ) -> CCDABatchResult:
+        """Write every document into a zip archive as ``<mrn>.xml``.
+
+        Args:
+            records: Records to render
+            path: Archive to create (overwritten if it exists)
+            compression: zipfile compression method
+
+        Returns:
+            CCDABatchResult with document and byte counts
+        """
+        archive_path = Path(path)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        result = CCDABatchResult(output_path=archive_path)
+
+        with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
+            for mrn, document in self.iter_documents(records):
+                archive.writestr(f"{mrn}.xml", document)
+                result.documents += 1
+                result.bytes_written += len(document)
+
+        return result
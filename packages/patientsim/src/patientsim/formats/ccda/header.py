@@ -40,21 +40,31 @@ class HeaderBuilder:
             config: C-CDA configuration settings
         """
         self.config = config
-
-    def build_header(self, patient: Patient, encounter: Encounter | None = None) -> str:
+        # The custodian depends only on the configuration; built on first use
+        self._custodian_xml: str | None = None
+
+    def build_header(
+        self,
+        patient: Patient,
+        encounter: Encounter | None = None,
+        timestamp: datetime | None = None,
+    ) -> str:
         """Build complete CDA header.
 
         Args:
             patient: Patient object for recordTarget
             encounter: Optional encounter for encompassingEncounter
+            timestamp: Author time (defaults to now)
 
         Returns:
             XML string containing header elements
         """
+        if self._custodian_xml is None:
+            self._custodian_xml = self._build_custodian()
         parts = [
             self._build_record_target(patient),
-            self._build_author(),
-            self._build_custodian(),
+            self._build_author(timestamp),
+            self._custodian_xml,
         ]
 
         if encounter:
@@ -87,10 +97,10 @@ class HeaderBuilder:
         address_xml = ""
         if hasattr(patient, "address") and patient.address:
             addr = patient.address
-            street = self._escape_xml(addr.get("street", ""))
-            city = self._escape_xml(addr.get("city", ""))
-            state = self._escape_xml(addr.get("state", ""))
-            postal = self._escape_xml(addr.get("postal_code", ""))
+            street = self._escape_xml(addr.street_address)
+            city = self._escape_xml(addr.city)
+            state = self._escape_xml(addr.state)
+            postal = self._escape_xml(addr.postal_code)
             address_xml = f"""<addr use="HP">
           <streetAddressLine>{street}</streetAddressLine>
           <city>{city}</city>
@@ -103,8 +113,8 @@ class HeaderBuilder:
 
         # Build telecom if available
         telecom_xml = ""
-        if hasattr(patient, "phone") and patient.phone:
-            telecom_xml = f'<telecom use="HP" value="tel:{patient.phone}"/>'
+        if patient.contact and patient.contact.phone:
+            telecom_xml = f'<telecom use="HP" value="tel:{patient.contact.phone}"/>'
         else:
             telecom_xml = '<telecom nullFlavor="UNK"/>'
 
@@ -124,13 +134,16 @@ class HeaderBuilder:
     </patientRole>
   </recordTarget>"""
 
-    def _build_author(self) -> str:
+    def _build_author(self, timestamp: datetime | None = None) -> str:
         """Build author element.
 
+        Args:
+            timestamp: Author time (defaults to now)
+
         Returns:
             XML string for author
         """
-        author_time = datetime.now().strftime("%Y%m%d%H%M%S")
+        author_time = (timestamp or datetime.now()).strftime("%Y%m%d%H%M%S")
         author_id = str(uuid.uuid4())
 
         # Author name
@@ -102,6 +102,18 @@ class CCDATransformer:
     VITAL_SIGNS_OBSERVATION_OID = "2.16.840.1.113883.10.20.22.4.27"
     PROCEDURE_ACTIVITY_OID = "2.16.840.1.113883.10.20.22.4.14"
 
+    # Vital sign observations: (VitalSign attribute, LOINC code, display name, unit)
+    VITAL_SIGN_OBSERVATIONS = (
+        ("systolic_bp", "8480-6", "Systolic blood pressure", "mm[Hg]"),
+        ("diastolic_bp", "8462-4", "Diastolic blood pressure", "mm[Hg]"),
+        ("heart_rate", "8867-4", "Heart rate", "/min"),
+        ("respiratory_rate", "9279-1", "Respiratory rate", "/min"),
+        ("temperature", "8310-5", "Body temperature", "[degF]"),
+        ("spo2", "2708-6", "Oxygen saturation", "%"),
+        ("height_cm", "8302-2", "Body height", "cm"),
+        ("weight_kg", "29463-7", "Body weight", "kg"),
+    )
+
     def __init__(self, config: CCDAConfig) -> None:
         """Initialize transformer with configuration.
 
@@ -120,6 +132,7 @@ class CCDATransformer:
         labs: list[LabResult] | None = None,
         vitals: list[VitalSign] | None = None,
         procedures: list[Procedure] | None = None,
+        timestamp: datetime | None = None,
     ) -> str:
         """Transform PatientSim data to C-CDA XML document.
 
@@ -131,18 +144,20 @@ class CCDATransformer:
             labs: List of lab results for Results section
             vitals: List of vital signs for Vital Signs section
             procedures: List of procedures for Procedures section
+            timestamp: Document and author time (defaults to now)
 
         Returns:
             C-CDA XML document as string
         """
         # Get primary encounter for header
         primary_encounter = encounters[0] if encounters else None
+        timestamp = timestamp or datetime.now()
 
         # Build document parts
         xml_parts = [
             '<?xml version="1.0" encoding="UTF-8"?>',
-            self._build_clinical_document_open(),
-            self._header_builder.build_header(patient, primary_encounter),
+            self._build_clinical_document_open(timestamp),
+            self._header_builder.build_header(patient, primary_encounter, timestamp),
             "<component>",
             "<structuredBody>",
         ]
@@ -174,11 +189,11 @@ class CCDATransformer:
 
         return "\n".join(xml_parts)
 
-    def _build_clinical_document_open(self) -> str:
+    def _build_clinical_document_open(self, timestamp: datetime | None = None) -> str:
         """Build opening ClinicalDocument element with namespaces and type info."""
         doc_type = self.config.document_type
         doc_id = self._generate_document_id()
-        effective_time = self._format_datetime(datetime.now())
+        effective_time = self._format_datetime(timestamp or datetime.now())
 
         return f"""<ClinicalDocument xmlns="urn:hl7-org:v3" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:sdtc="urn:hl7-org:sdtc">
   <realmCode code="US"/>
@@ -204,7 +219,7 @@ class CCDATransformer:
         # Build narrative table
         rows = []
         for diag in diagnoses:
-            status = "Active" if diag.is_active else "Resolved"
+            status = "Active" if diag.resolved_date is None else "Resolved"
             rows.append(
                 f"<tr><td>{self._escape_xml(diag.description)}</td>"
                 f"<td>{diag.code}</td><td>{status}</td></tr>"
@@ -244,7 +259,7 @@ class CCDATransformer:
         """
         entry_id = str(uuid.uuid4())
         obs_id = str(uuid.uuid4())
-        status_code = "active" if diag.is_active else "completed"
+        status_code = "active" if diag.resolved_date is None else "completed"
         onset_time = self._format_datetime(diag.diagnosed_date) if diag.diagnosed_date else ""
 
         return f"""<entry typeCode="DRIV">
@@ -281,8 +296,8 @@ class CCDATransformer:
         for med in medications:
             status = med.status if hasattr(med, "status") else "active"
             rows.append(
-                f"<tr><td>{self._escape_xml(med.drug_name)}</td>"
-                f"<td>{med.dose} {med.unit}</td>"
+                f"<tr><td>{self._escape_xml(med.name)}</td>"
+                f"<td>{self._escape_xml(med.dose)}</td>"
                 f"<td>{med.frequency}</td><td>{status}</td></tr>"
             )
 
@@ -336,21 +351,24 @@ class CCDATransformer:
             )
 
         # RxNorm code if available
-        rxnorm_code = med.rxnorm_code if hasattr(med, "rxnorm_code") and med.rxnorm_code else ""
+        rxnorm_code = med.code or ""
         code_system = self.RXNORM_OID if rxnorm_code else ""
 
+        # Dose is recorded as "<quantity> <unit>", e.g. "500 mg"
+        dose_value, _, dose_unit = med.dose.partition(" ")
+
         return f"""<entry typeCode="DRIV">
   <substanceAdministration classCode="SBADM" moodCode="EVN">
     <templateId root="{self.MEDICATION_ACTIVITY_OID}" extension="2014-06-09"/>
     <id root="{entry_id}"/>
     <statusCode code="{status_code}"/>
     {effective_time}
-    <doseQuantity value="{med.dose}" unit="{med.unit}"/>
+    <doseQuantity value="{self._escape_xml(dose_value)}" unit="{self._escape_xml(dose_unit)}"/>
     <consumable>
       <manufacturedProduct classCode="MANU">
         <templateId root="2.16.840.1.113883.10.20.22.4.23" extension="2014-06-09"/>
         <manufacturedMaterial>
-          <code code="{rxnorm_code}" codeSystem="{code_system}" codeSystemName="RxNorm" displayName="{self._escape_xml(med.drug_name)}"/>
+          <code code="{rxnorm_code}" codeSystem="{code_system}" codeSystemName="RxNorm" displayName="{self._escape_xml(med.name)}"/>
         </manufacturedMaterial>
       </manufacturedProduct>
     </consumable>
@@ -498,19 +516,8 @@ class CCDATransformer:
         # Build individual observations
         observations = []
 
-        # LOINC codes for vital signs
-        vital_mappings = [
-            ("systolic_bp", vital.systolic_bp, "8480-6", "Systolic blood pressure", "mm[Hg]"),
-            ("diastolic_bp", vital.diastolic_bp, "8462-4", "Diastolic blood pressure", "mm[Hg]"),
-            ("heart_rate", vital.heart_rate, "8867-4", "Heart rate", "/min"),
-            ("respiratory_rate", vital.respiratory_rate, "9279-1", "Respiratory rate", "/min"),
-            ("temperature", vital.temperature, "8310-5", "Body temperature", "[degF]"),
-            ("spo2", vital.spo2, "2708-6", "Oxygen saturation", "%"),
-            ("height_cm", vital.height_cm, "8302-2", "Body height", "cm"),
-            ("weight_kg", vital.weight_kg, "29463-7", "Body weight", "kg"),
-        ]
-
-        for _, value, loinc_code, display, unit in vital_mappings:
+        for attribute, loinc_code, display, unit in self.VITAL_SIGN_OBSERVATIONS:
+            value = getattr(vital, attribute)
             if value is not None:
                 obs_id = str(uuid.uuid4())
                 observations.append(
@@ -549,7 +556,7 @@ class CCDATransformer:
         # Build narrative table
         rows = []
         for proc in procedures:
-            proc_date = proc.procedure_date.strftime("%Y-%m-%d") if proc.procedure_date else ""
+            proc_date = proc.performed_date.strftime("%Y-%m-%d") if proc.performed_date else ""
             rows.append(
                 f"<tr><td>{self._escape_xml(proc.description)}</td>"
                 f"<td>{proc.code}</td><td>{proc_date}</td></tr>"
@@ -588,7 +595,7 @@ class CCDATransformer:
             XML string for procedure entry
         """
         entry_id = str(uuid.uuid4())
-        proc_time = self._format_datetime(proc.procedure_date) if proc.procedure_date else ""
+        proc_time = self._format_datetime(proc.performed_date) if proc.performed_date else ""
 
         # Determine code system (CPT vs SNOMED)
         code_system = self.SNOMED_OID
@@ -5,7 +5,10 @@ into FHIR R4 compatible resources and bundles.
 
 Features:
     - FHIRTransformer: Convert to FHIR R4 Bundle format
-    - FHIRBulkExporter: NDJSON export for FHIR Bulk Data Access
+    - FHIRBulkExporter: NDJSON export for FHIR Bulk Data Access, including
+      sharded process-parallel export from iterables or a DuckDB cohort
+    - FHIRSerializer: Fast-path JSON encoding straight from PatientSim models
+      (optional orjson backend), byte-identical to the Pydantic resources
 
 Example - Bundle Export:
     >>> from patientsim.formats.fhir import FHIRTransformer
@@ -27,11 +30,13 @@ from patientsim.formats.fhir.bulk_export import (
     ExportResult,
     FHIRBulkExporter,
 )
+from patientsim.formats.fhir.serializers import FHIRSerializer
 from patientsim.formats.fhir.transformer import FHIRTransformer
 
 __all__ = [
     "FHIRTransformer",
     "FHIRBulkExporter",
+    "FHIRSerializer",
     "BulkExportManifest",
     "ExportResult",
 ]
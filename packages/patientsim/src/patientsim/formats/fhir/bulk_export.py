@@ -26,16 +26,31 @@ Example:
     #   ./fhir_export/Encounter.ndjson
     #   ./fhir_export/Condition.ndjson
     #   ./fhir_export/Observation.ndjson
+
+Example - Sharded parallel export:
+    >>> result = exporter.export_sharded(
+    ...     output_dir="./fhir_export",
+    ...     patients=iter_patients(),  # any iterable, consumed lazily
+    ...     workers=8,
+    ...     max_shard_bytes=64 * 1024 * 1024,
+    ... )
+    # Creates Patient.000.ndjson, Patient.001.ndjson, ... plus manifest.json
 """
 
 import gzip
 import json
-from collections.abc import Iterator
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import IO, Any
 
+from healthsim.formats import chunked
+from healthsim.person import Address, ContactInfo, PersonName
+
 from patientsim.core.models import (
     Diagnosis,
     Encounter,
@@ -44,8 +59,13 @@ from patientsim.core.models import (
     Patient,
     VitalSign,
 )
+from patientsim.formats.fhir.serializers import BACKEND_AUTO, FHIRSerializer
 from patientsim.formats.fhir.transformer import FHIRTransformer
 
+# Defaults for sharded export
+DEFAULT_SHARD_BYTES = 256 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 2000
+
 
 @dataclass
 class BulkExportManifest:
@@ -98,6 +118,217 @@ class ExportResult:
     files_created: list[Path]
 
 
+# =============================================================================
+# Sharded Export Workers
+# =============================================================================
+
+# Source name -> FHIR resource type written for it (labs and vitals share
+# the Observation shards)
+SOURCE_RESOURCE_TYPES = {
+    "patients": "Patient",
+    "encounters": "Encounter",
+    "diagnoses": "Condition",
+    "labs": "Observation",
+    "vitals": "Observation",
+}
+
+# Source name -> canonical DuckDB table used by export_cohort
+SOURCE_TABLES = {
+    "patients": "patients",
+    "encounters": "encounters",
+    "diagnoses": "diagnoses",
+    "labs": "lab_results",
+    "vitals": "vital_signs",
+}
+
+# Columns that are not part of the model (provenance and surrogate ids)
+_NON_MODEL_COLUMNS = frozenset(
+    {
+        "id",
+        "cohort_id",
+        "created_at",
+        "source_type",
+        "source_system",
+        "skill_used",
+        "generation_seed",
+    }
+)
+
+
+def _patient_from_row(row: dict[str, Any]) -> Patient:
+    """Build a Patient from a row of the canonical patients table."""
+    address = None
+    if any(row.get(k) for k in ("street_address", "city", "state", "postal_code")):
+        address = Address(
+            street_address=row.get("street_address"),
+            street_address_2=row.get("street_address_2"),
+            city=row.get("city"),
+            state=row.get("state"),
+            postal_code=row.get("postal_code"),
+            country=row.get("country") or "US",
+        )
+    contact = None
+    if any(row.get(k) for k in ("phone", "phone_mobile", "email")):
+        contact = ContactInfo(
+            phone=row.get("phone"),
+            phone_mobile=row.get("phone_mobile"),
+            email=row.get("email"),
+        )
+    return Patient(
+        id=row["id"],
+        mrn=row["mrn"],
+        ssn=row.get("ssn"),
+        name=PersonName(
+            given_name=row["given_name"],
+            middle_name=row.get("middle_name"),
+            family_name=row["family_name"],
+            suffix=row.get("suffix"),
+            prefix=row.get("prefix"),
+        ),
+        birth_date=row["birth_date"],
+        gender=row["gender"],
+        address=address,
+        contact=contact,
+        race=row.get("race"),
+        language=row.get("language") or "en",
+        deceased=bool(row.get("deceased")),
+        death_date=row.get("death_date"),
+    )
+
+
+def _model_fields(row: dict[str, Any]) -> dict[str, Any]:
+    """Drop provenance columns and NULLs so model defaults apply."""
+    return {k: v for k, v in row.items() if k not in _NON_MODEL_COLUMNS and v is not None}
+
+
+def _diagnosis_from_row(row: dict[str, Any]) -> Diagnosis:
+    """Build a Diagnosis from a row of the canonical diagnoses table."""
+    fields = _model_fields(row)
+    fields.setdefault("description", fields["code"])
+    return Diagnosis(**fields)
+
+
+# Source name -> builder for rows read from DuckDB
+_ROW_LOADERS = {
+    "patients": _patient_from_row,
+    "encounters": lambda row: Encounter(**_model_fields(row)),
+    "diagnoses": _diagnosis_from_row,
+    "labs": lambda row: LabResult(**_model_fields(row)),
+    "vitals": lambda row: VitalSign(**_model_fields(row)),
+}
+
+
+def _encode_items(serializer: FHIRSerializer, source: str, items: Iterable[Any]) -> Iterator[bytes]:
+    """Yield one encoded FHIR resource (no trailing newline) per output line."""
+    if source == "patients":
+        for patient in items:
+            yield serializer.patient(patient)
+    elif source == "encounters":
+        for encounter in items:
+            yield serializer.encounter(encounter)
+    elif source == "diagnoses":
+        for diagnosis in items:
+            yield serializer.condition(diagnosis)
+    elif source == "labs":
+        for lab in items:
+            line = serializer.lab_observation(lab)
+            if line is not None:  # Skip if no LOINC mapping
+                yield line
+    else:
+        for vital in items:
+            yield from serializer.vital_observations(vital)
+
+
+def _transform_chunk(
+    source: str,
+    items: list[Any],
+    columns: list[str] | None,
+    compress: bool,
+    backend: str = BACKEND_AUTO,
+) -> tuple[bytes, int]:
+    """Transform a chunk of models (or DuckDB rows) into NDJSON bytes.
+
+    Runs in a worker process. When ``compress`` is set the chunk comes back
+    as a complete gzip member, so the parent only appends bytes to a shard
+    (concatenated members are a valid gzip stream).
+
+    Args:
+        source: Source name (key of SOURCE_RESOURCE_TYPES)
+        items: Model objects, or row tuples when ``columns`` is given
+        columns: Column names for row tuples read from DuckDB
+        compress: Whether to gzip the chunk
+        backend: FHIRSerializer encoder backend
+
+    Returns:
+        Tuple of (encoded chunk, number of resources in it)
+    """
+    # Resource ids are uuid5-derived, so a fresh serializer per chunk gives
+    # the same ids as a shared one while keeping its id map from growing
+    serializer = FHIRSerializer(backend=backend)
+    if columns is not None:
+        loader = _ROW_LOADERS[source]
+        items = [loader(dict(zip(columns, row, strict=True))) for row in items]
+
+    lines = list(_encode_items(serializer, source, items))
+    if not lines:
+        return b"", 0
+
+    payload = b"\n".join(lines) + b"\n"
+    if compress:
+        # mtime=0 keeps the output byte-for-byte reproducible
+        payload = gzip.compress(payload, compresslevel=6, mtime=0)
+    return payload, len(lines)
+
+
+class _ShardWriter:
+    """Append encoded chunks to size-capped shard files for one resource type.
+
+    Each chunk is appended with its own ``with open(...)``, so no file handle
+    outlives a write, even if the export fails part way.
+    """
+
+    def __init__(self, output_dir: Path, resource_type: str, compress: bool, max_bytes: int):
+        self.output_dir = output_dir
+        self.resource_type = resource_type
+        self.suffix = ".ndjson.gz" if compress else ".ndjson"
+        self.max_bytes = max_bytes
+        self.shards: list[dict[str, Any]] = []
+        self.paths: list[Path] = []
+        self._path: Path | None = None
+        self._size = 0
+
+    def write(self, payload: bytes, count: int) -> None:
+        """Write one chunk, rolling to a new shard if it would overflow.
+
+        A chunk is never split, so a shard only exceeds ``max_bytes`` when a
+        single chunk is larger than the cap.
+        """
+        if self._path is not None and self._size + len(payload) > self.max_bytes:
+            self.close()
+        mode = "ab"
+        if self._path is None:
+            self._path = (
+                self.output_dir / f"{self.resource_type}.{len(self.shards):03d}{self.suffix}"
+            )
+            mode = "wb"
+            self._size = 0
+            self.paths.append(self._path)
+            self.shards.append({"type": self.resource_type, "url": str(self._path), "count": 0})
+        with open(self._path, mode) as f:
+            f.write(payload)
+        self._size += len(payload)
+        self.shards[-1]["count"] += count
+
+    def close(self) -> None:
+        """Finish the current shard, if any; the next write starts a new one."""
+        self._path = None
+
+    @property
+    def count(self) -> int:
+        """Total resources written across all shards."""
+        return sum(shard["count"] for shard in self.shards)
+
+
 class FHIRBulkExporter:
     """Export FHIR resources in NDJSON format for Bulk Data Access.
 
@@ -131,16 +362,19 @@ class FHIRBulkExporter:
         "MedicationRequest": "MedicationRequest.ndjson",
     }
 
-    def __init__(self, compress: bool = False) -> None:
+    def __init__(self, compress: bool = False, backend: str = BACKEND_AUTO) -> None:
         """Initialize bulk exporter.
 
         Args:
             compress: Whether to gzip compress output files
+            backend: JSON encoder for FHIRSerializer ("auto", "json" or "orjson")
         """
         self.compress = compress
+        self.backend = backend
         self._transformer = FHIRTransformer()
+        self._serializer = FHIRSerializer(self._transformer, backend=backend)
 
-    def _open_file(self, path: Path) -> IO[str]:
+    def _open_file(self, path: Path) -> IO[bytes]:
         """Open file for writing, with optional compression.
 
         Args:
@@ -151,22 +385,26 @@ class FHIRBulkExporter:
         """
         if self.compress:
             path = path.with_suffix(path.suffix + ".gz")
-            return gzip.open(path, "wt", encoding="utf-8")
-        return open(path, "w", encoding="utf-8")
+            return gzip.open(path, "wb")
+        return open(path, "wb")
 
-    def _write_resource(self, file: IO[str], resource: Any) -> None:
-        """Write a single resource as NDJSON line.
+    def _write_lines(self, file: IO[bytes], source: str, items: Iterable[Any]) -> int:
+        """Write the NDJSON lines for one source to an open file.
 
         Args:
-            file: File handle to write to
-            resource: Pydantic model or dict to serialize
+            file: Binary file handle to write to
+            source: Source name ("patients", "encounters", "diagnoses", "labs", "vitals")
+            items: Domain models to serialize
+
+        Returns:
+            Number of resources written
         """
-        if hasattr(resource, "model_dump"):
-            data = resource.model_dump(by_alias=True, exclude_none=True)
-        else:
-            data = resource
-        json_line = json.dumps(data, separators=(",", ":"))
-        file.write(json_line + "\n")
+        count = 0
+        for line in _encode_items(self._serializer, source, items):
+            file.write(line)
+            file.write(b"\n")
+            count += 1
+        return count
 
     def export_patients(
         self,
@@ -182,13 +420,8 @@ class FHIRBulkExporter:
         Returns:
             Number of resources exported
         """
-        count = 0
         with self._open_file(output_file) as f:
-            for patient in patients:
-                resource = self._transformer.transform_patient(patient)
-                self._write_resource(f, resource)
-                count += 1
-        return count
+            return self._write_lines(f, "patients", patients)
 
     def export_encounters(
         self,
@@ -204,13 +437,8 @@ class FHIRBulkExporter:
         Returns:
             Number of resources exported
         """
-        count = 0
         with self._open_file(output_file) as f:
-            for encounter in encounters:
-                resource = self._transformer.transform_encounter(encounter)
-                self._write_resource(f, resource)
-                count += 1
-        return count
+            return self._write_lines(f, "encounters", encounters)
 
     def export_conditions(
         self,
@@ -226,13 +454,8 @@ class FHIRBulkExporter:
         Returns:
             Number of resources exported
         """
-        count = 0
         with self._open_file(output_file) as f:
-            for diagnosis in diagnoses:
-                resource = self._transformer.transform_condition(diagnosis)
-                self._write_resource(f, resource)
-                count += 1
-        return count
+            return self._write_lines(f, "diagnoses", diagnoses)
 
     def export_observations(
         self,
@@ -259,19 +482,11 @@ class FHIRBulkExporter:
         with self._open_file(output_file) as f:
             # Export lab observations
             if labs:
-                for lab in labs:
-                    resource = self._transformer.transform_lab_observation(lab)
-                    if resource:  # Skip if no LOINC mapping
-                        self._write_resource(f, resource)
-                        count += 1
+                count += self._write_lines(f, "labs", labs)
 
             # Export vital sign observations
             if vitals:
-                for vital in vitals:
-                    vital_obs = self._transformer.transform_vital_observations(vital)
-                    for resource in vital_obs:
-                        self._write_resource(f, resource)
-                        count += 1
+                count += self._write_lines(f, "vitals", vitals)
 
         return count
 
@@ -411,38 +626,20 @@ class FHIRBulkExporter:
         Yields:
             NDJSON lines (JSON string + newline)
         """
-        if resource_type == "Patient" and patients:
-            for patient in patients:
-                resource = self._transformer.transform_patient(patient)
-                data = resource.model_dump(by_alias=True, exclude_none=True)
-                yield json.dumps(data, separators=(",", ":")) + "\n"
-
-        elif resource_type == "Encounter" and encounters:
-            for encounter in encounters:
-                resource = self._transformer.transform_encounter(encounter)
-                data = resource.model_dump(by_alias=True, exclude_none=True)
-                yield json.dumps(data, separators=(",", ":")) + "\n"
-
-        elif resource_type == "Condition" and diagnoses:
-            for diagnosis in diagnoses:
-                resource = self._transformer.transform_condition(diagnosis)
-                data = resource.model_dump(by_alias=True, exclude_none=True)
-                yield json.dumps(data, separators=(",", ":")) + "\n"
-
+        sources: list[tuple[str, Any]] = []
+        if resource_type == "Patient":
+            sources = [("patients", patients)]
+        elif resource_type == "Encounter":
+            sources = [("encounters", encounters)]
+        elif resource_type == "Condition":
+            sources = [("diagnoses", diagnoses)]
         elif resource_type == "Observation":
-            if labs:
-                for lab in labs:
-                    resource = self._transformer.transform_lab_observation(lab)
-                    if resource:
-                        data = resource.model_dump(by_alias=True, exclude_none=True)
-                        yield json.dumps(data, separators=(",", ":")) + "\n"
+            sources = [("labs", labs), ("vitals", vitals)]
 
-            if vitals:
-                for vital in vitals:
-                    vital_obs = self._transformer.transform_vital_observations(vital)
-                    for resource in vital_obs:
-                        data = resource.model_dump(by_alias=True, exclude_none=True)
-                        yield json.dumps(data, separators=(",", ":")) + "\n"
+        for source, items in sources:
+            if items:
+                for line in _encode_items(self._serializer, source, items):
+                    yield line.decode("utf-8") + "\n"
 
     def to_ndjson_string(
         self,
@@ -485,3 +682,217 @@ class FHIRBulkExporter:
             result["Observation"] = "".join(lines)
 
         return result
+
+    # =========================================================================
+    # Sharded Parallel Export
+    # =========================================================================
+
+    def export_sharded(
+        self,
+        output_dir: str | Path,
+        patients: Iterable[Patient] | None = None,
+        encounters: Iterable[Encounter] | None = None,
+        diagnoses: Iterable[Diagnosis] | None = None,
+        labs: Iterable[LabResult] | None = None,
+        vitals: Iterable[VitalSign] | None = None,
+        workers: int | None = None,
+        max_shard_bytes: int = DEFAULT_SHARD_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        create_manifest: bool = True,
+    ) -> ExportResult:
+        """Export resources to size-capped NDJSON shards using a process pool.
+
+        Inputs may be any iterables (including generators); they are consumed
+        in chunks of ``chunk_size``, so memory stays bounded by the number of
+        chunks in flight rather than the export size. Each chunk is
+        transformed, serialized and (optionally) gzipped in a worker process.
+        Chunks are written in input order, so output is identical for any
+        ``workers`` value.
+
+        Shards are named ``<Type>.<NNN>.ndjson[.gz]`` and the manifest lists
+        one output entry per shard.
+
+        Args:
+            output_dir: Directory to write shards and manifest to
+            patients: Patient objects
+            encounters: Encounter objects
+            diagnoses: Diagnosis objects
+            labs: LabResult objects
+            vitals: VitalSign objects
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            max_shard_bytes: Roll to a new shard before a chunk would push
+                the current one past this size (bytes on disk)
+            chunk_size: Input items per worker task
+            create_manifest: Whether to write manifest.json
+
+        Returns:
+            ExportResult with per-type counts and every shard written
+        """
+        sources = {
+            "patients": patients,
+            "encounters": encounters,
+            "diagnoses": diagnoses,
+            "labs": labs,
+            "vitals": vitals,
+        }
+        chunks = (
+            (source, chunk, None)
+            for source, items in sources.items()
+            if items is not None
+            for chunk in chunked(items, chunk_size)
+        )
+        return self._write_shards(
+            output_dir, chunks, workers, max_shard_bytes, chunk_size, create_manifest
+        )
+
+    def export_cohort(
+        self,
+        cohort_id: str,
+        output_dir: str | Path,
+        conn: Any = None,
+        workers: int | None = None,
+        max_shard_bytes: int = DEFAULT_SHARD_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        create_manifest: bool = True,
+    ) -> ExportResult:
+        """Export a persisted cohort from DuckDB to sharded NDJSON.
+
+        Rows are read from the canonical tables (patients, encounters,
+        diagnoses, lab_results, vital_signs) with ``fetchmany``, and the raw
+        row tuples are shipped to workers, which build the models there.
+        Tables missing from the database are skipped.
+
+        Args:
+            cohort_id: Cohort whose rows to export
+            output_dir: Directory to write shards and manifest to
+            conn: DuckDB connection (default: healthsim.db.get_connection())
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            max_shard_bytes: Maximum shard size in bytes on disk
+            chunk_size: Rows per worker task
+            create_manifest: Whether to write manifest.json
+
+        Returns:
+            ExportResult with per-type counts and every shard written
+        """
+        if conn is None:
+            from healthsim.db import get_connection
+
+            conn = get_connection()
+
+        existing = {
+            row[0]
+            for row in conn.execute(
+                "SELECT table_name FROM information_schema.tables"
+            ).fetchall()
+        }
+
+        def chunks() -> Iterator[tuple[str, list[Any], list[str]]]:
+            for source, table in SOURCE_TABLES.items():
+                if table not in existing:
+                    continue
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT * FROM {table} WHERE cohort_id = ? ORDER BY rowid",
+                    [cohort_id],
+                )
+                columns = [desc[0] for desc in cursor.description]
+                while rows := cursor.fetchmany(chunk_size):
+                    yield source, rows, columns
+                cursor.close()
+
+        return self._write_shards(
+            output_dir, chunks(), workers, max_shard_bytes, chunk_size, create_manifest
+        )
+
+    def _write_shards(
+        self,
+        output_dir: str | Path,
+        chunks: Iterator[tuple[str, list[Any], list[str] | None]],
+        workers: int | None,
+        max_shard_bytes: int,
+        chunk_size: int,
+        create_manifest: bool,
+    ) -> ExportResult:
+        """Transform chunks (in a pool if workers > 1) and write them to shards."""
+        if max_shard_bytes <= 0:
+            raise ValueError("max_shard_bytes must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        workers = workers or os.cpu_count() or 1
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        writers: dict[str, _ShardWriter] = {}
+
+        def write(source: str, payload: bytes, count: int) -> None:
+            if not count:
+                return
+            resource_type = SOURCE_RESOURCE_TYPES[source]
+            writer = writers.get(resource_type)
+            if writer is None:
+                writer = _ShardWriter(output_path, resource_type, self.compress, max_shard_bytes)
+                writers[resource_type] = writer
+            writer.write(payload, count)
+
+        try:
+            if workers == 1:
+                for source, items, columns in chunks:
+                    write(
+                        source,
+                        *_transform_chunk(source, items, columns, self.compress, self.backend),
+                    )
+            else:
+                # Bound the chunks in flight so a lazy input stays lazy, and
+                # drain them in submission order for deterministic shards
+                pending: deque[tuple[str, Future[tuple[bytes, int]]]] = deque()
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for source, items, columns in chunks:
+                        pending.append(
+                            (
+                                source,
+                                pool.submit(
+                                    _transform_chunk,
+                                    source,
+                                    items,
+                                    columns,
+                                    self.compress,
+                                    self.backend,
+                                ),
+                            )
+                        )
+                        if len(pending) >= workers * 2:
+                            done_source, future = pending.popleft()
+                            write(done_source, *future.result())
+                    while pending:
+                        done_source, future = pending.popleft()
+                        write(done_source, *future.result())
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        resource_counts: dict[str, int] = {}
+        files_created: list[Path] = []
+        manifest_output: list[dict[str, Any]] = []
+        for resource_type, writer in writers.items():
+            resource_counts[resource_type] = writer.count
+            files_created.extend(writer.paths)
+            manifest_output.extend(writer.shards)
+
+        manifest = BulkExportManifest(
+            transactionTime=datetime.now().isoformat(),
+            output=manifest_output,
+        )
+
+        if create_manifest:
+            manifest_path = output_path / "manifest.json"
+            with open(manifest_path, "w") as f:
+                json.dump(manifest.to_dict(), f, indent=2)
+            files_created.append(manifest_path)
+
+        return ExportResult(
+            output_dir=output_path,
+            manifest=manifest,
+            resource_counts=resource_counts,
+            total_resources=sum(resource_counts.values()),
+            files_created=files_created,
+        )
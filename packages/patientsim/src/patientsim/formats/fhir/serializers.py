@@ -0,0 +1,412 @@
+"""Fast-path FHIR R4 serialization.
+
+Builds FHIR JSON for PatientSim domain models as plain dicts and encodes
+them directly, skipping the Pydantic resource models (construction,
+validation and ``model_dump``) that FHIRTransformer goes through. Output is
+byte-for-byte identical to::
+
+    json.dumps(resource.model_dump(by_alias=True, exclude_none=True), separators=(",", ":"))
+
+Constant fragments (codings, categories, LOINC codes) are built once per
+serializer and shared between resources.
+
+When orjson is installed it is used as the encoder. json.dumps escapes
+non-ASCII text and writes ``NaN``, while orjson emits raw UTF-8 and ``null``.
+The two also format floats differently outside 1e-4 <= |x| < 1e16
+(``1e-05`` vs ``0.00001``, ``2e+16`` vs ``2e16``). So a resource whose
+orjson output is not pure ASCII, or whose quantity value is non-finite or
+outside that range, is re-encoded with the stdlib to keep the bytes
+identical.
+
+Example:
+    >>> from patientsim.formats.fhir import FHIRSerializer
+    >>> serializer = FHIRSerializer()
+    >>> line = serializer.patient(patient)  # bytes, no trailing newline
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from patientsim.core.models import (
+    Diagnosis,
+    Encounter,
+    LabResult,
+    Patient,
+    VitalSign,
+)
+from patientsim.formats.fhir.resources import (
+    CodeSystems,
+    create_coding,
+    get_loinc_code,
+    get_vital_loinc,
+)
+from patientsim.formats.fhir.transformer import FHIRTransformer
+
+# Encoder backends
+BACKEND_AUTO = "auto"
+BACKEND_JSON = "json"
+BACKEND_ORJSON = "orjson"
+
+_GENDER_MAP = {"M": "male", "F": "female", "O": "other", "U": "unknown"}
+
+_ENCOUNTER_STATUSES = frozenset({"planned", "in-progress", "finished", "cancelled"})
+
+_ENCOUNTER_CLASSES = {
+    "I": ("IMP", "inpatient encounter"),
+    "O": ("AMB", "ambulatory"),
+    "E": ("EMER", "emergency"),
+    "U": ("OBSENC", "observation encounter"),
+}
+
+# (vital type, model attribute, unit), in transform_vital_observations order
+_VITAL_FIELDS = (
+    ("temperature", "temperature", "F"),
+    ("heart_rate", "heart_rate", "bpm"),
+    ("respiratory_rate", "respiratory_rate", "/min"),
+    ("systolic_bp", "systolic_bp", "mm[Hg]"),
+    ("diastolic_bp", "diastolic_bp", "mm[Hg]"),
+    ("spo2", "spo2", "%"),
+    ("height", "height_cm", "cm"),
+    ("weight", "weight_kg", "kg"),
+)
+
+
+def _concept(system: str, code: str, display: str | None = None) -> dict[str, Any]:
+    """Dict form of create_codeable_concept() after model_dump(exclude_none=True)."""
+    concept: dict[str, Any] = {"coding": [create_coding(system, code, display)]}
+    if display:
+        concept["text"] = display
+    return concept
+
+
+def _quantity(value: float, unit: str | None) -> dict[str, Any]:
+    """Dict form of a UCUM Quantity after model_dump(exclude_none=True)."""
+    quantity: dict[str, Any] = {"value": value}
+    if unit is not None:
+        quantity["unit"] = unit
+    quantity["system"] = CodeSystems.UCUM
+    if unit is not None:
+        quantity["code"] = unit
+    return quantity
+
+
+def _dumps_stdlib(data: dict[str, Any]) -> bytes:
+    """Encode exactly as the Pydantic export path does."""
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_float_matches(value: float) -> bool:
+    """Whether orjson writes a float exactly as json.dumps does.
+
+    Both write the shortest round-trip digits, but outside
+    1e-4 <= |x| < 1e16 they use different notations, and orjson writes
+    null for NaN and infinities (which fail both comparisons here).
+    """
+    magnitude = abs(value)
+    return magnitude == 0 or 1e-4 <= magnitude < 1e16
+
+
+def _dumps_orjson(data: dict[str, Any]) -> bytes:
+    """Encode with orjson, falling back where its output would differ."""
+    encoded = orjson.dumps(data)
+    if encoded.isascii():
+        return encoded
+    return _dumps_stdlib(data)
+
+
+class FHIRSerializer:
+    """Serialize PatientSim models straight to FHIR R4 JSON bytes.
+
+    Resource ids come from a FHIRTransformer, so references and ids match
+    the ones the transformer would assign.
+
+    Attributes:
+        backend: Encoder in use ("json" or "orjson")
+    """
+
+    def __init__(
+        self,
+        transformer: FHIRTransformer | None = None,
+        backend: str = BACKEND_AUTO,
+    ) -> None:
+        """Initialize serializer.
+
+        Args:
+            transformer: Transformer whose resource ids to share (default: new one)
+            backend: "auto" (orjson if installed), "json" or "orjson"
+
+        Raises:
+            ValueError: If backend is unknown, or "orjson" is requested but
+                orjson is not installed
+        """
+        if backend == BACKEND_AUTO:
+            backend = BACKEND_ORJSON if orjson is not None else BACKEND_JSON
+        if backend not in (BACKEND_JSON, BACKEND_ORJSON):
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == BACKEND_ORJSON and orjson is None:
+            raise ValueError("orjson backend requested but orjson is not installed")
+
+        self.backend = backend
+        self._dumps = _dumps_orjson if backend == BACKEND_ORJSON else _dumps_stdlib
+        self._transformer = transformer or FHIRTransformer()
+        self._resource_id = self._transformer._get_resource_id
+
+        # Compiled constant fragments, shared by every resource
+        self._encounter_classes = {
+            code: _concept(CodeSystems.ENCOUNTER_CLASS, fhir_code, display)
+            for code, (fhir_code, display) in _ENCOUNTER_CLASSES.items()
+        }
+        self._condition_clinical = _concept(CodeSystems.CONDITION_CLINICAL, "active", "Active")
+        self._condition_verification = _concept(
+            CodeSystems.CONDITION_VERIFICATION, "confirmed", "Confirmed"
+        )
+        self._condition_category = [
+            _concept(
+                "http://terminology.hl7.org/CodeSystem/condition-category",
+                "encounter-diagnosis",
+                "Encounter Diagnosis",
+            )
+        ]
+        self._lab_category = [
+            _concept(CodeSystems.OBSERVATION_CATEGORY, "laboratory", "Laboratory")
+        ]
+        self._vital_category = [
+            _concept(CodeSystems.OBSERVATION_CATEGORY, "vital-signs", "Vital Signs")
+        ]
+        self._loinc_concepts: dict[tuple[str, str], dict[str, Any]] = {}
+        self._vital_plan = []
+        for vital_type, attr, unit in _VITAL_FIELDS:
+            loinc_info = get_vital_loinc(vital_type)
+            if loinc_info:
+                self._vital_plan.append((attr, unit, loinc_info[0], self._loinc_concept(loinc_info)))
+
+    def _loinc_concept(self, loinc_info: tuple[str, str]) -> dict[str, Any]:
+        """Return the shared LOINC CodeableConcept for a (code, display) pair."""
+        concept = self._loinc_concepts.get(loinc_info)
+        if concept is None:
+            concept = _concept(CodeSystems.LOINC, *loinc_info)
+            self._loinc_concepts[loinc_info] = concept
+        return concept
+
+    # =========================================================================
+    # Resource Builders
+    # =========================================================================
+
+    def patient_dict(self, patient: Patient) -> dict[str, Any]:
+        """Build the FHIR Patient dict for a Patient.
+
+        Args:
+            patient: PatientSim Patient object
+
+        Returns:
+            Dict equal to transform_patient(patient).model_dump(...)
+        """
+        given = patient.name.given_name
+        family = patient.name.family_name
+        data: dict[str, Any] = {
+            "resourceType": "Patient",
+            "id": self._resource_id("Patient", patient.mrn),
+            "identifier": [
+                {"system": CodeSystems.PATIENT_MRN, "value": patient.mrn, "use": "usual"}
+            ],
+            "name": [
+                {
+                    "use": "official",
+                    "family": family,
+                    "given": [given],
+                    "text": f"{given} {family}",
+                }
+            ],
+            "gender": _GENDER_MAP.get(patient.gender, "unknown"),
+            "birthDate": patient.birth_date.isoformat(),
+        }
+        if patient.deceased:
+            if patient.death_date:
+                data["deceasedDateTime"] = patient.death_date.isoformat()
+            else:
+                data["deceasedBoolean"] = True
+        return data
+
+    def encounter_dict(self, encounter: Encounter) -> dict[str, Any]:
+        """Build the FHIR Encounter dict for an Encounter.
+
+        Args:
+            encounter: PatientSim Encounter object
+
+        Returns:
+            Dict equal to transform_encounter(encounter).model_dump(...)
+        """
+        status = encounter.status if encounter.status in _ENCOUNTER_STATUSES else "finished"
+        data: dict[str, Any] = {
+            "resourceType": "Encounter",
+            "id": self._resource_id("Encounter", encounter.encounter_id),
+            "identifier": [{"system": CodeSystems.ENCOUNTER_ID, "value": encounter.encounter_id}],
+            "status": status,
+            "class": self._encounter_classes.get(
+                encounter.class_code, self._encounter_classes["O"]
+            ),
+            "type": [],
+            "subject": {
+                "reference": f"Patient/{self._resource_id('Patient', encounter.patient_mrn)}",
+                "display": f"Patient {encounter.patient_mrn}",
+            },
+        }
+        if encounter.admission_time:
+            period = {"start": encounter.admission_time.isoformat()}
+            if encounter.discharge_time:
+                period["end"] = encounter.discharge_time.isoformat()
+            data["period"] = period
+        data["reasonCode"] = (
+            [{"coding": [], "text": encounter.admitting_diagnosis}]
+            if encounter.admitting_diagnosis
+            else []
+        )
+        if encounter.discharge_disposition:
+            data["hospitalization"] = {
+                "dischargeDisposition": {"text": encounter.discharge_disposition}
+            }
+        return data
+
+    def condition_dict(self, diagnosis: Diagnosis) -> dict[str, Any]:
+        """Build the FHIR Condition dict for a Diagnosis.
+
+        Args:
+            diagnosis: PatientSim Diagnosis object
+
+        Returns:
+            Dict equal to transform_condition(diagnosis).model_dump(...)
+        """
+        mrn = diagnosis.patient_mrn
+        data: dict[str, Any] = {
+            "resourceType": "Condition",
+            "id": self._resource_id("Condition", f"{mrn}-{diagnosis.code}"),
+            "identifier": [],
+            "clinicalStatus": self._condition_clinical,
+            "verificationStatus": self._condition_verification,
+            "category": self._condition_category,
+            "code": _concept(CodeSystems.ICD10, diagnosis.code, diagnosis.description),
+            "subject": {"reference": f"Patient/{self._resource_id('Patient', mrn)}"},
+        }
+        if diagnosis.encounter_id:
+            encounter_id = self._resource_id("Encounter", diagnosis.encounter_id)
+            data["encounter"] = {"reference": f"Encounter/{encounter_id}"}
+        if diagnosis.diagnosed_date:
+            diagnosed = diagnosis.diagnosed_date.isoformat()
+            data["onsetDateTime"] = diagnosed
+            data["recordedDate"] = diagnosed
+        return data
+
+    def lab_observation_dict(self, lab: LabResult) -> dict[str, Any] | None:
+        """Build the FHIR Observation dict for a LabResult.
+
+        Args:
+            lab: PatientSim LabResult object
+
+        Returns:
+            Dict equal to transform_lab_observation(lab).model_dump(...),
+            or None if the test has no LOINC mapping
+        """
+        loinc_info = get_loinc_code(lab.test_name)
+        if not loinc_info:
+            return None
+        loinc_code = loinc_info[0]
+        effective = lab.collected_time.isoformat()
+        obs_id = f"{lab.patient_mrn}-lab-{loinc_code}-{effective}"
+        data: dict[str, Any] = {
+            "resourceType": "Observation",
+            "id": self._resource_id("Observation", obs_id),
+            "identifier": [],
+            "status": "final",
+            "category": self._lab_category,
+            "code": self._loinc_concept(loinc_info),
+            "subject": {"reference": f"Patient/{self._resource_id('Patient', lab.patient_mrn)}"},
+        }
+        if lab.encounter_id:
+            encounter_id = self._resource_id("Encounter", lab.encounter_id)
+            data["encounter"] = {"reference": f"Encounter/{encounter_id}"}
+        data["effectiveDateTime"] = effective
+        if lab.resulted_time:
+            data["issued"] = lab.resulted_time.isoformat()
+        try:
+            data["valueQuantity"] = _quantity(float(lab.value), lab.unit)
+        except (ValueError, TypeError):
+            data["valueString"] = lab.value
+        return data
+
+    def vital_observation_dicts(self, vital: VitalSign) -> list[dict[str, Any]]:
+        """Build FHIR Observation dicts for a VitalSign, one per measurement.
+
+        Args:
+            vital: PatientSim VitalSign object
+
+        Returns:
+            Dicts equal to the model_dump of transform_vital_observations(vital)
+        """
+        mrn = vital.patient_mrn
+        subject = {"reference": f"Patient/{self._resource_id('Patient', mrn)}"}
+        encounter = None
+        if vital.encounter_id:
+            encounter = {
+                "reference": f"Encounter/{self._resource_id('Encounter', vital.encounter_id)}"
+            }
+        effective = vital.observation_time.isoformat()
+
+        observations = []
+        for attr, unit, loinc_code, code in self._vital_plan:
+            value = getattr(vital, attr)
+            if value is None:
+                continue
+            data: dict[str, Any] = {
+                "resourceType": "Observation",
+                "id": self._resource_id("Observation", f"{mrn}-vital-{loinc_code}-{effective}"),
+                "identifier": [],
+                "status": "final",
+                "category": self._vital_category,
+                "code": code,
+                "subject": subject,
+            }
+            if encounter is not None:
+                data["encounter"] = encounter
+            data["effectiveDateTime"] = effective
+            data["valueQuantity"] = _quantity(float(value), unit)
+            observations.append(data)
+        return observations
+
+    # =========================================================================
+    # Encoders
+    # =========================================================================
+
+    def patient(self, patient: Patient) -> bytes:
+        """Serialize a Patient to FHIR Patient JSON bytes."""
+        return self._dumps(self.patient_dict(patient))
+
+    def encounter(self, encounter: Encounter) -> bytes:
+        """Serialize an Encounter to FHIR Encounter JSON bytes."""
+        return self._dumps(self.encounter_dict(encounter))
+
+    def condition(self, diagnosis: Diagnosis) -> bytes:
+        """Serialize a Diagnosis to FHIR Condition JSON bytes."""
+        return self._dumps(self.condition_dict(diagnosis))
+
+    def lab_observation(self, lab: LabResult) -> bytes | None:
+        """Serialize a LabResult to FHIR Observation JSON bytes (None if unmapped)."""
+        data = self.lab_observation_dict(lab)
+        if data is None:
+            return None
+        return self._dumps_observation(data)
+
+    def vital_observations(self, vital: VitalSign) -> list[bytes]:
+        """Serialize a VitalSign to FHIR Observation JSON bytes, one per measurement."""
+        return [self._dumps_observation(data) for data in self.vital_observation_dicts(vital)]
+
+    def _dumps_observation(self, data: dict[str, Any]) -> bytes:
+        """Encode an Observation, using the stdlib for values orjson writes differently."""
+        quantity = data.get("valueQuantity")
+        if quantity is not None and not _orjson_float_matches(quantity["value"]):
+            return _dumps_stdlib(data)
+        return self._dumps(data)
@@ -1,20 +1,74 @@
 """HL7v2 message generator.
 
-Generates HL7v2 ADT messages from PatientSim objects.
+Generates HL7v2 ADT messages from PatientSim objects, one at a time or as a
+stream written to a sink: an HL7 batch file (FHS/BHS ... BTS/FTS) or
+MLLP-framed messages.
 """
 
 import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import datetime
+from typing import TextIO
 
 from patientsim.core.models import Diagnosis, Encounter, Patient
 from patientsim.formats.hl7v2.segments import (
+    build_bhs_segment,
+    build_bts_segment,
     build_dg1_segment,
     build_evn_segment,
+    build_fhs_segment,
+    build_fts_segment,
     build_msh_segment,
     build_pid_segment,
     build_pv1_segment,
+    pid_segment_key,
 )
 
+# ADT trigger events supported by the generator
+ADT_EVENTS = ("A01", "A03", "A08")
+
+# Output framings supported by write_batch()
+FRAMINGS = ("batch", "mllp")
+
+# MLLP block delimiters: <VT> message <FS><CR>
+MLLP_START = "\x0b"
+MLLP_END = "\x1c\r"
+
+# Default messages per BHS/BTS batch
+DEFAULT_MESSAGES_PER_BATCH = 10_000
+
+# Default number of patients whose PID segment is kept for reuse
+DEFAULT_PID_CACHE_SIZE = 100_000
+
+# An ADT event to stream: (patient, encounter, event) with optional diagnoses
+ADTEvent = (
+    tuple[Patient, Encounter, str] | tuple[Patient, Encounter, str, Sequence[Diagnosis] | None]
+)
+
+
+@dataclass
+class HL7v2BatchResult:
+    """Summary of a streamed HL7v2 batch.
+
+    Attributes:
+        messages: ADT messages written
+        batches: BHS/BTS batches written (0 for MLLP framing)
+        pid_segments: PID segments built; the rest were reused from the cache
+    """
+
+    messages: int = 0
+    batches: int = 0
+    pid_segments: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "pid_segments": self.pid_segments,
+        }
+
 
 class HL7v2Generator:
     """Generates HL7v2 messages from PatientSim objects.
@@ -23,6 +77,12 @@ class HL7v2Generator:
         >>> generator = HL7v2Generator()
         >>> message = generator.generate_adt_a01(patient, encounter)
         >>> print(message)
+        >>>
+        >>> # Stream a year of ADT events to a batch file
+        >>> with open("adt.hl7", "w", newline="") as sink:
+        ...     generator.write_batch(
+        ...         ((p, e, "A01") for p, e in admissions), sink
+        ...     )
     """
 
     def __init__(
@@ -64,6 +124,78 @@ class HL7v2Generator:
         """
         return "\r".join(segments) + "\r"
 
+    def _adt_segments(
+        self,
+        event: str,
+        patient: Patient,
+        encounter: Encounter,
+        diagnoses: Sequence[Diagnosis] | None,
+        timestamp: datetime,
+        pid: str | None = None,
+    ) -> list[str]:
+        """Build the segments of an ADT message.
+
+        Args:
+            event: Trigger event (A01, A03 or A08)
+            patient: Patient object
+            encounter: Encounter object
+            diagnoses: Optional list of diagnoses
+            timestamp: Message timestamp
+            pid: Prebuilt PID segment for the patient
+
+        Returns:
+            MSH, EVN, PID, PV1 and DG1 segments
+
+        Raises:
+            ValueError: If the event is not supported
+        """
+        if event == "A01":
+            event_timestamp = encounter.admission_time or timestamp
+        elif event == "A03":
+            event_timestamp = encounter.discharge_time or timestamp
+        elif event == "A08":
+            event_timestamp = timestamp
+        else:
+            raise ValueError(f"event must be one of {', '.join(ADT_EVENTS)}, got '{event}'")
+
+        segments = [
+            # MSH - Message Header
+            build_msh_segment(
+                message_type="ADT",
+                trigger_event=event,
+                message_control_id=self._generate_message_control_id(),
+                timestamp=timestamp,
+                sending_application=self.sending_application,
+                sending_facility=self.sending_facility,
+                receiving_application=self.receiving_application,
+                receiving_facility=self.receiving_facility,
+            ),
+            # EVN - Event Type
+            build_evn_segment(event_type=event, event_timestamp=event_timestamp),
+            # PID - Patient Identification
+            pid or build_pid_segment(patient),
+            # PV1 - Patient Visit
+            build_pv1_segment(encounter),
+        ]
+
+        # DG1 - Diagnosis (optional)
+        if diagnoses:
+            for idx, diagnosis in enumerate(diagnoses, start=1):
+                if event == "A03":
+                    diagnosis_type = "F"  # Final diagnosis at discharge
+                else:
+                    diagnosis_type = "F" if diagnosis.type == "final" else "W"
+                segments.append(
+                    build_dg1_segment(
+                        diagnosis_code=diagnosis.code,
+                        diagnosis_text=diagnosis.description,
+                        set_id=idx,
+                        diagnosis_type=diagnosis_type,
+                    )
+                )
+
+        return segments
+
     def generate_adt_a01(
         self,
         patient: Patient,
@@ -83,51 +215,9 @@ class HL7v2Generator:
             HL7v2 ADT^A01 message
         """
         timestamp = timestamp or datetime.now()
-        event_timestamp = encounter.admission_time or timestamp
-        message_control_id = self._generate_message_control_id()
-
-        segments = []
-
-        # MSH - Message Header
-        msh = build_msh_segment(
-            message_type="ADT",
-            trigger_event="A01",
-            message_control_id=message_control_id,
-            timestamp=timestamp,
-            sending_application=self.sending_application,
-            sending_facility=self.sending_facility,
-            receiving_application=self.receiving_application,
-            receiving_facility=self.receiving_facility,
+        return self._build_message(
+            self._adt_segments("A01", patient, encounter, diagnoses, timestamp)
         )
-        segments.append(msh)
-
-        # EVN - Event Type
-        evn = build_evn_segment(
-            event_type="A01",
-            event_timestamp=event_timestamp,
-        )
-        segments.append(evn)
-
-        # PID - Patient Identification
-        pid = build_pid_segment(patient)
-        segments.append(pid)
-
-        # PV1 - Patient Visit
-        pv1 = build_pv1_segment(encounter)
-        segments.append(pv1)
-
-        # DG1 - Diagnosis (optional)
-        if diagnoses:
-            for idx, diagnosis in enumerate(diagnoses, start=1):
-                dg1 = build_dg1_segment(
-                    diagnosis_code=diagnosis.code,
-                    diagnosis_text=diagnosis.description,
-                    set_id=idx,
-                    diagnosis_type="F" if diagnosis.type == "final" else "W",
-                )
-                segments.append(dg1)
-
-        return self._build_message(segments)
 
     def generate_adt_a03(
         self,
@@ -148,51 +238,9 @@ class HL7v2Generator:
             HL7v2 ADT^A03 message
         """
         timestamp = timestamp or datetime.now()
-        event_timestamp = encounter.discharge_time or timestamp
-        message_control_id = self._generate_message_control_id()
-
-        segments = []
-
-        # MSH - Message Header
-        msh = build_msh_segment(
-            message_type="ADT",
-            trigger_event="A03",
-            message_control_id=message_control_id,
-            timestamp=timestamp,
-            sending_application=self.sending_application,
-            sending_facility=self.sending_facility,
-            receiving_application=self.receiving_application,
-            receiving_facility=self.receiving_facility,
-        )
-        segments.append(msh)
-
-        # EVN - Event Type
-        evn = build_evn_segment(
-            event_type="A03",
-            event_timestamp=event_timestamp,
+        return self._build_message(
+            self._adt_segments("A03", patient, encounter, diagnoses, timestamp)
         )
-        segments.append(evn)
-
-        # PID - Patient Identification
-        pid = build_pid_segment(patient)
-        segments.append(pid)
-
-        # PV1 - Patient Visit
-        pv1 = build_pv1_segment(encounter)
-        segments.append(pv1)
-
-        # DG1 - Diagnosis (optional)
-        if diagnoses:
-            for idx, diagnosis in enumerate(diagnoses, start=1):
-                dg1 = build_dg1_segment(
-                    diagnosis_code=diagnosis.code,
-                    diagnosis_text=diagnosis.description,
-                    set_id=idx,
-                    diagnosis_type="F",  # Final diagnosis at discharge
-                )
-                segments.append(dg1)
-
-        return self._build_message(segments)
 
     def generate_adt_a08(
         self,
@@ -213,47 +261,106 @@ class HL7v2Generator:
             HL7v2 ADT^A08 message
         """
         timestamp = timestamp or datetime.now()
-        message_control_id = self._generate_message_control_id()
-
-        segments = []
-
-        # MSH - Message Header
-        msh = build_msh_segment(
-            message_type="ADT",
-            trigger_event="A08",
-            message_control_id=message_control_id,
-            timestamp=timestamp,
-            sending_application=self.sending_application,
-            sending_facility=self.sending_facility,
-            receiving_application=self.receiving_application,
-            receiving_facility=self.receiving_facility,
+        return self._build_message(
+            self._adt_segments("A08", patient, encounter, diagnoses, timestamp)
         )
-        segments.append(msh)
 
-        # EVN - Event Type
-        evn = build_evn_segment(
-            event_type="A08",
-            event_timestamp=timestamp,
-        )
-        segments.append(evn)
+    def write_batch(
+        self,
+        events: Iterable[ADTEvent],
+        sink: TextIO,
+        framing: str = "batch",
+        messages_per_batch: int = DEFAULT_MESSAGES_PER_BATCH,
+        timestamp: datetime | None = None,
+        pid_cache_size: int = DEFAULT_PID_CACHE_SIZE,
+    ) -> HL7v2BatchResult:
+        """Stream ADT messages to a text sink in constant memory.
 
-        # PID - Patient Identification
-        pid = build_pid_segment(patient)
-        segments.append(pid)
+        With ``framing="batch"`` the sink receives an HL7 batch file: FHS,
+        then BHS/BTS batches of up to ``messages_per_batch`` messages, then
+        FTS. With ``framing="mllp"`` each message is wrapped in MLLP block
+        delimiters for a socket or capture file. Open file sinks with
+        ``newline=""`` so segment terminators stay carriage returns.
 
-        # PV1 - Patient Visit
-        pv1 = build_pv1_segment(encounter)
-        segments.append(pv1)
+        The PID segment of each patient is built once and reused for their
+        later events, as long as the fields it is built from are unchanged.
+        The ``pid_cache_size`` most recently seen patients are kept.
 
-        # DG1 - Diagnosis (optional)
-        if diagnoses:
-            for idx, diagnosis in enumerate(diagnoses, start=1):
-                dg1 = build_dg1_segment(
-                    diagnosis_code=diagnosis.code,
-                    diagnosis_text=diagnosis.description,
-                    set_id=idx,
-                    diagnosis_type="F" if diagnosis.type == "final" else "W",
-                )
-                segments.append(dg1)
+        Args:
+            events: ``(patient, encounter, event)`` or ``(patient, encounter,
+                event, diagnoses)`` tuples, consumed lazily
+            sink: Text file-like object
+            framing: "batch" or "mllp"
+            messages_per_batch: Maximum messages per BHS/BTS batch
+            timestamp: Message, batch and file timestamp (defaults to now)
+            pid_cache_size: Maximum patients whose PID segment is cached
+
+        Returns:
+            HL7v2BatchResult with message, batch and PID segment counts
+
+        Raises:
+            ValueError: If the framing or an event is not supported, or
+                messages_per_batch is less than 1
+        """
+        if framing not in FRAMINGS:
+            raise ValueError(f"framing must be one of {', '.join(FRAMINGS)}, got '{framing}'")
+        if messages_per_batch < 1:
+            raise ValueError("messages_per_batch must be at least 1")
 
-        return self._build_message(segments)
+        timestamp = timestamp or datetime.now()
+        mllp = framing == "mllp"
+        envelope = {
+            "timestamp": timestamp,
+            "sending_application": self.sending_application,
+            "sending_facility": self.sending_facility,
+            "receiving_application": self.receiving_application,
+            "receiving_facility": self.receiving_facility,
+        }
+        result = HL7v2BatchResult()
+        pids: dict[str, tuple[tuple, str]] = {}
+        in_batch = 0
+
+        if not mllp:
+            sink.write(build_fhs_segment(self._generate_message_control_id(), **envelope) + "\r")
+
+        for patient, encounter, event, *rest in events:
+            # Keyed on the PID's own fields, so in-place edits invalidate it
+            key = pid_segment_key(patient)
+            cached = pids.pop(patient.mrn, None)
+            if cached is not None and cached[0] == key:
+                pid = cached[1]
+            else:
+                pid = build_pid_segment(patient)
+                result.pid_segments += 1
+            if pid_cache_size > 0:
+                if len(pids) >= pid_cache_size:
+                    # Evict the least recently seen patient
+                    del pids[next(iter(pids))]
+                # Reinsert so dict order runs from least to most recently seen
+                pids[patient.mrn] = (key, pid)
+
+            diagnoses = rest[0] if rest else None
+            message = self._build_message(
+                self._adt_segments(event, patient, encounter, diagnoses, timestamp, pid)
+            )
+
+            if mllp:
+                sink.write(f"{MLLP_START}{message}{MLLP_END}")
+            else:
+                if in_batch == 0:
+                    batch_control_id = self._generate_message_control_id()
+                    sink.write(build_bhs_segment(batch_control_id, **envelope) + "\r")
+                    result.batches += 1
+                sink.write(message)
+                in_batch += 1
+                if in_batch == messages_per_batch:
+                    sink.write(build_bts_segment(in_batch) + "\r")
+                    in_batch = 0
+            result.messages += 1
+
+        if not mllp:
+            if in_batch:
+                sink.write(build_bts_segment(in_batch) + "\r")
+            sink.write(build_fts_segment(result.batches) + "\r")
+
+        return result
@@ -108,6 +108,106 @@ def build_msh_segment(
     return FIELD_SEP.join(fields)
 
 
+def build_fhs_segment(
+    file_control_id: str,
+    timestamp: datetime,
+    sending_application: str = "PATIENTSIM",
+    sending_facility: str = "HOSPITAL",
+    receiving_application: str = "EMR",
+    receiving_facility: str = "HOSPITAL",
+) -> str:
+    """Build FHS (File Header) segment.
+
+    Args:
+        file_control_id: Unique file control ID
+        timestamp: File creation timestamp
+        sending_application: Sending application name
+        sending_facility: Sending facility name
+        receiving_application: Receiving application name
+        receiving_facility: Receiving facility name
+
+    Returns:
+        FHS segment string
+    """
+    fields = [
+        "FHS",
+        ENCODING_CHARS,  # FHS-2: Encoding characters
+        sending_application,  # FHS-3: Sending application
+        sending_facility,  # FHS-4: Sending facility
+        receiving_application,  # FHS-5: Receiving application
+        receiving_facility,  # FHS-6: Receiving facility
+        format_hl7_datetime(timestamp),  # FHS-7: File creation date/time
+        "",  # FHS-8: File security
+        "",  # FHS-9: File name/ID
+        "",  # FHS-10: File header comment
+        file_control_id,  # FHS-11: File control ID
+    ]
+
+    return FIELD_SEP.join(fields)
+
+
+def build_bhs_segment(
+    batch_control_id: str,
+    timestamp: datetime,
+    sending_application: str = "PATIENTSIM",
+    sending_facility: str = "HOSPITAL",
+    receiving_application: str = "EMR",
+    receiving_facility: str = "HOSPITAL",
+) -> str:
+    """Build BHS (Batch Header) segment.
+
+    Args:
+        batch_control_id: Unique batch control ID
+        timestamp: Batch creation timestamp
+        sending_application: Sending application name
+        sending_facility: Sending facility name
+        receiving_application: Receiving application name
+        receiving_facility: Receiving facility name
+
+    Returns:
+        BHS segment string
+    """
+    fields = [
+        "BHS",
+        ENCODING_CHARS,  # BHS-2: Encoding characters
+        sending_application,  # BHS-3: Sending application
+        sending_facility,  # BHS-4: Sending facility
+        receiving_application,  # BHS-5: Receiving application
+        receiving_facility,  # BHS-6: Receiving facility
+        format_hl7_datetime(timestamp),  # BHS-7: Batch creation date/time
+        "",  # BHS-8: Batch security
+        "",  # BHS-9: Batch name/ID/type
+        "",  # BHS-10: Batch comment
+        batch_control_id,  # BHS-11: Batch control ID
+    ]
+
+    return FIELD_SEP.join(fields)
+
+
+def build_bts_segment(message_count: int) -> str:
+    """Build BTS (Batch Trailer) segment.
+
+    Args:
+        message_count: Number of messages in the batch
+
+    Returns:
+        BTS segment string
+    """
+    return FIELD_SEP.join(["BTS", str(message_count)])  # BTS-1: Batch message count
+
+
+def build_fts_segment(batch_count: int) -> str:
+    """Build FTS (File Trailer) segment.
+
+    Args:
+        batch_count: Number of batches in the file
+
+    Returns:
+        FTS segment string
+    """
+    return FIELD_SEP.join(["FTS", str(batch_count)])  # FTS-1: File batch count
+
+
 def build_evn_segment(
     event_type: str,
     event_timestamp: datetime,
@@ -201,6 +301,29 @@ def build_pid_segment(patient: Patient) -> str:
     return FIELD_SEP.join(fields)
 
 
+def pid_segment_key(patient: Patient) -> tuple:
+    """Get the patient fields the PID segment is built from.
+
+    Two patients with equal keys get the same PID segment, so the key can
+    check whether a cached segment is still current.
+
+    Args:
+        patient: Patient object
+
+    Returns:
+        Tuple of the fields read by build_pid_segment()
+    """
+    return (
+        patient.mrn,
+        patient.family_name,
+        patient.given_name,
+        patient.birth_date,
+        patient.gender,
+        patient.deceased,
+        patient.death_date,
+    )
+
+
 def build_pv1_segment(encounter: Encounter, patient_class: str | None = None) -> str:
     """Build PV1 (Patient Visit) segment.
 
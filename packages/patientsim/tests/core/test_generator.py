@@ -3,6 +3,7 @@
 from datetime import date, datetime
 
 import pytest
+from healthsim.person import IdentifierAllocator
 
 from patientsim.core import (
     EncounterClass,
@@ -34,6 +35,35 @@ class TestPatientGenerator:
         # Assert
         assert gen.seed == 42
 
+    def test_patient_ids_unique_in_large_cohort(self) -> None:
+        """Test patient IDs and MRNs never collide, even across generators."""
+        # Arrange
+        allocator = IdentifierAllocator()
+        gen1 = PatientGenerator(seed=1, id_allocator=allocator)
+        gen2 = PatientGenerator(seed=1, id_allocator=allocator)
+
+        # Act
+        patients = [gen1.generate_patient() for _ in range(1500)]
+        patients += [gen2.generate_patient() for _ in range(1500)]
+
+        # Assert
+        assert len({p.id for p in patients}) == 3000
+        assert len({p.mrn for p in patients}) == 3000
+
+    def test_patient_ids_unique_across_seeds(self) -> None:
+        """Test generators with different seeds never share IDs by default."""
+        # Arrange
+        gen1 = PatientGenerator(seed=1)
+        gen2 = PatientGenerator(seed=2)
+
+        # Act
+        patients = [gen1.generate_patient() for _ in range(500)]
+        patients += [gen2.generate_patient() for _ in range(500)]
+
+        # Assert
+        assert len({p.id for p in patients}) == 1000
+        assert len({p.mrn for p in patients}) == 1000
+
     def test_generator_reproducibility_same_seed(self) -> None:
         """Test that same seed produces same patient."""
         # Arrange & Act - Create and use generators separately to reset state
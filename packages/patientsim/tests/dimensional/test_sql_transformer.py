@@ -0,0 +1,247 @@
+"""Tests for PatientSim SQL Dimensional Transformer."""
+
+import math
+import uuid
+from datetime import date, datetime, timedelta
+
+import duckdb
+import pandas as pd
+import pytest
+from healthsim.db.schema import apply_schema
+
+from patientsim.core.generator import PatientGenerator
+from patientsim.dimensional import (
+    PatientDimensionalTransformer,
+    PatientSQLDimensionalTransformer,
+)
+
+SNAPSHOT = date(2025, 1, 1)
+
+
+def _normalize(value):
+    """Normalize a cell so object and SQL outputs compare equal."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, pd.Timestamp):
+        value = value.item()
+    if isinstance(value, (date, datetime)):
+        return pd.Timestamp(value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def _rows(df: pd.DataFrame) -> list[list]:
+    return [[_normalize(v) for v in row] for row in df.itertuples(index=False)]
+
+
+def _assert_same_tables(expected: dict, actual: dict) -> None:
+    assert list(actual) == list(expected)
+    for name, df in expected.items():
+        assert list(actual[name].columns) == list(df.columns), name
+        assert _rows(actual[name]) == _rows(df), name
+
+
+@pytest.fixture
+def records():
+    """Patients with encounters spaced to produce 7- and 30-day readmissions."""
+    generator = PatientGenerator(seed=42)
+    data = {
+        name: []
+        for name in ["patients", "encounters", "diagnoses", "medications", "lab_results", "vitals"]
+    }
+    for i in range(12):
+        patient = generator.generate_patient()
+        data["patients"].append(patient)
+        admission = datetime(2024, 1, 1, 8, 0) + timedelta(days=i)
+        for j, gap_days in enumerate([3, 12, 45, 0]):
+            discharge = admission + timedelta(hours=5 + 13 * j + i) if (i + j) % 5 else None
+            encounter = generator.generate_encounter(patient).model_copy(
+                update={"admission_time": admission, "discharge_time": discharge}
+            )
+            data["encounters"].append(encounter)
+            data["diagnoses"].append(generator.generate_diagnosis(patient, encounter))
+            data["medications"].append(generator.generate_medication(patient, encounter))
+            data["lab_results"].append(generator.generate_lab_result(patient, encounter))
+            data["vitals"].append(generator.generate_vital_signs(patient, encounter))
+            admission = (discharge or admission) + timedelta(days=gap_days)
+    return data
+
+
+def _insert(conn, table: str, rows: list[dict]) -> None:
+    columns = {row[0] for row in conn.execute(f"DESCRIBE {table}").fetchall()}
+    keys = [key for key in rows[0] if key in columns]
+    if "id" in columns and "id" not in keys:
+        keys.append("id")
+    placeholders = ", ".join("?" * len(keys))
+    conn.executemany(
+        f"INSERT INTO {table} ({', '.join(keys)}) VALUES ({placeholders})",
+        [[row.get(key, str(uuid.uuid4())) for key in keys] for row in rows],
+    )
+
+
+def _patient_row(patient) -> dict:
+    name, address = patient.name, patient.address
+    return {
+        "id": patient.id,
+        "mrn": patient.mrn,
+        "given_name": name.given_name,
+        "middle_name": name.middle_name,
+        "family_name": name.family_name,
+        "suffix": name.suffix,
+        "prefix": name.prefix,
+        "birth_date": patient.birth_date,
+        "gender": patient.gender,
+        "race": patient.race,
+        "language": patient.language,
+        "city": address.city if address else None,
+        "state": address.state if address else None,
+        "postal_code": address.postal_code if address else None,
+    }
+
+
+@pytest.fixture
+def conn(records):
+    """In-memory database holding the records in canonical tables."""
+    connection = duckdb.connect()
+    apply_schema(connection)
+    _insert(connection, "patients", [_patient_row(p) for p in records["patients"]])
+    for table, key in [
+        ("encounters", "encounters"),
+        ("diagnoses", "diagnoses"),
+        ("medications", "medications"),
+        ("lab_results", "lab_results"),
+        ("vital_signs", "vitals"),
+    ]:
+        _insert(connection, table, [model.model_dump() for model in records[key]])
+    yield connection
+    connection.close()
+
+
+class TestPatientSQLDimensionalTransformer:
+    """Tests for PatientSQLDimensionalTransformer."""
+
+    def test_matches_object_transformer(self, conn, records):
+        """Test SQL output equals the object transformer on the same records."""
+        expected = PatientDimensionalTransformer(**records, snapshot_date=SNAPSHOT).transform()
+        actual = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).transform()
+
+        for expected_tables, actual_tables in zip(expected, actual, strict=True):
+            _assert_same_tables(expected_tables, actual_tables)
+
+    def test_readmission_flags(self, conn):
+        """Test readmission windows are detected from encounter spacing."""
+        _, facts = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).transform()
+        fact_enc = facts["fact_encounters"]
+
+        assert fact_enc["is_readmission_7_day"].sum() > 0
+        assert fact_enc["is_readmission_30_day"].sum() > fact_enc["is_readmission_7_day"].sum()
+
+    def test_cohort_filter(self, conn, records):
+        """Test only rows in the requested cohort are transformed."""
+        conn.execute("UPDATE patients SET cohort_id = 'c1' WHERE rowid % 2 = 0")
+        conn.execute(
+            "UPDATE encounters SET cohort_id = 'c1' "
+            "WHERE patient_mrn IN (SELECT mrn FROM patients WHERE cohort_id = 'c1')"
+        )
+        in_cohort_mrns = {p.mrn for i, p in enumerate(records["patients"]) if i % 2 == 0}
+
+        _, facts = PatientSQLDimensionalTransformer(
+            conn, cohort_id="c1", snapshot_date=SNAPSHOT
+        ).transform()
+        expected = PatientDimensionalTransformer(
+            patients=[p for p in records["patients"] if p.mrn in in_cohort_mrns],
+            encounters=[e for e in records["encounters"] if e.patient_mrn in in_cohort_mrns],
+            snapshot_date=SNAPSHOT,
+        ).transform()[1]
+
+        assert list(facts) == ["fact_encounters"]
+        _assert_same_tables(expected, facts)
+
+    def test_transform_arrow(self, conn):
+        """Test Arrow output carries the same tables and row counts."""
+        pytest.importorskip("pyarrow")
+        transformer = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT)
+
+        dimensions, facts = transformer.transform()
+        arrow_dimensions, arrow_facts = transformer.transform_arrow()
+
+        for frames, tables in [(dimensions, arrow_dimensions), (facts, arrow_facts)]:
+            assert list(tables) == list(frames)
+            for name, df in frames.items():
+                assert tables[name].num_rows == len(df)
+                assert tables[name].column_names == list(df.columns)
+
+    def test_materialize(self, conn):
+        """Test tables are written to the target schema."""
+        counts = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT).materialize()
+
+        assert counts["fact_encounters"] == 48
+        rows = conn.execute("SELECT COUNT(*) FROM analytics.dim_patient").fetchone()[0]
+        assert rows == counts["dim_patient"] == 12
+
+    def test_materialize_merge(self, conn):
+        """Test merge inserts only rows missing from keyed tables."""
+        transformer = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT)
+        transformer.materialize()
+        conn.execute("DELETE FROM analytics.fact_encounters WHERE rowid % 4 = 0")
+        conn.execute("DELETE FROM analytics.dim_patient WHERE rowid % 3 = 0")
+
+        counts = transformer.materialize(if_exists="merge")
+
+        assert counts["fact_encounters"] == 12
+        assert counts["dim_patient"] == 4
+        for table, rows in [("fact_encounters", 48), ("dim_patient", 12)]:
+            assert conn.execute(f"SELECT COUNT(*) FROM analytics.{table}").fetchone()[0] == rows
+
+    def test_materialize_merge_new_facility(self, conn):
+        """Test a new facility in a later batch leaves loaded keys resolving."""
+        transformer = PatientSQLDimensionalTransformer(conn, snapshot_date=SNAPSHOT)
+        transformer.materialize()
+        conn.execute(
+            "INSERT INTO encounters SELECT * REPLACE ("
+            "'ENC-NEW' AS encounter_id, 'AAA New Clinic' AS facility) "
+            "FROM encounters LIMIT 1"
+        )
+
+        counts = transformer.materialize(if_exists="merge")
+
+        assert counts["dim_facility"] == 1
+        assert counts["fact_encounters"] == 1
+        mismatched = conn.execute(
+            """
+            SELECT COUNT(*) FROM analytics.fact_encounters f
+            JOIN encounters e ON e.encounter_id = f.encounter_key
+            LEFT JOIN analytics.dim_facility d ON d.facility_key = f.facility_key
+            WHERE d.facility_name IS DISTINCT FROM e.facility
+            """
+        ).fetchone()[0]
+        assert mismatched == 0
+        assert not conn.execute(
+            "SELECT * FROM duckdb_tables() WHERE table_name LIKE '_key_map%'"
+        ).fetchall()
+
+    def test_watermark(self, conn):
+        """Test the watermark is the cohort's latest update."""
+        transformer = PatientSQLDimensionalTransformer(conn, cohort_id="c1")
+        assert transformer.watermark() is None
+
+        conn.execute(
+            "INSERT INTO cohorts (id, name, updated_at) VALUES "
+            "('c1', 'one', TIMESTAMP '2024-06-01 12:00'), "
+            "('c2', 'two', TIMESTAMP '2024-07-01 12:00')"
+        )
+
+        assert transformer.watermark() == datetime(2024, 6, 1, 12)
+
+    def test_empty_tables(self):
+        """Test an empty database yields no tables."""
+        connection = duckdb.connect()
+        apply_schema(connection)
+
+        dimensions, facts = PatientSQLDimensionalTransformer(connection).transform()
+
+        assert dimensions == {}
+        assert facts == {}
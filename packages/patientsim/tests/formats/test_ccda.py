@@ -6,11 +6,68 @@ Tests cover:
 - CCDAValidator section validation
 - CCDAValidator code system validation
 - XML parsing and error handling
+- CCDATransformer documents from generated patients
+- CCDABatchGenerator file, zip and process pool output
 """
 
+import re
+import zipfile
+from datetime import datetime
+
 import pytest
 
-from patientsim.formats.ccda import CCDAValidator, ValidationResult
+from patientsim.core.generator import PatientGenerator
+from patientsim.core.models import Procedure
+from patientsim.formats.ccda import (
+    CCDABatchGenerator,
+    CCDAConfig,
+    CCDARecord,
+    CCDATransformer,
+    CCDAValidator,
+    DocumentType,
+    ValidationResult,
+)
+
+TIMESTAMP = datetime(2025, 1, 1, 12, 0, 0)
+UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+
+@pytest.fixture
+def config():
+    return CCDAConfig(
+        document_type=DocumentType.CCD,
+        organization_name="Example Hospital",
+        organization_oid="2.16.840.1.113883.3.1234",
+    )
+
+
+def make_record(generator: PatientGenerator) -> CCDARecord:
+    """Build a record with every section populated."""
+    patient = generator.generate_patient()
+    encounter = generator.generate_encounter(patient)
+    return CCDARecord(
+        patient=patient,
+        encounters=[encounter],
+        diagnoses=[generator.generate_diagnosis(patient, encounter) for _ in range(2)],
+        medications=[generator.generate_medication(patient, encounter) for _ in range(2)],
+        labs=[generator.generate_lab_result(patient, encounter) for _ in range(3)],
+        vitals=[generator.generate_vital_signs(patient, encounter)],
+        procedures=[
+            Procedure(
+                code="80146002",
+                description="Appendectomy",
+                patient_mrn=patient.mrn,
+                encounter_id=encounter.encounter_id,
+                performed_date=datetime(2024, 6, 1, 9, 30),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def records():
+    generator = PatientGenerator(seed=42)
+    return [make_record(generator) for _ in range(5)]
 
 
 class TestValidationResult:
@@ -304,3 +361,86 @@ class TestCCDAValidatorIntegration:
         for xml_file in transfer_dir.glob("*.xml"):
             result = validator.validate_file(str(xml_file))
             assert result.is_valid, f"{xml_file.name} failed: {result.errors}"
+
+
+class TestCCDATransformer:
+    """Tests for documents built from generated patients."""
+
+    def test_transform_generated_patient(self, config, records):
+        """A document with every section should pass validation."""
+        record = records[0]
+        xml = CCDATransformer(config).transform(
+            record.patient,
+            record.encounters,
+            record.diagnoses,
+            record.medications,
+            record.labs,
+            record.vitals,
+            record.procedures,
+            timestamp=TIMESTAMP,
+        )
+
+        result = CCDAValidator().validate(xml)
+        assert result.is_valid, result.errors
+        assert f'extension="{record.patient.mrn}"' in xml
+        assert '<effectiveTime value="20250101120000"/>' in xml
+        assert record.medications[0].name in xml
+        assert "20240601" in xml
+
+    def test_entry_ids_are_v4_uuids(self, config, records):
+        """Entry ids should be distinct version 4 UUIDs."""
+        record = records[0]
+        xml = CCDATransformer(config).transform(record.patient, diagnoses=record.diagnoses)
+
+        ids = UUID_PATTERN.findall(xml)
+        assert len(ids) >= 4
+        assert len(set(ids)) == len(ids)
+
+
+class TestCCDABatchGenerator:
+    """Tests for batch C-CDA generation."""
+
+    def test_write_files(self, config, records, tmp_path):
+        """Each record should be written to <mrn>.xml."""
+        generator = CCDABatchGenerator(config, workers=1, chunk_size=2, timestamp=TIMESTAMP)
+
+        paths = []
+        result = generator.write_files(iter(records), tmp_path / "ccda", on_file=paths.append)
+
+        assert result.documents == 5
+        assert result.output_path == tmp_path / "ccda"
+        assert [path.name for path in paths] == [f"{r.patient.mrn}.xml" for r in records]
+        assert result.bytes_written == sum(path.stat().st_size for path in paths)
+        validator = CCDAValidator()
+        for path in paths:
+            assert validator.validate_file(str(path)).is_valid
+
+    def test_write_zip(self, config, records, tmp_path):
+        """Documents should be written into a single archive."""
+        generator = CCDABatchGenerator(config, workers=1, timestamp=TIMESTAMP)
+
+        result = generator.write_zip(records, tmp_path / "ccds.zip")
+
+        assert result.output_path == tmp_path / "ccds.zip"
+        assert result.to_dict()["documents"] == 5
+        with zipfile.ZipFile(tmp_path / "ccds.zip") as archive:
+            assert archive.namelist() == [f"{r.patient.mrn}.xml" for r in records]
+            xml = archive.read(archive.namelist()[0]).decode("utf-8")
+        assert CCDAValidator().validate(xml).is_valid
+
+    def test_process_pool_matches_serial(self, config, records):
+        """A process pool should yield the same documents, in order, as one process."""
+        serial = CCDABatchGenerator(config, workers=1, timestamp=TIMESTAMP)
+        pooled = CCDABatchGenerator(config, workers=2, chunk_size=2, timestamp=TIMESTAMP)
+
+        def normalize(documents):
+            return [(mrn, UUID_PATTERN.sub("ID", xml.decode())) for mrn, xml in documents]
+
+        assert normalize(pooled.iter_documents(records)) == normalize(
+            serial.iter_documents(records)
+        )
+
+    def test_invalid_chunk_size(self, config):
+        """Non-positive chunk sizes should be rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            CCDABatchGenerator(config, chunk_size=0)
@@ -10,6 +10,7 @@ Tests cover:
 
 import json
 from datetime import date, datetime
+from pathlib import Path
 
 import pytest
 
@@ -443,3 +444,178 @@ class TestFHIRExporterIntegration:
             ndjson_patient_count = 0
 
         assert bundle_patient_count == ndjson_patient_count
+
+
+class TestShardedBulkExport:
+    """Tests for sharded, process-parallel NDJSON export."""
+
+    @pytest.fixture
+    def dataset(self):
+        """Create a dataset large enough to span several chunks."""
+        from healthsim.person import Gender, PersonName
+
+        from patientsim.core.models import Diagnosis, Encounter, LabResult, Patient, VitalSign
+
+        patients, encounters, diagnoses, labs, vitals = [], [], [], [], []
+        for i in range(40):
+            mrn = f"MRN{i:05d}"
+            patients.append(
+                Patient(
+                    id=f"patient-{i:06d}",
+                    mrn=mrn,
+                    name=PersonName(given_name=f"Patient{i}", family_name="Test"),
+                    gender=Gender.MALE if i % 2 == 0 else Gender.FEMALE,
+                    birth_date=date(1950 + i, 1, 1),
+                )
+            )
+            encounters.append(
+                Encounter(
+                    encounter_id=f"E{i:05d}",
+                    patient_mrn=mrn,
+                    class_code="O",
+                    status="finished",
+                    admission_time=datetime(2024, 1, 10, 8, 0, 0),
+                )
+            )
+            diagnoses.append(
+                Diagnosis(
+                    code="E11.9",
+                    description="Type 2 diabetes mellitus",
+                    patient_mrn=mrn,
+                    encounter_id=f"E{i:05d}",
+                    diagnosed_date=date(2024, 1, 10),
+                )
+            )
+            labs.append(
+                LabResult(
+                    test_name="glucose",
+                    value=str(90 + i),
+                    unit="mg/dL",
+                    patient_mrn=mrn,
+                    encounter_id=f"E{i:05d}",
+                    collected_time=datetime(2024, 1, 10, 9, 0, 0),
+                )
+            )
+            vitals.append(
+                VitalSign(
+                    patient_mrn=mrn,
+                    encounter_id=f"E{i:05d}",
+                    observation_time=datetime(2024, 1, 10, 9, 0, 0),
+                    heart_rate=60 + i,
+                    systolic_bp=120,
+                    diastolic_bp=80,
+                )
+            )
+        return {
+            "patients": patients,
+            "encounters": encounters,
+            "diagnoses": diagnoses,
+            "labs": labs,
+            "vitals": vitals,
+        }
+
+    @staticmethod
+    def _read_shards(result, resource_type):
+        """Concatenate the NDJSON lines of every shard of one type."""
+        import gzip
+
+        lines = []
+        for entry in result.manifest.output:
+            if entry["type"] != resource_type:
+                continue
+            opener = gzip.open if entry["url"].endswith(".gz") else open
+            with opener(entry["url"], "rt", encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+        return lines
+
+    def test_matches_sequential_export(self, dataset, tmp_path):
+        """Shards should hold exactly the lines of the sequential exporter."""
+        exporter = FHIRBulkExporter()
+        result = exporter.export_sharded(tmp_path, workers=1, chunk_size=7, **dataset)
+        expected = exporter.to_ndjson_string(**dataset)
+
+        for resource_type, content in expected.items():
+            assert self._read_shards(result, resource_type) == content.splitlines()
+            assert result.resource_counts[resource_type] == len(content.splitlines())
+
+    def test_shard_naming_and_size_cap(self, dataset, tmp_path):
+        """Small caps should roll shards and list each one in the manifest."""
+        exporter = FHIRBulkExporter(compress=True)
+        result = exporter.export_sharded(
+            tmp_path, workers=1, chunk_size=5, max_shard_bytes=1500, **dataset
+        )
+
+        patient_shards = [e for e in result.manifest.output if e["type"] == "Patient"]
+        assert len(patient_shards) > 1
+        assert [Path(e["url"]).name for e in patient_shards[:2]] == [
+            "Patient.000.ndjson.gz",
+            "Patient.001.ndjson.gz",
+        ]
+        assert sum(e["count"] for e in patient_shards) == 40
+
+        with open(tmp_path / "manifest.json") as f:
+            manifest = json.load(f)
+        assert manifest["output"] == result.manifest.output
+        assert result.total_resources == sum(e["count"] for e in manifest["output"])
+
+    def test_parallel_output_is_identical(self, dataset, tmp_path):
+        """Worker count should not change a single byte of output."""
+        exporter = FHIRBulkExporter(compress=True)
+        serial = exporter.export_sharded(tmp_path / "serial", workers=1, chunk_size=6, **dataset)
+        parallel = exporter.export_sharded(
+            tmp_path / "parallel", workers=2, chunk_size=6, **dataset
+        )
+
+        assert serial.resource_counts == parallel.resource_counts
+        for a, b in zip(serial.files_created[:-1], parallel.files_created[:-1], strict=True):
+            assert a.name == b.name
+            assert a.read_bytes() == b.read_bytes()
+
+    def test_accepts_generators(self, dataset, tmp_path):
+        """Inputs may be lazy iterables rather than lists."""
+        exporter = FHIRBulkExporter()
+        result = exporter.export_sharded(
+            tmp_path, patients=(p for p in dataset["patients"]), workers=1, chunk_size=8
+        )
+
+        assert result.resource_counts == {"Patient": 40}
+
+    def test_export_cohort_from_duckdb(self, dataset, tmp_path):
+        """Cohort rows read from DuckDB should export like the source models."""
+        duckdb = pytest.importorskip("duckdb")
+        from healthsim.db.schema import apply_schema
+
+        conn = duckdb.connect()
+        apply_schema(conn)
+        for p in dataset["patients"]:
+            conn.execute(
+                "INSERT INTO patients (id, mrn, given_name, family_name, birth_date, gender, "
+                "cohort_id) VALUES (?, ?, ?, ?, ?, ?, 'c1')",
+                [p.id, p.mrn, p.name.given_name, p.name.family_name, p.birth_date, p.gender],
+            )
+        for e in dataset["encounters"]:
+            conn.execute(
+                "INSERT INTO encounters (encounter_id, patient_mrn, class_code, status, "
+                "admission_time, cohort_id) VALUES (?, ?, ?, ?, ?, 'c1')",
+                [e.encounter_id, e.patient_mrn, e.class_code, e.status, e.admission_time],
+            )
+        conn.execute(
+            "INSERT INTO patients (id, mrn, given_name, family_name, birth_date, gender, "
+            "cohort_id) VALUES ('other', 'MRN-X', 'A', 'B', DATE '1990-01-01', 'F', 'c2')"
+        )
+
+        exporter = FHIRBulkExporter()
+        result = exporter.export_cohort("c1", tmp_path, conn=conn, workers=1, chunk_size=16)
+        expected = exporter.to_ndjson_string(
+            patients=dataset["patients"], encounters=dataset["encounters"]
+        )
+
+        assert result.resource_counts == {"Patient": 40, "Encounter": 40}
+        assert self._read_shards(result, "Patient") == expected["Patient"].splitlines()
+        assert self._read_shards(result, "Encounter") == expected["Encounter"].splitlines()
+        conn.close()
+
+    def test_invalid_shard_size(self, tmp_path):
+        """A non-positive shard cap should be rejected."""
+        with pytest.raises(ValueError, match="max_shard_bytes"):
+            FHIRBulkExporter().export_sharded(tmp_path, patients=[], max_shard_bytes=0)
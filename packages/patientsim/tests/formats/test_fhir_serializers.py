@@ -0,0 +1,235 @@
+"""Conformance tests for the fast-path FHIR serializers.
+
+Every serializer must produce exactly the bytes of the Pydantic path:
+``json.dumps(resource.model_dump(by_alias=True, exclude_none=True),
+separators=(",", ":"))``.
+"""
+
+import json
+from datetime import date, datetime
+
+import pytest
+from healthsim.person import Gender, PersonName
+
+from patientsim.core.generator import PatientGenerator
+from patientsim.core.models import Diagnosis, Encounter, LabResult, Patient, VitalSign
+from patientsim.formats.fhir import FHIRSerializer, FHIRTransformer
+from patientsim.formats.fhir import serializers as serializers_module
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(
+            serializers_module.orjson is None, reason="orjson not installed"
+        ),
+    ),
+]
+
+
+def _reference(resource) -> bytes:
+    """Encode a Pydantic resource the way the original export path does."""
+    data = resource.model_dump(by_alias=True, exclude_none=True)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _generated_dataset(seed: int, count: int = 25) -> dict[str, list]:
+    """Generate a cohort with every resource type."""
+    generator = PatientGenerator(seed=seed)
+    dataset: dict[str, list] = {
+        "patients": [],
+        "encounters": [],
+        "diagnoses": [],
+        "labs": [],
+        "vitals": [],
+    }
+    for _ in range(count):
+        patient = generator.generate_patient()
+        encounter = generator.generate_encounter(patient)
+        dataset["patients"].append(patient)
+        dataset["encounters"].append(encounter)
+        dataset["diagnoses"].append(generator.generate_diagnosis(patient, encounter))
+        dataset["labs"].append(generator.generate_lab_result(patient, encounter))
+        dataset["vitals"].append(generator.generate_vital_signs(patient, encounter))
+    return dataset
+
+
+def _edge_case_dataset() -> dict[str, list]:
+    """Hand-built records covering optional fields and fallbacks."""
+    admitted = datetime(2024, 3, 1, 10, 30)
+    return {
+        "patients": [
+            Patient(
+                id="p-1",
+                mrn="MRN-1",
+                name=PersonName(given_name="Zoë", family_name="Müller"),
+                birth_date=date(1960, 5, 1),
+                gender=Gender.FEMALE,
+                deceased=True,
+                death_date=date(2020, 1, 2),
+            ),
+            Patient(
+                id="p-2",
+                mrn="MRN-2",
+                name=PersonName(given_name="Sam", family_name="O'Neil"),
+                birth_date=date(1990, 1, 1),
+                gender=Gender.UNKNOWN,
+                deceased=True,
+            ),
+        ],
+        "encounters": [
+            Encounter(
+                encounter_id="E-1",
+                patient_mrn="MRN-1",
+                class_code="I",
+                status="in-progress",
+                admission_time=admitted,
+                admitting_diagnosis="Chest pain — rule out MI",
+                discharge_disposition="Home",
+            ),
+            Encounter(
+                encounter_id="E-2",
+                patient_mrn="MRN-2",
+                class_code="OBS",
+                status="arrived",
+                admission_time=admitted,
+                discharge_time=datetime(2024, 3, 2, 9, 0),
+            ),
+        ],
+        "diagnoses": [
+            Diagnosis(
+                code="E11.9",
+                description="Diabète de type 2",
+                patient_mrn="MRN-1",
+                diagnosed_date=date(2024, 3, 1),
+            ),
+        ],
+        "labs": [
+            LabResult(
+                test_name="glucose",
+                value="105",
+                unit="mg/dL",
+                patient_mrn="MRN-1",
+                encounter_id="E-1",
+                collected_time=admitted,
+                resulted_time=datetime(2024, 3, 1, 12, 0),
+            ),
+            LabResult(
+                test_name="hgb",
+                value="12.5",
+                patient_mrn="MRN-1",
+                collected_time=admitted,
+            ),
+            LabResult(
+                test_name="sodium",
+                value="hemolyzed",
+                patient_mrn="MRN-1",
+                collected_time=admitted,
+            ),
+            LabResult(
+                test_name="potassium",
+                value="nan",
+                unit="mmol/L",
+                patient_mrn="MRN-1",
+                collected_time=admitted,
+            ),
+            *[
+                LabResult(
+                    test_name="glucose",
+                    value=value,
+                    unit="mg/dL",
+                    patient_mrn="MRN-1",
+                    collected_time=admitted,
+                )
+                for value in ("0.00001", "1e-7", "0.0001", "2e16", "1e16", "-inf", "0")
+            ],
+            LabResult(
+                test_name="not-a-loinc-test",
+                value="1",
+                patient_mrn="MRN-1",
+                collected_time=admitted,
+            ),
+        ],
+        "vitals": [
+            VitalSign(
+                patient_mrn="MRN-2",
+                observation_time=admitted,
+                temperature=98.6,
+                spo2=97,
+                weight_kg=81.25,
+            ),
+            VitalSign(patient_mrn="MRN-2", observation_time=admitted),
+        ],
+    }
+
+
+def _assert_conformant(dataset: dict[str, list], backend: str) -> None:
+    """Compare every serializer against its Pydantic reference."""
+    transformer = FHIRTransformer()
+    serializer = FHIRSerializer(backend=backend)
+
+    for patient in dataset["patients"]:
+        assert serializer.patient(patient) == _reference(transformer.transform_patient(patient))
+    for encounter in dataset["encounters"]:
+        assert serializer.encounter(encounter) == _reference(
+            transformer.transform_encounter(encounter)
+        )
+    for diagnosis in dataset["diagnoses"]:
+        assert serializer.condition(diagnosis) == _reference(
+            transformer.transform_condition(diagnosis)
+        )
+    for lab in dataset["labs"]:
+        expected = transformer.transform_lab_observation(lab)
+        actual = serializer.lab_observation(lab)
+        assert actual == (None if expected is None else _reference(expected))
+    for vital in dataset["vitals"]:
+        assert serializer.vital_observations(vital) == [
+            _reference(resource) for resource in transformer.transform_vital_observations(vital)
+        ]
+
+
+class TestFHIRSerializerConformance:
+    """Byte-for-byte equivalence with the Pydantic export path."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("seed", [42, 7])
+    def test_generated_cohort(self, backend, seed):
+        """Generated cohorts serialize identically."""
+        _assert_conformant(_generated_dataset(seed), backend)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_edge_cases(self, backend):
+        """Optional fields, fallbacks, non-ASCII text, NaN and exponent floats match."""
+        _assert_conformant(_edge_case_dataset(), backend)
+
+    def test_unmapped_lab_returns_none(self):
+        """Labs without a LOINC mapping produce no resource."""
+        lab = _edge_case_dataset()["labs"][-1]
+        assert FHIRSerializer().lab_observation(lab) is None
+
+
+class TestFHIRSerializerBackends:
+    """Backend selection."""
+
+    def test_auto_prefers_orjson(self):
+        """Auto uses orjson when it is importable."""
+        expected = "orjson" if serializers_module.orjson is not None else "json"
+        assert FHIRSerializer().backend == expected
+
+    def test_unknown_backend_rejected(self):
+        """Unknown backends raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            FHIRSerializer(backend="ujson")
+
+    def test_orjson_required_when_requested(self, monkeypatch):
+        """Requesting orjson without it installed raises ValueError."""
+        monkeypatch.setattr(serializers_module, "orjson", None)
+        with pytest.raises(ValueError, match="not installed"):
+            FHIRSerializer(backend="orjson")
+
+    def test_shared_transformer_ids(self):
+        """A shared transformer gives the serializer the same resource ids."""
+        transformer = FHIRTransformer()
+        patient = _edge_case_dataset()["patients"][0]
+        data = FHIRSerializer(transformer).patient_dict(patient)
+        assert data["id"] == transformer.transform_patient(patient).id
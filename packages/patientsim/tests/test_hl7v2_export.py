@@ -1,7 +1,9 @@
 """Tests for HL7v2 message generation."""
 
+import io
 from datetime import date, datetime
 
+import pytest
 from healthsim.person import PersonName
 
 from patientsim.core.models import (
@@ -475,3 +477,182 @@ class TestMessageStructure:
 
         assert fields[2] == "MYAPP"
         assert fields[3] == "MYFAC"
+
+
+def _mask_control_id(message: str) -> str:
+    """Blank MSH-10 so messages can be compared across runs."""
+    segments = message.split("\r")
+    msh = segments[0].split(FIELD_SEP)
+    msh[9] = ""
+    segments[0] = FIELD_SEP.join(msh)
+    return "\r".join(segments)
+
+
+class TestHL7v2Batch:
+    """Tests for streaming ADT messages with write_batch()."""
+
+    TIMESTAMP = datetime(2024, 2, 1, 8, 0)
+
+    def _events(self, patients: int = 2):
+        """Admit, update and discharge events for each patient."""
+        events = []
+        for i in range(patients):
+            patient = Patient(
+                id=f"patient-{i}",
+                mrn=f"MRN{i:05d}",
+                name=PersonName(given_name="Jane", family_name=f"O'Brien|{i}"),
+                birth_date=date(1970, 1, 1),
+                gender=Gender.FEMALE,
+            )
+            encounter = Encounter(
+                encounter_id=f"ENC{i:05d}",
+                patient_mrn=patient.mrn,
+                class_code=EncounterClass.INPATIENT,
+                status=EncounterStatus.FINISHED,
+                admission_time=datetime(2024, 1, 10, 9, 0),
+                discharge_time=datetime(2024, 1, 14, 11, 0),
+                discharge_disposition="Home",
+            )
+            events += [(patient, encounter, event) for event in ("A01", "A08", "A03")]
+        return events
+
+    def test_batch_file_structure(self) -> None:
+        """Test FHS/BHS envelopes wrap the messages with correct counts."""
+        sink = io.StringIO()
+        result = HL7v2Generator().write_batch(
+            self._events(), sink, messages_per_batch=4, timestamp=self.TIMESTAMP
+        )
+
+        segments = sink.getvalue().split("\r")
+        assert segments[-1] == ""
+        types = [segment[:3] for segment in segments[:-1]]
+
+        assert types[0] == "FHS"
+        assert types[1] == "BHS"
+        assert types.count("MSH") == 6
+        assert [s for s in segments if s.startswith("BTS")] == ["BTS|4", "BTS|2"]
+        assert segments[-2] == "FTS|2"
+        assert segments[0].startswith("FHS|^~\\&|PATIENTSIM|HOSPITAL|EMR|HOSPITAL|20240201080000")
+        assert result.to_dict() == {"messages": 6, "batches": 2, "pid_segments": 2}
+
+    def test_messages_match_single_message_api(self) -> None:
+        """Test streamed messages equal generate_adt_*() apart from control IDs."""
+        generator = HL7v2Generator()
+        events = self._events(patients=1)
+        sink = io.StringIO()
+        generator.write_batch(events, sink, framing="mllp", timestamp=self.TIMESTAMP)
+
+        streamed = [
+            frame.lstrip("\x0b") for frame in sink.getvalue().split("\x1c\r") if frame
+        ]
+        single = {
+            "A01": generator.generate_adt_a01,
+            "A03": generator.generate_adt_a03,
+            "A08": generator.generate_adt_a08,
+        }
+        expected = [
+            single[event](patient, encounter, timestamp=self.TIMESTAMP)
+            for patient, encounter, event in events
+        ]
+
+        assert [_mask_control_id(m) for m in streamed] == [
+            _mask_control_id(m) for m in expected
+        ]
+        assert "O'Brien\\F\\0^Jane" in streamed[0]
+
+    def test_mllp_framing(self) -> None:
+        """Test each message is wrapped in MLLP block delimiters."""
+        sink = io.StringIO()
+        result = HL7v2Generator().write_batch(self._events(), sink, framing="mllp")
+
+        output = sink.getvalue()
+        assert output.startswith("\x0bMSH|")
+        assert output.endswith("\r\x1c\r")
+        assert output.count("\x0b") == output.count("\x1c\r") == 6
+        assert "FHS" not in output
+        assert result.batches == 0
+
+    def test_pid_rebuilt_when_patient_changes(self) -> None:
+        """Test a cached PID is only reused while the patient is unchanged."""
+        patient, encounter, _ = self._events(patients=1)[0]
+        renamed = patient.model_copy(
+            update={"name": PersonName(given_name="Janet", family_name="Smith")}
+        )
+        sink = io.StringIO()
+        result = HL7v2Generator().write_batch(
+            [(patient, encounter, "A01"), (renamed, encounter, "A08")], sink
+        )
+
+        assert result.pid_segments == 2
+        assert "Smith^Janet" in sink.getvalue()
+
+    def test_pid_rebuilt_when_patient_mutated(self) -> None:
+        """Test editing a cached patient in place invalidates its PID."""
+        patient, encounter, _ = self._events(patients=1)[0]
+
+        def events():
+            yield patient, encounter, "A01"
+            patient.name = PersonName(given_name="Janet", family_name="Smith")
+            yield patient, encounter, "A08"
+            yield patient, encounter, "A03"
+
+        sink = io.StringIO()
+        result = HL7v2Generator().write_batch(events(), sink)
+
+        assert result.pid_segments == 2
+        assert sink.getvalue().count("Smith^Janet") == 2
+
+    def test_pid_cache_size(self) -> None:
+        """Test evicted patients get their PID rebuilt."""
+        events = self._events(patients=2)
+        interleaved = [events[0], events[3], events[1], events[4]]
+
+        result = HL7v2Generator().write_batch(interleaved, io.StringIO(), pid_cache_size=1)
+
+        assert result.pid_segments == 4
+
+    def test_pid_cache_evicts_least_recently_seen(self) -> None:
+        """Test a patient seen again is kept over one seen only earlier."""
+        events = self._events(patients=3)
+        first, second, third = events[0], events[3], events[6]
+        replay = [first, second, first, third, first]
+
+        result = HL7v2Generator().write_batch(replay, io.StringIO(), pid_cache_size=2)
+
+        assert result.pid_segments == 3
+
+    def test_diagnoses_in_event(self) -> None:
+        """Test an optional fourth tuple element adds DG1 segments."""
+        patient, encounter, _ = self._events(patients=1)[0]
+        diagnosis = Diagnosis(
+            code="I10",
+            description="Essential hypertension",
+            type=DiagnosisType.FINAL,
+            patient_mrn=patient.mrn,
+            encounter_id=encounter.encounter_id,
+            diagnosed_date=date(2024, 1, 10),
+        )
+        sink = io.StringIO()
+        HL7v2Generator().write_batch([(patient, encounter, "A01", [diagnosis])], sink)
+
+        assert "DG1|1||I10^Essential hypertension^I10||" in sink.getvalue()
+
+    def test_empty_stream(self) -> None:
+        """Test an empty stream still writes a valid file envelope."""
+        sink = io.StringIO()
+        result = HL7v2Generator().write_batch([], sink)
+
+        assert sink.getvalue().split("\r")[1:] == ["FTS|0", ""]
+        assert result.messages == 0
+
+    def test_invalid_arguments(self) -> None:
+        """Test unsupported framings, events and batch sizes are rejected."""
+        generator = HL7v2Generator()
+        patient, encounter, _ = self._events(patients=1)[0]
+
+        with pytest.raises(ValueError, match="framing"):
+            generator.write_batch([], io.StringIO(), framing="x12")
+        with pytest.raises(ValueError, match="A01, A03, A08"):
+            generator.write_batch([(patient, encounter, "A04")], io.StringIO())
+        with pytest.raises(ValueError, match="messages_per_batch"):
+            generator.write_batch([], io.StringIO(), messages_per_batch=0)
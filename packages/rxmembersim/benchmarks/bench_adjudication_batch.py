@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch claim adjudication throughput (claims/sec).
+
+Adjudicates a synthetic claim history (several fills per member across the
+year) with ``AdjudicationEngine.adjudicate_batch`` and ``adjudicate_stream``.
+A plain ``adjudicate()`` loop over the same claims is timed first as the
+per-claim reference; it does not carry accumulators between claims.
+
+Usage:
+    python benchmarks/bench_adjudication_batch.py
+    python benchmarks/bench_adjudication_batch.py --members 20000 --claims-per-member 12
+"""
+
+import argparse
+import random
+import resource
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rxmembersim.claims import AdjudicationEngine, PharmacyClaim, TransactionCode  # noqa: E402
+from rxmembersim.core.member import RxMemberFactory  # noqa: E402
+from rxmembersim.formulary.formulary import FormularyGenerator  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_claims(members, claims_per_member: int, ndcs: list[str], seed: int = 42):
+    """Build claims for every member, sorted by member and service date."""
+    rng = random.Random(seed)
+    claims = []
+    for member in members:
+        for i in range(claims_per_member):
+            cost = Decimal(rng.randrange(500, 50_000)) / 100
+            claims.append(
+                PharmacyClaim(
+                    claim_id=f"{member.member_id}-{i:03d}",
+                    transaction_code=TransactionCode.BILLING,
+                    service_date=date(2025, 1, 1) + timedelta(days=i * 365 // claims_per_member),
+                    pharmacy_npi="1234567890",
+                    member_id=member.member_id,
+                    cardholder_id=member.cardholder_id,
+                    person_code=member.person_code,
+                    bin=member.bin,
+                    pcn=member.pcn,
+                    group_number=member.group_number,
+                    prescription_number=f"RX{i}",
+                    fill_number=1,
+                    ndc=rng.choice(ndcs),
+                    quantity_dispensed=Decimal("30"),
+                    days_supply=30,
+                    daw_code="0",
+                    prescriber_npi="0987654321",
+                    ingredient_cost_submitted=cost,
+                    dispensing_fee_submitted=Decimal("2.50"),
+                    usual_customary_charge=cost + 10,
+                    gross_amount_due=cost + Decimal("2.50"),
+                )
+            )
+    return claims
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=5_000)
+    parser.add_argument("--claims-per-member", type=int, default=12)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    formulary = FormularyGenerator().generate_standard_commercial()
+    engine = AdjudicationEngine(formulary=formulary)
+    factory = RxMemberFactory()
+    members = []
+    for _ in range(args.members):
+        member = factory.generate()
+        member.effective_date = date(2024, 1, 1)
+        member.termination_date = None
+        members.append(member)
+    by_id = {member.member_id: member for member in members}
+    ndcs = [drug.ndc for drug in formulary.drugs.values()] + ["99999999999"]
+    claims = make_claims(members, args.claims_per_member, ndcs)
+
+    print(f"{'mode':>8} {'claims':>9} {'time (s)':>9} {'claims/s':>10} {'peak MB':>8}")
+
+    start = time.perf_counter()
+    for claim in claims:
+        engine.adjudicate(claim, by_id[claim.member_id])
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'single':>8} {len(claims):>9,} {elapsed:>9.2f} "
+        f"{len(claims) / elapsed:>10,.0f} {peak_rss_mb():>8.1f}"
+    )
+
+    start = time.perf_counter()
+    result = engine.adjudicate_batch(claims, by_id)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'batch':>8} {len(result.claims):>9,} {elapsed:>9.2f} "
+        f"{len(claims) / elapsed:>10,.0f} {peak_rss_mb():>8.1f}"
+    )
+
+    start = time.perf_counter()
+    rows = sum(
+        len(chunk)
+        for chunk in engine.adjudicate_stream(iter(claims), by_id, chunk_size=args.chunk_size)
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'stream':>8} {rows:>9,} {elapsed:>9.2f} "
+        f"{len(claims) / elapsed:>10,.0f} {peak_rss_mb():>8.1f}"
+    )
+    print(result.to_dict())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
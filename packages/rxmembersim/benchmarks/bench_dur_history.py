@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replaying a member's fill history through DUR validation.
+
+Validates every fill of a long-tenured member against the fills before it.
+The profile path passes the growing fill list as ``current_medications``
+(every fill is rescanned on every claim); the history path appends each
+fill to a ``MemberMedicationHistory`` and screens only the drugs on hand.
+
+Usage:
+    python benchmarks/bench_dur_history.py
+    python benchmarks/bench_dur_history.py --fills 500 2000 8000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rxmembersim.dur import (  # noqa: E402
+    DURValidationRequest,
+    DURValidator,
+    MemberMedication,
+    MemberMedicationHistory,
+    MemberProfile,
+)
+
+# (NDC, GPI) of a chronic regimen refilled every 30 days
+REGIMEN = [
+    ("00071015523", "39400010000310"),
+    ("00093505698", "27250050000350"),
+    ("00378180001", "36100030000310"),
+    ("00172208460", "58160020100320"),
+    ("00056017270", "83300010000330"),
+    ("00591040401", "33200020000305"),
+]
+
+
+def make_fills(count: int, seed: int = 42) -> list[MemberMedication]:
+    """Build ``count`` fills in service-date order."""
+    rng = random.Random(seed)
+    fills = []
+    day = date(2015, 1, 1)
+    while len(fills) < count:
+        for ndc, gpi in REGIMEN:
+            fills.append(
+                MemberMedication(
+                    ndc=ndc,
+                    gpi=gpi,
+                    name=ndc,
+                    service_date=day + timedelta(days=rng.randrange(3)),
+                    days_supply=30,
+                    quantity=30,
+                )
+            )
+        day += timedelta(days=30)
+    fills = fills[:count]
+    fills.sort(key=lambda fill: fill.service_date)
+    return fills
+
+
+def request_for(i: int, fill: MemberMedication) -> DURValidationRequest:
+    """Build the DUR request for a fill."""
+    return DURValidationRequest(
+        claim_id=f"CLM{i}",
+        service_date=fill.service_date,
+        ndc=fill.ndc,
+        gpi=fill.gpi,
+        drug_name=fill.name,
+        quantity=fill.quantity,
+        days_supply=fill.days_supply,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fills", type=int, nargs="+", default=[250, 1_000, 4_000])
+    args = parser.parse_args()
+
+    validator = DURValidator()
+    print(f"{'fills':>7} {'profile (s)':>11} {'history (s)':>11} {'speedup':>8}")
+    for count in args.fills:
+        fills = make_fills(count)
+        requests = [request_for(i, fill) for i, fill in enumerate(fills)]
+
+        start = time.perf_counter()
+        profile = MemberProfile(member_id="M1", date_of_birth=date(1960, 1, 1), gender="F")
+        for request, fill in zip(requests, fills, strict=True):
+            validator.validate(request, profile)
+            profile.current_medications.append(fill)
+        profile_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        member = MemberProfile(member_id="M1", date_of_birth=date(1960, 1, 1), gender="F")
+        history = MemberMedicationHistory()
+        for request, fill in zip(requests, fills, strict=True):
+            validator.validate(request, member, history=history)
+            history.add(fill)
+        history_s = time.perf_counter() - start
+
+        print(f"{count:>7,} {profile_s:>11.2f} {history_s:>11.2f} {profile_s / history_s:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DUR drug-drug interaction screening against a large knowledge base.
+
+Loads a synthetic interaction knowledge base of GPI-prefix rules into
+``DURRulesEngine`` and screens new prescriptions against a member's active
+medications. Lookups go through the engine's GPI prefix index; a linear
+``startswith`` scan over every rule, as the engine used to do, is timed
+alongside for reference.
+
+Usage:
+    python benchmarks/bench_dur_screening.py
+    python benchmarks/bench_dur_screening.py --interactions 1000 10000 100000 --active-meds 15
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from rxmembersim.dur.rules import (  # noqa: E402
+    ClinicalSignificance,
+    DrugDrugInteraction,
+    DURRulesEngine,
+)
+
+
+def random_gpi(rng: random.Random) -> str:
+    """A 14-character GPI drawn from a few hundred drug groups."""
+    return f"{rng.randrange(10, 99)}{rng.randrange(10, 30)}" + "".join(
+        str(rng.randrange(10)) for _ in range(10)
+    )
+
+
+def make_interactions(count: int, rng: random.Random) -> list[DrugDrugInteraction]:
+    """Build ``count`` interactions between GPI prefixes of 4 to 10 characters."""
+    return [
+        DrugDrugInteraction(
+            interaction_id=f"DD-{i:06d}",
+            drug1_gpi=random_gpi(rng)[: rng.choice((4, 6, 8, 10))],
+            drug2_gpi=random_gpi(rng)[: rng.choice((4, 6, 8, 10))],
+            drug1_name="Drug A",
+            drug2_name="Drug B",
+            interaction_description="Synthetic interaction",
+            clinical_effect="Synthetic effect",
+            clinical_significance=ClinicalSignificance.LEVEL_2,
+            recommendation="Monitor",
+        )
+        for i in range(count)
+    ]
+
+
+def linear_scan(
+    interactions: list[DrugDrugInteraction], new_gpi: str, current: list[dict]
+) -> int:
+    """Count matches the way the engine did before it was indexed."""
+    hits = 0
+    for med in current:
+        gpi = med["gpi"]
+        for rule in interactions:
+            if (new_gpi.startswith(rule.drug1_gpi) and gpi.startswith(rule.drug2_gpi)) or (
+                new_gpi.startswith(rule.drug2_gpi) and gpi.startswith(rule.drug1_gpi)
+            ):
+                hits += 1
+    return hits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--interactions", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--active-meds", type=int, default=15)
+    parser.add_argument("--screens", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'rules':>8} {'build (ms)':>10} {'indexed (us)':>12} {'linear (us)':>11} "
+        f"{'speedup':>8} {'alerts':>8}"
+    )
+    for count in args.interactions:
+        rng = random.Random(args.seed)
+        engine = DURRulesEngine()
+        engine.drug_interactions = make_interactions(count, rng)
+        members = [
+            [
+                {"ndc": f"{i:011d}", "gpi": random_gpi(rng), "name": "Active"}
+                for i in range(args.active_meds)
+            ]
+            for _ in range(50)
+        ]
+        new_gpis = [random_gpi(rng) for _ in range(args.screens)]
+
+        start = time.perf_counter()
+        engine.check_drug_drug_interactions("", "", "", [])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        alerts = 0
+        start = time.perf_counter()
+        for i, new_gpi in enumerate(new_gpis):
+            alerts += len(
+                engine.check_drug_drug_interactions(
+                    new_gpi, "00000000000", "New", members[i % len(members)]
+                )
+            )
+        indexed_us = (time.perf_counter() - start) / len(new_gpis) * 1e6
+
+        # The linear scan is slow on large bases, so it gets fewer screens
+        linear_screens = new_gpis[: max(10, len(new_gpis) * 1_000 // count)]
+        start = time.perf_counter()
+        linear_alerts = sum(
+            linear_scan(engine.drug_interactions, new_gpi, members[i % len(members)])
+            for i, new_gpi in enumerate(linear_screens)
+        )
+        linear_us = (time.perf_counter() - start) / len(linear_screens) * 1e6
+        indexed_alerts = sum(
+            len(engine.check_drug_drug_interactions(g, "", "", members[i % len(members)]))
+            for i, g in enumerate(linear_screens)
+        )
+        assert linear_alerts == indexed_alerts, (linear_alerts, indexed_alerts)
+
+        print(
+            f"{count:>8,} {build_ms:>10.1f} {indexed_us:>12.1f} {linear_us:>11.0f} "
+            f"{linear_us / indexed_us:>7.0f}x {alerts:>8,}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: quarterly rebate and spread runs over the pharmacy_claims table.
+
+Fills an in-memory DuckDB ``pharmacy_claims`` table with synthetic fills and
+times ``calculate_period_rebate_sql`` and ``calculate_period_spread_sql``.
+The in-memory ``calculate_period_rebate``/``calculate_period_spread`` are
+timed on claim dicts fetched from the same table (fetch time excluded) as
+the reference.
+
+Usage:
+    python benchmarks/bench_period_rebates.py
+    python benchmarks/bench_period_rebates.py --claims 5000000 --loop-max 200000
+"""
+
+import argparse
+import resource
+import sys
+import time
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import duckdb
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from healthsim.db.schema import apply_schema  # noqa: E402
+
+from rxmembersim.core.drug import DrugReference  # noqa: E402
+from rxmembersim.pricing import (  # noqa: E402
+    RebateCalculator,
+    SampleRebateContracts,
+    SampleSpreadConfigs,
+    SpreadCalculator,
+)
+
+PERIOD = (date(2025, 1, 1), date(2025, 3, 31))
+
+# NDC -> (GPI, unit AWP, brand)
+DRUGS = {
+    "00069015430": ("39400010000310", 12.5, True),
+    "00093505698": ("39400010000320", 0.85, False),
+    "00169413512": ("27200060002020", 935.0, True),
+    "00074320502": ("66400020002020", 3100.0, True),
+    "00378180001": ("36100030000310", 0.12, False),
+    "00172208460": ("58160020100320", 0.09, False),
+}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_claims(conn: duckdb.DuckDBPyConnection, count: int) -> None:
+    """Insert ``count`` fills spread over 2025 across the DRUGS NDCs."""
+    ndcs = ", ".join(f"'{ndc}'" for ndc in DRUGS)
+    conn.execute(
+        f"""
+        INSERT INTO pharmacy_claims (
+            claim_id, transaction_code, service_date, pharmacy_npi, member_id,
+            cardholder_id, bin, pcn, group_number, prescription_number, ndc,
+            quantity_dispensed, days_supply, prescriber_npi, ingredient_cost_submitted
+        )
+        SELECT
+            'RX' || i, CASE WHEN i % 50 = 0 THEN 'B2' ELSE 'B1' END,
+            DATE '2025-01-01' + CAST(i % 365 AS INTEGER), '1234567890', 'M' || (i % 100000),
+            'C1', '610014', 'RX', 'G1', 'P' || i, ([{ndcs}])[1 + i % {len(DRUGS)}],
+            [30, 90, 2.5][1 + (i // 7) % 3], 30, '0987654321', ((i * 7919) % 99900 + 100) / 100
+        FROM range({count}) t(i)
+        """
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--claims", type=int, default=1_000_000)
+    parser.add_argument("--loop-max", type=int, default=100_000, help="claims for dict runs")
+    args = parser.parse_args()
+
+    conn = duckdb.connect()
+    apply_schema(conn)
+    start = time.perf_counter()
+    load_claims(conn, args.claims)
+    print(f"loaded {args.claims:,} claims in {time.perf_counter() - start:.1f}s")
+
+    drugs = [
+        DrugReference(
+            ndc=ndc, drug_name=ndc, generic_name=ndc, gpi=gpi, therapeutic_class="Test",
+            strength="1 mg", dosage_form="Tablet", route_of_admin="Oral",
+            is_brand=is_brand, awp=awp,
+        )
+        for ndc, (gpi, awp, is_brand) in DRUGS.items()
+    ]
+    rebates = RebateCalculator(
+        [
+            SampleRebateContracts.brand_statin(),
+            SampleRebateContracts.glp1_agonist(),
+            SampleRebateContracts.tnf_inhibitor(),
+        ]
+    )
+    spread = SpreadCalculator(*SampleSpreadConfigs.traditional_pbm())
+
+    rows = conn.execute(
+        """
+        SELECT ndc, quantity_dispensed, ingredient_cost_submitted FROM pharmacy_claims
+        WHERE service_date BETWEEN $1 AND $2 AND transaction_code <> 'B2' LIMIT $3
+        """,
+        [*PERIOD, args.loop_max],
+    ).fetchall()
+    claims = [
+        {
+            "ndc": ndc, "gpi": DRUGS[ndc][0], "awp": DRUGS[ndc][1], "is_brand": DRUGS[ndc][2],
+            "quantity": quantity, "ingredient_cost": cost,
+        }
+        for ndc, quantity, cost in rows
+    ]
+
+    print(f"{'run':>12} {'claims':>10} {'time (s)':>9} {'claims/s':>12} {'peak MB':>8}")
+    runs = [
+        ("rebate dict", len(claims),
+         lambda: rebates.calculate_period_rebate(claims, Decimal("35"), *PERIOD)),
+        ("rebate sql", None,
+         lambda: rebates.calculate_period_rebate_sql(conn, *PERIOD, Decimal("35"), drugs)),
+        ("spread dict", len(claims), lambda: spread.calculate_period_spread(claims, *PERIOD)),
+        ("spread sql", None, lambda: spread.calculate_period_spread_sql(conn, *PERIOD, drugs)),
+    ]
+    for name, count, run in runs:
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        if count is None:
+            count = (
+                result.total_claims
+                if hasattr(result, "total_claims")
+                else sum(summary.total_claims for summary in result)
+            )
+        print(
+            f"{name:>12} {count:>10,} {elapsed:>9.2f} "
+            f"{count / elapsed:>12,.0f} {peak_rss_mb():>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
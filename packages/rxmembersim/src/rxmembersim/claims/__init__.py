@@ -1,6 +1,11 @@
 """Pharmacy claims module."""
 
-from .adjudication import AdjudicationEngine, EligibilityResult, PricingResult
+from .adjudication import (
+    AdjudicationEngine,
+    BatchAdjudicationResult,
+    EligibilityResult,
+    PricingResult,
+)
 from .claim import PharmacyClaim, TransactionCode
 from .response import ClaimResponse, DURAlert, RejectCode
 
@@ -8,6 +13,7 @@ __all__ = [
     "PharmacyClaim",
     "TransactionCode",
     "AdjudicationEngine",
+    "BatchAdjudicationResult",
     "EligibilityResult",
     "PricingResult",
     "ClaimResponse",
@@ -1,13 +1,41 @@
 """Claim adjudication engine."""
 import random
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from decimal import Decimal
+from itertools import islice
+from typing import Any
+
+import pandas as pd
 
 from ..core.member import RxMember
 from ..formulary.formulary import Formulary, FormularyStatus
 from .claim import PharmacyClaim
 from .response import ClaimResponse, RejectCode
 
+# Columns of the claim table produced by batch adjudication
+BATCH_COLUMNS = (
+    "claim_id",
+    "member_id",
+    "service_date",
+    "ndc",
+    "response_status",
+    "reject_codes",
+    "authorization_number",
+    "tier",
+    "ingredient_cost_paid",
+    "dispensing_fee_paid",
+    "total_amount_paid",
+    "patient_pay_amount",
+    "copay_amount",
+    "deductible_amount",
+    "remaining_deductible",
+    "remaining_oop",
+)
+
+# Claims per DataFrame chunk yielded by adjudicate_stream()
+DEFAULT_STREAM_CHUNK_SIZE = 100_000
+
 
 @dataclass
 class EligibilityResult:
@@ -29,6 +57,30 @@ class PricingResult:
     deductible_applied: Decimal
 
 
+@dataclass
+class BatchAdjudicationResult:
+    """Result of adjudicating a batch of claims.
+
+    Attributes:
+        claims: One row per claim, in processing order, with BATCH_COLUMNS
+        responses: ClaimResponse per claim (same order), if requested
+    """
+
+    claims: pd.DataFrame
+    responses: list[ClaimResponse] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize claim counts and paid amounts."""
+        paid = self.claims[self.claims["response_status"] == "P"]
+        return {
+            "claims": len(self.claims),
+            "paid": len(paid),
+            "rejected": len(self.claims) - len(paid),
+            "total_amount_paid": round(float(paid["total_amount_paid"].sum()), 2),
+            "patient_pay_amount": round(float(paid["patient_pay_amount"].sum()), 2),
+        }
+
+
 class AdjudicationEngine:
     """Process pharmacy claims."""
 
@@ -64,22 +116,185 @@ class AdjudicationEngine:
         # Calculate pricing
         pricing = self._calculate_pricing(claim, member, formulary_status)
 
-        return ClaimResponse(
-            claim_id=claim.claim_id,
-            transaction_response_status="A",
-            response_status="P",
-            authorization_number=self._generate_auth_number(),
-            ingredient_cost_paid=pricing.ingredient_cost,
-            dispensing_fee_paid=pricing.dispensing_fee,
-            total_amount_paid=pricing.plan_pays,
-            patient_pay_amount=pricing.patient_pays,
-            copay_amount=pricing.copay,
-            deductible_amount=pricing.deductible_applied,
-            remaining_deductible=member.accumulators.deductible_remaining
-            - pricing.deductible_applied,
-            remaining_oop=member.accumulators.oop_remaining - pricing.patient_pays,
+        return self._create_payment(
+            claim,
+            pricing,
+            self._generate_auth_number(),
+            member.accumulators.deductible_remaining - pricing.deductible_applied,
+            member.accumulators.oop_remaining - pricing.patient_pays,
         )
 
+    def adjudicate_batch(
+        self,
+        claims: Iterable[PharmacyClaim],
+        members: Mapping[str, RxMember] | Iterable[RxMember],
+        return_responses: bool = False,
+        update_accumulators: bool = False,
+    ) -> BatchAdjudicationResult:
+        """Adjudicate many claims, carrying member accumulators across them.
+
+        Claims are sorted by member and service date and adjudicated with
+        the same rules as adjudicate(), except that each paid claim draws
+        down the member's deductible and out-of-pocket balance for their
+        later claims. Formulary status is looked up once per NDC, and claims
+        for members not in ``members`` are rejected (52).
+
+        Args:
+            claims: Claims to adjudicate
+            members: Members keyed by member_id, or an iterable of members
+            return_responses: Also build a ClaimResponse for every claim
+            update_accumulators: Write each member's final balances back to
+                their accumulators
+
+        Returns:
+            BatchAdjudicationResult with one row per claim
+        """
+        ordered = sorted(claims, key=lambda c: (c.member_id, c.service_date, c.claim_id))
+        responses: list[ClaimResponse] | None = [] if return_responses else None
+        rows = list(self._adjudicate_rows(ordered, members, update_accumulators, responses))
+        return BatchAdjudicationResult(claims=self._claims_frame(rows), responses=responses)
+
+    def adjudicate_stream(
+        self,
+        claims: Iterable[PharmacyClaim],
+        members: Mapping[str, RxMember] | Iterable[RxMember],
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        update_accumulators: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Adjudicate claims lazily, yielding the claim table in chunks.
+
+        Works like adjudicate_batch() without holding the claims in memory:
+        claims are consumed as they are read and are not sorted, so each
+        member's claims must arrive in service-date order (for example, a
+        feed sorted by member and service date).
+
+        Args:
+            claims: Claims to adjudicate, in service-date order per member
+            members: Members keyed by member_id, or an iterable of members
+            chunk_size: Claims per yielded DataFrame
+            update_accumulators: Write each member's final balances back to
+                their accumulators once the stream is exhausted
+
+        Yields:
+            DataFrames of up to ``chunk_size`` rows with BATCH_COLUMNS
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        rows = self._adjudicate_rows(claims, members, update_accumulators, None)
+        while chunk := list(islice(rows, chunk_size)):
+            yield self._claims_frame(chunk)
+
+    def _adjudicate_rows(
+        self,
+        claims: Iterable[PharmacyClaim],
+        members: Mapping[str, RxMember] | Iterable[RxMember],
+        update_accumulators: bool,
+        responses: list[ClaimResponse] | None,
+    ) -> Iterator[tuple]:
+        """Adjudicate claims in order, yielding one BATCH_COLUMNS row each."""
+        if not isinstance(members, Mapping):
+            members = {member.member_id: member for member in members}
+        # member_id -> [deductible remaining, OOP remaining] after their last paid claim
+        balances: dict[str, list[Decimal]] = {}
+        # ndc -> (formulary status, copay), looked up once per batch
+        statuses: dict[str, tuple[FormularyStatus, Decimal]] = {}
+        unpriced = (None,) * 8
+
+        for claim in claims:
+            member = members.get(claim.member_id)
+            if member is None:
+                reject_codes = [RejectCode(code="52", description="Non-Matched Cardholder ID")]
+            else:
+                reject_codes = self._check_eligibility(claim, member).reject_codes
+
+            if not reject_codes:
+                cached = statuses.get(claim.ndc)
+                if cached is None:
+                    status = self.formulary.check_coverage(claim.ndc)
+                    cached = statuses[claim.ndc] = (status, self._copay(status))
+                formulary_status, copay = cached
+                if not formulary_status.covered:
+                    reject_codes = [
+                        RejectCode(code="70", description="Product/Service Not Covered")
+                    ]
+                elif formulary_status.requires_pa and not claim.prior_auth_number:
+                    reject_codes = [
+                        RejectCode(code="75", description="Prior Authorization Required")
+                    ]
+
+            if reject_codes:
+                if responses is not None:
+                    responses.append(self._create_rejection(claim, reject_codes))
+                yield (
+                    claim.claim_id,
+                    claim.member_id,
+                    claim.service_date,
+                    claim.ndc,
+                    "R",
+                    ",".join(reject_code.code for reject_code in reject_codes),
+                    None,
+                    None,
+                    *unpriced,
+                )
+                continue
+
+            balance = balances.get(claim.member_id)
+            if balance is None:
+                accumulators = member.accumulators
+                balance = [accumulators.deductible_remaining, accumulators.oop_remaining]
+                balances[claim.member_id] = balance
+
+            pricing = self._price(
+                claim.ingredient_cost_submitted,
+                claim.dispensing_fee_submitted,
+                copay,
+                balance[0],
+                balance[1],
+            )
+            balance[0] -= pricing.deductible_applied
+            balance[1] -= pricing.patient_pays
+            authorization_number = self._generate_auth_number()
+
+            if responses is not None:
+                responses.append(
+                    self._create_payment(claim, pricing, authorization_number, *balance)
+                )
+            yield (
+                claim.claim_id,
+                claim.member_id,
+                claim.service_date,
+                claim.ndc,
+                "P",
+                "",
+                authorization_number,
+                formulary_status.tier,
+                float(pricing.ingredient_cost),
+                float(pricing.dispensing_fee),
+                float(pricing.plan_pays),
+                float(pricing.patient_pays),
+                float(pricing.copay),
+                float(pricing.deductible_applied),
+                float(balance[0]),
+                float(balance[1]),
+            )
+
+        if update_accumulators:
+            for member_id, (deductible_remaining, oop_remaining) in balances.items():
+                accumulators = members[member_id].accumulators
+                accumulators.deductible_met += (
+                    accumulators.deductible_remaining - deductible_remaining
+                )
+                accumulators.deductible_remaining = deductible_remaining
+                accumulators.oop_met += accumulators.oop_remaining - oop_remaining
+                accumulators.oop_remaining = oop_remaining
+
+    @staticmethod
+    def _claims_frame(rows: list[tuple]) -> pd.DataFrame:
+        """Build the claim table from adjudicated rows."""
+        frame = pd.DataFrame.from_records(rows, columns=BATCH_COLUMNS)
+        frame["tier"] = frame["tier"].astype("Int64")
+        return frame
+
     def _check_eligibility(
         self, claim: PharmacyClaim, member: RxMember
     ) -> EligibilityResult:
@@ -124,16 +339,35 @@ class AdjudicationEngine:
     ) -> PricingResult:
         """Calculate claim pricing."""
         # Use submitted costs (in real system would price based on contract)
-        ingredient_cost = claim.ingredient_cost_submitted
-        dispensing_fee = claim.dispensing_fee_submitted
+        return self._price(
+            claim.ingredient_cost_submitted,
+            claim.dispensing_fee_submitted,
+            self._copay(formulary_status),
+            member.accumulators.deductible_remaining,
+            member.accumulators.oop_remaining,
+        )
 
-        total_cost = ingredient_cost + dispensing_fee
+    @staticmethod
+    def _copay(formulary_status: FormularyStatus) -> Decimal:
+        """Get the copay from the formulary status."""
+        return Decimal(str(formulary_status.copay or 30))
 
-        # Get copay from formulary
-        copay = Decimal(str(formulary_status.copay or 30))
+    @staticmethod
+    def _price(
+        ingredient_cost: Decimal,
+        dispensing_fee: Decimal,
+        copay: Decimal,
+        deductible_remaining: Decimal,
+        oop_remaining: Decimal,
+    ) -> PricingResult:
+        """Split a claim's cost between plan and patient.
+
+        The patient's share is capped at the out-of-pocket balance left, so
+        a member who reaches the maximum pays nothing further.
+        """
+        total_cost = ingredient_cost + dispensing_fee
 
         # Check deductible
-        deductible_remaining = member.accumulators.deductible_remaining
         deductible_applied = Decimal("0")
 
         if deductible_remaining > 0:
@@ -142,8 +376,9 @@ class AdjudicationEngine:
         else:
             total_cost_after_deductible = total_cost
 
-        # Patient pays copay (or less if cost is lower)
-        patient_pays = min(copay + deductible_applied, total_cost)
+        # Patient pays copay (or less if cost or the OOP balance is lower)
+        patient_pays = min(copay + deductible_applied, total_cost, max(oop_remaining, Decimal("0")))
+        deductible_applied = min(deductible_applied, patient_pays)
 
         # Plan pays the rest
         plan_pays = total_cost - patient_pays
@@ -153,10 +388,34 @@ class AdjudicationEngine:
             dispensing_fee=dispensing_fee,
             plan_pays=max(plan_pays, Decimal("0")),
             patient_pays=patient_pays,
-            copay=min(copay, total_cost_after_deductible),
+            copay=min(copay, total_cost_after_deductible, patient_pays - deductible_applied),
             deductible_applied=deductible_applied,
         )
 
+    def _create_payment(
+        self,
+        claim: PharmacyClaim,
+        pricing: PricingResult,
+        authorization_number: str,
+        remaining_deductible: Decimal,
+        remaining_oop: Decimal,
+    ) -> ClaimResponse:
+        """Create paid response."""
+        return ClaimResponse(
+            claim_id=claim.claim_id,
+            transaction_response_status="A",
+            response_status="P",
+            authorization_number=authorization_number,
+            ingredient_cost_paid=pricing.ingredient_cost,
+            dispensing_fee_paid=pricing.dispensing_fee,
+            total_amount_paid=pricing.plan_pays,
+            patient_pay_amount=pricing.patient_pays,
+            copay_amount=pricing.copay,
+            deductible_amount=pricing.deductible_applied,
+            remaining_deductible=remaining_deductible,
+            remaining_oop=remaining_oop,
+        )
+
     def _create_rejection(
         self, claim: PharmacyClaim, reject_codes: list[RejectCode]
     ) -> ClaimResponse:
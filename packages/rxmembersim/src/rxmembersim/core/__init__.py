@@ -12,6 +12,7 @@ from rxmembersim.core.member import (
     RxMemberFactory,
 )
 from rxmembersim.core.pharmacy import Pharmacy
+from rxmembersim.core.prefix_index import PrefixIndex
 from rxmembersim.core.prescriber import Prescriber
 from rxmembersim.core.prescription import DAWCode, Prescription
 
@@ -22,6 +23,7 @@ __all__ = [
     "DrugReference",
     "MemberDemographics",
     "Pharmacy",
+    "PrefixIndex",
     "Prescriber",
     "Prescription",
     "RxMember",
@@ -0,0 +1,128 @@
+"""Prefix index for GPI and NDC rule lookups.
+
+Formulary, DUR and pricing rules are keyed by drug code prefixes: a rule on
+GPI ``3940`` applies to every statin, one on ``39400010`` to simvastatin
+only. ``PrefixIndex`` stores rules in a character trie so the rules matching
+a code are found by walking the code once, instead of calling
+``code.startswith(prefix)`` for every rule.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Trie node key holding the entries added under a node's prefix; codes are
+# walked one character at a time, so no child key is ever empty.
+_ENTRIES = ""
+
+
+class PrefixIndex(Generic[T]):
+    """Character trie mapping code prefixes to values.
+
+    Values are returned in the order they were added, so a caller that adds
+    its rules in list order gets "first matching rule wins" semantics from
+    ``first()``. Entries may carry an effective window, checked against the
+    ``as_of`` date of a lookup.
+
+    Example:
+        >>> index = PrefixIndex()
+        >>> index.add("3940", "statins")
+        >>> index.add("39400010", "simvastatin")
+        >>> index.match("39400010000310")
+        ['statins', 'simvastatin']
+        >>> index.match("3940", exact=True)
+        ['statins']
+    """
+
+    def __init__(self, items: Iterable[tuple[str, T]] = ()) -> None:
+        """Initialize the index.
+
+        Args:
+            items: Initial ``(prefix, value)`` pairs
+        """
+        self._root: dict = {}
+        self._size = 0
+        for prefix, value in items:
+            self.add(prefix, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(
+        self,
+        prefix: str,
+        value: T,
+        effective_date: date | None = None,
+        termination_date: date | None = None,
+    ) -> None:
+        """Add a value under a code prefix.
+
+        Args:
+            prefix: GPI or NDC prefix (a full code matches only itself
+                and longer codes)
+            value: Value returned by lookups matching the prefix
+            effective_date: First date the value applies (inclusive)
+            termination_date: Last date the value applies (inclusive)
+        """
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(_ENTRIES, []).append(
+            (self._size, value, effective_date, termination_date)
+        )
+        self._size += 1
+
+    def match(self, code: str | None, as_of: date | None = None, exact: bool = False) -> list[T]:
+        """Find the values whose prefix the code starts with.
+
+        Args:
+            code: GPI or NDC to look up (None or empty matches only values
+                added under the empty prefix)
+            as_of: Only return values effective on this date; values added
+                without a window always apply
+            exact: Only return values added under the code itself
+
+        Returns:
+            Matching values in the order they were added
+        """
+        node = self._root
+        found = [] if exact else list(node.get(_ENTRIES, ()))
+        for char in code or "":
+            node = node.get(char)
+            if node is None:
+                break
+            if not exact and _ENTRIES in node:
+                found.extend(node[_ENTRIES])
+        else:
+            if exact:
+                found = node.get(_ENTRIES, [])
+
+        if len(found) > 1 and not exact:
+            # Entries are in order within a node, not across nodes
+            found.sort(key=lambda entry: entry[0])
+
+        return [
+            value
+            for _, value, effective, termination in found
+            if as_of is None
+            or (
+                (effective is None or effective <= as_of)
+                and (termination is None or termination >= as_of)
+            )
+        ]
+
+    def first(self, code: str | None, as_of: date | None = None, exact: bool = False) -> T | None:
+        """Find the earliest-added value matching the code.
+
+        Args:
+            code: GPI or NDC to look up
+            as_of: Only consider values effective on this date
+            exact: Only consider values added under the code itself
+
+        Returns:
+            The matching value, or None
+        """
+        matches = self.match(code, as_of, exact)
+        return matches[0] if matches else None
@@ -4,6 +4,7 @@ Transforms RxMemberSim canonical models into dimensional (star schema) format
 for analytics, reporting, and BI tools.
 """
 
+from .sql_transformer import RxMemberSimSQLDimensionalTransformer
 from .transformer import RxMemberSimDimensionalTransformer
 
-__all__ = ["RxMemberSimDimensionalTransformer"]
+__all__ = ["RxMemberSimDimensionalTransformer", "RxMemberSimSQLDimensionalTransformer"]
@@ -0,0 +1,249 @@
+"""RxMemberSim SQL Dimensional Transformer.
+
+Builds the RxMemberSim star schema as DuckDB SQL over the canonical
+``pharmacy_claims`` table instead of from lists of model objects.
+"""
+
+from __future__ import annotations
+
+from healthsim.dimensional import SQLDimensionalTransformer
+
+from .transformer import RxMemberSimDimensionalTransformer
+
+
+class RxMemberSimSQLDimensionalTransformer(SQLDimensionalTransformer):
+    """Columnar counterpart of ``RxMemberSimDimensionalTransformer``.
+
+    Produces the same tables, columns, keys and row order as the object
+    transformer fed with the same pharmacy claims in table order and no
+    reference data. Pharmacy members, drug references, pharmacies,
+    prescribers, formularies and prior authorizations have no canonical
+    tables, so ``dim_rx_member``, ``dim_formulary``, ``fact_prior_auth`` and
+    ``fact_rx_eligibility_spans`` are not produced and the medication,
+    pharmacy and prescriber dimensions carry only the identifiers seen on
+    claims. Claim fields the table does not store (compound code, prior
+    authorization and DUR codes) take the ``PharmacyClaim`` defaults.
+
+    Example:
+        >>> from healthsim.db import get_connection
+        >>> from rxmembersim.dimensional import RxMemberSimSQLDimensionalTransformer
+        >>>
+        >>> transformer = RxMemberSimSQLDimensionalTransformer(
+        ...     get_connection(), cohort_id="pbm-cohort"
+        ... )
+        >>> dimensions, facts = transformer.transform()
+    """
+
+    NATURAL_KEYS = RxMemberSimDimensionalTransformer.NATURAL_KEYS
+    SURROGATE_KEYS = RxMemberSimDimensionalTransformer.SURROGATE_KEYS
+    FOREIGN_KEYS = RxMemberSimDimensionalTransformer.FOREIGN_KEYS
+
+    def _build_queries(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Build queries for every table whose source has rows."""
+        dimensions: dict[str, str] = {}
+        facts: dict[str, str] = {}
+
+        if not self.has_rows("pharmacy_claims"):
+            return dimensions, facts
+
+        # Build dimensions
+        dimensions["dim_medication"] = self._dim_medication_sql()
+
+        if self.has_rows("pharmacy_claims", self.truthy_sql("pharmacy_npi")):
+            dimensions["dim_pharmacy"] = self._dim_pharmacy_sql()
+
+        if self.has_rows("pharmacy_claims", self.truthy_sql("prescriber_npi")):
+            dimensions["dim_prescriber"] = self._dim_prescriber_sql()
+
+        # Build facts
+        facts["fact_prescription_fills"] = self._fact_prescription_fills_sql()
+
+        return dimensions, facts
+
+    # -------------------------------------------------------------------------
+    # Dimension Queries
+    # -------------------------------------------------------------------------
+
+    def _dim_medication_sql(self) -> str:
+        """Medication dimension from the NDCs on claims."""
+        return f"""
+            SELECT
+                key AS medication_key,
+                ndc_11,
+                {self.ndc_11_to_10_sql("ndc_11")} AS ndc_10,
+                NULL::VARCHAR AS drug_name,
+                NULL::VARCHAR AS generic_name,
+                NULL::VARCHAR AS gpi,
+                NULL::VARCHAR AS gpi_2,
+                NULL::VARCHAR AS gpi_4,
+                NULL::VARCHAR AS gpi_6,
+                NULL::VARCHAR AS therapeutic_class,
+                'Unknown' AS therapeutic_category,
+                NULL::VARCHAR AS strength,
+                NULL::VARCHAR AS dosage_form,
+                NULL::VARCHAR AS route_of_admin,
+                NULL::VARCHAR AS dea_schedule,
+                false AS is_controlled,
+                NULL::BOOLEAN AS is_brand,
+                NULL::VARCHAR AS multi_source_code,
+                NULL::DOUBLE AS awp,
+                NULL::DOUBLE AS wac
+            FROM ({self._medication_keys_sql()})
+            ORDER BY key
+        """
+
+    def _dim_pharmacy_sql(self) -> str:
+        """Pharmacy dimension from the NPIs on claims."""
+        return f"""
+            SELECT
+                row_number() OVER (ORDER BY npi) AS pharmacy_key,
+                npi AS pharmacy_npi,
+                ncpdp_id,
+                npi AS pharmacy_name,
+                NULL::VARCHAR AS dba_name,
+                'UNKNOWN' AS pharmacy_type,
+                'Other' AS pharmacy_category,
+                NULL::VARCHAR AS city,
+                NULL::VARCHAR AS state,
+                NULL::VARCHAR AS postal_code,
+                NULL::BOOLEAN AS in_network,
+                NULL::BOOLEAN AS preferred,
+                NULL::BOOLEAN AS specialty_certified,
+                NULL::VARCHAR AS chain_code,
+                NULL::VARCHAR AS chain_name,
+                NULL::BOOLEAN AS has_delivery,
+                NULL::BOOLEAN AS has_24_hour
+            FROM (
+                SELECT pharmacy_npi AS npi, first(pharmacy_ncpdp ORDER BY _row) AS ncpdp_id
+                FROM {self.source("pharmacy_claims")}
+                WHERE {self.truthy_sql("pharmacy_npi")}
+                GROUP BY pharmacy_npi
+            )
+            ORDER BY pharmacy_key
+        """
+
+    def _dim_prescriber_sql(self) -> str:
+        """Prescriber dimension from the NPIs on claims."""
+        return f"""
+            SELECT
+                key AS prescriber_key,
+                npi AS prescriber_npi,
+                NULL::VARCHAR AS dea_number,
+                NULL::VARCHAR AS first_name,
+                NULL::VARCHAR AS last_name,
+                npi AS full_name,
+                npi AS display_name,
+                NULL::VARCHAR AS credential,
+                NULL::VARCHAR AS specialty,
+                NULL::VARCHAR AS taxonomy_code,
+                NULL::VARCHAR AS city,
+                NULL::VARCHAR AS state,
+                NULL::BOOLEAN AS is_active,
+                NULL::BOOLEAN AS can_prescribe_controlled
+            FROM ({self._npi_keys_sql("prescriber_npi")})
+            ORDER BY key
+        """
+
+    # -------------------------------------------------------------------------
+    # Fact Queries
+    # -------------------------------------------------------------------------
+
+    def _fact_prescription_fills_sql(self) -> str:
+        """Prescription fill facts, one per pharmacy claim."""
+        return f"""
+            WITH claims AS (
+                SELECT *, {self.normalize_ndc_sql("ndc")} AS ndc_11
+                FROM {self.source("pharmacy_claims")}
+            ),
+            pharmacies AS ({self._npi_keys_sql("pharmacy_npi")}),
+            prescribers AS ({self._npi_keys_sql("prescriber_npi")}),
+            medications AS ({self._medication_keys_sql()})
+            SELECT
+                row_number() OVER (ORDER BY c._row) AS fill_fact_key,
+                c.claim_id,
+                c.member_id AS member_key,
+                c.cardholder_id AS cardholder_key,
+                coalesce(ph.key, -1) AS pharmacy_key,
+                coalesce(pr.key, -1) AS prescriber_key,
+                coalesce(m.key, -1) AS medication_key,
+                {self.date_key_sql("c.service_date")} AS service_date_key,
+                c.service_date,
+                c.transaction_code,
+                c.fill_number = 0 AS is_new_fill,
+                c.fill_number > 0 AS is_refill,
+                c.fill_number,
+                c.prescription_number,
+                c.ndc_11,
+                CAST(c.quantity_dispensed AS DOUBLE) AS quantity_dispensed,
+                c.days_supply,
+                c.daw_code,
+                '0' AS compound_code,
+                false AS is_compound,
+                CAST(c.ingredient_cost_submitted AS DOUBLE) AS ingredient_cost_submitted,
+                CAST(c.dispensing_fee_submitted AS DOUBLE) AS dispensing_fee_submitted,
+                CAST(c.usual_customary_charge AS DOUBLE) AS usual_customary_charge,
+                CAST(c.gross_amount_due AS DOUBLE) AS gross_amount_due,
+                NULL::VARCHAR AS prior_auth_number,
+                false AS has_prior_auth,
+                NULL::VARCHAR AS dur_reason_for_service,
+                NULL::VARCHAR AS dur_professional_service,
+                false AS has_dur_intervention,
+                c.bin,
+                c.pcn,
+                c.group_number,
+                NULL::BOOLEAN AS is_brand,
+                NULL::BOOLEAN AS is_controlled,
+                NULL::DOUBLE AS awp_unit_price
+            FROM claims c
+            LEFT JOIN pharmacies ph ON ph.npi = c.pharmacy_npi
+            LEFT JOIN prescribers pr ON pr.npi = c.prescriber_npi
+            LEFT JOIN medications m ON m.ndc_11 = c.ndc_11
+            ORDER BY c._row
+        """
+
+    # -------------------------------------------------------------------------
+    # Key Lookups
+    # -------------------------------------------------------------------------
+
+    def _npi_keys_sql(self, column: str) -> str:
+        """Claim NPI column to surrogate key, numbered in sorted order."""
+        return f"""
+            SELECT npi, row_number() OVER (ORDER BY npi) AS key
+            FROM (
+                SELECT DISTINCT {column} AS npi FROM {self.source("pharmacy_claims")}
+                WHERE {self.truthy_sql(column)}
+            )
+        """
+
+    def _medication_keys_sql(self) -> str:
+        """Normalized 11-digit NDC to surrogate key, numbered in sorted order."""
+        return f"""
+            SELECT ndc_11, row_number() OVER (ORDER BY ndc_11) AS key
+            FROM (
+                SELECT DISTINCT {self.normalize_ndc_sql("ndc")} AS ndc_11
+                FROM {self.source("pharmacy_claims")}
+            )
+        """
+
+    # -------------------------------------------------------------------------
+    # SQL Fragment Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def normalize_ndc_sql(expr: str) -> str:
+        """SQL equivalent of ``_normalize_ndc``: 10-digit NDCs padded to 11."""
+        clean = f"replace(replace({expr}, '-', ''), ' ', '')"
+        return (
+            f"CASE WHEN length({clean}) = 10 "
+            f"THEN left({clean}, 9) || '0' || substr({clean}, 10) "
+            f"ELSE {clean} END"
+        )
+
+    @staticmethod
+    def ndc_11_to_10_sql(expr: str) -> str:
+        """SQL equivalent of ``_ndc_11_to_10``."""
+        return (
+            f"CASE WHEN length({expr}) = 11 "
+            f"THEN left({expr}, 9) || substr({expr}, 11) "
+            f"ELSE {expr} END"
+        )
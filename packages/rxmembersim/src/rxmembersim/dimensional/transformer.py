@@ -78,6 +78,31 @@ class RxMemberSimDimensionalTransformer(BaseDimensionalTransformer):
         >>> dimensions, facts = transformer.transform()
     """
 
+    NATURAL_KEYS = {
+        "dim_rx_member": ("member_key",),
+        "dim_medication": ("ndc_11",),
+        "dim_pharmacy": ("pharmacy_npi",),
+        "dim_prescriber": ("prescriber_npi",),
+        "dim_formulary": ("formulary_id",),
+        "fact_prescription_fills": ("claim_id",),
+    }
+
+    SURROGATE_KEYS = {
+        "dim_medication": "medication_key",
+        "dim_pharmacy": "pharmacy_key",
+        "dim_prescriber": "prescriber_key",
+        "dim_formulary": "formulary_key",
+    }
+
+    FOREIGN_KEYS = {
+        "fact_prescription_fills": {
+            "pharmacy_key": "dim_pharmacy",
+            "prescriber_key": "dim_prescriber",
+            "medication_key": "dim_medication",
+        },
+        "fact_prior_auth": {"medication_key": "dim_medication"},
+    }
+
     def __init__(
         self,
         members: list[RxMember] | None = None,
@@ -6,6 +6,7 @@ from .alerts import (
     DUROverride,
     DUROverrideManager,
 )
+from .history import MemberMedicationHistory
 from .rules import (
     AgeRestriction,
     ClinicalSignificance,
@@ -51,4 +52,5 @@ __all__ = [
     "DURValidationResult",
     "MemberProfile",
     "MemberMedication",
+    "MemberMedicationHistory",
 ]
@@ -0,0 +1,196 @@
+"""Per-member medication history for DUR checks.
+
+Replaying a member's fill history through DUR used to rebuild and rescan the
+whole medication list for every fill. ``MemberMedicationHistory`` keeps each
+member's fills sorted by service date per NDC and per GPI class, plus the
+days each NDC is on hand as merged intervals, so the latest fill of a drug
+and the drugs active on a date are found by bisection. Fills are appended
+as they are adjudicated.
+
+Example:
+    >>> history = MemberMedicationHistory()
+    >>> history.add(MemberMedication(ndc="00093505698", gpi="39400010000320",
+    ...     name="Atorvastatin", service_date=date(2025, 1, 2), days_supply=30, quantity=30))
+    >>> history.is_active("00093505698", date(2025, 1, 20))
+    True
+    >>> [med.name for med in history.active_medications(date(2025, 2, 15))]
+    []
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .validator import MemberMedication
+
+# GPI characters identifying a drug class (2-digit group + 2-digit class)
+GPI_CLASS_LENGTH = 4
+
+
+class MemberMedicationHistory:
+    """A member's pharmacy fills, indexed for DUR lookups.
+
+    Fills may be added in any order; adding them in service-date order, as
+    when fills are adjudicated, keeps every append O(log n).
+    """
+
+    def __init__(self, fills: Iterable[MemberMedication] = ()) -> None:
+        """Initialize the history.
+
+        Args:
+            fills: Initial fills
+        """
+        self._fills: list[MemberMedication] = []
+        # (service_date, fill position) per NDC and per GPI class, sorted
+        self._by_ndc: dict[str, list[tuple[date, int]]] = {}
+        self._by_class: dict[str, list[tuple[date, int]]] = {}
+        # Days on hand per NDC as disjoint, sorted [start, end) intervals
+        self._starts: dict[str, list[date]] = {}
+        self._ends: dict[str, list[date]] = {}
+        for fill in fills:
+            self.add(fill)
+
+    def __len__(self) -> int:
+        return len(self._fills)
+
+    def add(self, fill: MemberMedication) -> None:
+        """Add a fill to the history.
+
+        Args:
+            fill: Fill to add
+        """
+        key = (fill.service_date, len(self._fills))
+        self._fills.append(fill)
+        _insert(self._by_ndc.setdefault(fill.ndc, []), key)
+        _insert(self._by_class.setdefault(fill.gpi[:GPI_CLASS_LENGTH], []), key)
+        self._add_supply(
+            fill.ndc, fill.service_date, fill.service_date + timedelta(days=fill.days_supply)
+        )
+
+    def last_fill(self, ndc: str, as_of: date | None = None) -> MemberMedication | None:
+        """Find the most recent fill of an NDC.
+
+        Of several fills on the latest date, the first added is returned.
+
+        Args:
+            ndc: NDC to look up
+            as_of: Ignore fills after this date
+
+        Returns:
+            The fill, or None if the NDC was not filled
+        """
+        return self._last(self._by_ndc.get(ndc), as_of)
+
+    def fills(
+        self, ndc: str | None = None, gpi_prefix: str | None = None
+    ) -> list[MemberMedication]:
+        """List fills in service-date order.
+
+        Args:
+            ndc: Only fills of this NDC
+            gpi_prefix: Only fills whose GPI starts with this prefix
+
+        Returns:
+            Matching fills, oldest first
+        """
+        if ndc is not None:
+            keys = self._by_ndc.get(ndc, [])
+        elif gpi_prefix is not None:
+            keys = self._class_keys(gpi_prefix)
+        else:
+            keys = sorted(
+                (fill.service_date, position) for position, fill in enumerate(self._fills)
+            )
+        fills = [self._fills[position] for _, position in keys]
+        if gpi_prefix is not None:
+            fills = [fill for fill in fills if fill.gpi.startswith(gpi_prefix)]
+        return fills
+
+    def is_active(self, ndc: str, as_of: date) -> bool:
+        """Check whether a fill of the NDC covers a date.
+
+        Args:
+            ndc: NDC to check
+            as_of: Date to check
+
+        Returns:
+            True if the member has the drug on hand on the date
+        """
+        starts = self._starts.get(ndc)
+        if not starts:
+            return False
+        i = bisect_right(starts, as_of) - 1
+        return i >= 0 and as_of < self._ends[ndc][i]
+
+    def active_medications(
+        self, as_of: date, gpi_prefix: str | None = None
+    ) -> list[MemberMedication]:
+        """List the drugs on hand on a date, one fill per NDC.
+
+        Args:
+            as_of: Date to check
+            gpi_prefix: Only drugs whose GPI starts with this prefix
+
+        Returns:
+            The latest fill on or before the date of each active NDC, in the
+            order the NDCs were first filled
+        """
+        if gpi_prefix is None:
+            ndcs: Iterable[str] = self._by_ndc
+        else:
+            ndcs = dict.fromkeys(fill.ndc for fill in self.fills(gpi_prefix=gpi_prefix))
+        active = []
+        for ndc in ndcs:
+            if self.is_active(ndc, as_of):
+                fill = self.last_fill(ndc, as_of)
+                if fill is not None and (gpi_prefix is None or fill.gpi.startswith(gpi_prefix)):
+                    active.append(fill)
+        return active
+
+    def _last(
+        self, keys: list[tuple[date, int]] | None, as_of: date | None
+    ) -> MemberMedication | None:
+        """Find the first-added fill on the latest date in sorted keys."""
+        if not keys:
+            return None
+        end = len(keys) if as_of is None else bisect_right(keys, (as_of, len(self._fills)))
+        if not end:
+            return None
+        latest = keys[end - 1][0]
+        return self._fills[keys[bisect_left(keys, (latest,))][1]]
+
+    def _class_keys(self, gpi_prefix: str) -> list[tuple[date, int]]:
+        """Sorted keys of the GPI classes a prefix can match."""
+        if len(gpi_prefix) >= GPI_CLASS_LENGTH:
+            return self._by_class.get(gpi_prefix[:GPI_CLASS_LENGTH], [])
+        return sorted(
+            key
+            for gpi_class, keys in self._by_class.items()
+            if gpi_class.startswith(gpi_prefix)
+            for key in keys
+        )
+
+    def _add_supply(self, ndc: str, start: date, end: date) -> None:
+        """Merge a fill's days on hand into the NDC's intervals."""
+        starts = self._starts.setdefault(ndc, [])
+        ends = self._ends.setdefault(ndc, [])
+        # Intervals overlapping or touching [start, end) are i..j-1
+        i = bisect_left(ends, start)
+        j = bisect_right(starts, end)
+        if i < j:
+            start = min(start, starts[i])
+            end = max(end, ends[j - 1])
+        starts[i:j] = [start]
+        ends[i:j] = [end]
+
+
+def _insert(keys: list[tuple[date, int]], key: tuple[date, int]) -> None:
+    """Insert a key keeping the list sorted, appending in the common case."""
+    if not keys or keys[-1] <= key:
+        keys.append(key)
+    else:
+        insort(keys, key)
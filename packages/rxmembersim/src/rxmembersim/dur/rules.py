@@ -1,9 +1,15 @@
 """Drug Utilization Review rules engine."""
+from collections.abc import Sequence
 from datetime import date, timedelta
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel
 
+from rxmembersim.core.prefix_index import PrefixIndex
+
+from .history import MemberMedicationHistory
+
 
 class DURAlertType(str, Enum):
     """DUR alert types (NCPDP standard)."""
@@ -145,6 +151,13 @@ class GenderRestriction(BaseModel):
     message: str
 
 
+def _med_field(med: dict | BaseModel, field: str, default: Any = "") -> Any:
+    """Read a field of a medication given as a dict or a MemberMedication."""
+    if isinstance(med, dict):
+        return med.get(field, default)
+    return getattr(med, field, default)
+
+
 class DURRulesEngine:
     """DUR rules processing engine."""
 
@@ -153,8 +166,35 @@ class DURRulesEngine:
         self.therapeutic_duplications: list[TherapeuticDuplication] = []
         self.age_restrictions: list[AgeRestriction] = []
         self.gender_restrictions: list[GenderRestriction] = []
+        # GPI prefix indexes of rule positions, keyed by "<rule list>.<field>"
+        self._indexes: dict[str, tuple[list, int, PrefixIndex[int]]] = {}
         self._load_default_rules()
 
+    def invalidate_indexes(self) -> None:
+        """Drop the rule indexes so the next check rebuilds them.
+
+        Call after editing rules in place (replacing a list item or changing
+        a rule's GPI); replacing or growing a rule list is picked up without
+        it.
+        """
+        self._indexes.clear()
+
+    def _rule_index(self, name: str, rules: list, field: str) -> PrefixIndex[int]:
+        """Index rule positions by a GPI prefix field.
+
+        The index is built on first use and rebuilt when the rule list is
+        replaced or changes length, or after invalidate_indexes().
+        """
+        key = f"{name}.{field}"
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] is rules and cached[1] == len(rules):
+            return cached[2]
+        index: PrefixIndex[int] = PrefixIndex(
+            (getattr(rule, field), position) for position, rule in enumerate(rules)
+        )
+        self._indexes[key] = (rules, len(rules), index)
+        return index
+
     def _load_default_rules(self) -> None:
         """Load common DUR rules."""
         self._load_drug_interactions()
@@ -370,43 +410,49 @@ class DURRulesEngine:
         new_drug_gpi: str,
         new_drug_ndc: str,
         new_drug_name: str,
-        current_medications: list[dict],
+        current_medications: Sequence[dict | BaseModel],
     ) -> list[DURAlert]:
-        """Check for drug-drug interactions."""
+        """Check for drug-drug interactions.
+
+        Current medications may be dicts or MemberMedication models.
+        """
         alerts: list[DURAlert] = []
+        interactions = self.drug_interactions
+        by_drug1 = self._rule_index("drug_interactions", interactions, "drug1_gpi")
+        by_drug2 = self._rule_index("drug_interactions", interactions, "drug2_gpi")
 
-        for current_med in current_medications:
-            current_gpi = current_med.get("gpi", "")
-            current_ndc = current_med.get("ndc", "")
-            current_name = current_med.get("name", "")
-
-            for interaction in self.drug_interactions:
-                # Check if either direction matches
-                match1 = (
-                    new_drug_gpi.startswith(interaction.drug1_gpi)
-                    and current_gpi.startswith(interaction.drug2_gpi)
-                )
-                match2 = (
-                    new_drug_gpi.startswith(interaction.drug2_gpi)
-                    and current_gpi.startswith(interaction.drug1_gpi)
-                )
+        # Interactions the new drug takes part in, as either drug
+        new_as_drug1 = set(by_drug1.match(new_drug_gpi))
+        new_as_drug2 = set(by_drug2.match(new_drug_gpi))
+        if not new_as_drug1 and not new_as_drug2:
+            return alerts
 
-                if match1 or match2:
-                    alerts.append(
-                        DURAlert(
-                            alert_type=DURAlertType.DRUG_DRUG,
-                            clinical_significance=interaction.clinical_significance,
-                            drug1_ndc=new_drug_ndc,
-                            drug1_name=new_drug_name,
-                            drug1_gpi=new_drug_gpi,
-                            drug2_ndc=current_ndc,
-                            drug2_name=current_name,
-                            drug2_gpi=current_gpi,
-                            message=interaction.interaction_description,
-                            recommendation=interaction.recommendation,
-                            reason_for_service=DURReasonForService.DRUG_DRUG_INTERACTION.value,
-                        )
+        for current_med in current_medications:
+            current_gpi = _med_field(current_med, "gpi")
+            current_ndc = _med_field(current_med, "ndc")
+            current_name = _med_field(current_med, "name")
+
+            # Check if either direction matches
+            matched = new_as_drug1.intersection(by_drug2.match(current_gpi))
+            matched.update(new_as_drug2.intersection(by_drug1.match(current_gpi)))
+
+            for position in sorted(matched):
+                interaction = interactions[position]
+                alerts.append(
+                    DURAlert(
+                        alert_type=DURAlertType.DRUG_DRUG,
+                        clinical_significance=interaction.clinical_significance,
+                        drug1_ndc=new_drug_ndc,
+                        drug1_name=new_drug_name,
+                        drug1_gpi=new_drug_gpi,
+                        drug2_ndc=current_ndc,
+                        drug2_name=current_name,
+                        drug2_gpi=current_gpi,
+                        message=interaction.interaction_description,
+                        recommendation=interaction.recommendation,
+                        reason_for_service=DURReasonForService.DRUG_DRUG_INTERACTION.value,
                     )
+                )
 
         return alerts
 
@@ -415,20 +461,25 @@ class DURRulesEngine:
         new_drug_gpi: str,
         new_drug_ndc: str,
         new_drug_name: str,
-        current_medications: list[dict],
+        current_medications: Sequence[dict | BaseModel],
     ) -> list[DURAlert]:
-        """Check for therapeutic duplication."""
+        """Check for therapeutic duplication.
+
+        Current medications may be dicts or MemberMedication models.
+        """
         alerts: list[DURAlert] = []
 
-        for dup_rule in self.therapeutic_duplications:
-            if not new_drug_gpi.startswith(dup_rule.gpi_class):
-                continue
+        duplications = self.therapeutic_duplications
+        index = self._rule_index("therapeutic_duplications", duplications, "gpi_class")
+
+        for position in index.match(new_drug_gpi):
+            dup_rule = duplications[position]
 
             # Count current medications in same class
             same_class = [
                 med
                 for med in current_medications
-                if med.get("gpi", "").startswith(dup_rule.gpi_class)
+                if _med_field(med, "gpi").startswith(dup_rule.gpi_class)
             ]
 
             if len(same_class) >= dup_rule.max_concurrent:
@@ -440,9 +491,9 @@ class DURRulesEngine:
                             drug1_ndc=new_drug_ndc,
                             drug1_name=new_drug_name,
                             drug1_gpi=new_drug_gpi,
-                            drug2_ndc=existing.get("ndc", ""),
-                            drug2_name=existing.get("name", ""),
-                            drug2_gpi=existing.get("gpi", ""),
+                            drug2_ndc=_med_field(existing, "ndc"),
+                            drug2_name=_med_field(existing, "name"),
+                            drug2_gpi=_med_field(existing, "gpi"),
                             message=f"Therapeutic duplication: {dup_rule.class_name}",
                             recommendation=f"Maximum {dup_rule.max_concurrent} concurrent",
                             reason_for_service=DURReasonForService.THERAPEUTIC_DUPLICATION.value,
@@ -456,29 +507,35 @@ class DURRulesEngine:
         ndc: str,
         drug_name: str,
         service_date: date,
-        previous_fills: list[dict],
+        previous_fills: Sequence[dict | BaseModel] | MemberMedicationHistory,
         threshold_percent: float = 0.80,
     ) -> DURAlert | None:
-        """Check for early refill."""
-        if not previous_fills:
-            return None
-
-        # Find most recent fill for this NDC
-        same_drug_fills = [
-            fill for fill in previous_fills if fill.get("ndc") == ndc
-        ]
+        """Check for early refill.
+
+        Previous fills may be dicts, MemberMedication models, or a member's
+        MemberMedicationHistory (fills after the service date are ignored).
+        """
+        if isinstance(previous_fills, MemberMedicationHistory):
+            last_fill = previous_fills.last_fill(ndc, as_of=service_date)
+            if last_fill is None:
+                return None
+        else:
+            # Find most recent fill for this NDC
+            same_drug_fills = [
+                fill for fill in previous_fills if _med_field(fill, "ndc", None) == ndc
+            ]
 
-        if not same_drug_fills:
-            return None
+            if not same_drug_fills:
+                return None
 
-        # Get most recent
-        last_fill = max(
-            same_drug_fills,
-            key=lambda f: f.get("service_date", date.min),
-        )
+            # Get most recent
+            last_fill = max(
+                same_drug_fills,
+                key=lambda f: _med_field(f, "service_date", date.min),
+            )
 
-        last_fill_date = last_fill.get("service_date")
-        last_days_supply = last_fill.get("days_supply", 30)
+        last_fill_date = _med_field(last_fill, "service_date", None)
+        last_days_supply = _med_field(last_fill, "days_supply", 30)
 
         if not last_fill_date:
             return None
@@ -516,10 +573,11 @@ class DURRulesEngine:
         patient_age: int,
     ) -> DURAlert | None:
         """Check for age-based restrictions."""
-        for restriction in self.age_restrictions:
-            if not drug_gpi.startswith(restriction.drug_gpi):
-                continue
+        restrictions = self.age_restrictions
+        index = self._rule_index("age_restrictions", restrictions, "drug_gpi")
 
+        for position in index.match(drug_gpi):
+            restriction = restrictions[position]
             violated = False
             if restriction.min_age and patient_age < restriction.min_age:
                 violated = True
@@ -549,10 +607,11 @@ class DURRulesEngine:
         patient_gender: str,
     ) -> DURAlert | None:
         """Check for gender-based restrictions."""
-        for restriction in self.gender_restrictions:
-            if not drug_gpi.startswith(restriction.drug_gpi):
-                continue
+        restrictions = self.gender_restrictions
+        index = self._rule_index("gender_restrictions", restrictions, "drug_gpi")
 
+        for position in index.match(drug_gpi):
+            restriction = restrictions[position]
             if patient_gender != restriction.allowed_gender:
                 return DURAlert(
                     alert_type=DURAlertType.DRUG_GENDER,
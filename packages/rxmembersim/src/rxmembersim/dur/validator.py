@@ -4,6 +4,7 @@ from datetime import date
 from pydantic import BaseModel, Field
 
 from .alerts import DURAlertFormatter, DURAlertSummary, DUROverride
+from .history import MemberMedicationHistory
 from .rules import ClinicalSignificance, DURAlert, DURRulesEngine
 
 
@@ -103,22 +104,27 @@ class DURValidator:
         self,
         request: DURValidationRequest,
         member_profile: MemberProfile,
+        history: MemberMedicationHistory | None = None,
     ) -> DURValidationResult:
-        """Run all DUR checks for a claim."""
+        """Run all DUR checks for a claim.
+
+        Args:
+            request: Claim to validate
+            member_profile: Member demographics and current medications
+            history: The member's fill history; when given, it replaces
+                ``member_profile.current_medications``, with the drugs on hand
+                on the service date screened for interactions and duplication
+
+        Returns:
+            DURValidationResult with every alert raised
+        """
         all_alerts: list[DURAlert] = []
         messages: list[str] = []
 
-        # Convert current medications to format needed by rules engine
-        current_meds = [
-            {
-                "ndc": med.ndc,
-                "gpi": med.gpi,
-                "name": med.name,
-                "service_date": med.service_date,
-                "days_supply": med.days_supply,
-            }
-            for med in member_profile.current_medications
-        ]
+        if history is not None:
+            current_meds = history.active_medications(request.service_date)
+        else:
+            current_meds = member_profile.current_medications
 
         # 1. Drug-Drug Interactions
         dd_alerts = self.rules_engine.check_drug_drug_interactions(
@@ -143,19 +149,11 @@ class DURValidator:
             messages.append(f"{len(td_alerts)} therapeutic duplication(s) found")
 
         # 3. Early Refill
-        previous_fills = [
-            {
-                "ndc": med.ndc,
-                "service_date": med.service_date,
-                "days_supply": med.days_supply,
-            }
-            for med in member_profile.current_medications
-        ]
         er_alert = self.rules_engine.check_early_refill(
             ndc=request.ndc,
             drug_name=request.drug_name,
             service_date=request.service_date,
-            previous_fills=previous_fills,
+            previous_fills=history if history is not None else current_meds,
         )
         if er_alert:
             all_alerts.append(er_alert)
@@ -5,6 +5,8 @@ from enum import Enum
 
 from pydantic import BaseModel
 
+from rxmembersim.core.prefix_index import PrefixIndex
+
 
 class QuantityLimitType(str, Enum):
     """Types of quantity limits."""
@@ -61,6 +63,9 @@ class QuantityLimitManager:
 
     def __init__(self) -> None:
         self.limits: dict[str, list[QuantityLimit]] = {}  # keyed by drug identifier
+        # Identifier prefix index of the limit lists, rebuilt when limits is
+        # replaced or changes length, or after invalidate_index()
+        self._index: tuple[dict, int, PrefixIndex[list[QuantityLimit]]] | None = None
         self._load_default_limits()
 
     def _load_default_limits(self) -> None:
@@ -147,6 +152,10 @@ class QuantityLimitManager:
             self.limits[limit.drug_identifier] = []
         self.limits[limit.drug_identifier].append(limit)
 
+    def invalidate_index(self) -> None:
+        """Drop the identifier index after limits are edited in place."""
+        self._index = None
+
     def find_limits_for_drug(
         self, ndc: str, gpi: str | None = None
     ) -> list[QuantityLimit]:
@@ -159,9 +168,13 @@ class QuantityLimitManager:
 
         # Check GPI-based limits
         if gpi:
-            for identifier, limits in self.limits.items():
-                if gpi.startswith(identifier):
-                    applicable_limits.extend(limits)
+            limits_by_id = self.limits
+            cached = self._index
+            if cached is None or cached[0] is not limits_by_id or cached[1] != len(limits_by_id):
+                index = PrefixIndex(limits_by_id.items())
+                cached = self._index = (limits_by_id, len(limits_by_id), index)
+            for limits in cached[2].match(gpi):
+                applicable_limits.extend(limits)
 
         return applicable_limits
 
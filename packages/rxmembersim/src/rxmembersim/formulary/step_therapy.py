@@ -3,6 +3,8 @@ from datetime import date, timedelta
 
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.prefix_index import PrefixIndex
+
 
 class StepTherapyStep(BaseModel):
     """Single step in step therapy protocol."""
@@ -151,6 +153,9 @@ class StepTherapyManager:
 
     def __init__(self) -> None:
         self.protocols: dict[str, StepTherapyProtocol] = {}
+        # Target NDC/GPI prefix index, rebuilt when protocols is replaced or
+        # changes length, or after invalidate_index()
+        self._index: tuple[dict, int, PrefixIndex[StepTherapyProtocol]] | None = None
         self._load_default_protocols()
 
     def _load_default_protocols(self) -> None:
@@ -276,6 +281,11 @@ class StepTherapyManager:
     def add_protocol(self, protocol: StepTherapyProtocol) -> None:
         """Add a step therapy protocol."""
         self.protocols[protocol.protocol_id] = protocol
+        self.invalidate_index()
+
+    def invalidate_index(self) -> None:
+        """Drop the target drug index after protocols are edited in place."""
+        self._index = None
 
     def get_protocol(self, protocol_id: str) -> StepTherapyProtocol | None:
         """Get protocol by ID."""
@@ -283,11 +293,16 @@ class StepTherapyManager:
 
     def find_protocol_for_drug(self, ndc: str) -> StepTherapyProtocol | None:
         """Find step therapy protocol for a drug."""
-        for protocol in self.protocols.values():
-            for target in protocol.target_drugs:
-                if ndc == target or ndc.startswith(target):
-                    return protocol
-        return None
+        protocols = self.protocols
+        cached = self._index
+        if cached is None or cached[0] is not protocols or cached[1] != len(protocols):
+            index: PrefixIndex[StepTherapyProtocol] = PrefixIndex(
+                (target, protocol)
+                for protocol in protocols.values()
+                for target in protocol.target_drugs
+            )
+            cached = self._index = (protocols, len(protocols), index)
+        return cached[2].first(ndc)
 
     def check_step_therapy(
         self,
@@ -6,6 +6,8 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.prefix_index import PrefixIndex
+
 
 class ProgramType(str, Enum):
     """Type of copay assistance program."""
@@ -151,11 +153,18 @@ class CopayAssistanceCalculator:
     ) -> None:
         self.programs: list[CopayAssistanceProgram] = programs or []
         self.usage_tracker: dict[str, list[CopayCardUsage]] = {}
+        # NDC and GPI indexes of program positions, rebuilt when programs
+        # is replaced or changes length, or after invalidate_index()
+        self._index: tuple[list, int, PrefixIndex[int], PrefixIndex[int]] | None = None
 
     def add_program(self, program: CopayAssistanceProgram) -> None:
         """Add a copay assistance program."""
         self.programs.append(program)
 
+    def invalidate_index(self) -> None:
+        """Drop the program index after programs are edited in place."""
+        self._index = None
+
     def find_program(
         self,
         ndc: str,
@@ -165,13 +174,15 @@ class CopayAssistanceCalculator:
     ) -> CopayAssistanceProgram | None:
         """Find applicable copay assistance program."""
         check_date = service_date or date.today()
+        ndc_index, gpi_index = self._program_index()
+
+        # Programs in effect that cover the NDC or a GPI prefix of the drug
+        positions = set(ndc_index.match(ndc, check_date, exact=True))
+        if gpi:
+            positions.update(gpi_index.match(gpi, check_date))
 
-        for program in self.programs:
-            # Check date validity
-            if program.effective_date > check_date:
-                continue
-            if program.termination_date and program.termination_date < check_date:
-                continue
+        for position in sorted(positions):
+            program = self.programs[position]
 
             # Check eligibility
             if program.eligibility_type == EligibilityType.COMMERCIAL_ONLY:
@@ -181,18 +192,29 @@ class CopayAssistanceCalculator:
                 if has_commercial_insurance:
                     continue
 
-            # Check NDC match
-            if ndc in program.covered_ndcs:
-                return program
-
-            # Check GPI prefix match
-            if gpi:
-                for gpi_prefix in program.covered_gpis:
-                    if gpi.startswith(gpi_prefix):
-                        return program
+            return program
 
         return None
 
+    def _program_index(self) -> tuple[PrefixIndex[int], PrefixIndex[int]]:
+        """Index program positions by covered NDC and GPI prefix."""
+        programs = self.programs
+        cached = self._index
+        if cached is not None and cached[0] is programs and cached[1] == len(programs):
+            return cached[2], cached[3]
+
+        ndc_index: PrefixIndex[int] = PrefixIndex()
+        gpi_index: PrefixIndex[int] = PrefixIndex()
+        for position, program in enumerate(programs):
+            window = (program.effective_date, program.termination_date)
+            for ndc in program.covered_ndcs:
+                ndc_index.add(ndc, position, *window)
+            for gpi_prefix in program.covered_gpis:
+                gpi_index.add(gpi_prefix, position, *window)
+
+        self._index = (programs, len(programs), ndc_index, gpi_index)
+        return ndc_index, gpi_index
+
     def calculate_benefit(
         self,
         program: CopayAssistanceProgram,
@@ -1,11 +1,25 @@
 """Pharmaceutical rebate models."""
 
+from collections.abc import Iterable
 from datetime import date
 from decimal import Decimal
 from enum import Enum
+from typing import Any
 
+import pandas as pd
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.drug import DrugReference
+from rxmembersim.core.prefix_index import PrefixIndex
+
+# Filter selecting a period's billed claims from the canonical pharmacy_claims
+# table; reversals (B2) are left out
+PERIOD_CLAIMS_WHERE = """
+    service_date BETWEEN $period_start AND $period_end
+    AND transaction_code <> 'B2'
+    AND ($cohort_id IS NULL OR cohort_id = $cohort_id)
+"""
+
 
 class RebateType(str, Enum):
     """Type of rebate arrangement."""
@@ -114,11 +128,18 @@ class RebateCalculator:
 
     def __init__(self, contracts: list[RebateContract] | None = None) -> None:
         self.contracts: list[RebateContract] = contracts or []
+        # NDC and GPI indexes of contract positions, rebuilt when contracts
+        # is replaced or changes length, or after invalidate_index()
+        self._index: tuple[list, int, PrefixIndex[int], PrefixIndex[int]] | None = None
 
     def add_contract(self, contract: RebateContract) -> None:
         """Add a rebate contract."""
         self.contracts.append(contract)
 
+    def invalidate_index(self) -> None:
+        """Drop the contract index after contracts are edited in place."""
+        self._index = None
+
     def calculate_claim_rebate(
         self,
         ndc: str,
@@ -172,80 +193,180 @@ class RebateCalculator:
         period_end: date | None = None,
     ) -> list[PeriodRebateSummary]:
         """Calculate rebates for a period of claims."""
-        summaries: list[PeriodRebateSummary] = []
-
-        # Group claims by contract
-        contract_claims: dict[str, list[dict]] = {}
+        # Claim count, ingredient cost and quantity per contract position
+        totals: dict[int, list] = {}
         for claim in claims:
-            ndc = claim.get("ndc", "")
-            gpi = claim.get("gpi")
-            contract = self._find_contract(ndc, gpi)
-            if contract:
-                if contract.contract_id not in contract_claims:
-                    contract_claims[contract.contract_id] = []
-                contract_claims[contract.contract_id].append(claim)
-
-        # Calculate rebates for each contract
-        for contract_id, contract_claim_list in contract_claims.items():
-            contract = next(
-                (c for c in self.contracts if c.contract_id == contract_id), None
-            )
-            if not contract:
+            position = self._find_position(claim.get("ndc", ""), claim.get("gpi"))
+            if position is None:
                 continue
-
-            # Determine tier based on market share or volume
-            tier = self._determine_tier(
-                contract, market_share, len(contract_claim_list)
+            total = totals.setdefault(position, [0, Decimal("0"), Decimal("0")])
+            total[0] += 1
+            total[1] += Decimal(str(claim.get("ingredient_cost", 0)))
+            total[2] += Decimal(str(claim.get("quantity", 0)))
+
+        return [
+            self._summarize_period(
+                self.contracts[position], *total, market_share, period_start, period_end
             )
-            if not tier:
-                tier = contract.tiers[0]
+            for position, total in totals.items()
+        ]
 
-            # Calculate totals
-            total_ingredient = sum(
-                Decimal(str(c.get("ingredient_cost", 0))) for c in contract_claim_list
+    def calculate_period_rebate_sql(
+        self,
+        conn: Any,
+        period_start: date,
+        period_end: date,
+        market_share: Decimal | None = None,
+        drugs: Iterable[DrugReference] = (),
+        cohort_id: str | None = None,
+    ) -> list[PeriodRebateSummary]:
+        """Calculate rebates for a period directly from the pharmacy_claims table.
+
+        Claims are matched to contracts and totalled in DuckDB, so only one
+        row per contract comes back to Python. Each claim falls under the
+        first contract in effect on its service date that covers its NDC or
+        a GPI prefix of the drug, as in calculate_claim_rebate().
+
+        Args:
+            conn: DuckDB connection holding the canonical tables
+            period_start: First service date of the period (inclusive)
+            period_end: Last service date of the period (inclusive)
+            market_share: Market share for market-share contract tiers
+            drugs: Drug references supplying each NDC's GPI; claims for
+                other NDCs match on NDC only
+            cohort_id: Restrict to claims of this cohort
+
+        Returns:
+            One summary per contract with claims, in contract order
+        """
+        keys = pd.DataFrame(
+            [
+                (position, key_type, key, contract.effective_date, contract.termination_date)
+                for position, contract in enumerate(self.contracts)
+                for key_type, covered in (
+                    ("ndc", contract.covered_ndcs),
+                    ("gpi", contract.covered_gpis),
+                )
+                for key in covered
+            ],
+            columns=["position", "key_type", "key", "effective_date", "termination_date"],
+        )
+        if keys.empty:
+            return []
+        gpis = pd.DataFrame(
+            [(drug.ndc, drug.gpi) for drug in drugs], columns=["ndc", "gpi"], dtype=object
+        ).drop_duplicates("ndc")
+
+        # Contracts are matched against each distinct drug, then claims join
+        # the candidate contracts by NDC and keep the first one in effect
+        sql = f"""
+            WITH claims AS (
+                SELECT
+                    c.claim_id,
+                    c.service_date,
+                    c.ndc,
+                    g.gpi,
+                    COALESCE(c.ingredient_cost_submitted, 0) AS ingredient_cost,
+                    c.quantity_dispensed AS quantity
+                FROM pharmacy_claims c
+                LEFT JOIN _rebate_drug_gpis g ON g.ndc = c.ndc
+                WHERE {PERIOD_CLAIMS_WHERE}
+            ),
+            candidates AS (
+                SELECT d.ndc, k.position, k.effective_date, k.termination_date
+                FROM (SELECT DISTINCT ndc, gpi FROM claims) d
+                JOIN _rebate_contract_keys k
+                    ON (k.key_type = 'ndc' AND k.key = d.ndc)
+                    OR (k.key_type = 'gpi' AND starts_with(d.gpi, k.key))
+            ),
+            matched AS (
+                SELECT c.claim_id, c.ingredient_cost, c.quantity, MIN(k.position) AS position
+                FROM claims c
+                JOIN candidates k
+                    ON k.ndc = c.ndc
+                    AND c.service_date >= k.effective_date
+                    AND (k.termination_date IS NULL OR c.service_date <= k.termination_date)
+                GROUP BY c.claim_id, c.ingredient_cost, c.quantity
             )
-            total_quantity = sum(
-                Decimal(str(c.get("quantity", 0))) for c in contract_claim_list
+            SELECT position, COUNT(*), SUM(ingredient_cost), SUM(quantity)
+            FROM matched
+            GROUP BY position
+            ORDER BY position
+        """
+        conn.register("_rebate_contract_keys", keys)
+        conn.register("_rebate_drug_gpis", gpis)
+        try:
+            rows = conn.execute(
+                sql,
+                {"period_start": period_start, "period_end": period_end, "cohort_id": cohort_id},
+            ).fetchall()
+        finally:
+            conn.unregister("_rebate_contract_keys")
+            conn.unregister("_rebate_drug_gpis")
+
+        return [
+            self._summarize_period(
+                self.contracts[position],
+                claim_count,
+                Decimal(total_ingredient),
+                Decimal(total_quantity),
+                market_share,
+                period_start,
+                period_end,
             )
+            for position, claim_count, total_ingredient, total_quantity in rows
+        ]
 
-            # Calculate gross rebate
-            if tier.rebate_type == "percentage":
-                gross_rebate = total_ingredient * (tier.rebate_value / 100)
-            else:
-                gross_rebate = tier.rebate_value * total_quantity
-
-            gross_rebate = gross_rebate.quantize(Decimal("0.01"))
+    def _summarize_period(
+        self,
+        contract: RebateContract,
+        claim_count: int,
+        total_ingredient: Decimal,
+        total_quantity: Decimal,
+        market_share: Decimal | None,
+        period_start: date | None,
+        period_end: date | None,
+    ) -> PeriodRebateSummary:
+        """Apply a contract's period tier to its claim totals."""
+        # Determine tier based on market share or volume
+        tier = self._determine_tier(contract, market_share, claim_count)
+        if not tier:
+            tier = contract.tiers[0]
+
+        # Calculate gross rebate
+        if tier.rebate_type == "percentage":
+            gross_rebate = total_ingredient * (tier.rebate_value / 100)
+        else:
+            gross_rebate = tier.rebate_value * total_quantity
 
-            # Admin fees
-            admin_fees = (gross_rebate * contract.admin_fee_percentage / 100).quantize(
-                Decimal("0.01")
-            )
-            net_rebate = gross_rebate - admin_fees
+        gross_rebate = gross_rebate.quantize(Decimal("0.01"))
 
-            # Effective rate
-            effective_rate = (
-                (gross_rebate / total_ingredient * 100).quantize(Decimal("0.01"))
-                if total_ingredient
-                else Decimal("0")
-            )
+        # Admin fees
+        admin_fees = (gross_rebate * contract.admin_fee_percentage / 100).quantize(
+            Decimal("0.01")
+        )
+        net_rebate = gross_rebate - admin_fees
 
-            summaries.append(
-                PeriodRebateSummary(
-                    contract_id=contract_id,
-                    manufacturer_name=contract.manufacturer_name,
-                    period_start=period_start or date.today(),
-                    period_end=period_end or date.today(),
-                    total_claims=len(contract_claim_list),
-                    total_ingredient_cost=total_ingredient,
-                    total_quantity=total_quantity,
-                    gross_rebate=gross_rebate,
-                    admin_fees=admin_fees,
-                    net_rebate=net_rebate,
-                    effective_rebate_rate=effective_rate,
-                )
-            )
+        # Effective rate
+        effective_rate = (
+            (gross_rebate / total_ingredient * 100).quantize(Decimal("0.01"))
+            if total_ingredient
+            else Decimal("0")
+        )
 
-        return summaries
+        return PeriodRebateSummary(
+            contract_id=contract.contract_id,
+            manufacturer_name=contract.manufacturer_name,
+            period_start=period_start or date.today(),
+            period_end=period_end or date.today(),
+            total_claims=claim_count,
+            total_ingredient_cost=total_ingredient,
+            total_quantity=total_quantity,
+            gross_rebate=gross_rebate,
+            admin_fees=admin_fees,
+            net_rebate=net_rebate,
+            effective_rebate_rate=effective_rate,
+        )
 
     def _find_contract(
         self,
@@ -253,27 +374,48 @@ class RebateCalculator:
         gpi: str | None = None,
         service_date: date | None = None,
     ) -> RebateContract | None:
-        """Find applicable contract for a drug."""
-        check_date = service_date or date.today()
+        """Find applicable contract for a drug.
 
-        for contract in self.contracts:
-            # Check date validity
-            if contract.effective_date > check_date:
-                continue
-            if contract.termination_date and contract.termination_date < check_date:
-                continue
-
-            # Check NDC match
-            if ndc in contract.covered_ndcs:
-                return contract
+        The first contract in effect on the service date that covers the
+        NDC, or a GPI prefix of the drug, applies.
+        """
+        position = self._find_position(ndc, gpi, service_date)
+        return self.contracts[position] if position is not None else None
 
-            # Check GPI prefix match
-            if gpi:
-                for gpi_prefix in contract.covered_gpis:
-                    if gpi.startswith(gpi_prefix):
-                        return contract
-
-        return None
+    def _find_position(
+        self,
+        ndc: str,
+        gpi: str | None = None,
+        service_date: date | None = None,
+    ) -> int | None:
+        """Find the position of the applicable contract in ``contracts``."""
+        check_date = service_date or date.today()
+        ndc_index, gpi_index = self._contract_index()
+
+        positions = ndc_index.match(ndc, check_date, exact=True)
+        if gpi:
+            positions += gpi_index.match(gpi, check_date)
+
+        return min(positions) if positions else None
+
+    def _contract_index(self) -> tuple[PrefixIndex[int], PrefixIndex[int]]:
+        """Index contract positions by covered NDC and GPI prefix."""
+        contracts = self.contracts
+        cached = self._index
+        if cached is not None and cached[0] is contracts and cached[1] == len(contracts):
+            return cached[2], cached[3]
+
+        ndc_index: PrefixIndex[int] = PrefixIndex()
+        gpi_index: PrefixIndex[int] = PrefixIndex()
+        for position, contract in enumerate(contracts):
+            window = (contract.effective_date, contract.termination_date)
+            for ndc in contract.covered_ndcs:
+                ndc_index.add(ndc, position, *window)
+            for gpi_prefix in contract.covered_gpis:
+                gpi_index.add(gpi_prefix, position, *window)
+
+        self._index = (contracts, len(contracts), ndc_index, gpi_index)
+        return ndc_index, gpi_index
 
     def _determine_tier(
         self,
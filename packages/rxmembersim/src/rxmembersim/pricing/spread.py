@@ -1,11 +1,17 @@
 """PBM spread pricing models."""
 
+from collections.abc import Collection, Iterable
 from datetime import date
 from decimal import Decimal
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
+from rxmembersim.core.drug import DrugReference
+
+from .rebate import PERIOD_CLAIMS_WHERE
+
 
 class SpreadType(str, Enum):
     """Type of spread pricing arrangement."""
@@ -257,33 +263,97 @@ class SpreadCalculator:
         period_end: date | None = None,
     ) -> PeriodSpreadSummary:
         """Calculate spread summary for a period of claims."""
-        calculations: list[SpreadCalculation] = []
+        calculations = [
+            (
+                self.calculate_claim_spread(
+                    ndc=claim.get("ndc", ""),
+                    awp=Decimal(str(claim.get("awp", 0))),
+                    quantity=Decimal(str(claim.get("quantity", 1))),
+                    is_brand=claim.get("is_brand", False),
+                    is_specialty=claim.get("is_specialty", False),
+                    channel=claim.get("channel", ChannelType.RETAIL),
+                ),
+                1,
+            )
+            for claim in claims
+        ]
+        return self._summarize_period(calculations, period_start, period_end)
 
-        for claim in claims:
+    def calculate_period_spread_sql(
+        self,
+        conn: Any,
+        period_start: date,
+        period_end: date,
+        drugs: Iterable[DrugReference],
+        specialty_ndcs: Collection[str] = (),
+        cohort_id: str | None = None,
+    ) -> PeriodSpreadSummary:
+        """Calculate spread summary for a period from the pharmacy_claims table.
+
+        A claim's spread depends only on its drug and quantity, so DuckDB
+        counts the period's claims per NDC and quantity and each distinct
+        fill is priced once, with the same arithmetic as
+        calculate_period_spread().
+
+        Args:
+            conn: DuckDB connection holding the canonical tables
+            period_start: First service date of the period (inclusive)
+            period_end: Last service date of the period (inclusive)
+            drugs: Drug references supplying each NDC's unit AWP and brand
+                flag; claims for other NDCs are priced as generics at AWP 0
+            specialty_ndcs: NDCs priced on specialty terms
+            cohort_id: Restrict to claims of this cohort
+
+        Returns:
+            PeriodSpreadSummary for the period
+        """
+        rows = conn.execute(
+            f"""
+            SELECT ndc, quantity_dispensed, COUNT(*)
+            FROM pharmacy_claims
+            WHERE {PERIOD_CLAIMS_WHERE}
+            GROUP BY ndc, quantity_dispensed
+            ORDER BY ndc, quantity_dispensed
+            """,
+            {"period_start": period_start, "period_end": period_end, "cohort_id": cohort_id},
+        ).fetchall()
+
+        by_ndc = {drug.ndc: drug for drug in drugs}
+        calculations = []
+        for ndc, quantity, claim_count in rows:
+            drug = by_ndc.get(ndc)
+            awp = drug.awp if drug and drug.awp is not None else 0
             calc = self.calculate_claim_spread(
-                ndc=claim.get("ndc", ""),
-                awp=Decimal(str(claim.get("awp", 0))),
-                quantity=Decimal(str(claim.get("quantity", 1))),
-                is_brand=claim.get("is_brand", False),
-                is_specialty=claim.get("is_specialty", False),
-                channel=claim.get("channel", ChannelType.RETAIL),
+                ndc=ndc,
+                awp=Decimal(str(awp)),
+                quantity=quantity,
+                is_brand=bool(drug and drug.is_brand),
+                is_specialty=ndc in specialty_ndcs,
             )
-            calculations.append(calc)
+            calculations.append((calc, claim_count))
+
+        return self._summarize_period(calculations, period_start, period_end)
 
-        # Aggregate
-        total_claims = len(calculations)
-        brand_claims = sum(1 for c in calculations if c.is_brand and not c.is_specialty)
+    def _summarize_period(
+        self,
+        calculations: list[tuple[SpreadCalculation, int]],
+        period_start: date | None,
+        period_end: date | None,
+    ) -> PeriodSpreadSummary:
+        """Aggregate claim spreads, each counted the given number of times."""
+        total_claims = sum(n for _, n in calculations)
+        brand_claims = sum(n for c, n in calculations if c.is_brand and not c.is_specialty)
         generic_claims = sum(
-            1 for c in calculations if not c.is_brand and not c.is_specialty
+            n for c, n in calculations if not c.is_brand and not c.is_specialty
         )
-        specialty_claims = sum(1 for c in calculations if c.is_specialty)
-
-        total_awp = sum(c.awp for c in calculations)
-        total_pharmacy = sum(c.pharmacy_total for c in calculations)
-        total_client = sum(c.client_total for c in calculations)
-        total_spread = sum(c.total_spread for c in calculations)
-        total_admin = sum(c.admin_fee for c in calculations)
-        net_margin = sum(c.net_margin for c in calculations)
+        specialty_claims = sum(n for c, n in calculations if c.is_specialty)
+
+        total_awp = sum(c.awp * n for c, n in calculations)
+        total_pharmacy = sum(c.pharmacy_total * n for c, n in calculations)
+        total_client = sum(c.client_total * n for c, n in calculations)
+        total_spread = sum(c.total_spread * n for c, n in calculations)
+        total_admin = sum(c.admin_fee * n for c, n in calculations)
+        net_margin = sum(c.net_margin * n for c, n in calculations)
 
         avg_spread = (
             (total_spread / total_claims).quantize(Decimal("0.01"))
@@ -0,0 +1,154 @@
+"""Tests for RxMemberSim SQL Dimensional Transformer."""
+
+import math
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import duckdb
+import pandas as pd
+import pytest
+from healthsim.db.schema import apply_schema
+
+from rxmembersim.claims.claim import PharmacyClaim, TransactionCode
+from rxmembersim.dimensional import (
+    RxMemberSimDimensionalTransformer,
+    RxMemberSimSQLDimensionalTransformer,
+)
+
+CLAIM_COLUMNS = [
+    "claim_id", "transaction_code", "service_date", "pharmacy_npi", "pharmacy_ncpdp",
+    "member_id", "cardholder_id", "person_code", "bin", "pcn", "group_number",
+    "prescription_number", "fill_number", "ndc", "quantity_dispensed", "days_supply",
+    "daw_code", "prescriber_npi", "ingredient_cost_submitted", "dispensing_fee_submitted",
+    "usual_customary_charge", "gross_amount_due",
+]
+
+
+def _normalize(value):
+    """Normalize a cell so object and SQL outputs compare equal."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, pd.Timestamp):
+        value = value.item()
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def _rows(df: pd.DataFrame) -> list[list]:
+    return [[_normalize(v) for v in row] for row in df.itertuples(index=False)]
+
+
+def _assert_same_tables(expected: dict, actual: dict) -> None:
+    assert list(actual) == list(expected)
+    for name, df in expected.items():
+        assert list(actual[name].columns) == list(df.columns), name
+        assert _rows(actual[name]) == _rows(df), name
+
+
+@pytest.fixture
+def claims():
+    """Pharmacy claims with dashed, 10-digit and 11-digit NDCs."""
+    rng = random.Random(11)
+    ndcs = ["00071-0155-23", "0002143380", "59762333001", "00093 7180 56"]
+    return [
+        PharmacyClaim(
+            claim_id=f"RX{i:05d}",
+            transaction_code=rng.choice(list(TransactionCode)),
+            service_date=date(2024, 1, 1) + timedelta(days=i),
+            pharmacy_npi=rng.choice(["1234567890", "2345678901", "3456789012"]),
+            pharmacy_ncpdp=rng.choice([None, "1234567", "7654321"]),
+            member_id=f"RXM-{i % 7:08d}",
+            cardholder_id=f"CH{i % 7:07d}",
+            person_code="01",
+            bin="610014",
+            pcn="RXTEST",
+            group_number="GRP001",
+            prescription_number=f"RX{i // 3:06d}",
+            fill_number=i % 3,
+            ndc=rng.choice(ndcs),
+            quantity_dispensed=Decimal(rng.choice(["30", "90", "2.5"])),
+            days_supply=rng.choice([30, 90]),
+            daw_code="0",
+            prescriber_npi=rng.choice(["9876543210", "8765432109"]),
+            ingredient_cost_submitted=Decimal(rng.randint(100, 99999)) / 100,
+            dispensing_fee_submitted=Decimal("1.75"),
+            usual_customary_charge=Decimal(rng.randint(100, 99999)) / 100,
+            gross_amount_due=Decimal(rng.randint(100, 99999)) / 100,
+        )
+        for i in range(40)
+    ]
+
+
+@pytest.fixture
+def conn(claims):
+    """In-memory database holding the claims in canonical tables."""
+    connection = duckdb.connect()
+    apply_schema(connection)
+    placeholders = ", ".join("?" * len(CLAIM_COLUMNS))
+    connection.executemany(
+        f"INSERT INTO pharmacy_claims ({', '.join(CLAIM_COLUMNS)}) VALUES ({placeholders})",
+        [
+            [getattr(c, col).value if col == "transaction_code" else getattr(c, col)
+             for col in CLAIM_COLUMNS]
+            for c in claims
+        ],
+    )
+    yield connection
+    connection.close()
+
+
+class TestRxMemberSimSQLDimensionalTransformer:
+    """Tests for RxMemberSimSQLDimensionalTransformer."""
+
+    def test_matches_object_transformer(self, conn, claims):
+        """Test SQL output equals the object transformer on the same claims."""
+        expected = RxMemberSimDimensionalTransformer(claims=claims).transform()
+        actual = RxMemberSimSQLDimensionalTransformer(conn).transform()
+
+        for expected_tables, actual_tables in zip(expected, actual, strict=True):
+            _assert_same_tables(expected_tables, actual_tables)
+
+    def test_ndc_normalization(self, conn):
+        """Test NDCs are normalized to 11 digits with a derived 10-digit form."""
+        dimensions, _ = RxMemberSimSQLDimensionalTransformer(conn).transform()
+        dim_med = dimensions["dim_medication"]
+
+        assert set(dim_med["ndc_11"]) == {
+            "00071015523", "00021433800", "59762333001", "00093718056"
+        }
+        assert dim_med["ndc_10"].str.len().eq(10).all()
+
+    def test_cohort_filter(self, conn, claims):
+        """Test only claims in the requested cohort are transformed."""
+        conn.execute("UPDATE pharmacy_claims SET cohort_id = 'pbm' WHERE fill_number = 0")
+        in_cohort = [c for c in claims if c.fill_number == 0]
+
+        expected = RxMemberSimDimensionalTransformer(claims=in_cohort).transform()
+        actual = RxMemberSimSQLDimensionalTransformer(conn, cohort_id="pbm").transform()
+
+        for expected_tables, actual_tables in zip(expected, actual, strict=True):
+            _assert_same_tables(expected_tables, actual_tables)
+
+    def test_empty_tables(self):
+        """Test an empty database yields no tables."""
+        connection = duckdb.connect()
+        apply_schema(connection)
+
+        dimensions, facts = RxMemberSimSQLDimensionalTransformer(connection).transform()
+
+        assert dimensions == {}
+        assert facts == {}
+
+    def test_materialize(self, conn):
+        """Test tables are written to the target schema."""
+        counts = RxMemberSimSQLDimensionalTransformer(conn).materialize(schema="rx_analytics")
+
+        assert counts["fact_prescription_fills"] == 40
+        rows = conn.execute("SELECT COUNT(*) FROM rx_analytics.dim_medication").fetchone()[0]
+        assert rows == counts["dim_medication"] == 4
@@ -278,3 +278,121 @@ class TestAdjudicationEngine:
         # With $250 deductible and $152.50 claim, full deductible applies
         assert response.deductible_amount is not None
         assert response.deductible_amount <= member.accumulators.deductible_remaining
+
+    def test_batch_matches_single_claim(
+        self, member: RxMember, claim: PharmacyClaim
+    ) -> None:
+        """Test a one-claim batch prices the claim like adjudicate()."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        engine = AdjudicationEngine(formulary=formulary)
+        response = engine.adjudicate(claim, member)
+
+        result = engine.adjudicate_batch([claim], [member], return_responses=True)
+        row = result.claims.iloc[0]
+        batch_response = result.responses[0]
+
+        assert row["response_status"] == "P"
+        assert row["total_amount_paid"] == float(response.total_amount_paid)
+        assert row["patient_pay_amount"] == float(response.patient_pay_amount)
+        assert row["remaining_deductible"] == float(response.remaining_deductible)
+        assert batch_response.patient_pay_amount == response.patient_pay_amount
+        assert batch_response.authorization_number == row["authorization_number"]
+
+    def test_batch_carries_deductible_across_claims(
+        self, member: RxMember, claim: PharmacyClaim
+    ) -> None:
+        """Test each claim sees the deductible left by the member's earlier claims."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        engine = AdjudicationEngine(formulary=formulary)
+        later = claim.model_copy(update={"claim_id": "CLM002", "service_date": date(2025, 2, 15)})
+
+        result = engine.adjudicate_batch([later, claim], {member.member_id: member})
+
+        assert list(result.claims["claim_id"]) == ["CLM001", "CLM002"]
+        assert list(result.claims["deductible_amount"]) == [152.50, 97.50]
+        assert list(result.claims["remaining_deductible"]) == [97.50, 0.0]
+        assert result.to_dict()["paid"] == 2
+        # Accumulators are left alone unless asked
+        assert member.accumulators.deductible_remaining == Decimal("250")
+
+    def test_batch_caps_patient_pay_at_oop_max(
+        self, member: RxMember, claim: PharmacyClaim
+    ) -> None:
+        """Test a member reaching the OOP max mid-batch pays nothing further."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        engine = AdjudicationEngine(formulary=formulary)
+        member.accumulators.oop_remaining = Decimal("200")
+        claims = [
+            claim.model_copy(
+                update={"claim_id": f"CLM{i:03d}", "service_date": date(2025, 1, 15 + i)}
+            )
+            for i in range(4)
+        ]
+
+        result = engine.adjudicate_batch(
+            claims, [member], return_responses=True, update_accumulators=True
+        ).claims
+
+        assert result["patient_pay_amount"].sum() == 200.0
+        assert list(result["patient_pay_amount"])[-2:] == [0.0, 0.0]
+        assert (result["remaining_oop"] >= 0).all()
+        assert list(result["remaining_oop"])[-1] == 0.0
+        paid = result["total_amount_paid"] + result["patient_pay_amount"]
+        assert (paid == 152.50).all()
+        assert member.accumulators.oop_remaining == Decimal("0")
+        assert member.accumulators.oop_met == Decimal("200")
+
+    def test_single_claim_caps_patient_pay_at_oop_max(
+        self, member: RxMember, claim: PharmacyClaim
+    ) -> None:
+        """Test adjudicate() never charges more than the OOP balance left."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        member.accumulators.oop_remaining = Decimal("10")
+
+        response = AdjudicationEngine(formulary=formulary).adjudicate(claim, member)
+
+        assert response.patient_pay_amount == Decimal("10")
+        assert response.deductible_amount + response.copay_amount == Decimal("10")
+        assert response.remaining_oop == Decimal("0")
+
+    def test_batch_rejections(self, member: RxMember, claim: PharmacyClaim) -> None:
+        """Test rejected claims carry their reject codes and no amounts."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        engine = AdjudicationEngine(formulary=formulary)
+        wrong_bin = claim.model_copy(update={"claim_id": "CLM002", "bin": "999999"})
+        not_covered = claim.model_copy(update={"claim_id": "CLM003", "ndc": "99999999999"})
+        unknown = claim.model_copy(update={"claim_id": "CLM004", "member_id": "MEM999"})
+
+        claims = engine.adjudicate_batch(
+            [claim, wrong_bin, not_covered, unknown], [member]
+        ).claims.set_index("claim_id")
+
+        assert claims.loc["CLM002", "reject_codes"] == "25"
+        assert claims.loc["CLM003", "reject_codes"] == "70"
+        assert claims.loc["CLM004", "reject_codes"] == "52"
+        assert claims.loc["CLM001", "reject_codes"] == ""
+        assert claims["total_amount_paid"].isna().sum() == 3
+
+    def test_stream_chunks_and_updates_accumulators(
+        self, member: RxMember, claim: PharmacyClaim
+    ) -> None:
+        """Test streaming yields chunks and writes final balances back."""
+        formulary = FormularyGenerator().generate_standard_commercial()
+        engine = AdjudicationEngine(formulary=formulary)
+        claims = (
+            claim.model_copy(
+                update={"claim_id": f"CLM{i:03d}", "service_date": date(2025, 1, 15 + i)}
+            )
+            for i in range(5)
+        )
+
+        chunks = list(
+            engine.adjudicate_stream(claims, [member], chunk_size=2, update_accumulators=True)
+        )
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert member.accumulators.deductible_remaining == Decimal("0")
+        assert member.accumulators.deductible_met == Decimal("250")
+        assert member.accumulators.oop_remaining == Decimal(
+            str(chunks[-1]["remaining_oop"].iloc[-1])
+        )
@@ -2,8 +2,10 @@
 from datetime import date, timedelta
 
 from rxmembersim.dur.alerts import DURAlertFormatter, DUROverrideManager
+from rxmembersim.dur.history import MemberMedicationHistory
 from rxmembersim.dur.rules import (
     ClinicalSignificance,
+    DrugDrugInteraction,
     DURAlert,
     DURAlertType,
     DURRulesEngine,
@@ -228,6 +230,48 @@ class TestDURRulesEngine:
 
         assert alert is None
 
+    def test_drug_drug_interaction_either_direction(self) -> None:
+        """Test interactions match with the new drug as either drug."""
+        engine = DURRulesEngine()
+        warfarin = {"ndc": "1", "gpi": "83300010000330", "name": "Warfarin"}
+        ibuprofen = {"ndc": "2", "gpi": "66100010000310", "name": "Ibuprofen"}
+
+        forward = engine.check_drug_drug_interactions(
+            ibuprofen["gpi"], ibuprofen["ndc"], ibuprofen["name"], [warfarin]
+        )
+        reverse = engine.check_drug_drug_interactions(
+            warfarin["gpi"], warfarin["ndc"], warfarin["name"], [ibuprofen]
+        )
+
+        assert [a.message for a in forward] == [a.message for a in reverse]
+        assert forward[0].drug2_name == "Warfarin"
+        assert reverse[0].drug2_name == "Ibuprofen"
+
+    def test_drug_drug_interaction_added_rule(self) -> None:
+        """Test rules appended after a screening are picked up, in list order."""
+        engine = DURRulesEngine()
+        current_meds = [{"ndc": "1", "gpi": "27100030000310", "name": "Metformin"}]
+        screen = engine.check_drug_drug_interactions
+        assert screen("39400010000310", "2", "Atorva", current_meds) == []
+
+        for interaction_id, gpi in (("DD-900", "3940"), ("DD-901", "39400010")):
+            engine.drug_interactions.append(
+                DrugDrugInteraction(
+                    interaction_id=interaction_id,
+                    drug1_gpi=gpi,
+                    drug2_gpi="2710",
+                    drug1_name="Statin",
+                    drug2_name="Biguanide",
+                    interaction_description=interaction_id,
+                    clinical_effect="Test",
+                    clinical_significance=ClinicalSignificance.LEVEL_3,
+                    recommendation="Monitor",
+                )
+            )
+
+        alerts = screen("39400010000310", "2", "Atorva", current_meds)
+        assert [a.message for a in alerts] == ["DD-900", "DD-901"]
+
 
 class TestDURValidator:
     """Tests for DUR Validator."""
@@ -295,6 +339,47 @@ class TestDURValidator:
         assert result.passed is True
         assert result.total_alerts == 0
 
+    def test_validate_with_history(self) -> None:
+        """Test a replayed fill history screens only drugs on hand."""
+        validator = DURValidator()
+        member = MemberProfile(member_id="TEST001", date_of_birth=date(1980, 1, 1), gender="M")
+        history = MemberMedicationHistory()
+        fills = [
+            ("00056017270", "83300010000330", date(2025, 1, 1)),  # Warfarin
+            ("00071015523", "39400010000310", date(2025, 1, 1)),  # Atorvastatin
+            ("00071015523", "39400010000310", date(2025, 1, 10)),  # Early refill
+            ("00000000001", "66100010000310", date(2025, 3, 1)),  # NSAID, warfarin ran out
+        ]
+
+        results = []
+        for i, (ndc, gpi, service_date) in enumerate(fills):
+            request = DURValidationRequest(
+                claim_id=f"CLM{i}",
+                service_date=service_date,
+                ndc=ndc,
+                gpi=gpi,
+                drug_name=ndc,
+                quantity=30,
+                days_supply=30,
+            )
+            results.append(validator.validate(request, member, history=history))
+            history.add(
+                MemberMedication(
+                    ndc=ndc,
+                    gpi=gpi,
+                    name=ndc,
+                    service_date=service_date,
+                    days_supply=30,
+                    quantity=30,
+                )
+            )
+
+        assert [r.total_alerts for r in results] == [0, 0, 2, 0]
+        assert {a.alert_type for a in results[2].alerts} == {
+            DURAlertType.EARLY_REFILL,
+            DURAlertType.THERAPEUTIC_DUPLICATION,
+        }
+
     def test_validate_simple_interface(self) -> None:
         """Test simplified validation interface."""
         validator = DURValidator()
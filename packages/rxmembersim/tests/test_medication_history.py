@@ -0,0 +1,74 @@
+"""Tests for the per-member medication history used by DUR."""
+from datetime import date
+
+from rxmembersim.dur import MemberMedication, MemberMedicationHistory
+
+
+def _fill(ndc: str, gpi: str, day: date, days_supply: int = 30) -> MemberMedication:
+    return MemberMedication(
+        ndc=ndc,
+        gpi=gpi,
+        name=ndc,
+        service_date=day,
+        days_supply=days_supply,
+        quantity=30,
+    )
+
+
+STATIN = ("00093505698", "39400010000320")
+WARFARIN = ("00056017270", "83300010000330")
+
+
+class TestMemberMedicationHistory:
+    """Tests for MemberMedicationHistory."""
+
+    def test_last_fill(self) -> None:
+        """Test the latest fill wins, on or before the as-of date."""
+        first = _fill(*STATIN, date(2025, 1, 1))
+        second = _fill(*STATIN, date(2025, 1, 31))
+        same_day = _fill(*STATIN, date(2025, 1, 31), days_supply=90)
+        # Out of date order
+        history = MemberMedicationHistory([second, first, same_day])
+
+        assert history.last_fill(STATIN[0]) is second
+        assert history.last_fill(STATIN[0], as_of=date(2025, 1, 30)) is first
+        assert history.last_fill(STATIN[0], as_of=date(2024, 12, 31)) is None
+        assert history.last_fill(WARFARIN[0]) is None
+        assert history.fills(STATIN[0]) == [first, second, same_day]
+
+    def test_active_intervals_merge(self) -> None:
+        """Test overlapping and adjacent fills form one on-hand interval."""
+        history = MemberMedicationHistory()
+        history.add(_fill(*STATIN, date(2025, 1, 1)))
+        history.add(_fill(*STATIN, date(2025, 3, 1)))
+        assert not history.is_active(STATIN[0], date(2025, 2, 15))
+
+        # Bridges the gap between the two fills
+        history.add(_fill(*STATIN, date(2025, 1, 31)))
+
+        assert history._starts[STATIN[0]] == [date(2025, 1, 1)]
+        assert history._ends[STATIN[0]] == [date(2025, 3, 31)]
+        assert history.is_active(STATIN[0], date(2025, 2, 15))
+        assert not history.is_active(STATIN[0], date(2025, 3, 31))
+        assert not history.is_active(STATIN[0], date(2024, 12, 31))
+
+    def test_active_medications(self) -> None:
+        """Test one fill per drug on hand is returned, filtered by GPI prefix."""
+        history = MemberMedicationHistory(
+            [
+                _fill(*WARFARIN, date(2025, 1, 1), days_supply=90),
+                _fill(*STATIN, date(2025, 1, 1)),
+                _fill(*STATIN, date(2025, 1, 25)),
+            ]
+        )
+
+        active = history.active_medications(date(2025, 2, 1))
+        assert [(med.ndc, med.service_date) for med in active] == [
+            (WARFARIN[0], date(2025, 1, 1)),
+            (STATIN[0], date(2025, 1, 25)),
+        ]
+        assert [med.ndc for med in history.active_medications(date(2025, 2, 1), "3940")] == [
+            STATIN[0]
+        ]
+        assert [med.ndc for med in history.fills(gpi_prefix="83")] == [WARFARIN[0]]
+        assert history.active_medications(date(2025, 6, 1)) == []
@@ -0,0 +1,178 @@
+"""Tests for the GPI/NDC prefix index and the lookups built on it."""
+from datetime import date
+from decimal import Decimal
+
+from rxmembersim.core.prefix_index import PrefixIndex
+from rxmembersim.dur.rules import (
+    ClinicalSignificance,
+    DrugDrugInteraction,
+    DURRulesEngine,
+)
+from rxmembersim.pricing.copay_assist import (
+    CopayAssistanceCalculator,
+    CopayAssistanceProgram,
+    EligibilityType,
+)
+from rxmembersim.pricing.rebate import (
+    RebateCalculator,
+    RebateContract,
+    RebateTier,
+    RebateType,
+)
+
+
+class TestPrefixIndex:
+    """Tests for PrefixIndex."""
+
+    def test_match_returns_every_prefix_in_insertion_order(self) -> None:
+        """Test all matching prefixes are returned in the order added."""
+        index: PrefixIndex[str] = PrefixIndex()
+        index.add("39400010", "simvastatin")
+        index.add("3940", "statins")
+        index.add("3945", "other")
+        index.add("39", "cardiovascular")
+
+        assert index.match("39400010000310") == ["simvastatin", "statins", "cardiovascular"]
+        assert index.first("39400010000310") == "simvastatin"
+        assert index.match("3945") == ["other", "cardiovascular"]
+        assert index.match("66100010") == []
+        assert len(index) == 4
+
+    def test_exact_match(self) -> None:
+        """Test exact lookups ignore shorter and longer keys."""
+        index = PrefixIndex([("00069015430", "lipitor"), ("0006901", "prefix")])
+
+        assert index.match("00069015430", exact=True) == ["lipitor"]
+        assert index.match("000690154", exact=True) == []
+        assert index.match("00069015430999", exact=True) == []
+
+    def test_empty_prefix_and_code(self) -> None:
+        """Test the empty prefix matches every code, including None."""
+        index = PrefixIndex([("", "all"), ("12", "twelve")])
+
+        assert index.match("1234") == ["all", "twelve"]
+        assert index.match(None) == ["all"]
+        assert index.match("") == ["all"]
+
+    def test_effective_window(self) -> None:
+        """Test values outside their effective window are filtered out."""
+        index: PrefixIndex[str] = PrefixIndex()
+        index.add("3940", "2024", date(2024, 1, 1), date(2024, 12, 31))
+        index.add("3940", "2025", date(2025, 1, 1))
+        index.add("3940", "always")
+
+        assert index.match("39400010", as_of=date(2024, 12, 31)) == ["2024", "always"]
+        assert index.match("39400010", as_of=date(2025, 6, 1)) == ["2025", "always"]
+        assert index.match("39400010", as_of=date(2023, 6, 1)) == ["always"]
+        assert index.match("39400010") == ["2024", "2025", "always"]
+
+
+def _contract(contract_id: str, **kwargs) -> RebateContract:
+    return RebateContract(
+        contract_id=contract_id,
+        manufacturer_id="MFR",
+        manufacturer_name="Manufacturer",
+        contract_type=RebateType.ACCESS,
+        tiers=[RebateTier(tier_number=1, rebate_type="percentage", rebate_value=Decimal("10"))],
+        **kwargs,
+    )
+
+
+def _interaction(interaction_id: str, drug1_gpi: str, drug2_gpi: str) -> DrugDrugInteraction:
+    return DrugDrugInteraction(
+        interaction_id=interaction_id,
+        drug1_gpi=drug1_gpi,
+        drug2_gpi=drug2_gpi,
+        drug1_name="Drug A",
+        drug2_name="Drug B",
+        interaction_description="Interaction",
+        clinical_effect="Effect",
+        clinical_significance=ClinicalSignificance.LEVEL_2,
+        recommendation="Monitor",
+    )
+
+
+class TestIndexedLookups:
+    """Tests that indexed lookups keep first-match and date semantics."""
+
+    def test_rebate_contract_first_in_list_wins(self) -> None:
+        """Test the earliest contract in effect covering the drug applies."""
+        calculator = RebateCalculator(
+            [
+                _contract(
+                    "EXPIRED",
+                    effective_date=date(2020, 1, 1),
+                    termination_date=date(2020, 12, 31),
+                    covered_ndcs=["00069015430"],
+                ),
+                _contract("CLASS", effective_date=date(2024, 1, 1), covered_gpis=["3940"]),
+                _contract("NDC", effective_date=date(2024, 1, 1), covered_ndcs=["00069015430"]),
+            ]
+        )
+
+        contract = calculator._find_contract("00069015430", "39400010000310", date(2025, 1, 1))
+        assert contract.contract_id == "CLASS"
+        contract = calculator._find_contract("00069015430", None, date(2025, 1, 1))
+        assert contract.contract_id == "NDC"
+        contract = calculator._find_contract("00069015430", None, date(2020, 6, 1))
+        assert contract.contract_id == "EXPIRED"
+        assert calculator._find_contract("00069015430", None, date(2019, 1, 1)) is None
+
+    def test_rebate_contract_added_after_lookup(self) -> None:
+        """Test contracts added after a lookup are found."""
+        calculator = RebateCalculator()
+        assert calculator._find_contract("1", "3940", date(2025, 1, 1)) is None
+
+        calculator.add_contract(
+            _contract("LATE", effective_date=date(2024, 1, 1), covered_gpis=["39"])
+        )
+        assert calculator._find_contract("1", "3940", date(2025, 1, 1)).contract_id == "LATE"
+
+    def test_rebate_contract_edited_in_place(self) -> None:
+        """Test in-place contract edits apply once the index is invalidated."""
+        contract = _contract("CLASS", effective_date=date(2024, 1, 1), covered_gpis=["3940"])
+        calculator = RebateCalculator([contract])
+        assert calculator._find_contract("1", "27170020", date(2025, 1, 1)) is None
+
+        contract.covered_gpis.append("2717")
+        calculator.invalidate_index()
+
+        assert calculator._find_contract("1", "27170020", date(2025, 1, 1)) is contract
+
+    def test_dur_rule_replaced_in_place(self) -> None:
+        """Test a rule replaced by position applies once the indexes are invalidated."""
+        engine = DURRulesEngine()
+        engine.drug_interactions = [_interaction("OLD", "8310", "6610")]
+        current = [{"gpi": "66100010", "ndc": "2", "name": "Current"}]
+        assert len(engine.check_drug_drug_interactions("83100010", "1", "New", current)) == 1
+
+        engine.drug_interactions[0] = _interaction("NEW", "2717", "6610")
+        engine.invalidate_indexes()
+
+        assert engine.check_drug_drug_interactions("83100010", "1", "New", current) == []
+        alerts = engine.check_drug_drug_interactions("27170020", "1", "New", current)
+        assert [alert.drug1_gpi for alert in alerts] == ["27170020"]
+
+    def test_copay_program_skips_ineligible(self) -> None:
+        """Test eligibility is checked in program order after matching."""
+        calculator = CopayAssistanceCalculator()
+        for program_id, eligibility in (
+            ("UNINSURED", EligibilityType.UNINSURED_ONLY),
+            ("COMMERCIAL", EligibilityType.COMMERCIAL_ONLY),
+        ):
+            calculator.add_program(
+                CopayAssistanceProgram(
+                    program_id=program_id,
+                    program_name=program_id,
+                    manufacturer_name="Manufacturer",
+                    covered_gpis=["2717"],
+                    eligibility_type=eligibility,
+                    effective_date=date(2024, 1, 1),
+                )
+            )
+
+        commercial = calculator.find_program("1", "27170020", date(2025, 1, 1), True)
+        uninsured = calculator.find_program("1", "27170020", date(2025, 1, 1), False)
+
+        assert commercial.program_id == "COMMERCIAL"
+        assert uninsured.program_id == "UNINSURED"
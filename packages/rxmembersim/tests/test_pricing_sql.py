@@ -0,0 +1,179 @@
+"""Tests for period rebate and spread calculations run in DuckDB."""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import duckdb
+import pytest
+from healthsim.db.schema import apply_schema
+
+from rxmembersim.core.drug import DrugReference
+from rxmembersim.pricing import (
+    RebateCalculator,
+    SampleRebateContracts,
+    SampleSpreadConfigs,
+    SpreadCalculator,
+)
+
+# NDC -> (GPI, unit AWP, brand)
+DRUGS = {
+    "00069015430": ("39400010000310", 12.5, True),  # Lipitor, statin contract by NDC
+    "00093505698": ("39400010000320", 0.85, False),  # Generic statin, by GPI prefix
+    "00169413512": ("27200060002020", 935.0, True),  # Ozempic
+    "00074320502": ("66400020002020", 3100.0, True),  # Humira
+    "00378180001": ("36100030000310", 0.12, False),  # No contract
+}
+
+
+def _drug(ndc: str) -> DrugReference:
+    gpi, awp, is_brand = DRUGS[ndc]
+    return DrugReference(
+        ndc=ndc,
+        drug_name=ndc,
+        generic_name=ndc,
+        gpi=gpi,
+        therapeutic_class="Test",
+        strength="1 mg",
+        dosage_form="Tablet",
+        route_of_admin="Oral",
+        is_brand=is_brand,
+        awp=awp,
+    )
+
+
+@pytest.fixture
+def claims() -> list[dict]:
+    """Claim rows across Q1 2025, with a few reversals and out-of-period fills."""
+    rng = random.Random(7)
+    return [
+        {
+            "claim_id": f"RX{i:05d}",
+            "transaction_code": "B2" if i % 17 == 0 else "B1",
+            "service_date": date(2024, 12, 20) + timedelta(days=i % 110),
+            "ndc": rng.choice(list(DRUGS)),
+            "quantity": Decimal(rng.choice(["30", "90", "2.5"])),
+            "ingredient_cost": Decimal(rng.randint(100, 99999)) / 100,
+            "cohort_id": "pbm" if i % 3 else "other",
+        }
+        for i in range(500)
+    ]
+
+
+@pytest.fixture
+def conn(claims):
+    """In-memory database holding the claims in pharmacy_claims."""
+    connection = duckdb.connect()
+    apply_schema(connection)
+    connection.executemany(
+        """
+        INSERT INTO pharmacy_claims (
+            claim_id, transaction_code, service_date, pharmacy_npi, member_id,
+            cardholder_id, bin, pcn, group_number, prescription_number, ndc,
+            quantity_dispensed, days_supply, prescriber_npi, ingredient_cost_submitted,
+            cohort_id
+        ) VALUES (?, ?, ?, '1234567890', 'M1', 'C1', '610014', 'RX', 'G1', 'P1', ?, ?, 30,
+                  '0987654321', ?, ?)
+        """,
+        [
+            [c["claim_id"], c["transaction_code"], c["service_date"], c["ndc"],
+             c["quantity"], c["ingredient_cost"], c["cohort_id"]]
+            for c in claims
+        ],
+    )
+    yield connection
+    connection.close()
+
+
+def _in_q1(claims: list[dict], cohort_id: str | None = None) -> list[dict]:
+    return [
+        {**c, "gpi": DRUGS[c["ndc"]][0], "awp": DRUGS[c["ndc"]][1],
+         "is_brand": DRUGS[c["ndc"]][2]}
+        for c in claims
+        if date(2025, 1, 1) <= c["service_date"] <= date(2025, 3, 31)
+        and c["transaction_code"] != "B2"
+        and cohort_id in (None, c["cohort_id"])
+    ]
+
+
+class TestPeriodRebateSQL:
+    """Tests for RebateCalculator.calculate_period_rebate_sql."""
+
+    @pytest.fixture
+    def calculator(self) -> RebateCalculator:
+        return RebateCalculator(
+            [
+                SampleRebateContracts.brand_statin(),
+                SampleRebateContracts.glp1_agonist(),
+                SampleRebateContracts.tnf_inhibitor(),
+            ]
+        )
+
+    @pytest.mark.parametrize("cohort_id", [None, "pbm"])
+    def test_matches_python_calculation(self, conn, claims, calculator, cohort_id) -> None:
+        """Test SQL summaries equal the in-memory calculation on the same claims."""
+        period = (date(2025, 1, 1), date(2025, 3, 31))
+        expected = calculator.calculate_period_rebate(
+            _in_q1(claims, cohort_id), Decimal("35"), *period
+        )
+        actual = calculator.calculate_period_rebate_sql(
+            conn,
+            *period,
+            market_share=Decimal("35"),
+            drugs=[_drug(ndc) for ndc in DRUGS],
+            cohort_id=cohort_id,
+        )
+
+        assert [s.contract_id for s in actual] == [
+            "REBATE-STATIN-001", "REBATE-GLP1-001", "REBATE-TNF-001"
+        ]
+        by_contract = {s.contract_id: s for s in expected}
+        for summary in actual:
+            assert summary == by_contract[summary.contract_id]
+
+    def test_without_gpis_matches_ndc_only(self, conn, calculator) -> None:
+        """Test claims match contracts by NDC alone when no GPIs are given."""
+        statin = calculator.calculate_period_rebate_sql(
+            conn, date(2025, 1, 1), date(2025, 3, 31)
+        )[0]
+        lipitor_count = conn.execute(
+            """
+            SELECT COUNT(*) FROM pharmacy_claims
+            WHERE ndc = '00069015430' AND transaction_code <> 'B2'
+                AND service_date BETWEEN '2025-01-01' AND '2025-03-31'
+            """
+        ).fetchone()[0]
+
+        assert statin.total_claims == lipitor_count
+
+    def test_contract_window(self, conn, calculator) -> None:
+        """Test claims before a contract's effective date are not rebated."""
+        assert calculator.calculate_period_rebate_sql(
+            conn, date(2024, 12, 1), date(2024, 12, 31)
+        ) == []
+
+
+class TestPeriodSpreadSQL:
+    """Tests for SpreadCalculator.calculate_period_spread_sql."""
+
+    @pytest.mark.parametrize("config", ["traditional_pbm", "pass_through", "transparent"])
+    def test_matches_python_calculation(self, conn, claims, config) -> None:
+        """Test the SQL summary equals the in-memory calculation."""
+        calculator = SpreadCalculator(*getattr(SampleSpreadConfigs, config)())
+        specialty = {"00074320502"}
+        q1 = [
+            {**c, "is_specialty": c["ndc"] in specialty}
+            for c in _in_q1(claims, "pbm")
+        ]
+        period = (date(2025, 1, 1), date(2025, 3, 31))
+
+        expected = calculator.calculate_period_spread(q1, *period)
+        actual = calculator.calculate_period_spread_sql(
+            conn,
+            *period,
+            drugs=[_drug(ndc) for ndc in DRUGS],
+            specialty_ndcs=specialty,
+            cohort_id="pbm",
+        )
+
+        assert actual == expected
+        assert actual.total_claims == len(q1)